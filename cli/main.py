@@ -45,7 +45,7 @@ from core_engine.rbac import authorize, role_report
 from core_engine.visibility import build_visibility_report
 from core_engine.visibility_history import build_visibility_snapshot, compare_visibility_snapshots
 from core_engine.vuln.cve_client import analyze_service_cves, fetch_nvd_cves, load_cves_from_json
-from core_engine.vuln.cve_store import load_cve_cache, merge_cve_records, save_cve_cache
+from core_engine.vuln.cve_store import CVEShardStore, is_cve_store, load_cve_cache, load_cve_index, merge_cve_records, save_cve_cache
 from core_engine.vuln.vuln_correlator import correlate_vulnerabilities
 from core_engine import stack_launcher
 from cli.runtime import add_runtime_subparser
@@ -1010,13 +1010,14 @@ def cmd_cve(args: argparse.Namespace) -> int:
                 api_key=args.api_key,
                 limit=args.limit,
             )
-            existing = load_cve_cache(args.cache)
-            records = merge_cve_records(existing.get("records") or [], fetched["records"])
-            saved = save_cve_cache(
-                records,
-                path=args.cache,
-                metadata={"source": "nvd", "query": fetched["query"]},
-            )
+            metadata = {"source": "nvd", "query": fetched["query"]}
+            if is_cve_store(args.cache):
+                with CVEShardStore(args.cache) as store:
+                    saved = store.merge(fetched["records"], metadata=metadata)
+            else:
+                existing = load_cve_cache(args.cache)
+                records = merge_cve_records(existing.get("records") or [], fetched["records"])
+                saved = save_cve_cache(records, path=args.cache, metadata=metadata)
             payload = {
                 "ok": True,
                 "mode": "update",
@@ -1030,10 +1031,12 @@ def cmd_cve(args: argparse.Namespace) -> int:
         else:
             if args.cve_json:
                 cves = load_cves_from_json(args.cve_json)
+                matcher = cves
                 source = "inline"
             else:
-                cache = load_cve_cache(args.cache)
+                cache = load_cve_index(args.cache)
                 cves = cache.get("records") or []
+                matcher = cache["index"]
                 source = "cache"
             if args.service_json:
                 service_payload = json.loads(args.service_json)
@@ -1048,7 +1051,7 @@ def cmd_cve(args: argparse.Namespace) -> int:
                     services = service_payload
                 else:
                     raise ValueError("--service-json must decode to a service object/list")
-                payload = analyze_service_cves(services, cves, min_confidence=args.min_confidence)
+                payload = analyze_service_cves(services, matcher, min_confidence=args.min_confidence, max_workers=args.workers)
                 payload["source"] = source
             else:
                 payload = {
@@ -1056,7 +1059,7 @@ def cmd_cve(args: argparse.Namespace) -> int:
                     "mode": "list",
                     "source": source,
                     "record_count": len(cves),
-                    "records": cves,
+                    "records": list(cves),
                     "automatic_changes": False,
                     "raw_payload_stored": False,
                 }
@@ -1613,8 +1616,9 @@ def build_parser() -> argparse.ArgumentParser:
     cve = subparsers.add_parser("cve", help="Match service evidence against local or NVD CVE intelligence")
     cve.add_argument("--service-json", help="Service row/list or service enumeration report to match")
     cve.add_argument("--cve-json", help="Inline CVE list/object or NVD response JSON for offline analysis")
-    cve.add_argument("--cache", help="Local CVE cache path; defaults to ~/.portmap-ai/data/cve_cache.json")
+    cve.add_argument("--cache", help="Local CVE cache path; defaults to ~/.portmap-ai/data/cve_cache.json (a directory selects the sharded store)")
     cve.add_argument("--min-confidence", type=float, default=0.25, help="Minimum local match confidence")
+    cve.add_argument("--workers", type=int, default=0, help="Worker processes for service matching; 0 matches in-process")
     cve.add_argument("--update", action="store_true", help="Fetch CVEs from NVD and update the local cache")
     cve.add_argument("--query", help="NVD keyword query for --update")
     cve.add_argument("--cve-id", help="Specific CVE ID for --update")
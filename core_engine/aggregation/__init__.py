@@ -2,24 +2,36 @@
 
 from core_engine.aggregation.collector import (
     collect_node_reports,
+    iter_node_report_section,
     normalize_node_report,
     summarize_collection,
     validate_node_report,
 )
 from core_engine.aggregation.conflict_resolution import build_conflict_record
 from core_engine.aggregation.merger import (
+    NodeReportMerger,
     merge_assets,
     merge_findings,
     merge_node_reports,
     merge_services,
     merge_topology_edges,
 )
+from core_engine.aggregation.streaming import (
+    IncrementalKeyedMerger,
+    merge_grouped_rows,
+    merge_key_groups,
+)
 
 __all__ = [
+    "IncrementalKeyedMerger",
+    "NodeReportMerger",
     "build_conflict_record",
     "collect_node_reports",
+    "iter_node_report_section",
     "merge_assets",
     "merge_findings",
+    "merge_grouped_rows",
+    "merge_key_groups",
     "merge_node_reports",
     "merge_services",
     "merge_topology_edges",
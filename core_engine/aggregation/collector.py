@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
+
+
+NODE_REPORT_ROW_PREFIXES = {"assets": "asset", "services": "service", "topology_edges": "edge", "findings": "finding"}
 
 
 class AggregationError(ValueError):
@@ -11,15 +14,12 @@ class AggregationError(ValueError):
 def normalize_node_report(report: dict[str, Any]) -> dict[str, Any]:
     validate_node_report(report)
     node_id = str(report["node_id"])
-    collected_at = str(report.get("collected_at") or _now())
+    collected_at = node_report_collected_at(report)
     normalized = {
         "node_id": node_id,
         "node_label": str(report.get("node_label") or node_id),
         "collected_at": collected_at,
-        "assets": [_with_source(row, node_id, collected_at, "asset") for row in _rows(report.get("assets"))],
-        "services": [_with_source(row, node_id, collected_at, "service") for row in _rows(report.get("services"))],
-        "topology_edges": [_with_source(row, node_id, collected_at, "edge") for row in _rows(report.get("topology_edges"))],
-        "findings": [_with_source(row, node_id, collected_at, "finding") for row in _rows(report.get("findings"))],
+        **{section: list(iter_node_report_section(report, section, collected_at=collected_at)) for section in NODE_REPORT_ROW_PREFIXES},
         "metadata": dict(report.get("metadata") or {}),
         "raw_payload_stored": bool(report.get("raw_payload_stored", False)),
         "automatic_changes": bool(report.get("automatic_changes", False)),
@@ -30,6 +30,18 @@ def normalize_node_report(report: dict[str, Any]) -> dict[str, Any]:
     return normalized
 
 
+def iter_node_report_section(report: dict[str, Any], section: str, *, collected_at: str) -> Iterator[dict[str, Any]]:
+    """Yield the rows ``normalize_node_report`` produces for one section, one at a time."""
+    node_id = str(report["node_id"])
+    prefix = NODE_REPORT_ROW_PREFIXES[section]
+    for row in _rows(report.get(section)):
+        yield _with_source(row, node_id, collected_at, prefix)
+
+
+def node_report_collected_at(report: dict[str, Any]) -> str:
+    return str(report.get("collected_at") or _now())
+
+
 def validate_node_report(report: dict[str, Any]) -> None:
     if not isinstance(report, dict):
         raise AggregationError("node report must be an object")
@@ -1,22 +1,111 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Any, Iterable
 
-from core_engine.aggregation.collector import collect_node_reports
+from core_engine.aggregation.collector import (
+    collect_node_reports,
+    iter_node_report_section,
+    node_report_collected_at,
+    normalize_node_report,
+    validate_node_report,
+)
 from core_engine.aggregation.conflict_resolution import build_conflict_record
+from core_engine.aggregation.streaming import IncrementalKeyedMerger, merge_grouped_rows
 
 
-def merge_node_reports(reports: Iterable[dict[str, Any]]) -> dict[str, Any]:
-    normalized = collect_node_reports(reports)
-    assets, asset_conflicts = merge_assets(_chain(normalized, "assets"))
-    services, service_conflicts = merge_services(_chain(normalized, "services"))
-    edges, edge_conflicts = merge_topology_edges(_chain(normalized, "topology_edges"))
-    findings, finding_conflicts = merge_findings(_chain(normalized, "findings"))
+def merge_node_reports(reports: Iterable[dict[str, Any]], *, presorted: bool = False) -> dict[str, Any]:
+    """Merge node reports section by section with a k-way merge over the nodes.
+
+    Pass ``presorted=True`` when every report's sections are already ordered
+    by merge key to skip the per-node sort and stream groups lazily; rows are
+    then normalized as the merge consumes them instead of copying every
+    report up front.
+    """
+    if not presorted:
+        normalized = collect_node_reports(reports)
+        sections = {
+            name: merge_grouped_rows((report[name] for report in normalized), key_fn, group_merger)
+            for name, (key_fn, group_merger) in NODE_REPORT_SECTIONS.items()
+        }
+        return _merged_report(sections, node_count=len(normalized), source_node_ids={report["node_id"] for report in normalized})
+    sources = []
+    for report in reports:
+        validate_node_report(report)
+        sources.append((report, node_report_collected_at(report)))
+    sections = {
+        name: merge_grouped_rows(
+            (iter_node_report_section(report, name, collected_at=collected_at) for report, collected_at in sources),
+            key_fn,
+            group_merger,
+            presorted=True,
+        )
+        for name, (key_fn, group_merger) in NODE_REPORT_SECTIONS.items()
+    }
+    return _merged_report(sections, node_count=len(sources), source_node_ids={str(report["node_id"]) for report, _collected_at in sources})
+
+
+class NodeReportMerger:
+    """Keeps the latest report per node merged, re-merging only what a node changes.
+
+    ``update`` normalizes one node report and re-merges only the keys that
+    node reported before or reports now; ``result`` matches
+    ``merge_node_reports`` over the current reports in first-seen node order.
+    """
+
+    def __init__(self) -> None:
+        self._merger = IncrementalKeyedMerger(NODE_REPORT_SECTIONS)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._merger
+
+    def __len__(self) -> int:
+        return len(self._merger)
+
+    def update(self, report: dict[str, Any]) -> dict[str, int]:
+        normalized = normalize_node_report(report)
+        return self._merger.update(normalized["node_id"], normalized)
+
+    def remove(self, node_id: str) -> dict[str, int]:
+        return self._merger.remove(node_id)
+
+    def result(self) -> dict[str, Any]:
+        sections = {name: self._merger.section(name) for name in NODE_REPORT_SECTIONS}
+        node_ids = self._merger.node_ids()
+        return _merged_report(sections, node_count=len(node_ids), source_node_ids=set(node_ids))
+
+
+def merge_assets(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    return merge_grouped_rows([rows], *NODE_REPORT_SECTIONS["assets"])
+
+
+def merge_services(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    return merge_grouped_rows([rows], *NODE_REPORT_SECTIONS["services"])
+
+
+def merge_topology_edges(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    return merge_grouped_rows([rows], *NODE_REPORT_SECTIONS["topology_edges"])
+
+
+def merge_findings(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    return merge_grouped_rows([rows], *NODE_REPORT_SECTIONS["findings"])
+
+
+def _merged_report(
+    sections: dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]],
+    *,
+    node_count: int,
+    source_node_ids: set[str],
+) -> dict[str, Any]:
+    assets, asset_conflicts = sections["assets"]
+    services, service_conflicts = sections["services"]
+    edges, edge_conflicts = sections["topology_edges"]
+    findings, finding_conflicts = sections["findings"]
     conflicts = asset_conflicts + service_conflicts + edge_conflicts + finding_conflicts
     return {
         "status": "ok",
-        "node_count": len(normalized),
-        "source_node_ids": sorted({report["node_id"] for report in normalized}),
+        "node_count": node_count,
+        "source_node_ids": sorted(source_node_ids),
         "assets": assets,
         "services": services,
         "topology_edges": edges,
@@ -36,76 +125,25 @@ def merge_node_reports(reports: Iterable[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def merge_assets(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    return _merge_rows(
-        rows,
-        key_fn=lambda row: _first(row, "asset_id", "host", "label") or "asset-unknown",
-        record_type="asset",
-        duplicate_conflict_type="duplicate_asset",
-        conflict_fields={"label": "conflicting_asset_labels", "category": "conflicting_asset_categories"},
-        optional_fields=("label", "category"),
-    )
-
-
-def merge_services(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    return _merge_rows(
-        rows,
-        key_fn=lambda row: "|".join([_first(row, "asset_id", "target", "host") or "target-unknown", str(row.get("port") or "0")]),
-        record_type="service",
-        duplicate_conflict_type="duplicate_service",
-        conflict_fields={"service": "conflicting_service_names", "service_name": "conflicting_service_names"},
-        optional_fields=("service", "service_name", "port"),
-    )
-
-
-def merge_topology_edges(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    return _merge_rows(
-        rows,
-        key_fn=lambda row: "|".join([
-            _first(row, "source_asset", "src", "source", "from") or "source-unknown",
-            _first(row, "target_asset", "dst", "target", "to") or "target-unknown",
-            _first(row, "relationship_type", "type") or "relationship",
-        ]),
-        record_type="topology_edge",
-        duplicate_conflict_type="duplicate_topology_edge",
-        conflict_fields={"protocol": "conflicting_protocols", "service_label": "conflicting_service_labels"},
-        optional_fields=("source_asset", "src", "target_asset", "dst", "relationship_type", "type"),
-        sum_fields=("observation_count", "flow_count"),
-    )
-
-
-def merge_findings(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    return _merge_rows(
-        rows,
-        key_fn=lambda row: _first(row, "finding_id", "source_ref", "title", "summary") or "finding-unknown",
-        record_type="finding",
-        duplicate_conflict_type="duplicate_finding",
-        conflict_fields={"severity": "conflicting_severities", "title": "conflicting_titles"},
-        optional_fields=("title", "severity"),
-    )
-
-
-def _merge_rows(
-    rows: Iterable[dict[str, Any]],
+def _merge_group(
+    key: str,
+    rows: list[dict[str, Any]],
     *,
-    key_fn,
     record_type: str,
     duplicate_conflict_type: str,
     conflict_fields: dict[str, str],
     optional_fields: tuple[str, ...] = (),
     sum_fields: tuple[str, ...] = (),
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    merged: dict[str, dict[str, Any]] = {}
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Merge every row reported for one key, in report order."""
+    item: dict[str, Any] = {}
     conflicts: list[dict[str, Any]] = []
-    observed_values: dict[tuple[str, str], set[str]] = {}
-    observed_keys: dict[str, int] = {}
-    confidence_values: dict[str, set[str]] = {}
-    source_by_key: dict[str, set[str]] = {}
-    for row in rows:
-        key = key_fn(row)
-        observed_keys[key] = observed_keys.get(key, 0) + 1
-        source_by_key.setdefault(key, set()).update(_source_nodes(row))
-        if key not in merged:
+    observed_values: dict[str, set[str]] = {}
+    confidence_values: set[str] = set()
+    sources: set[str] = set()
+    for count, row in enumerate(rows, start=1):
+        sources.update(_source_nodes(row))
+        if count == 1:
             item = dict(row)
             item["source_node_ids"] = sorted(set(_source_nodes(row)))
             item["source_refs"] = sorted(set(_source_refs(row)))
@@ -113,9 +151,7 @@ def _merge_rows(
             item["last_seen_at"] = _first(row, "last_seen_at", "collected_at") or item["first_seen_at"]
             item["confidence"] = _confidence(row)
             item["merge_key"] = key
-            merged[key] = item
         else:
-            item = merged[key]
             before_sources = set(item.get("source_node_ids") or [])
             item["source_node_ids"] = sorted(before_sources | set(_source_nodes(row)))
             item["source_refs"] = sorted(set(item.get("source_refs") or []) | set(_source_refs(row)))
@@ -125,25 +161,25 @@ def _merge_rows(
             for field in sum_fields:
                 if field in row:
                     item[field] = int(item.get(field) or 0) + int(row.get(field) or 0)
-        if observed_keys[key] == 2:
+        if count == 2:
             conflicts.append(
                 build_conflict_record(
                     conflict_type=duplicate_conflict_type,
                     affected_ref=f"{record_type}:{key}",
-                    source_node_ids=sorted(source_by_key[key]),
+                    source_node_ids=sorted(sources),
                     summary=f"{record_type} {key} was reported by multiple node summaries.",
                     severity="low",
                     recommended_review=True,
                 )
             )
-        confidence_values.setdefault(key, set()).add(f"{_confidence(row):.4f}")
-        if len(confidence_values[key]) > 1:
+        confidence_values.add(f"{_confidence(row):.4f}")
+        if len(confidence_values) > 1:
             conflicts.append(
                 build_conflict_record(
                     conflict_type="different_confidence_values",
                     affected_ref=f"{record_type}:{key}",
-                    source_node_ids=merged[key]["source_node_ids"],
-                    summary=f"{record_type} {key} has different confidence values: {', '.join(sorted(confidence_values[key]))}",
+                    source_node_ids=item["source_node_ids"],
+                    summary=f"{record_type} {key} has different confidence values: {', '.join(sorted(confidence_values))}",
                     severity="low",
                     recommended_review=True,
                 )
@@ -154,7 +190,7 @@ def _merge_rows(
                 build_conflict_record(
                     conflict_type="missing_optional_fields",
                     affected_ref=f"{record_type}:{key}",
-                    source_node_ids=merged[key]["source_node_ids"],
+                    source_node_ids=item["source_node_ids"],
                     summary=f"{record_type} {key} is missing optional fields: {', '.join(missing)}",
                     severity="info",
                     recommended_review=True,
@@ -164,20 +200,20 @@ def _merge_rows(
             value = row.get(field)
             if value in (None, ""):
                 continue
-            values = observed_values.setdefault((key, conflict_type), set())
+            values = observed_values.setdefault(conflict_type, set())
             values.add(str(value))
             if len(values) > 1:
                 conflicts.append(
                     build_conflict_record(
                         conflict_type=conflict_type,
                         affected_ref=f"{record_type}:{key}",
-                        source_node_ids=merged[key]["source_node_ids"],
+                        source_node_ids=item["source_node_ids"],
                         summary=f"{record_type} {key} has conflicting {field} values: {', '.join(sorted(values))}",
                         severity="medium",
                         recommended_review=True,
                     )
                 )
-    return sorted(merged.values(), key=lambda item: item["merge_key"]), _dedupe_conflicts(conflicts)
+    return item, conflicts
 
 
 def _missing_optional_fields(row: dict[str, Any], fields: tuple[str, ...]) -> list[str]:
@@ -203,13 +239,6 @@ def _missing_optional_fields(row: dict[str, Any], fields: tuple[str, ...]) -> li
     return sorted(set(missing))
 
 
-def _chain(reports: list[dict[str, Any]], field: str) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for report in reports:
-        rows.extend(report.get(field) or [])
-    return rows
-
-
 def _source_nodes(row: dict[str, Any]) -> list[str]:
     nodes = row.get("source_node_ids")
     if isinstance(nodes, list):
@@ -241,6 +270,50 @@ def _confidence(row: dict[str, Any]) -> float:
     return min(max(value, 0.0), 1.0)
 
 
-def _dedupe_conflicts(conflicts: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    by_id = {conflict["conflict_id"]: conflict for conflict in conflicts}
-    return sorted(by_id.values(), key=lambda item: item["conflict_id"])
+NODE_REPORT_SECTIONS = {
+    "assets": (
+        lambda row: _first(row, "asset_id", "host", "label") or "asset-unknown",
+        partial(
+            _merge_group,
+            record_type="asset",
+            duplicate_conflict_type="duplicate_asset",
+            conflict_fields={"label": "conflicting_asset_labels", "category": "conflicting_asset_categories"},
+            optional_fields=("label", "category"),
+        ),
+    ),
+    "services": (
+        lambda row: "|".join([_first(row, "asset_id", "target", "host") or "target-unknown", str(row.get("port") or "0")]),
+        partial(
+            _merge_group,
+            record_type="service",
+            duplicate_conflict_type="duplicate_service",
+            conflict_fields={"service": "conflicting_service_names", "service_name": "conflicting_service_names"},
+            optional_fields=("service", "service_name", "port"),
+        ),
+    ),
+    "topology_edges": (
+        lambda row: "|".join([
+            _first(row, "source_asset", "src", "source", "from") or "source-unknown",
+            _first(row, "target_asset", "dst", "target", "to") or "target-unknown",
+            _first(row, "relationship_type", "type") or "relationship",
+        ]),
+        partial(
+            _merge_group,
+            record_type="topology_edge",
+            duplicate_conflict_type="duplicate_topology_edge",
+            conflict_fields={"protocol": "conflicting_protocols", "service_label": "conflicting_service_labels"},
+            optional_fields=("source_asset", "src", "target_asset", "dst", "relationship_type", "type"),
+            sum_fields=("observation_count", "flow_count"),
+        ),
+    ),
+    "findings": (
+        lambda row: _first(row, "finding_id", "source_ref", "title", "summary") or "finding-unknown",
+        partial(
+            _merge_group,
+            record_type="finding",
+            duplicate_conflict_type="duplicate_finding",
+            conflict_fields={"severity": "conflicting_severities", "title": "conflicting_titles"},
+            optional_fields=("title", "severity"),
+        ),
+    ),
+}
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from heapq import merge
+from itertools import groupby
+from typing import Any, Callable, Iterable, Iterator
+
+from core_engine.aggregation.collector import AggregationError
+
+
+KeyFunction = Callable[[dict[str, Any]], str]
+GroupMerger = Callable[[str, list[dict[str, Any]]], tuple[dict[str, Any], list[dict[str, Any]]]]
+
+
+def merge_key_groups(
+    streams: Iterable[Iterable[dict[str, Any]]],
+    key_fn: KeyFunction,
+    *,
+    presorted: bool = False,
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """K-way merge node row streams into ``(key, rows)`` groups in key order.
+
+    Each stream is one node's rows. Rows in a group keep stream order, then
+    the stream's own order, which is the order a flat concatenation of the
+    streams would give. With ``presorted=True``, streams must already be
+    ordered by key (ties in report order) and are consumed lazily, so only
+    one group per stream is held in memory at a time; a stream whose keys
+    go backwards raises ``AggregationError``. Otherwise each stream is
+    stably sorted first.
+    """
+    iterators = []
+    for index, stream in enumerate(streams):
+        entries = _keyed_entries(stream, key_fn, index)
+        iterators.append(_checked_order(entries, index) if presorted else sorted(entries, key=_entry_order))
+    for key, entries in groupby(merge(*iterators, key=_entry_order), key=lambda entry: entry[0]):
+        yield key, [entry[3] for entry in entries]
+
+
+def merge_grouped_rows(
+    streams: Iterable[Iterable[dict[str, Any]]],
+    key_fn: KeyFunction,
+    group_merger: GroupMerger,
+    *,
+    presorted: bool = False,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Merge streams group by group; returns merged rows and conflicts sorted by id."""
+    merged: list[dict[str, Any]] = []
+    conflicts: dict[str, dict[str, Any]] = {}
+    for key, rows in merge_key_groups(streams, key_fn, presorted=presorted):
+        item, group_conflicts = group_merger(key, rows)
+        merged.append(item)
+        for conflict in group_conflicts:
+            conflicts[conflict["conflict_id"]] = conflict
+    return merged, sorted(conflicts.values(), key=lambda item: item["conflict_id"])
+
+
+class IncrementalKeyedMerger:
+    """Per-node keyed rows plus merged output, re-merged only where a node changed.
+
+    ``sections`` maps a section name (``"assets"``, ...) to its key function
+    and per-key group merger. ``update`` replaces one node's rows and
+    re-merges just the keys whose rows from that node changed, gathering
+    the other nodes' rows for those keys from their indexes. Nodes keep the
+    position of their first ``update``, so results match merging all current
+    reports in that order.
+    """
+
+    def __init__(self, sections: dict[str, tuple[KeyFunction, GroupMerger]]) -> None:
+        if not sections:
+            raise AggregationError("at least one merge section is required")
+        self.sections = dict(sections)
+        self._nodes: dict[str, dict[str, dict[str, list[dict[str, Any]]]]] = {}
+        self._merged: dict[str, dict[str, tuple[dict[str, Any], list[dict[str, Any]]]]] = {name: {} for name in self.sections}
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def node_ids(self) -> list[str]:
+        return list(self._nodes)
+
+    def update(self, node_id: str, rows_by_section: dict[str, Iterable[dict[str, Any]]]) -> dict[str, int]:
+        """Replace ``node_id``'s rows; returns the number of re-merged keys per section."""
+        node_id = str(node_id)
+        previous = self._nodes.get(node_id, {})
+        indexed: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        for name, (key_fn, _merger) in self.sections.items():
+            groups: dict[str, list[dict[str, Any]]] = {}
+            for row in rows_by_section.get(name) or []:
+                groups.setdefault(key_fn(row), []).append(row)
+            indexed[name] = groups
+        self._nodes[node_id] = indexed
+        counts = {}
+        for name in self.sections:
+            before = previous.get(name, {})
+            after = indexed[name]
+            counts[name] = self._remerge(name, {key for key in before.keys() | after.keys() if before.get(key) != after.get(key)})
+        return counts
+
+    def remove(self, node_id: str) -> dict[str, int]:
+        previous = self._nodes.pop(str(node_id), None)
+        if previous is None:
+            return {name: 0 for name in self.sections}
+        return {name: self._remerge(name, set(previous.get(name, {}))) for name in self.sections}
+
+    def section(self, name: str) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Merged rows sorted by key and conflicts sorted by id for one section."""
+        if name not in self._merged:
+            raise AggregationError(f"unknown merge section: {name}")
+        merged = self._merged[name]
+        conflicts = {conflict["conflict_id"]: conflict for key in merged for conflict in merged[key][1]}
+        return [merged[key][0] for key in sorted(merged)], sorted(conflicts.values(), key=lambda item: item["conflict_id"])
+
+    def _remerge(self, name: str, keys: set[str]) -> int:
+        _key_fn, group_merger = self.sections[name]
+        merged = self._merged[name]
+        for key in keys:
+            rows = [row for node in self._nodes.values() for row in node[name].get(key, ())]
+            if rows:
+                merged[key] = group_merger(key, rows)
+            else:
+                merged.pop(key, None)
+        return len(keys)
+
+
+def _keyed_entries(
+    stream: Iterable[dict[str, Any]],
+    key_fn: KeyFunction,
+    index: int,
+) -> Iterator[tuple[str, int, int, dict[str, Any]]]:
+    for position, row in enumerate(stream):
+        yield key_fn(row), index, position, row
+
+
+def _checked_order(entries: Iterator[tuple[str, int, int, dict[str, Any]]], index: int) -> Iterator[tuple[str, int, int, dict[str, Any]]]:
+    previous = None
+    for entry in entries:
+        if previous is not None and entry[0] < previous:
+            raise AggregationError(f"presorted stream {index} is not ordered by key: {entry[0]!r} follows {previous!r}")
+        previous = entry[0]
+        yield entry
+
+
+def _entry_order(entry: tuple[str, int, int, dict[str, Any]]) -> tuple[str, int, int]:
+    return entry[0], entry[1], entry[2]
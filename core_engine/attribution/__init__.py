@@ -17,6 +17,7 @@ from core_engine.attribution.behavior_graph import (
     GRAPH_NODE_TYPES,
     GRAPH_RELATIONSHIP_TYPES,
     build_behavior_graph_model,
+    build_behavior_graph_models,
     deterministic_behavior_graph_json,
 )
 from core_engine.attribution.learning_profiles import (
@@ -90,6 +91,7 @@ __all__ = [
     "build_application_attribution_dashboard",
     "build_application_attribution_report",
     "build_behavior_graph_model",
+    "build_behavior_graph_models",
     "build_behavioral_signature_record",
     "build_behavioral_signature_records",
     "build_confidence_breakdown",
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from hashlib import sha256
-from typing import Any, Iterable
+from typing import Any, Iterable, Sequence
 
 from core_engine.attribution.confidence_models import ATTRIBUTION_SAFETY_FLAGS
 from core_engine.time_utils import normalize_timestamp, parse_utc_instant, utc_isoformat, utc_now_iso
@@ -91,6 +93,7 @@ INVESTIGATION_CHAIN_CATEGORIES = {
     "stability_monitoring_chain",
 }
 INVESTIGATION_CHAIN_PRIORITIES = {"critical", "high", "medium", "low"}
+DEFAULT_GRAPH_BATCH_CHUNK_SIZE = 256
 
 
 def build_behavior_graph_model(
@@ -105,15 +108,183 @@ def build_behavior_graph_model(
     generated_at: str | None = None,
 ) -> dict[str, Any]:
     """Build a deterministic metadata-only behavior graph for one observed service."""
+    return _build_behavior_graph(
+        observation,
+        classification_model=classification_model,
+        learning_profile=learning_profile,
+        learning_profile_history=learning_profile_history,
+        inputs=_behavior_graph_inputs(flows, findings, federated_intelligence),
+        generated_at=generated_at,
+    )
+
+
+def build_behavior_graph_models(
+    observations: Iterable[dict[str, Any]],
+    *,
+    classification_models: Sequence[dict[str, Any] | None] | None = None,
+    learning_profiles: Sequence[dict[str, Any] | None] | None = None,
+    learning_profile_histories: Sequence[dict[str, Any] | None] | None = None,
+    flows: Iterable[dict[str, Any]] | None = None,
+    findings: Iterable[dict[str, Any]] | None = None,
+    federated_intelligence: Iterable[dict[str, Any]] | None = None,
+    generated_at: str | None = None,
+    max_workers: int | None = 0,
+    chunk_size: int = DEFAULT_GRAPH_BATCH_CHUNK_SIZE,
+) -> list[dict[str, Any]]:
+    """Build behavior graphs for many observations that share flows, findings, and peer intelligence.
+
+    The shared inputs are indexed once: the fallback flow reference, the
+    deduplicated flow asset labels, and findings keyed by port and service
+    name, so each graph costs O(matching findings) instead of O(flows +
+    findings). Shared peer intelligence is normalized into federated
+    intelligence objects once per call; every graph still carries all of
+    them, but only copies them. Per-observation classification models and learning profiles
+    line up with ``observations`` by position. Results match calling
+    ``build_behavior_graph_model`` once per observation with the same
+    ``generated_at``.
+
+    With ``max_workers`` above 1, chunks of ``chunk_size`` observations are
+    built in a process pool. Each worker receives the shared index once
+    through its initializer.
+    """
+    rows = list(observations)
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+    timestamp = generated_at or _now()
+    items = [
+        (
+            observation,
+            _aligned(classification_models, index),
+            _aligned(learning_profiles, index),
+            _aligned(learning_profile_histories, index),
+        )
+        for index, observation in enumerate(rows)
+    ]
+    inputs = _behavior_graph_inputs(flows, findings, federated_intelligence, generated_at=timestamp)
+    if not max_workers or max_workers <= 1 or len(items) <= chunk_size:
+        return [_build_behavior_graph_item(item, inputs, timestamp) for item in items]
+    chunks = [items[offset : offset + chunk_size] for offset in range(0, len(items), chunk_size)]
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_graph_worker, initargs=(inputs, timestamp)) as executor:
+        return [graph for chunk in executor.map(_build_graph_chunk, chunks) for graph in chunk]
+
+
+@dataclass(frozen=True, slots=True)
+class _BehaviorGraphInputs:
+    flow_reference: str
+    flow_asset_labels: tuple[str, ...]
+    findings: tuple[dict[str, Any], ...]
+    findings_by_port: dict[str, tuple[int, ...]]
+    findings_by_service: dict[str, tuple[int, ...]]
+    peers: tuple[dict[str, Any], ...]
+    peer_objects: tuple[dict[str, Any], ...] | None
+    peer_objects_at: str
+
+    def matching_findings(self, observation: dict[str, Any]) -> list[dict[str, Any]]:
+        port = _port_label(observation)
+        service = _first_text(observation, ("service_name", "service", "program"))
+        indexes = set(self.findings_by_port.get(port, ()) if port != "-" else ())
+        if service != "-":
+            indexes.update(self.findings_by_service.get(service, ()))
+        return [self.findings[index] for index in sorted(indexes)]
+
+
+def _behavior_graph_inputs(
+    flows: Iterable[dict[str, Any]] | None,
+    findings: Iterable[dict[str, Any]] | None,
+    federated_intelligence: Iterable[dict[str, Any]] | None,
+    *,
+    generated_at: str | None = None,
+) -> _BehaviorGraphInputs:
+    flow_rows = [flow for flow in flows or [] if isinstance(flow, dict)]
+    flow_labels: list[str] = []
+    for flow in flow_rows:
+        flow_labels.extend(_list_text(flow, ("source_asset", "destination_asset", "peer_asset", "node_id")))
+    finding_rows = tuple(finding for finding in findings or [] if isinstance(finding, dict))
+    by_port: dict[str, list[int]] = {}
+    by_service: dict[str, list[int]] = {}
+    for index, finding in enumerate(finding_rows):
+        port = _port_label(finding)
+        if port != "-":
+            by_port.setdefault(port, []).append(index)
+        service = _first_text(finding, ("service_name", "service", "program"))
+        if service != "-":
+            by_service.setdefault(service, []).append(index)
+    peer_rows = tuple(_federated_rows(federated_intelligence))
+    peer_objects = None
+    peer_objects_at = ""
+    if generated_at is not None:
+        # Every graph of a batch shares generated_at, so shared peer rows are normalized once.
+        peer_objects_at = normalize_timestamp(generated_at, preserve_ambiguous=True)
+        peer_objects = tuple(
+            normalized
+            for normalized in (_normalize_federated_intelligence_object(row, generated_at=peer_objects_at) for row in peer_rows)
+            if normalized
+        )
+    return _BehaviorGraphInputs(
+        flow_reference=_first_flow_reference(flow_rows),
+        flow_asset_labels=tuple(_unique_text(flow_labels, limit=len(flow_labels) + 1)),
+        findings=finding_rows,
+        findings_by_port={key: tuple(value) for key, value in by_port.items()},
+        findings_by_service={key: tuple(value) for key, value in by_service.items()},
+        peers=peer_rows,
+        peer_objects=peer_objects,
+        peer_objects_at=peer_objects_at,
+    )
+
+
+_GRAPH_WORKER_STATE: tuple[_BehaviorGraphInputs, str] | None = None
+
+
+def _init_graph_worker(inputs: _BehaviorGraphInputs, timestamp: str) -> None:
+    global _GRAPH_WORKER_STATE
+    _GRAPH_WORKER_STATE = (inputs, timestamp)
+
+
+def _build_graph_chunk(items: list[tuple[Any, Any, Any, Any]]) -> list[dict[str, Any]]:
+    if _GRAPH_WORKER_STATE is None:
+        raise RuntimeError("behavior graph worker was not initialized")
+    inputs, timestamp = _GRAPH_WORKER_STATE
+    return [_build_behavior_graph_item(item, inputs, timestamp) for item in items]
+
+
+def _build_behavior_graph_item(item: tuple[Any, Any, Any, Any], inputs: _BehaviorGraphInputs, timestamp: str) -> dict[str, Any]:
+    observation, classification_model, learning_profile, learning_profile_history = item
+    return _build_behavior_graph(
+        observation,
+        classification_model=classification_model,
+        learning_profile=learning_profile,
+        learning_profile_history=learning_profile_history,
+        inputs=inputs,
+        generated_at=timestamp,
+    )
+
+
+def _aligned(values: Sequence[Any] | None, index: int) -> Any:
+    if values is None or index >= len(values):
+        return None
+    return values[index]
+
+
+def _build_behavior_graph(
+    observation: dict[str, Any],
+    *,
+    classification_model: dict[str, Any] | None,
+    learning_profile: dict[str, Any] | None,
+    learning_profile_history: dict[str, Any] | None,
+    inputs: _BehaviorGraphInputs,
+    generated_at: str | None,
+) -> dict[str, Any]:
     timestamp = normalize_timestamp(generated_at or _now(), preserve_ambiguous=True)
     classifier = classification_model if isinstance(classification_model, dict) else {}
     profile = learning_profile if isinstance(learning_profile, dict) else {}
     history = learning_profile_history if isinstance(learning_profile_history, dict) else {}
+    observed = observation if isinstance(observation, dict) else {}
+    shared_objects = inputs.peer_objects if inputs.peer_objects is not None and inputs.peer_objects_at == timestamp else None
     peer_intelligence = _federated_intelligence_inputs(
-        observation if isinstance(observation, dict) else {},
+        observed,
         classifier,
         history,
-        federated_intelligence,
+        inputs.peers if shared_objects is None else (),
     )
     if not isinstance(observation, dict) or not observation:
         return _graph_record(
@@ -122,6 +293,7 @@ def build_behavior_graph_model(
             edges=[],
             related={},
             peer_intelligence=peer_intelligence,
+            shared_peer_objects=shared_objects or (),
         )
 
     related_asset = _asset_label(observation)
@@ -146,7 +318,7 @@ def build_behavior_graph_model(
     profile_node = _add_node(nodes, "profile_node", related_profile) if related_profile != "-" else None
     peer_asset_nodes = [
         _add_node(nodes, "asset_node", label)
-        for label in _related_asset_labels(observation, flows)
+        for label in _related_asset_labels(observation, inputs.flow_asset_labels)
         if label != related_asset
     ]
     related_service_nodes = [
@@ -175,23 +347,23 @@ def build_behavior_graph_model(
         _add_edge(edges, "service_classified_as_application", service_node, application_node)
     if service_node and profile_node:
         _add_edge(edges, "service_linked_to_profile", service_node, profile_node)
-    if asset_node and service_node and _has_flow_metadata(observation, flows):
+    flow_reference = _observation_flow_reference(observation, inputs.flow_reference)
+    if asset_node and service_node and flow_reference != "-":
         _add_edge(
             edges,
             "asset_observed_flow",
             asset_node,
             service_node,
-            metadata={"flow_reference": _flow_reference(observation, flows)},
+            metadata={"flow_reference": flow_reference},
+        )
+    for finding in inputs.matching_findings(observation) if asset_node and service_node else []:
+        _add_edge(
+            edges,
+            "asset_observed_flow",
+            asset_node,
+            service_node,
+            metadata={"flow_reference": _safe_text(finding.get("finding") or finding.get("reason") or "finding")},
         )
-    for finding in findings or []:
-        if isinstance(finding, dict) and asset_node and service_node and _finding_matches_observation(finding, observation):
-            _add_edge(
-                edges,
-                "asset_observed_flow",
-                asset_node,
-                service_node,
-                metadata={"flow_reference": _safe_text(finding.get("finding") or finding.get("reason") or "finding")},
-            )
 
     _infer_relationships(
         relationships,
@@ -207,7 +379,7 @@ def build_behavior_graph_model(
         related_service_nodes=related_service_nodes,
         application_nodes=application_nodes,
         profile_nodes=profile_nodes,
-        flows=flows,
+        flow_reference=flow_reference,
     )
     node_rows = sorted(nodes.values(), key=lambda row: (row["node_type"], row["node_id"]))
     edge_rows = sorted(edges.values(), key=lambda row: (row["edge_type"], row["edge_id"]))
@@ -236,6 +408,7 @@ def build_behavior_graph_model(
             **related_identity,
         },
         peer_intelligence=peer_intelligence,
+        shared_peer_objects=shared_objects or (),
     )
 
 
@@ -252,6 +425,7 @@ def _graph_record(
     clusters: list[dict[str, Any]] | None = None,
     risk_context: dict[str, Any] | None = None,
     peer_intelligence: Iterable[dict[str, Any]] | None = None,
+    shared_peer_objects: Sequence[dict[str, Any]] = (),
     related: dict[str, str],
 ) -> dict[str, Any]:
     relationship_rows = relationships or []
@@ -311,6 +485,7 @@ def _graph_record(
         related=related,
         generated_at=timestamp,
         peer_intelligence=peer_intelligence,
+        shared_peer_objects=shared_peer_objects,
     )
     investigation_chains = _build_autonomous_investigation_chains(
         relationship_rows,
@@ -691,11 +866,10 @@ def _infer_relationships(
     related_service_nodes: list[dict[str, Any]],
     application_nodes: list[dict[str, Any]],
     profile_nodes: list[dict[str, Any]],
-    flows: Iterable[dict[str, Any]] | None,
+    flow_reference: str,
 ) -> None:
     port = _port_label(observation)
     protocol = _protocol_label(observation)
-    flow_reference = _flow_reference(observation, flows)
     risk_signals = _risk_signal_values(observation)
 
     if asset_node and application_node:
@@ -2231,27 +2405,29 @@ def _federated_intelligence_inputs(
     observation: dict[str, Any],
     classification_model: dict[str, Any],
     learning_profile_history: dict[str, Any],
-    explicit: Iterable[dict[str, Any]] | None,
+    shared: Iterable[dict[str, Any]],
 ) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
+    """Shared peer rows, then the observation's own peer metadata."""
+    rows = list(shared)
     for source in (
-        explicit,
         observation.get("federated_intelligence"),
         observation.get("federated_metadata"),
         observation.get("peer_intelligence"),
         classification_model.get("federated_intelligence"),
         learning_profile_history.get("federated_intelligence"),
     ):
-        if isinstance(source, dict):
-            source = source.get("items") or source.get("records") or source.get("intelligence") or [source]
-        if not isinstance(source, Iterable) or isinstance(source, (str, bytes)):
-            continue
-        for item in source:
-            if isinstance(item, dict):
-                rows.append(dict(item))
+        rows.extend(_federated_rows(source))
     return rows
 
 
+def _federated_rows(source: Any) -> list[dict[str, Any]]:
+    if isinstance(source, dict):
+        source = source.get("items") or source.get("records") or source.get("intelligence") or [source]
+    if not isinstance(source, Iterable) or isinstance(source, (str, bytes)):
+        return []
+    return [dict(item) for item in source if isinstance(item, dict)]
+
+
 def _build_federated_intelligence_model(
     relationships: list[dict[str, Any]],
     clusters: list[dict[str, Any]],
@@ -2266,7 +2442,9 @@ def _build_federated_intelligence_model(
     related: dict[str, str],
     generated_at: str,
     peer_intelligence: Iterable[dict[str, Any]] | None,
+    shared_peer_objects: Sequence[dict[str, Any]] = (),
 ) -> dict[str, Any]:
+    """Merge the local summary object, pre-normalized shared peer objects, then raw peer rows."""
     peer_rows = list(peer_intelligence or [])
     has_local_metadata = bool(
         relationships
@@ -2292,6 +2470,7 @@ def _build_federated_intelligence_model(
                 generated_at=generated_at,
             )
         )
+    objects.extend({**item, "metadata": dict(item["metadata"])} for item in shared_peer_objects)
     for item in peer_rows:
         normalized = _normalize_federated_intelligence_object(item, generated_at=generated_at)
         if normalized:
@@ -4140,12 +4319,10 @@ def _profile_label(profile: dict[str, Any], history: dict[str, Any]) -> str:
     return _safe_text(profile.get("profile_id") or history.get("profile_id"))
 
 
-def _related_asset_labels(observation: dict[str, Any], flows: Iterable[dict[str, Any]] | None) -> list[str]:
+def _related_asset_labels(observation: dict[str, Any], flow_asset_labels: Iterable[str]) -> list[str]:
     labels = _list_text(observation, ("related_assets", "peer_assets", "assets"))
     labels.extend(_list_text(observation, ("peer_asset", "source_asset", "destination_asset", "remote_asset")))
-    for flow in flows or []:
-        if isinstance(flow, dict):
-            labels.extend(_list_text(flow, ("source_asset", "destination_asset", "peer_asset", "node_id")))
+    labels.extend(flow_asset_labels)
     return _unique_text(labels)
 
 
@@ -4498,12 +4675,21 @@ def _first_text(observation: dict[str, Any], keys: tuple[str, ...]) -> str:
     return "-"
 
 
-def _has_flow_metadata(observation: dict[str, Any], flows: Iterable[dict[str, Any]] | None) -> bool:
-    return _flow_reference(observation, flows) != "-"
+def _observation_flow_reference(observation: dict[str, Any], fallback: str) -> str:
+    own_reference = _own_flow_reference(observation)
+    return own_reference if own_reference != "-" else fallback
 
 
-def _flow_reference(observation: dict[str, Any], flows: Iterable[dict[str, Any]] | None) -> str:
-    own_reference = _first_text(
+def _first_flow_reference(flows: Iterable[dict[str, Any]]) -> str:
+    for flow in flows:
+        reference = _first_text(flow, ("flow_id", "flow_key", "source", "destination", "dst", "peer"))
+        if reference != "-":
+            return reference
+    return "-"
+
+
+def _own_flow_reference(observation: dict[str, Any]) -> str:
+    return _first_text(
         observation,
         (
             "flow_id",
@@ -4517,25 +4703,6 @@ def _flow_reference(observation: dict[str, Any], flows: Iterable[dict[str, Any]]
             "peer",
         ),
     )
-    if own_reference != "-":
-        return own_reference
-    for flow in flows or []:
-        if not isinstance(flow, dict):
-            continue
-        reference = _first_text(flow, ("flow_id", "flow_key", "source", "destination", "dst", "peer"))
-        if reference != "-":
-            return reference
-    return "-"
-
-
-def _finding_matches_observation(finding: dict[str, Any], observation: dict[str, Any]) -> bool:
-    finding_port = _port_label(finding)
-    observation_port = _port_label(observation)
-    if finding_port != "-" and observation_port != "-" and finding_port == observation_port:
-        return True
-    finding_service = _first_text(finding, ("service_name", "service", "program"))
-    observation_service = _first_text(observation, ("service_name", "service", "program"))
-    return finding_service != "-" and observation_service != "-" and finding_service == observation_service
 
 
 def _safe_metadata(metadata: dict[str, Any]) -> dict[str, str]:
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Iterable
 
 from core_engine import config_loader
+from core_engine.log_tail import tail_jsonl
 from core_engine.time_utils import utc_now_iso
 
 AUDIT_EVENTS_FILENAME = "audit_events.jsonl"
@@ -113,14 +114,21 @@ def filter_audit_events(
     limit: int | None = None,
 ) -> list[dict[str, Any]]:
     root = log_dir or Path(config_loader.LOG_DIR)
+
+    def matches(event: dict[str, Any]) -> bool:
+        if node_id and event.get("node_id") != node_id:
+            return False
+        if event_type and event.get("event_type") != event_type:
+            return False
+        return True
+
     events: list[dict[str, Any]] = []
     for filename in filenames:
-        for event in read_jsonl_events(root / filename):
-            if node_id and event.get("node_id") != node_id:
-                continue
-            if event_type and event.get("event_type") != event_type:
-                continue
-            events.append(event)
+        if limit is not None and limit > 0:
+            # Audit files are append-only, so the newest matches sit at the end.
+            events.extend(tail_jsonl(root / filename, limit=limit, predicate=matches))
+            continue
+        events.extend(event for event in read_jsonl_events(root / filename) if matches(event))
     events.sort(key=lambda item: str(item.get("timestamp", "")))
     if limit is not None and limit >= 0:
         return events[-limit:]
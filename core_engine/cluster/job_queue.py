@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import heapq
+import json
 import time
 from dataclasses import dataclass, field
 from hashlib import sha256
-from typing import Any, Iterable
+from pathlib import Path
+from typing import Any, Callable, Iterable
 
 
 JOB_STATUSES = {"queued", "planned", "running", "completed", "partial", "failed", "cancelled"}
 TASK_STATUSES = {"queued", "planned", "assigned", "running", "completed", "failed", "retry"}
+READY_TASK_STATUSES = {"queued", "retry"}
+IN_FLIGHT_TASK_STATUSES = {"assigned", "running"}
+DEFAULT_LOG_COMPACT_RECORDS = 10_000
 
 
 @dataclass
@@ -23,6 +29,8 @@ class ClusterTask:
     max_retries: int = 1
     result: dict[str, Any] | None = None
     error: str | None = None
+    assigned_at: float | None = None
+    lease_expires_at: float | None = None
 
     @property
     def total_probes(self) -> int:
@@ -42,6 +50,8 @@ class ClusterTask:
             "total_probes": self.total_probes,
             "result": self.result,
             "error": self.error,
+            "assigned_at": self.assigned_at,
+            "lease_expires_at": self.lease_expires_at,
         }
 
 
@@ -109,38 +119,170 @@ class ClusterJob:
 
 
 class JobQueue:
-    """Small in-memory queue for distributed scan jobs and task outcomes."""
-
-    def __init__(self, jobs: Iterable[ClusterJob] | None = None):
+    """In-memory queue for distributed scan jobs and task outcomes.
+
+    Ready tasks sit in a per-scan-type heap ordered like the original scan
+    (job ``created_at``, submission order, task order), and every task is
+    indexed by id. With ``lease_seconds`` set, an assignment expires unless
+    the worker reports or renews it; expired leases count as a failed attempt
+    and go back to the ready heap. With ``steal_after_seconds`` set, a worker
+    that finds nothing ready takes over the longest-running task of another
+    worker once it has run that long. ``log_path`` appends every state change
+    to a JSONL log that is replayed on construction, so in-flight jobs survive
+    an orchestrator restart; initial ``jobs`` already restored from the log
+    are skipped. ``compact_log()`` rewrites the log to current state, and runs
+    on its own once ``compact_log_after`` records were appended since the
+    last rewrite (``None`` turns that off).
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[ClusterJob] | None = None,
+        *,
+        lease_seconds: float | None = None,
+        steal_after_seconds: float | None = None,
+        log_path: Path | str | None = None,
+        compact_log_after: int | None = DEFAULT_LOG_COMPACT_RECORDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.lease_seconds = float(lease_seconds) if lease_seconds else None
+        self.steal_after_seconds = float(steal_after_seconds) if steal_after_seconds else None
+        self.log_path = Path(log_path) if log_path else None
+        self.compact_log_after = int(compact_log_after) if compact_log_after else None
+        self._clock = clock
         self._jobs: dict[str, ClusterJob] = {}
+        self._tasks: dict[str, ClusterTask] = {}
+        self._order: dict[str, tuple[float, int, int]] = {}
+        self._ready: dict[str, list[tuple[tuple[float, int, int], str]]] = {}
+        self._leases: list[tuple[float, str, int]] = []
+        self._in_flight: dict[str, float] = {}
+        self._worker_tasks: dict[str, set[str]] = {}
+        self._capacity: dict[str, int] = {}
+        self._sequence = 0
+        self._replaying = False
+        self._log_appended = 0
+        if self.log_path is not None:
+            self._replay_log()
         for job in jobs or []:
-            self.submit(job)
+            if job.job_id not in self._jobs:
+                self.submit(job)
 
     def submit(self, job: ClusterJob) -> ClusterJob:
         if job.job_id in self._jobs:
             raise ValueError(f"job already exists: {job.job_id}")
         self._jobs[job.job_id] = job
+        sequence = self._sequence
+        self._sequence += 1
+        for index, task in enumerate(job.tasks):
+            self._tasks[task.task_id] = task
+            self._order[task.task_id] = (job.created_at, sequence, index)
+            if task.status in READY_TASK_STATUSES:
+                self._push_ready(task)
+            elif task.status in IN_FLIGHT_TASK_STATUSES:
+                self._track_in_flight(task)
+        self._log({"op": "submit", "job": _job_state(job)})
         return job
 
     def get(self, job_id: str) -> ClusterJob | None:
         return self._jobs.get(job_id)
 
+    def get_task(self, task_id: str) -> ClusterTask | None:
+        return self._tasks.get(task_id)
+
     def list_jobs(self) -> list[dict[str, Any]]:
         return [job.to_dict() for job in sorted(self._jobs.values(), key=lambda item: item.created_at)]
 
-    def assign_next(self, worker_id: str, *, scan_type: str = "tcp_connect") -> ClusterTask | None:
-        for job in sorted(self._jobs.values(), key=lambda item: item.created_at):
-            if job.scan_type != scan_type:
+    def ready_count(self, scan_type: str | None = None) -> int:
+        types = [scan_type] if scan_type is not None else list(self._ready)
+        return sum(
+            1
+            for name in types
+            for _order, task_id in self._ready.get(name, [])
+            if self._tasks[task_id].status in READY_TASK_STATUSES
+        )
+
+    def in_flight(self, worker_id: str) -> int:
+        return len(self._worker_tasks.get(worker_id, ()))
+
+    def assign_next(
+        self,
+        worker_id: str,
+        *,
+        scan_type: str = "tcp_connect",
+        capacity: int | None = None,
+    ) -> ClusterTask | None:
+        """Hand ``worker_id`` the next ready task, or steal a straggler when none is ready.
+
+        ``capacity`` (remembered per worker) caps how many tasks the worker
+        holds at once; ``None`` leaves it uncapped.
+        """
+        now = self._clock()
+        self.expire_leases(now=now)
+        if capacity is not None:
+            self._capacity[worker_id] = max(int(capacity), 0)
+        limit = self._capacity.get(worker_id)
+        if limit is not None and self.in_flight(worker_id) >= limit:
+            return None
+        task = self._pop_ready(scan_type)
+        if task is None:
+            task = self._steal(worker_id, scan_type, now)
+            if task is None:
+                return None
+        self._assign(task, worker_id, now)
+        return task
+
+    def assign_to_workers(self, workers: Iterable[Any], *, scan_type: str = "tcp_connect") -> list[dict[str, Any]]:
+        """Spread ready tasks over workers in proportion to their free capacity.
+
+        ``workers`` are ``ClusterWorker`` objects (or anything with ``node_id``
+        and ``available_capacity``); each round goes to the worker with the
+        most remaining headroom, so larger workers receive more tasks.
+        """
+        now = self._clock()
+        self.expire_leases(now=now)
+        headroom = []
+        for worker in workers:
+            node_id = str(getattr(worker, "node_id", "") or "")
+            free = int(getattr(worker, "available_capacity", 0) or 0) - self.in_flight(node_id)
+            if node_id and free > 0:
+                heapq.heappush(headroom, (-free, node_id))
+        assignments = []
+        while headroom:
+            negative_free, node_id = heapq.heappop(headroom)
+            task = self._pop_ready(scan_type)
+            if task is None:
+                break
+            self._assign(task, node_id, now)
+            assignments.append({"task_id": task.task_id, "worker_id": node_id, "attempts": task.attempts})
+            if negative_free + 1 < 0:
+                heapq.heappush(headroom, (negative_free + 1, node_id))
+        return assignments
+
+    def renew_lease(self, task_id: str) -> ClusterTask:
+        task = self._require_task(task_id)
+        if task.status in IN_FLIGHT_TASK_STATUSES and self.lease_seconds:
+            task.lease_expires_at = self._clock() + self.lease_seconds
+            heapq.heappush(self._leases, (task.lease_expires_at, task.task_id, task.attempts))
+            self._log({"op": "task", "task": _task_state(task)})
+        return task
+
+    def expire_leases(self, *, now: float | None = None) -> list[ClusterTask]:
+        """Requeue (or fail) assigned tasks whose lease deadline has passed."""
+        current = self._clock() if now is None else now
+        expired = []
+        while self._leases and self._leases[0][0] <= current:
+            deadline, task_id, attempts = heapq.heappop(self._leases)
+            task = self._tasks.get(task_id)
+            if (
+                task is None
+                or task.status not in IN_FLIGHT_TASK_STATUSES
+                or task.attempts != attempts
+                or task.lease_expires_at != deadline
+            ):
                 continue
-            for task in job.tasks:
-                if task.status not in {"queued", "retry"}:
-                    continue
-                task.status = "assigned"
-                task.assigned_worker = worker_id
-                task.attempts += 1
-                job.refresh_status()
-                return task
-        return None
+            self._settle(task, status="retry" if task.attempts <= task.max_retries else "failed", error="lease expired")
+            expired.append(task)
+        return expired
 
     def record_result(
         self,
@@ -149,18 +291,29 @@ class JobQueue:
         success: bool,
         result: dict[str, Any] | None = None,
         error: str | None = None,
+        worker_id: str | None = None,
     ) -> ClusterTask:
-        task = self._find_task(task_id)
+        """Store a task outcome; the first success wins.
+
+        Reports for a task that is not assigned or running (already settled,
+        or requeued after its lease expired) are ignored. When ``worker_id``
+        is given, a failure from a worker that no longer holds the task (it
+        was stolen or re-leased) is ignored too.
+        """
+        task = self._require_task(task_id)
+        if task.status not in IN_FLIGHT_TASK_STATUSES:
+            return task
+        if not success and worker_id is not None and task.assigned_worker not in {None, worker_id}:
+            return task
         task.result = result or {}
         task.error = error
         if success:
-            task.status = "completed"
+            status = "completed"
         elif task.attempts <= task.max_retries:
-            task.status = "retry"
+            status = "retry"
         else:
-            task.status = "failed"
-        job = self._jobs[task.job_id]
-        job.refresh_status()
+            status = "failed"
+        self._settle(task, status=status, error=error)
         return task
 
     def aggregate_results(self, job_id: str) -> dict[str, Any]:
@@ -185,18 +338,187 @@ class JobQueue:
             "automatic_changes": False,
         }
 
+    def compact_log(self) -> None:
+        """Rewrite the backing log so it holds one snapshot per job."""
+        if self.log_path is None:
+            return
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.log_path.with_name(self.log_path.name + ".tmp")
+        with open(temporary, "w", encoding="utf-8") as handle:
+            for job in sorted(self._jobs.values(), key=lambda item: item.created_at):
+                handle.write(json.dumps({"op": "submit", "job": _job_state(job)}, sort_keys=True, default=str) + "\n")
+        temporary.replace(self.log_path)
+        self._log_appended = 0
+
     def _require_job(self, job_id: str) -> ClusterJob:
         job = self._jobs.get(job_id)
         if job is None:
             raise KeyError(f"unknown cluster job: {job_id}")
         return job
 
-    def _find_task(self, task_id: str) -> ClusterTask:
-        for job in self._jobs.values():
-            for task in job.tasks:
-                if task.task_id == task_id:
-                    return task
-        raise KeyError(f"unknown cluster task: {task_id}")
+    def _require_task(self, task_id: str) -> ClusterTask:
+        task = self._tasks.get(task_id)
+        if task is None:
+            raise KeyError(f"unknown cluster task: {task_id}")
+        return task
+
+    def _push_ready(self, task: ClusterTask) -> None:
+        scan_type = self._jobs[task.job_id].scan_type
+        heapq.heappush(self._ready.setdefault(scan_type, []), (self._order[task.task_id], task.task_id))
+
+    def _pop_ready(self, scan_type: str) -> ClusterTask | None:
+        ready = self._ready.get(scan_type)
+        while ready:
+            _order, task_id = heapq.heappop(ready)
+            task = self._tasks[task_id]
+            if task.status in READY_TASK_STATUSES:
+                return task
+        return None
+
+    def _steal(self, worker_id: str, scan_type: str, now: float) -> ClusterTask | None:
+        if self.steal_after_seconds is None:
+            return None
+        for task_id, assigned_at in self._in_flight.items():
+            if now - assigned_at < self.steal_after_seconds:
+                break
+            task = self._tasks[task_id]
+            if task.assigned_worker != worker_id and self._jobs[task.job_id].scan_type == scan_type:
+                self._release(task)
+                return task
+        return None
+
+    def _assign(self, task: ClusterTask, worker_id: str, now: float) -> None:
+        task.status = "assigned"
+        task.assigned_worker = worker_id
+        task.attempts += 1
+        task.assigned_at = now
+        task.lease_expires_at = now + self.lease_seconds if self.lease_seconds else None
+        if task.lease_expires_at is not None:
+            heapq.heappush(self._leases, (task.lease_expires_at, task.task_id, task.attempts))
+        self._track_in_flight(task)
+        self._jobs[task.job_id].refresh_status()
+        self._log({"op": "task", "task": _task_state(task)})
+
+    def _settle(self, task: ClusterTask, *, status: str, error: str | None) -> None:
+        self._release(task)
+        task.status = status
+        task.error = error
+        task.lease_expires_at = None
+        if status in READY_TASK_STATUSES:
+            self._push_ready(task)
+        self._jobs[task.job_id].refresh_status()
+        self._log({"op": "task", "task": _task_state(task)})
+
+    def _track_in_flight(self, task: ClusterTask) -> None:
+        self._in_flight.pop(task.task_id, None)
+        self._in_flight[task.task_id] = task.assigned_at if task.assigned_at is not None else self._clock()
+        if task.assigned_worker:
+            self._worker_tasks.setdefault(task.assigned_worker, set()).add(task.task_id)
+        if task.lease_expires_at is not None and self._replaying:
+            heapq.heappush(self._leases, (task.lease_expires_at, task.task_id, task.attempts))
+
+    def _release(self, task: ClusterTask) -> None:
+        self._in_flight.pop(task.task_id, None)
+        held = self._worker_tasks.get(task.assigned_worker or "")
+        if held is not None:
+            held.discard(task.task_id)
+            if not held:
+                del self._worker_tasks[task.assigned_worker or ""]
+
+    def _log(self, entry: dict[str, Any]) -> None:
+        if self.log_path is None or self._replaying:
+            return
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry, sort_keys=True, default=str) + "\n")
+        self._log_appended += 1
+        if self.compact_log_after is not None and self._log_appended >= self.compact_log_after:
+            self.compact_log()
+
+    def _replay_log(self) -> None:
+        try:
+            lines = self.log_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+        jobs: dict[str, ClusterJob] = {}
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            if entry.get("op") == "submit" and isinstance(entry.get("job"), dict):
+                job = _job_from_state(entry["job"])
+                jobs[job.job_id] = job
+            elif entry.get("op") == "task" and isinstance(entry.get("task"), dict):
+                state = entry["task"]
+                job = jobs.get(str(state.get("job_id") or ""))
+                task = next((item for item in job.tasks if item.task_id == state.get("task_id")), None) if job else None
+                if task is not None:
+                    _apply_task_state(task, state)
+        self._replaying = True
+        try:
+            for job in jobs.values():
+                self.submit(job)
+        finally:
+            self._replaying = False
+        self._log_appended = max(len(lines) - len(jobs), 0)
+        for task in sorted(
+            (task for task in self._tasks.values() if task.status in IN_FLIGHT_TASK_STATUSES),
+            key=lambda item: item.assigned_at or 0.0,
+        ):
+            self._track_in_flight(task)
+
+
+def _task_state(task: ClusterTask) -> dict[str, Any]:
+    state = task.to_dict()
+    state.pop("total_probes", None)
+    return state
+
+
+def _job_state(job: ClusterJob) -> dict[str, Any]:
+    return {
+        "job_id": job.job_id,
+        "scan_type": job.scan_type,
+        "status": job.status,
+        "created_at": job.created_at,
+        "warnings": list(job.warnings),
+        "metadata": dict(job.metadata),
+        "tasks": [_task_state(task) for task in job.tasks],
+    }
+
+
+def _apply_task_state(task: ClusterTask, state: dict[str, Any]) -> None:
+    for name in ("status", "assigned_worker", "attempts", "max_retries", "result", "error", "assigned_at", "lease_expires_at"):
+        if name in state:
+            setattr(task, name, state[name])
+
+
+def _job_from_state(state: dict[str, Any]) -> ClusterJob:
+    job_id = str(state.get("job_id") or "")
+    tasks = []
+    for row in state.get("tasks") or []:
+        if not isinstance(row, dict):
+            continue
+        task = ClusterTask(
+            task_id=str(row.get("task_id") or ""),
+            job_id=job_id,
+            targets=list(row.get("targets") or []),
+            ports=list(row.get("ports") or []),
+            scan_type=str(row.get("scan_type") or "tcp_connect"),
+        )
+        _apply_task_state(task, row)
+        tasks.append(task)
+    return ClusterJob(
+        job_id=job_id,
+        scan_type=str(state.get("scan_type") or "tcp_connect"),
+        status=str(state.get("status") or "queued"),
+        created_at=float(state.get("created_at") or 0.0),
+        tasks=tasks,
+        warnings=list(state.get("warnings") or []),
+        metadata=dict(state.get("metadata") or {}),
+    )
 
 
 def make_job_id(scan_type: str, targets: Iterable[dict[str, Any]], ports: Iterable[int]) -> str:
@@ -210,7 +532,10 @@ def make_task_id(job_id: str, index: int, targets: Iterable[dict[str, Any]], por
 
 
 __all__ = [
+    "DEFAULT_LOG_COMPACT_RECORDS",
+    "IN_FLIGHT_TASK_STATUSES",
     "JOB_STATUSES",
+    "READY_TASK_STATUSES",
     "TASK_STATUSES",
     "ClusterJob",
     "ClusterTask",
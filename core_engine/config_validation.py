@@ -12,6 +12,7 @@ from core_engine.config_loader import load_node_config
 
 VALID_ROLES = {"orchestrator", "master", "worker"}
 VALID_REMEDIATION_MODES = {"prompt", "silent"}
+VALID_TELEMETRY_ENCODINGS = {"json", "compact", "auto"}
 
 
 @dataclass
@@ -267,6 +268,9 @@ def validate_config(
             result.add_warning("worker master_ip is empty; config is standalone/offline only")
         if config.get("port") is None:
             result.add_warning("worker port is empty; config is standalone/offline only")
+        encoding = config.get("telemetry_encoding")
+        if encoding is not None and encoding not in VALID_TELEMETRY_ENCODINGS:
+            result.add_error(f"telemetry_encoding must be one of: {', '.join(sorted(VALID_TELEMETRY_ENCODINGS))}")
     elif role == "master":
         if "listen_port" in config and "port" not in config:
             result.add_warning("listen_port is a legacy key; prefer port")
@@ -10,13 +10,19 @@ from core_engine.correlation.scoring import (
     score_delta_finding,
     summarize_delta_scores,
 )
+from core_engine.snapshot_diff import KeyedSnapshot, SnapshotIndexCache, SnapshotKeySpec, diff_rows
 
 
-def compare_baselines(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+def compare_baselines(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    index_cache: SnapshotIndexCache | None = None,
+) -> dict[str, Any]:
     findings: list[dict[str, Any]] = []
-    findings.extend(compare_asset_sets(baseline.get("assets"), current.get("assets")))
-    findings.extend(compare_service_sets(baseline.get("services"), current.get("services")))
-    findings.extend(compare_topology_sets(baseline.get("topology_edges"), current.get("topology_edges")))
+    findings.extend(compare_asset_sets(*_sections(baseline, current, "assets", _ASSET_SPEC, index_cache)))
+    findings.extend(compare_service_sets(*_sections(baseline, current, "services", _SERVICE_SPEC, index_cache)))
+    findings.extend(compare_topology_sets(*_sections(baseline, current, "topology_edges", _TOPOLOGY_SPEC, index_cache)))
     findings.extend(compare_finding_sets(baseline.get("findings"), current.get("findings")))
     scored = [_with_score(finding) for finding in findings]
     return {
@@ -33,11 +39,13 @@ def compare_baselines(baseline: dict[str, Any], current: dict[str, Any]) -> dict
     }
 
 
-def compare_asset_sets(baseline_assets: Iterable[dict[str, Any]] | None, current_assets: Iterable[dict[str, Any]] | None) -> list[dict[str, Any]]:
-    baseline = _index(_rows(baseline_assets), _asset_key)
-    current = _index(_rows(current_assets), _asset_key)
+def compare_asset_sets(
+    baseline_assets: Iterable[dict[str, Any]] | KeyedSnapshot | None,
+    current_assets: Iterable[dict[str, Any]] | KeyedSnapshot | None,
+) -> list[dict[str, Any]]:
+    baseline, current, delta = diff_rows(baseline_assets, current_assets, _ASSET_SPEC)
     findings: list[dict[str, Any]] = []
-    for key in sorted(set(current) - set(baseline)):
+    for key in delta.added:
         findings.append(_finding(
             "new_asset_observed",
             "medium",
@@ -47,7 +55,7 @@ def compare_asset_sets(baseline_assets: Iterable[dict[str, Any]] | None, current
             _source_refs(current[key]),
             confidence=_confidence(current[key]),
         ))
-    for key in sorted(set(baseline) - set(current)):
+    for key in delta.removed:
         findings.append(_finding(
             "asset_missing_from_current_window",
             "low",
@@ -57,7 +65,7 @@ def compare_asset_sets(baseline_assets: Iterable[dict[str, Any]] | None, current
             _source_refs(baseline[key]),
             confidence=_confidence(baseline[key]),
         ))
-    for key in sorted(set(baseline) & set(current)):
+    for key in delta.common():
         confidence = min(_confidence(baseline[key]), _confidence(current[key]))
         if 0 < confidence < 0.5:
             findings.append(_finding(
@@ -73,13 +81,12 @@ def compare_asset_sets(baseline_assets: Iterable[dict[str, Any]] | None, current
 
 
 def compare_service_sets(
-    baseline_services: Iterable[dict[str, Any]] | None,
-    current_services: Iterable[dict[str, Any]] | None,
+    baseline_services: Iterable[dict[str, Any]] | KeyedSnapshot | None,
+    current_services: Iterable[dict[str, Any]] | KeyedSnapshot | None,
 ) -> list[dict[str, Any]]:
-    baseline = _index(_rows(baseline_services), _service_key)
-    current = _index(_rows(current_services), _service_key)
+    baseline, current, delta = diff_rows(baseline_services, current_services, _SERVICE_SPEC)
     findings: list[dict[str, Any]] = []
-    for key in sorted(set(current) - set(baseline)):
+    for key in delta.added:
         findings.append(_finding(
             "new_service_observed",
             "medium",
@@ -89,7 +96,7 @@ def compare_service_sets(
             _source_refs(current[key]),
             confidence=_confidence(current[key]),
         ))
-    for key in sorted(set(baseline) - set(current)):
+    for key in delta.removed:
         findings.append(_finding(
             "service_missing_from_current_window",
             "low",
@@ -99,7 +106,7 @@ def compare_service_sets(
             _source_refs(baseline[key]),
             confidence=_confidence(baseline[key]),
         ))
-    for key in sorted(set(baseline) & set(current)):
+    for key in delta.common():
         before = _service_label(baseline[key])
         after = _service_label(current[key])
         if before and after and before != after:
@@ -116,13 +123,12 @@ def compare_service_sets(
 
 
 def compare_topology_sets(
-    baseline_edges: Iterable[dict[str, Any]] | None,
-    current_edges: Iterable[dict[str, Any]] | None,
+    baseline_edges: Iterable[dict[str, Any]] | KeyedSnapshot | None,
+    current_edges: Iterable[dict[str, Any]] | KeyedSnapshot | None,
 ) -> list[dict[str, Any]]:
-    baseline = _index(_rows(baseline_edges), _topology_key)
-    current = _index(_rows(current_edges), _topology_key)
+    baseline, current, delta = diff_rows(baseline_edges, current_edges, _TOPOLOGY_SPEC)
     findings: list[dict[str, Any]] = []
-    for key in sorted(set(current) - set(baseline)):
+    for key in delta.added:
         findings.append(_finding(
             "topology_relationship_added",
             "medium",
@@ -132,7 +138,7 @@ def compare_topology_sets(
             _source_refs(current[key]),
             confidence=_confidence(current[key]),
         ))
-    for key in sorted(set(baseline) - set(current)):
+    for key in delta.removed:
         findings.append(_finding(
             "topology_relationship_removed",
             "low",
@@ -219,8 +225,19 @@ def _rows(value: Any) -> list[dict[str, Any]]:
     return [item for item in value or [] if isinstance(item, dict)]
 
 
-def _index(rows: list[dict[str, Any]], key_fn) -> dict[str, dict[str, Any]]:
-    return {key_fn(row): row for row in rows}
+def _sections(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    field_name: str,
+    spec: SnapshotKeySpec,
+    cache: SnapshotIndexCache | None,
+) -> tuple[Any, Any]:
+    if cache is None:
+        return baseline.get(field_name), current.get(field_name)
+    return (
+        cache.index(baseline, lambda: _rows(baseline.get(field_name)), spec),
+        cache.index(current, lambda: _rows(current.get(field_name)), spec),
+    )
 
 
 def _asset_key(row: dict[str, Any]) -> str:
@@ -284,3 +301,13 @@ def _first(row: dict[str, Any], *keys: str) -> str:
         if value not in (None, ""):
             return str(value)
     return ""
+
+
+_ASSET_SPEC = SnapshotKeySpec(
+    "correlation.assets",
+    _asset_key,
+    content=_confidence,
+    flag=lambda confidence: 0 < confidence < 0.5,
+)
+_SERVICE_SPEC = SnapshotKeySpec("correlation.services", _service_key, content=_service_label)
+_TOPOLOGY_SPEC = SnapshotKeySpec("correlation.topology_edges", _topology_key)
@@ -1,12 +1,14 @@
 """Local event model and pipeline helpers for PortMap-AI."""
 
 from core_engine.events.bus import EventHandlerResult, LocalEventBus
+from core_engine.events.log import EventLogError, SegmentedEventLog
 from core_engine.events.models import (
     EVENT_TYPES,
     SEVERITIES,
     EventValidationError,
     LocalEvent,
     create_event,
+    create_events,
 )
 from core_engine.events.queue import LocalEventQueue
 from core_engine.events.serializer import event_from_dict, event_from_json, event_to_dict, event_to_json
@@ -15,11 +17,14 @@ __all__ = [
     "EVENT_TYPES",
     "SEVERITIES",
     "EventHandlerResult",
+    "EventLogError",
     "EventValidationError",
     "LocalEvent",
     "LocalEventBus",
     "LocalEventQueue",
+    "SegmentedEventLog",
     "create_event",
+    "create_events",
     "event_from_dict",
     "event_from_json",
     "event_to_dict",
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from itertools import count
-from threading import Lock
-from typing import Callable
+from pathlib import Path
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Any, Callable
+from uuid import uuid4
 
+from core_engine.events.log import SegmentedEventLog
 from core_engine.events.models import EVENT_TYPES, EventValidationError, LocalEvent
 from core_engine.events.queue import LocalEventQueue
+from core_engine.events.serializer import event_from_json, event_to_json
 
 
 EventHandler = Callable[[LocalEvent], None]
 
+DELIVERY_MODES = {"sync", "async"}
+OVERFLOW_POLICIES = {"block", "drop", "spill"}
+
 
 @dataclass(frozen=True)
 class EventHandlerResult:
@@ -18,86 +27,370 @@ class EventHandlerResult:
     event_type: str | None
     ok: bool
     error: str | None = None
+    queued: bool = False
+
+
+class _Subscription:
+    """One subscriber: its handler, filter and, for async delivery, its bounded queue."""
+
+    def __init__(
+        self,
+        subscription_id: str,
+        sequence: int,
+        handler: EventHandler,
+        event_type: str | None,
+        *,
+        mode: str,
+        max_pending: int,
+        overflow: str,
+        block_timeout: float | None,
+        spill_path: Path | None,
+    ) -> None:
+        self.subscription_id = subscription_id
+        self.sequence = sequence
+        self.handler = handler
+        self.event_type = event_type
+        self.mode = mode
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.spill_path = spill_path
+        self.pending: deque[tuple[LocalEvent, float]] = deque()
+        self.spilled_pending = 0
+        self.in_progress = 0
+        self.closed = False
+        self.lock = Lock()
+        self.condition = Condition(self.lock)
+        self.worker: Thread | None = None
+        self.delivered = 0
+        self.failed = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.last_error: str | None = None
+
+    def enqueue(self, event: LocalEvent) -> EventHandlerResult:
+        with self.condition:
+            if self.closed:
+                return self._result(False, "subscriber is closed; event dropped", dropped=True)
+            if self.spilled_pending or len(self.pending) >= self.max_pending:
+                if self.overflow == "spill":
+                    self._spill(event)
+                    return self._result(True, queued=True)
+                if self.overflow == "block":
+                    deadline = None if self.block_timeout is None else monotonic() + self.block_timeout
+                    while len(self.pending) >= self.max_pending and not self.closed:
+                        remaining = None if deadline is None else deadline - monotonic()
+                        if remaining is not None and remaining <= 0:
+                            break
+                        self.condition.wait(remaining)
+                if self.closed or len(self.pending) >= self.max_pending:
+                    return self._result(False, "subscriber queue full; event dropped", dropped=True)
+            self.pending.append((event, monotonic()))
+            self.condition.notify_all()
+        return self._result(True, queued=True)
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.pending and not self.spilled_pending and not self.closed:
+                    self.condition.wait()
+                if self.pending:
+                    batch = [self.pending.popleft()]
+                elif self.spilled_pending:
+                    batch = self._unspill()
+                else:
+                    return
+                self.in_progress = len(batch)
+                self.condition.notify_all()
+            for event, enqueued_at in batch:
+                error = _call_handler(self.handler, event)
+                with self.condition:
+                    self._record(error, monotonic() - enqueued_at)
+                    self.in_progress -= 1
+                    self.condition.notify_all()
+
+    def deliver_now(self, event: LocalEvent) -> EventHandlerResult:
+        started = monotonic()
+        try:
+            self.handler(event)
+        except Exception as exc:  # Handler failures must not interrupt delivery.
+            error = str(exc)
+            with self.lock:
+                self._record(error, monotonic() - started)
+            return EventHandlerResult(self.subscription_id, self.event_type, False, error)
+        latency = monotonic() - started
+        with self.lock:
+            self.delivered += 1
+            self.latency_total += latency
+            if latency > self.latency_max:
+                self.latency_max = latency
+        return EventHandlerResult(self.subscription_id, self.event_type, True)
+
+    def wait_idle(self, deadline: float | None) -> bool:
+        with self.condition:
+            while self.pending or self.spilled_pending or self.in_progress:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def metrics(self) -> dict[str, Any]:
+        with self.condition:
+            completed = self.delivered + self.failed
+            return {
+                "subscription_id": self.subscription_id,
+                "event_type": self.event_type,
+                "mode": self.mode,
+                "overflow": self.overflow,
+                "max_pending": self.max_pending if self.mode == "async" else 0,
+                "lag": len(self.pending) + self.spilled_pending + self.in_progress,
+                "spilled_pending": self.spilled_pending,
+                "delivered": self.delivered,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "spilled": self.spilled,
+                "average_latency_ms": round(1000 * self.latency_total / completed, 3) if completed else 0.0,
+                "max_latency_ms": round(1000 * self.latency_max, 3),
+                "last_error": self.last_error,
+            }
+
+    def _record(self, error: str | None, latency: float) -> None:
+        if error is None:
+            self.delivered += 1
+        else:
+            self.failed += 1
+            self.last_error = error
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def _spill(self, event: LocalEvent) -> None:
+        assert self.spill_path is not None
+        with self.spill_path.open("a", encoding="utf-8") as handle:
+            handle.write(f"{monotonic()!r}\t{event_to_json(event)}\n")
+        self.spilled_pending += 1
+        self.spilled += 1
+        self.condition.notify_all()
+
+    def _unspill(self) -> list[tuple[LocalEvent, float]]:
+        assert self.spill_path is not None
+        lines = self.spill_path.read_text(encoding="utf-8").splitlines()
+        self.spill_path.unlink()
+        self.spilled_pending = 0
+        batch = []
+        for line in lines:
+            enqueued_at, payload = line.split("\t", 1)
+            batch.append((event_from_json(payload), float(enqueued_at)))
+        return batch
+
+    def _result(self, ok: bool, error: str | None = None, *, queued: bool = False, dropped: bool = False) -> EventHandlerResult:
+        if dropped:
+            self.dropped += 1
+        return EventHandlerResult(self.subscription_id, self.event_type, ok, error, queued)
 
 
 class LocalEventBus:
-    """Local-only event bus with in-memory queue and handler isolation."""
+    """Local-only event bus with in-memory queue and handler isolation.
+
+    Subscribers are delivered to on the publisher's thread by default. With
+    ``mode="async"`` a subscriber gets its own bounded queue and worker
+    thread, so a slow handler no longer stalls publishers; ``overflow``
+    chooses what happens when its queue is full: ``"block"`` waits (up to
+    ``block_timeout``), ``"drop"`` discards the event, and ``"spill"``
+    appends it to a JSONL file under ``spill_dir`` that the worker reads
+    back in order once the queue drains. Spill file names carry a random
+    per-bus id, so buses sharing ``spill_dir`` (or a restarted process)
+    never read or remove each other's files.
+
+    With an ``event_log``, every published event is also appended to that
+    durable log, and ``replay`` can start from a log offset or timestamp
+    instead of the in-memory history.
+    """
 
-    def __init__(self, *, queue: LocalEventQueue | None = None, history_limit: int = 1000) -> None:
+    def __init__(
+        self,
+        *,
+        queue: LocalEventQueue | None = None,
+        history_limit: int = 1000,
+        spill_dir: str | Path | None = None,
+        event_log: SegmentedEventLog | None = None,
+    ) -> None:
         if history_limit < 0:
             raise ValueError("history_limit must be non-negative")
         self.queue = queue or LocalEventQueue()
         self.history_limit = history_limit
-        self._history: list[LocalEvent] = []
-        self._subscriptions: dict[str, tuple[str | None, EventHandler]] = {}
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.event_log = event_log
+        self._history: deque[LocalEvent] = deque(maxlen=history_limit)
+        self._subscriptions: dict[str, _Subscription] = {}
+        self._by_event_type: dict[str | None, list[_Subscription]] = {}
         self._ids = count(1)
+        self._spill_prefix = uuid4().hex[:16]
         self._lock = Lock()
 
-    def subscribe(self, handler: EventHandler, event_type: str | None = None) -> str:
+    def subscribe(
+        self,
+        handler: EventHandler,
+        event_type: str | None = None,
+        *,
+        mode: str = "sync",
+        max_pending: int = 1000,
+        overflow: str = "block",
+        block_timeout: float | None = None,
+    ) -> str:
         if not callable(handler):
             raise EventValidationError("event handler must be callable")
         if event_type is not None and event_type not in EVENT_TYPES:
             raise EventValidationError(f"unsupported event_type subscription: {event_type}")
-        subscription_id = f"sub-{next(self._ids)}"
+        if mode not in DELIVERY_MODES:
+            raise EventValidationError(f"unsupported delivery mode: {mode}")
+        if overflow not in OVERFLOW_POLICIES:
+            raise EventValidationError(f"unsupported overflow policy: {overflow}")
+        if max_pending < 1:
+            raise EventValidationError("max_pending must be at least 1")
+        if mode == "async" and overflow == "spill" and self.spill_dir is None:
+            raise EventValidationError("spill overflow requires a bus spill_dir")
+        sequence = next(self._ids)
+        subscription_id = f"sub-{sequence}"
+        spill_path = None
+        if mode == "async" and overflow == "spill":
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            spill_path = self.spill_dir / f"{self._spill_prefix}-{subscription_id}.spill.jsonl"
+        subscription = _Subscription(
+            subscription_id,
+            sequence,
+            handler,
+            event_type,
+            mode=mode,
+            max_pending=max_pending,
+            overflow=overflow,
+            block_timeout=block_timeout,
+            spill_path=spill_path,
+        )
+        if mode == "async":
+            subscription.worker = Thread(target=subscription.run, name=f"event-bus-{subscription_id}", daemon=True)
+            subscription.worker.start()
         with self._lock:
-            self._subscriptions[subscription_id] = (event_type, handler)
+            self._subscriptions[subscription_id] = subscription
+            self._by_event_type.setdefault(event_type, []).append(subscription)
         return subscription_id
 
     def unsubscribe(self, subscription_id: str) -> bool:
         with self._lock:
-            return self._subscriptions.pop(subscription_id, None) is not None
+            subscription = self._subscriptions.pop(subscription_id, None)
+            if subscription is None:
+                return False
+            self._by_event_type[subscription.event_type].remove(subscription)
+        subscription.close()
+        return True
 
     def publish(self, event: LocalEvent) -> list[EventHandlerResult]:
         if not isinstance(event, LocalEvent):
             raise EventValidationError("publish accepts LocalEvent objects only")
         self.queue.enqueue(event)
+        if self.event_log is not None:
+            self.event_log.append(event)
         with self._lock:
-            if self.history_limit > 0:
-                self._history.append(event)
-                if len(self._history) > self.history_limit:
-                    self._history = self._history[-self.history_limit :]
-            subscriptions = list(self._subscriptions.items())
+            self._history.append(event)
+            subscriptions = self._matching(event.event_type)
         return self._deliver(event, subscriptions)
 
     def consume(self, limit: int | None = None) -> list[LocalEvent]:
         return self.queue.drain(limit=limit)
 
-    def replay(self, handler: EventHandler | None = None, *, event_type: str | None = None) -> list[EventHandlerResult]:
+    def replay(
+        self,
+        handler: EventHandler | None = None,
+        *,
+        event_type: str | None = None,
+        from_offset: int | None = None,
+        since: str | None = None,
+    ) -> list[EventHandlerResult]:
         if event_type is not None and event_type not in EVENT_TYPES:
             raise EventValidationError(f"unsupported event_type replay: {event_type}")
         if handler is not None and not callable(handler):
             raise EventValidationError("event handler must be callable")
-        with self._lock:
-            history = list(self._history)
-            subscriptions = list(self._subscriptions.items())
+        if from_offset is not None or since is not None:
+            if self.event_log is None:
+                raise EventValidationError("offset or timestamp replay requires an event_log")
+            history = [event for _offset, event in self.event_log.iter_records(from_offset, since=since)]
+        else:
+            with self._lock:
+                history = list(self._history)
         events = [event for event in history if event_type is None or event.event_type == event_type]
         results: list[EventHandlerResult] = []
         if handler is not None:
+            replay = _Subscription(
+                "replay", 0, handler, event_type, mode="sync", max_pending=1, overflow="drop", block_timeout=None, spill_path=None
+            )
             for event in events:
-                results.extend(self._deliver(event, [("replay", (event_type, handler))]))
+                results.append(replay.deliver_now(event))
             return results
         for event in events:
+            with self._lock:
+                subscriptions = self._matching(event.event_type)
             results.extend(self._deliver(event, subscriptions))
         return results
 
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until async subscribers have handled everything queued; False on timeout."""
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._lock:
+            subscriptions = list(self._subscriptions.values())
+        return all(subscription.wait_idle(deadline) for subscription in subscriptions if subscription.mode == "async")
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Drain async subscribers, then stop their workers."""
+        drained = self.flush(timeout)
+        with self._lock:
+            subscriptions = list(self._subscriptions.values())
+        for subscription in subscriptions:
+            subscription.close()
+        for subscription in subscriptions:
+            if subscription.worker is not None:
+                subscription.worker.join(timeout)
+        return drained
+
+    def subscriber_metrics(self) -> list[dict[str, Any]]:
+        """Per-subscriber lag, delivery counters and handler latency."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.values())
+        return [subscription.metrics() for subscription in subscriptions]
+
     @property
     def history(self) -> list[LocalEvent]:
         with self._lock:
             return list(self._history)
 
-    def _deliver(
-        self,
-        event: LocalEvent,
-        subscriptions: list[tuple[str, tuple[str | None, EventHandler]]],
-    ) -> list[EventHandlerResult]:
+    def _matching(self, event_type: str) -> list[_Subscription]:
+        typed = self._by_event_type.get(event_type, [])
+        untyped = self._by_event_type.get(None, [])
+        if not typed:
+            return list(untyped)
+        if not untyped:
+            return list(typed)
+        return sorted([*typed, *untyped], key=lambda subscription: subscription.sequence)
+
+    def _deliver(self, event: LocalEvent, subscriptions: list[_Subscription]) -> list[EventHandlerResult]:
         results: list[EventHandlerResult] = []
-        for subscription_id, (event_type, handler) in subscriptions:
-            if event_type is not None and event_type != event.event_type:
-                continue
-            try:
-                handler(event)
-            except Exception as exc:  # Handler failures must not interrupt delivery.
-                results.append(EventHandlerResult(subscription_id, event_type, False, str(exc)))
+        for subscription in subscriptions:
+            if subscription.mode == "async":
+                results.append(subscription.enqueue(event))
             else:
-                results.append(EventHandlerResult(subscription_id, event_type, True))
+                results.append(subscription.deliver_now(event))
         return results
+
+
+def _call_handler(handler: EventHandler, event: LocalEvent) -> str | None:
+    try:
+        handler(event)
+    except Exception as exc:  # Handler failures must not interrupt delivery.
+        return str(exc)
+    return None
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from threading import RLock
+from typing import Any, Callable, Iterator
+
+from core_engine.events.models import LocalEvent
+from core_engine.events.serializer import event_from_json, event_to_json
+
+
+DEFAULT_SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_SEGMENT_MAX_AGE = 3600.0
+DEFAULT_INDEX_INTERVAL_BYTES = 4096
+CONSUMER_OFFSETS_FILE = "consumer_offsets.json"
+
+
+class EventLogError(ValueError):
+    """Raised when the durable event log is misused or its files are unreadable."""
+
+
+@dataclass(slots=True)
+class _Segment:
+    base_offset: int
+    path: Path
+    index_path: Path
+    created_at: float
+    next_offset: int
+    size: int = 0
+    max_timestamp: float = float("-inf")
+    # Sparse index: (offset, byte position, max event timestamp before that record).
+    index: list[tuple[int, int, float]] = field(default_factory=list)
+    index_offsets: list[int] = field(default_factory=list)
+    last_indexed_position: int = -1
+
+
+class SegmentedEventLog:
+    """Append-only on-disk event log split into size- and age-rolled segments.
+
+    Each segment ``<base_offset>.log`` holds one ``event_to_json`` record per
+    line; offsets are global and increase by one per event. A sparse
+    ``<base_offset>.index`` records the byte position and the running maximum
+    event timestamp every ``index_interval_bytes``, so ``read`` can seek to an
+    offset or timestamp and scan memory-mapped segments from there. Consumer
+    groups keep committed offsets in ``consumer_offsets.json``. Retention only
+    ever deletes whole, closed segments. On open, a torn trailing record left
+    by a crash is truncated and the active segment's index is rebuilt.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        segment_max_age: float = DEFAULT_SEGMENT_MAX_AGE,
+        index_interval_bytes: int = DEFAULT_INDEX_INTERVAL_BYTES,
+        fsync: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if segment_max_bytes < 1 or index_interval_bytes < 1:
+            raise EventLogError("segment_max_bytes and index_interval_bytes must be positive")
+        if segment_max_age <= 0:
+            raise EventLogError("segment_max_age must be positive")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.segment_max_age = segment_max_age
+        self.index_interval_bytes = index_interval_bytes
+        self.fsync = fsync
+        self.clock = clock
+        self._lock = RLock()
+        self._segments: list[_Segment] = []
+        self._handle = None
+        self._index_handle = None
+        self._offsets = self._load_offsets()
+        self._recover()
+
+    @property
+    def start_offset(self) -> int:
+        with self._lock:
+            return self._segments[0].base_offset if self._segments else 0
+
+    @property
+    def next_offset(self) -> int:
+        with self._lock:
+            return self._segments[-1].next_offset if self._segments else 0
+
+    def __len__(self) -> int:
+        return self.next_offset - self.start_offset
+
+    def append(self, event: LocalEvent) -> int:
+        return self.append_many([event])[0]
+
+    def append_many(self, events: list[LocalEvent]) -> list[int]:
+        """Append events in order; returns their offsets."""
+        encoded = [(event_to_json(event) + "\n").encode("utf-8") for event in events]
+        timestamps = [_event_time(event.timestamp) for event in events]
+        offsets: list[int] = []
+        with self._lock:
+            for record, timestamp in zip(encoded, timestamps):
+                segment = self._writable_segment(len(record))
+                if segment.last_indexed_position < 0 or segment.size - segment.last_indexed_position >= self.index_interval_bytes:
+                    self._add_index_entry(segment, segment.next_offset, segment.size, segment.max_timestamp)
+                self._handle.write(record)
+                offsets.append(segment.next_offset)
+                segment.next_offset += 1
+                segment.size += len(record)
+                segment.max_timestamp = max(segment.max_timestamp, timestamp)
+            self._flush()
+        return offsets
+
+    def read(
+        self,
+        offset: int | None = None,
+        *,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[int, LocalEvent]]:
+        """Return ``(offset, event)`` pairs from ``offset`` or with timestamps at or after ``since``."""
+        records = []
+        for record in self.iter_records(offset, since=since):
+            if limit is not None and len(records) >= limit:
+                break
+            records.append(record)
+        return records
+
+    def iter_records(self, offset: int | None = None, *, since: str | None = None) -> Iterator[tuple[int, LocalEvent]]:
+        since_time = _event_time(since) if since is not None else None
+        with self._lock:
+            self._flush()
+            segments = [(segment, segment.size, segment.next_offset) for segment in self._segments]
+        start = max(offset if offset is not None else 0, segments[0][0].base_offset if segments else 0)
+        for segment, size, end_offset in segments:
+            if end_offset <= start or size == 0:
+                continue
+            if since_time is not None and segment.max_timestamp < since_time:
+                continue
+            entry_offset, position = self._seek(segment, start, since_time)
+            for record_offset, event in _scan_segment(segment.path, size, entry_offset, position):
+                if record_offset < start:
+                    continue
+                if since_time is not None and _event_time(event.timestamp) < since_time:
+                    continue
+                yield record_offset, event
+
+    def poll(self, group: str, limit: int | None = None) -> list[tuple[int, LocalEvent]]:
+        """Read events after ``group``'s committed offset; call ``commit`` once handled."""
+        return self.read(self.committed(group), limit=limit)
+
+    def commit(self, group: str, offset: int) -> None:
+        """Record ``offset`` as the next offset ``group`` should read."""
+        if not isinstance(group, str) or not group.strip():
+            raise EventLogError("consumer group must be a non-empty string")
+        if offset < 0 or offset > self.next_offset:
+            raise EventLogError(f"offset {offset} is outside the log")
+        with self._lock:
+            self._offsets[group] = offset
+            _atomic_write_json(self.directory / CONSUMER_OFFSETS_FILE, self._offsets)
+
+    def committed(self, group: str) -> int:
+        with self._lock:
+            return max(self._offsets.get(group, 0), self.start_offset)
+
+    def consumer_lag(self) -> dict[str, int]:
+        with self._lock:
+            return {group: self.next_offset - self.committed(group) for group in sorted(self._offsets)}
+
+    def apply_retention(
+        self,
+        *,
+        max_segments: int | None = None,
+        max_bytes: int | None = None,
+        max_age: float | None = None,
+    ) -> dict[str, Any]:
+        """Delete the oldest closed segments beyond the given limits."""
+        deleted = []
+        with self._lock:
+            now = self.clock()
+            while len(self._segments) > 1:
+                oldest = self._segments[0]
+                closed = self._segments[1:]
+                over_count = max_segments is not None and len(self._segments) > max_segments
+                over_bytes = max_bytes is not None and sum(segment.size for segment in self._segments) > max_bytes
+                # Every record in a closed segment predates its successor's creation.
+                over_age = max_age is not None and now - closed[0].created_at > max_age
+                if not (over_count or over_bytes or over_age):
+                    break
+                oldest.path.unlink(missing_ok=True)
+                oldest.index_path.unlink(missing_ok=True)
+                self._segments.pop(0)
+                deleted.append({"base_offset": oldest.base_offset, "events": oldest.next_offset - oldest.base_offset, "bytes": oldest.size})
+        return {
+            "deleted_segments": len(deleted),
+            "deleted_events": sum(item["events"] for item in deleted),
+            "deleted_bytes": sum(item["bytes"] for item in deleted),
+            "start_offset": self.start_offset,
+            "automatic_changes": False,
+        }
+
+    def segments(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "base_offset": segment.base_offset,
+                    "next_offset": segment.next_offset,
+                    "bytes": segment.size,
+                    "index_entries": len(segment.index),
+                    "created_at": segment.created_at,
+                    "active": segment is self._segments[-1],
+                }
+                for segment in self._segments
+            ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            for handle in (self._handle, self._index_handle):
+                if handle is not None:
+                    handle.close()
+            self._handle = None
+            self._index_handle = None
+
+    def __enter__(self) -> "SegmentedEventLog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _writable_segment(self, record_size: int) -> _Segment:
+        segment = self._segments[-1] if self._segments else None
+        if segment is not None and segment.size > 0:
+            too_big = segment.size + record_size > self.segment_max_bytes
+            too_old = self.clock() - segment.created_at >= self.segment_max_age
+            if too_big or too_old:
+                segment = None
+        if segment is None:
+            segment = self._new_segment(self.next_offset)
+        if self._handle is None:
+            self._open_handles(segment)
+        return segment
+
+    def _new_segment(self, base_offset: int) -> _Segment:
+        self.close()
+        path = self.directory / f"{base_offset:020d}.log"
+        index_path = self.directory / f"{base_offset:020d}.index"
+        created_at = self.clock()
+        path.touch()
+        index_path.write_text(f"created {created_at!r}\n", encoding="utf-8")
+        segment = _Segment(base_offset, path, index_path, created_at, base_offset)
+        self._segments.append(segment)
+        return segment
+
+    def _open_handles(self, segment: _Segment) -> None:
+        self._handle = segment.path.open("ab")
+        self._index_handle = segment.index_path.open("a", encoding="utf-8")
+
+    def _add_index_entry(self, segment: _Segment, offset: int, position: int, max_timestamp: float) -> None:
+        segment.index.append((offset, position, max_timestamp))
+        segment.index_offsets.append(offset)
+        segment.last_indexed_position = position
+        self._index_handle.write(f"{offset} {position} {max_timestamp!r}\n")
+
+    def _flush(self) -> None:
+        for handle in (self._handle, self._index_handle):
+            if handle is not None:
+                handle.flush()
+                if self.fsync:
+                    os.fsync(handle.fileno())
+
+    def _seek(self, segment: _Segment, offset: int, since_time: float | None) -> tuple[int, int]:
+        if not segment.index:
+            return segment.base_offset, 0
+        position = max(bisect_right(segment.index_offsets, offset) - 1, 0)
+        if since_time is not None:
+            # Records before the last entry whose running max is below ``since`` are all older.
+            for candidate in range(position + 1, len(segment.index)):
+                if segment.index[candidate][2] >= since_time:
+                    break
+                position = candidate
+        entry_offset, byte_position, _max_timestamp = segment.index[position]
+        return entry_offset, byte_position
+
+    def _recover(self) -> None:
+        paths = sorted(self.directory.glob("*.log"))
+        for number, path in enumerate(paths):
+            base_offset = int(path.stem)
+            index_path = path.with_suffix(".index")
+            created_at, index = _read_index(index_path)
+            segment = _Segment(base_offset, path, index_path, created_at if created_at is not None else path.stat().st_mtime, base_offset)
+            if number + 1 < len(paths):
+                segment.next_offset = int(paths[number + 1].stem)
+                segment.size = path.stat().st_size
+                segment.index = index
+                segment.index_offsets = [entry[0] for entry in index]
+                segment.max_timestamp = _segment_max_timestamp(path, segment.size, index)
+                segment.last_indexed_position = index[-1][1] if index else -1
+            else:
+                self._rebuild_active(segment)
+            self._segments.append(segment)
+
+    def _rebuild_active(self, segment: _Segment) -> None:
+        size = segment.path.stat().st_size
+        valid = 0
+        offset = segment.base_offset
+        max_timestamp = float("-inf")
+        index: list[tuple[int, int, float]] = []
+        last_indexed = -1
+        with segment.path.open("rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    event = event_from_json(line.decode("utf-8"))
+                except (UnicodeDecodeError, ValueError):
+                    break
+                if last_indexed < 0 or valid - last_indexed >= self.index_interval_bytes:
+                    index.append((offset, valid, max_timestamp))
+                    last_indexed = valid
+                max_timestamp = max(max_timestamp, _event_time(event.timestamp))
+                valid += len(line)
+                offset += 1
+        if valid < size:
+            with segment.path.open("r+b") as handle:
+                handle.truncate(valid)
+        segment.size = valid
+        segment.next_offset = offset
+        segment.max_timestamp = max_timestamp
+        segment.index = index
+        segment.index_offsets = [entry[0] for entry in index]
+        segment.last_indexed_position = last_indexed
+        lines = [f"created {segment.created_at!r}\n"] + [f"{entry[0]} {entry[1]} {entry[2]!r}\n" for entry in index]
+        segment.index_path.write_text("".join(lines), encoding="utf-8")
+
+    def _load_offsets(self) -> dict[str, int]:
+        path = self.directory / CONSUMER_OFFSETS_FILE
+        if not path.exists():
+            return {}
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            raise EventLogError(f"unreadable consumer offsets: {exc}") from exc
+        return {str(group): int(offset) for group, offset in payload.items()}
+
+
+def _scan_segment(path: Path, size: int, offset: int, position: int) -> Iterator[tuple[int, LocalEvent]]:
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+        while position < size:
+            end = mapped.find(b"\n", position, size)
+            if end < 0:
+                return
+            yield offset, event_from_json(mapped[position:end].decode("utf-8"))
+            offset += 1
+            position = end + 1
+
+
+def _segment_max_timestamp(path: Path, size: int, index: list[tuple[int, int, float]]) -> float:
+    if size == 0:
+        return float("-inf")
+    offset, position, max_timestamp = index[-1] if index else (0, 0, float("-inf"))
+    for _offset, event in _scan_segment(path, size, offset, position):
+        max_timestamp = max(max_timestamp, _event_time(event.timestamp))
+    return max_timestamp
+
+
+def _read_index(path: Path) -> tuple[float | None, list[tuple[int, int, float]]]:
+    if not path.exists():
+        return None, []
+    created_at = None
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0] == "created":
+            created_at = float(parts[1])
+        elif len(parts) == 3:
+            entries.append((int(parts[0]), int(parts[1]), float(parts[2])))
+    return created_at, entries
+
+
+def _event_time(value: str | None) -> float:
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return float("-inf")
+
+
+def _atomic_write_json(path: Path, payload: dict[str, Any]) -> None:
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    os.replace(temporary, path)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import json
+import os
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
-from typing import Any
-from uuid import uuid4
+from typing import Any, Iterable
 
 
 EVENT_TYPES = frozenset(
@@ -35,7 +36,7 @@ class LocalEvent:
     severity: str
     source: str
     message: str
-    event_id: str = field(default_factory=lambda: f"evt-{uuid4().hex}")
+    event_id: str = field(default_factory=lambda: _event_id(os.urandom(16)))
     timestamp: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
     asset_ref: str | None = None
     service_ref: str | None = None
@@ -46,10 +47,22 @@ class LocalEvent:
     raw_payload_stored: bool = False
     automatic_changes: bool = False
     administrator_controlled: bool = True
+    _json: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         _validate_event(self)
 
+    def to_json(self) -> str:
+        """Compact, key-sorted JSON for this event, encoded once and then reused.
+
+        Events are treated as immutable once serialized, as the bus, event log
+        and integrations already do; mutating one afterwards leaves a stale
+        encoding.
+        """
+        if self._json is None:
+            self._json = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+        return self._json
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "event_id": self.event_id,
@@ -73,7 +86,7 @@ class LocalEvent:
     def from_dict(cls, payload: dict[str, Any]) -> "LocalEvent":
         if not isinstance(payload, dict):
             raise EventValidationError("event payload must be an object")
-        allowed = set(cls.__dataclass_fields__)
+        allowed = _EVENT_FIELDS
         unknown = sorted(set(payload) - allowed)
         if unknown:
             raise EventValidationError(f"unknown event fields: {', '.join(unknown)}")
@@ -111,6 +124,78 @@ def create_event(
     )
 
 
+def create_events(batch: Iterable[dict[str, Any]]) -> list[LocalEvent]:
+    """Create validated events from ``create_event`` keyword dicts in one pass.
+
+    Each field is validated column-wise across the whole batch before any
+    event is built, and the events share one creation timestamp. Errors name
+    the offending batch index.
+    """
+    rows = list(batch)
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise EventValidationError(f"events[{index}]: event payload must be an object")
+        unknown = row.keys() - _CREATE_FIELDS
+        if unknown:
+            raise EventValidationError(f"events[{index}]: unknown event fields: {', '.join(sorted(unknown))}")
+    _check_column(rows, "event_type", None, lambda value: isinstance(value, str) and value in EVENT_TYPES, "unsupported event_type: {value}")
+    _check_column(rows, "severity", "info", lambda value: isinstance(value, str) and value in SEVERITIES, "unsupported severity: {value}")
+    for field_name in ("source", "message"):
+        _check_column(rows, field_name, None, _non_empty_string, f"{field_name} must be a non-empty string")
+    for field_name in _REF_FIELDS:
+        _check_column(rows, field_name, None, _optional_string, f"{field_name} must be a string when provided")
+    _check_column(rows, "metadata", None, lambda value: not value or isinstance(value, dict), "metadata must be an object")
+
+    timestamp = datetime.now(UTC).isoformat()
+    entropy = os.urandom(16 * len(rows))
+    events = []
+    for index, row in enumerate(rows):
+        event = object.__new__(LocalEvent)
+        event.event_type = row["event_type"]
+        event.severity = row.get("severity", "info")
+        event.source = row["source"]
+        event.message = row["message"]
+        event.event_id = _event_id(entropy[16 * index : 16 * index + 16])
+        event.timestamp = timestamp
+        event.asset_ref = row.get("asset_ref")
+        event.service_ref = row.get("service_ref")
+        event.flow_ref = row.get("flow_ref")
+        event.snapshot_ref = row.get("snapshot_ref")
+        event.finding_ref = row.get("finding_ref")
+        event.metadata = row.get("metadata") or {}
+        event.raw_payload_stored = False
+        event.automatic_changes = False
+        event.administrator_controlled = True
+        event._json = None
+        events.append(event)
+    return events
+
+
+_EVENT_FIELDS = frozenset(item.name for item in fields(LocalEvent) if item.init)
+_REF_FIELDS = ("asset_ref", "service_ref", "flow_ref", "snapshot_ref", "finding_ref")
+_CREATE_FIELDS = frozenset({"event_type", "severity", "source", "message", "metadata", *_REF_FIELDS})
+
+
+def _event_id(entropy: bytes) -> str:
+    return f"evt-{entropy.hex()}"
+
+
+def _check_column(rows: list[dict[str, Any]], field_name: str, default: Any, valid: Any, message: str) -> None:
+    values = [row.get(field_name, default) for row in rows]
+    if all(map(valid, values)):
+        return
+    index = next(position for position, value in enumerate(values) if not valid(value))
+    raise EventValidationError(f"events[{index}]: " + message.format(value=values[index]))
+
+
+def _non_empty_string(value: Any) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def _optional_string(value: Any) -> bool:
+    return value is None or isinstance(value, str)
+
+
 def _validate_event(event: LocalEvent) -> None:
     if event.event_type not in EVENT_TYPES:
         raise EventValidationError(f"unsupported event_type: {event.event_type}")
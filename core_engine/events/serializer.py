@@ -17,8 +17,10 @@ def event_from_dict(payload: dict[str, Any]) -> LocalEvent:
 
 
 def event_to_json(event: LocalEvent) -> str:
+    if not isinstance(event, LocalEvent):
+        raise EventValidationError("expected LocalEvent")
     try:
-        return json.dumps(event_to_dict(event), sort_keys=True, separators=(",", ":"))
+        return event.to_json()
     except TypeError as exc:
         raise EventValidationError(f"event is not JSON serializable: {exc}") from exc
 
@@ -45,6 +45,8 @@ def build_operational_export_bundle(
     snapshot_rows = _collect_snapshots(repository, snapshots)
     topology_rows = _collect_topology_edges(repository, topology_edges)
     finding_rows, repository_review_rows = _collect_findings(repository, findings)
+    if review_store is None and repository is not None:
+        review_store = PersistentReviewStore(repository, migrate=False)
     review_rows = _collect_reviews(review_store, reviews, repository_review_rows)
     runtime_rows = [_runtime_payload(runtime_state, runtime_summary, generated_at=timestamp)]
     diagnostic_payload = diagnostic_summary_response(_rows(diagnostics), generated_at=timestamp)
@@ -166,6 +168,9 @@ def _collect_reviews(
     if review_store is not None:
         response = review_summary_response(review_store)
         rows.extend(_rows(response.get("items")))
+    if isinstance(review_store, PersistentReviewStore):
+        rows.extend(review_store.list_review_history())
+        rows.extend(review_store.list_finding_statuses())
     rows.extend(_rows(reviews))
     by_key: dict[str, dict[str, Any]] = {}
     for index, row in enumerate(_rows(rows)):
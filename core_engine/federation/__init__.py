@@ -71,6 +71,25 @@ from core_engine.federation.event_propagation import (
     normalize_event_payload,
     summarize_event_propagation_batch,
 )
+from core_engine.federation.anti_entropy import (
+    ANTI_ENTROPY_MESSAGE_TYPES,
+    CLUSTER_STATE_RECORD_KINDS,
+    DEFAULT_MERKLE_DEPTH,
+    AntiEntropyError,
+    ClusterStateMerkleTree,
+    LocalAntiEntropyPeer,
+    build_anti_entropy_message,
+    build_cluster_state_merkle_tree,
+    cluster_state_from_merkle_tree,
+    run_anti_entropy_sync,
+)
+from core_engine.federation.canonical_digest import (
+    DEFAULT_DIGEST_MEMO_ENTRIES,
+    CanonicalDigestMemo,
+    canonical_bytes,
+    canonical_digest,
+    canonical_digest_many,
+)
 from core_engine.federation.event_window import (
     EventPropagationWindowError,
     build_event_propagation_window,
@@ -141,6 +160,13 @@ from core_engine.federation.peer_registry import (
     deterministic_peer_registry_json,
     summarize_trusted_peer_registry,
 )
+from core_engine.federation.replay_protection import (
+    DEFAULT_REPLAY_BUCKET_COUNT,
+    REPLAY_PROTECTION_RECORD_VERSION,
+    ReplayProtectionCache,
+    ReplayProtectionError,
+    store_replay_protection,
+)
 from core_engine.federation.runtime_manager import (
     build_default_federation_loop_plans,
     build_federation_runtime_manager,
@@ -219,6 +245,18 @@ from core_engine.federation.trust import (
 
 __all__ = [
     "DEFAULT_REPLAY_WINDOW_SECONDS",
+    "DEFAULT_REPLAY_BUCKET_COUNT",
+    "ANTI_ENTROPY_MESSAGE_TYPES",
+    "AntiEntropyError",
+    "CLUSTER_STATE_RECORD_KINDS",
+    "ClusterStateMerkleTree",
+    "DEFAULT_MERKLE_DEPTH",
+    "LocalAntiEntropyPeer",
+    "DEFAULT_DIGEST_MEMO_ENTRIES",
+    "CanonicalDigestMemo",
+    "REPLAY_PROTECTION_RECORD_VERSION",
+    "ReplayProtectionCache",
+    "ReplayProtectionError",
     "DEFAULT_FEDERATION_THRESHOLDS",
     "DEFAULT_TRANSPORT_MODE",
     "EXCHANGE_STATUSES",
@@ -312,6 +350,7 @@ __all__ = [
     "build_peer_runtime_counters",
     "build_readiness_score_panel",
     "build_replay_window_metadata",
+    "store_replay_protection",
     "build_runtime_exchange_scheduler",
     "build_runtime_scheduler_validation_summary",
     "build_signature_metadata",
@@ -340,6 +379,13 @@ __all__ = [
     "copy_event_propagation_window",
     "create_trusted_transport_session",
     "deterministic_digest",
+    "build_anti_entropy_message",
+    "build_cluster_state_merkle_tree",
+    "cluster_state_from_merkle_tree",
+    "run_anti_entropy_sync",
+    "canonical_bytes",
+    "canonical_digest",
+    "canonical_digest_many",
     "deterministic_exchange_json",
     "deterministic_exchange_job_json",
     "deterministic_exchange_scheduler_json",
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from hashlib import sha256
+from typing import Any, Iterable
+
+from core_engine.federation.canonical_digest import canonical_digest
+from core_engine.federation.signing import SIGNING_SAFETY_FLAGS, canonical_json
+from core_engine.federation.transport import validate_trusted_transport_session
+
+
+ANTI_ENTROPY_RECORD_VERSION = 1
+CLUSTER_STATE_RECORD_KINDS = ("assets", "services", "edges", "findings")
+ANTI_ENTROPY_MESSAGE_TYPES = frozenset({"root_hash", "subtree_hashes", "bucket_leaves", "leaf_records", "apply_records"})
+DEFAULT_MERKLE_DEPTH = 3
+MERKLE_FANOUT = "0123456789abcdef"
+INACTIVE_TRANSPORT_STATUSES = frozenset({"expired", "closed", "rejected"})
+
+
+class AntiEntropyError(ValueError):
+    """Raised when anti-entropy state or messages are malformed."""
+
+
+class ClusterStateMerkleTree:
+    """Merkle tree over cluster-state records keyed by ``kind:record_id``.
+
+    Keys are spread over ``16 ** depth`` buckets by the hex prefix of their
+    SHA-256, so both peers agree on the tree shape without exchanging keys. A
+    bucket hashes its sorted ``key=leaf_hash`` lines. An inner node hashes its
+    non-empty children, and an empty subtree hashes to ``""``. Writes only
+    dirty the path from their bucket to the root, so rehashing after ``k``
+    changes costs ``O(k * depth * 16)``.
+
+    Deletions are kept as tombstone leaves so they propagate like any other
+    change. Conflicting versions of one key resolve last-writer-wins on
+    ``(updated_at, leaf_hash)``, so both peers choose the same winner.
+    """
+
+    def __init__(self, *, depth: int = DEFAULT_MERKLE_DEPTH) -> None:
+        if int(depth) <= 0:
+            raise AntiEntropyError("depth must be greater than zero")
+        self.depth = int(depth)
+        self._records: dict[str, dict[str, Any]] = {}
+        self._leaf_hashes: dict[str, str] = {}
+        self._buckets: dict[str, dict[str, str]] = {}
+        self._node_hashes: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def put(self, kind: str, record: dict[str, Any]) -> bool:
+        """Insert or replace a record; returns ``False`` when it loses last-writer-wins."""
+        key = record_key(kind, record)
+        return self.apply(key, dict(record))
+
+    def delete(self, kind: str, record_id: str, *, deleted_at: str | None = None) -> bool:
+        key = record_key(kind, {"record_id": record_id})
+        return self.apply(key, {"record_id": str(record_id), "deleted": True, "updated_at": deleted_at or _now()})
+
+    def apply(self, key: str, record: dict[str, Any]) -> bool:
+        """Merge ``record`` under ``key`` if it wins against the local version."""
+        leaf_hash = canonical_digest(record)
+        current = self._leaf_hashes.get(key)
+        if current == leaf_hash:
+            return False
+        if current is not None and _version(self._records[key], current) >= _version(record, leaf_hash):
+            return False
+        prefix = self.bucket_prefix(key)
+        self._records[key] = record
+        self._leaf_hashes[key] = leaf_hash
+        self._buckets.setdefault(prefix, {})[key] = leaf_hash
+        for length in range(self.depth + 1):
+            self._node_hashes.pop(prefix[:length], None)
+        return True
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self._records.get(key)
+
+    def records(self, kind: str, *, include_deleted: bool = False) -> list[dict[str, Any]]:
+        _kind(kind)
+        prefix = f"{kind}:"
+        return [
+            dict(self._records[key])
+            for key in sorted(self._records)
+            if key.startswith(prefix) and (include_deleted or not self._records[key].get("deleted"))
+        ]
+
+    def bucket_prefix(self, key: str) -> str:
+        return sha256(key.encode("utf-8")).hexdigest()[: self.depth]
+
+    def root_hash(self) -> str:
+        return self.node_hash("")
+
+    def node_hash(self, prefix: str) -> str:
+        cached = self._node_hashes.get(prefix)
+        if cached is not None:
+            return cached
+        if len(prefix) == self.depth:
+            leaves = self._buckets.get(prefix) or {}
+            material = "\n".join(f"{key}={leaves[key]}" for key in sorted(leaves))
+        else:
+            children = [(child, self.node_hash(child)) for child in self.child_prefixes(prefix)]
+            material = "\n".join(f"{child}={value}" for child, value in children if value)
+        value = sha256(material.encode("utf-8")).hexdigest() if material else ""
+        self._node_hashes[prefix] = value
+        return value
+
+    def child_prefixes(self, prefix: str) -> list[str]:
+        if len(prefix) >= self.depth:
+            return []
+        return [prefix + digit for digit in MERKLE_FANOUT]
+
+    def child_hashes(self, prefix: str) -> dict[str, str]:
+        """Non-empty child hashes of ``prefix``; absent children are empty."""
+        return {child: value for child in self.child_prefixes(prefix) if (value := self.node_hash(child))}
+
+    def bucket_leaves(self, prefix: str) -> dict[str, str]:
+        return dict(self._buckets.get(prefix) or {})
+
+
+def build_cluster_state_merkle_tree(
+    cluster_state: dict[str, Iterable[dict[str, Any]]],
+    *,
+    depth: int = DEFAULT_MERKLE_DEPTH,
+) -> ClusterStateMerkleTree:
+    """Build a tree from ``{"assets": [...], "services": [...], "edges": [...], "findings": [...]}``."""
+    tree = ClusterStateMerkleTree(depth=depth)
+    for kind in CLUSTER_STATE_RECORD_KINDS:
+        for record in cluster_state.get(kind) or []:
+            if isinstance(record, dict):
+                tree.put(kind, record)
+    return tree
+
+
+def cluster_state_from_merkle_tree(tree: ClusterStateMerkleTree) -> dict[str, list[dict[str, Any]]]:
+    return {kind: tree.records(kind) for kind in CLUSTER_STATE_RECORD_KINDS}
+
+
+def record_key(kind: str, record: dict[str, Any]) -> str:
+    _kind(kind)
+    record_id = str(record.get("record_id") or record.get(f"{kind[:-1]}_id") or record.get("id") or "")
+    if not record_id.strip():
+        raise AntiEntropyError(f"{kind} record requires record_id, {kind[:-1]}_id, or id")
+    return f"{kind}:{record_id}"
+
+
+class LocalAntiEntropyPeer:
+    """In-process stand-in for a remote node that answers anti-entropy messages.
+
+    Messages arrive as the JSON text a real transport would carry. Each one
+    must reference a transport session whose destination is this node and
+    whose status is still active.
+    """
+
+    def __init__(self, node_id: str, tree: ClusterStateMerkleTree) -> None:
+        self.node_id = str(node_id)
+        self.tree = tree
+
+    def handle(self, wire: str, *, transport_session: dict[str, Any], generated_at: str | None = None) -> str:
+        message = json.loads(wire)
+        _check_session(message, transport_session, node_id=self.node_id, generated_at=generated_at)
+        message_type = message.get("message_type")
+        body = message.get("body") if isinstance(message.get("body"), dict) else {}
+        if message_type == "root_hash":
+            reply: dict[str, Any] = {"root_hash": self.tree.root_hash(), "depth": self.tree.depth}
+        elif message_type == "subtree_hashes":
+            reply = {"children": {prefix: self.tree.child_hashes(prefix) for prefix in body.get("prefixes") or []}}
+        elif message_type == "bucket_leaves":
+            reply = {"leaves": {prefix: self.tree.bucket_leaves(prefix) for prefix in body.get("prefixes") or []}}
+        elif message_type == "leaf_records":
+            reply = {"records": {key: record for key in body.get("keys") or [] if (record := self.tree.get(key)) is not None}}
+        elif message_type == "apply_records":
+            applied = [key for key, record in sorted(dict(body.get("records") or {}).items()) if self.tree.apply(key, dict(record))]
+            reply = {"applied_keys": applied, "root_hash": self.tree.root_hash()}
+        else:
+            raise AntiEntropyError(f"unsupported anti-entropy message type: {message_type}")
+        return canonical_json(reply)
+
+
+def run_anti_entropy_sync(
+    local_tree: ClusterStateMerkleTree,
+    remote_peer: LocalAntiEntropyPeer,
+    *,
+    transport_session: dict[str, Any],
+    generated_at: str | None = None,
+) -> dict[str, Any]:
+    """Reconcile ``local_tree`` with ``remote_peer`` by exchanging only differing hashes and leaves.
+
+    The initiator descends from the root and asks only for the children of
+    subtrees whose hashes differ. At bucket depth it compares leaf hashes. It
+    then pulls the records it lacks or may be outdated on, and pushes back the
+    records the peer lacks or that win last-writer-wins. Round trips are
+    bounded by ``depth + 4``, and the bytes sent scale with the number of
+    differing leaves. The peer is only reached through the exchange; its
+    root hash after the push comes back in the ``apply_records`` reply.
+    """
+    timestamp = generated_at or _now()
+    exchange = _Exchange(remote_peer, transport_session, generated_at=timestamp)
+    root_before = local_tree.root_hash()
+    remote_summary = exchange.send("root_hash", {})
+    if remote_summary.get("depth") != local_tree.depth:
+        raise AntiEntropyError("peers must use the same Merkle depth")
+    remote_root = remote_summary["root_hash"]
+    differing_buckets: list[str] = []
+    if remote_root != root_before:
+        frontier = [""]
+        while frontier and len(frontier[0]) < local_tree.depth:
+            remote_children = exchange.send("subtree_hashes", {"prefixes": frontier})["children"]
+            next_frontier = []
+            for prefix in frontier:
+                local_children = local_tree.child_hashes(prefix)
+                theirs = remote_children.get(prefix) or {}
+                next_frontier.extend(child for child in sorted(set(local_children) | set(theirs)) if local_children.get(child) != theirs.get(child))
+            frontier = next_frontier
+        differing_buckets = frontier
+
+    pull_keys: list[str] = []
+    push_keys: list[str] = []
+    if differing_buckets:
+        remote_leaves = exchange.send("bucket_leaves", {"prefixes": differing_buckets})["leaves"]
+        for prefix in differing_buckets:
+            local_leaves = local_tree.bucket_leaves(prefix)
+            theirs = remote_leaves.get(prefix) or {}
+            for key in sorted(set(local_leaves) | set(theirs)):
+                if key not in theirs:
+                    push_keys.append(key)
+                elif local_leaves.get(key) != theirs[key]:
+                    pull_keys.append(key)
+
+    pulled = 0
+    if pull_keys:
+        remote_records = exchange.send("leaf_records", {"keys": pull_keys})["records"]
+        for key in pull_keys:
+            record = remote_records.get(key)
+            if record is None:
+                continue
+            if local_tree.apply(key, dict(record)):
+                pulled += 1
+            elif local_tree.get(key) is not None:
+                push_keys.append(key)
+    pushed = 0
+    remote_root_after = remote_root
+    if push_keys:
+        records = {key: local_tree.get(key) for key in sorted(set(push_keys))}
+        applied = exchange.send("apply_records", {"records": records})
+        pushed = len(applied["applied_keys"])
+        remote_root_after = applied["root_hash"]
+
+    root_after = local_tree.root_hash()
+    summary = {
+        "generated_at": timestamp,
+        "in_sync_before": remote_root == root_before,
+        "converged": root_after == remote_root_after,
+        "round_trip_count": exchange.round_trips,
+        "bytes_sent": exchange.bytes_sent,
+        "bytes_received": exchange.bytes_received,
+        "differing_bucket_count": len(differing_buckets),
+        "pulled_record_count": pulled,
+        "pushed_record_count": pushed,
+        "local_record_count": len(local_tree),
+        **SIGNING_SAFETY_FLAGS,
+    }
+    return {
+        "record_type": "federation_anti_entropy_sync",
+        "record_version": ANTI_ENTROPY_RECORD_VERSION,
+        "sync_id": _stable_id("anti-entropy-sync", transport_session.get("session_id"), root_before, remote_root, timestamp),
+        "transport_session_id": str(transport_session.get("session_id") or ""),
+        "source_node_id": str(transport_session.get("source_node_id") or ""),
+        "destination_node_id": str(transport_session.get("destination_node_id") or ""),
+        "local_root_before": root_before,
+        "remote_root_before": remote_root,
+        "root_after": root_after,
+        "summary": summary,
+        **SIGNING_SAFETY_FLAGS,
+    }
+
+
+def build_anti_entropy_message(
+    message_type: str,
+    body: dict[str, Any],
+    *,
+    transport_session: dict[str, Any],
+    sequence: int,
+) -> dict[str, Any]:
+    if message_type not in ANTI_ENTROPY_MESSAGE_TYPES:
+        raise AntiEntropyError(f"unsupported anti-entropy message type: {message_type}")
+    return {
+        "record_type": "federation_anti_entropy_message",
+        "record_version": ANTI_ENTROPY_RECORD_VERSION,
+        "message_type": message_type,
+        "sequence": int(sequence),
+        "transport_session_id": str(transport_session.get("session_id") or ""),
+        "source_node_id": str(transport_session.get("source_node_id") or ""),
+        "destination_node_id": str(transport_session.get("destination_node_id") or ""),
+        "trust_scope_label": str(transport_session.get("trust_scope_label") or ""),
+        "body": body,
+    }
+
+
+class _Exchange:
+    def __init__(self, peer: LocalAntiEntropyPeer, transport_session: dict[str, Any], *, generated_at: str) -> None:
+        self.peer = peer
+        self.transport_session = transport_session
+        self.generated_at = generated_at
+        self.round_trips = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def send(self, message_type: str, body: dict[str, Any]) -> dict[str, Any]:
+        message = build_anti_entropy_message(message_type, body, transport_session=self.transport_session, sequence=self.round_trips + 1)
+        wire = canonical_json(message)
+        reply = self.peer.handle(wire, transport_session=self.transport_session, generated_at=self.generated_at)
+        self.round_trips += 1
+        self.bytes_sent += len(wire.encode("utf-8"))
+        self.bytes_received += len(reply.encode("utf-8"))
+        return json.loads(reply)
+
+
+def _check_session(message: dict[str, Any], session: dict[str, Any], *, node_id: str, generated_at: str | None) -> None:
+    if not isinstance(message, dict) or message.get("record_type") != "federation_anti_entropy_message":
+        raise AntiEntropyError("anti-entropy message must be a federation_anti_entropy_message record")
+    validation = validate_trusted_transport_session(session, generated_at=generated_at)
+    if not validation["ok"]:
+        raise AntiEntropyError("; ".join(validation["errors"]))
+    if session.get("status") in INACTIVE_TRANSPORT_STATUSES or "transport session is expired" in validation["warnings"]:
+        raise AntiEntropyError("transport session is not active")
+    if message.get("transport_session_id") != session.get("session_id"):
+        raise AntiEntropyError("message does not belong to the transport session")
+    if session.get("destination_node_id") != node_id or message.get("destination_node_id") != node_id:
+        raise AntiEntropyError("message is not addressed to this node")
+
+
+def _version(record: dict[str, Any], leaf_hash: str) -> tuple[str, str]:
+    return (str(record.get("updated_at") or record.get("observed_at") or ""), leaf_hash)
+
+
+def _kind(kind: str) -> None:
+    if kind not in CLUSTER_STATE_RECORD_KINDS:
+        raise AntiEntropyError(f"unsupported cluster state record kind: {kind}")
+
+
+def _stable_id(prefix: str, *parts: Any) -> str:
+    return f"{prefix}-" + canonical_digest(parts).removeprefix("sha256:")[:16]
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Any, Hashable, Iterable
+
+
+DEFAULT_DIGEST_MEMO_ENTRIES = 4096
+
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
+
+
+def canonical_bytes(payload: Any) -> bytes:
+    """Encode ``payload`` the way ``digest_payload(json.loads(canonical_json(payload)))`` hashes it.
+
+    The old path serialized, parsed, and serialized again. Parsing only changes
+    the output when a mapping has non-string keys, which JSON stringifies after
+    sorting. Other payloads are encoded once with the C encoder. Payloads with
+    non-string keys fall back to the full round-trip, so digests do not change.
+    Encoding happens before the key scan, so circular payloads raise the same
+    error as before.
+    """
+    encoded = _CANONICAL_ENCODER.encode(payload)
+    if _has_non_string_keys(payload):
+        encoded = _CANONICAL_ENCODER.encode(json.loads(encoded))
+    return encoded.encode("utf-8")
+
+
+def canonical_digest(payload: Any) -> str:
+    return "sha256:" + sha256(canonical_bytes(payload)).hexdigest()
+
+
+class CanonicalDigestMemo:
+    """Bounded LRU of canonical digests keyed by object identity and a version token.
+
+    Only use the memo for records that are not mutated while they are cached.
+    Otherwise, pass a ``version`` that changes when the record changes. Entries
+    keep a reference to their payload, so an ``id()`` cannot be reused by a
+    different object while its entry is still cached. Signature and digest
+    verification must not go through the memo; it recomputes every digest.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_DIGEST_MEMO_ENTRIES) -> None:
+        if int(max_entries) <= 0:
+            raise ValueError("max_entries must be greater than zero")
+        self.max_entries = int(max_entries)
+        self._entries: OrderedDict[tuple[int, Hashable], tuple[Any, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def digest(self, payload: Any, *, version: Hashable = None) -> str:
+        key = (id(payload), version)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is payload:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = canonical_digest(payload)
+        self._entries[key] = (payload, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def canonical_digest_many(payloads: Iterable[Any], *, memo: CanonicalDigestMemo | None = None) -> list[str]:
+    """Digest a batch of payloads in order.
+
+    Repeated payload objects are hashed once, even when no ``memo`` is given.
+    """
+    digests: list[str] = []
+    local: dict[int, tuple[Any, str]] = {}
+    for payload in payloads:
+        if memo is not None:
+            digests.append(memo.digest(payload))
+            continue
+        entry = local.get(id(payload))
+        if entry is None or entry[0] is not payload:
+            entry = (payload, canonical_digest(payload))
+            local[id(payload)] = entry
+        digests.append(entry[1])
+    return digests
+
+
+def _has_non_string_keys(payload: Any) -> bool:
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key in value:
+                if type(key) is not str:
+                    return True
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
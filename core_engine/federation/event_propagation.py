@@ -8,6 +8,7 @@ from typing import Any, Iterable
 from core_engine.events import LocalEvent, event_from_dict, event_to_dict
 from core_engine.federation.event_window import copy_event_propagation_window, summarize_event_propagation_window
 from core_engine.federation.exchange import build_signed_runtime_summary_envelope, verify_signed_runtime_summary_envelope
+from core_engine.federation.replay_protection import ReplayProtectionCache, store_replay_protection
 from core_engine.federation.signing import SIGNING_RECORD_VERSION, SIGNING_SAFETY_FLAGS, build_verification_status_record, deterministic_digest
 
 
@@ -101,6 +102,9 @@ def apply_distributed_event_batch(
     timestamp = generated_at or _now()
     window = copy_event_propagation_window(propagation_window)
     transports = _transport_map(transport_sessions)
+    replay_cache = ReplayProtectionCache.from_window(window, observed_at=timestamp)
+    replay_cache.expire(timestamp)
+    seen_digests = set(window["seen_event_digests"])
     accepted: list[dict[str, Any]] = []
     rejected: list[dict[str, Any]] = []
     for envelope in sorted(_rows(event_envelopes), key=lambda item: (str(item.get("source_node_id") or ""), int(item.get("event_sequence") or 0), str(item.get("event_envelope_id") or ""))):
@@ -123,12 +127,12 @@ def apply_distributed_event_batch(
                 signed,
                 trust_profile=trust_profile,
                 transport_session=transport,
-                seen_nonces=window.get("seen_nonces") or [],
-                last_sequence_by_node=dict(window.get("last_sequence_by_node") or {}),
+                seen_nonces=replay_cache,
+                last_sequence_by_node=replay_cache.last_sequence_by_node,
                 generated_at=timestamp,
             )
         event_record = build_event_propagation_record(envelope, verified, generated_at=timestamp)
-        if event_record["propagation_status"] == "accepted" and event_record["event_digest"] in set(window.get("seen_event_digests") or []):
+        if event_record["propagation_status"] == "accepted" and event_record["event_digest"] in seen_digests:
             event_record = {
                 **event_record,
                 "propagation_status": "duplicate",
@@ -139,10 +143,12 @@ def apply_distributed_event_batch(
             }
         if event_record["propagation_status"] == "accepted":
             accepted.append(event_record)
-            _record_accepted_event(window, event_record)
+            _record_accepted_event(window, event_record, replay_cache=replay_cache, seen_digests=seen_digests, observed_at=timestamp)
         else:
             rejected.append(event_record)
             _record_rejected_event(window, event_record)
+    window["seen_event_digests"] = sorted(seen_digests)
+    store_replay_protection(window, replay_cache, now=timestamp)
     summary = summarize_event_propagation_batch(
         window=window,
         accepted_events=accepted,
@@ -336,11 +342,18 @@ def deterministic_event_propagation_json(record: dict[str, Any]) -> str:
     return json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
 
 
-def _record_accepted_event(window: dict[str, Any], record: dict[str, Any]) -> None:
+def _record_accepted_event(
+    window: dict[str, Any],
+    record: dict[str, Any],
+    *,
+    replay_cache: ReplayProtectionCache,
+    seen_digests: set[str],
+    observed_at: str,
+) -> None:
     node_id = record["source_node_id"]
     window["accepted_event_ids"].append(record["event_id"])
-    window["seen_event_digests"] = sorted(set([*window.get("seen_event_digests", []), record["event_digest"]]))
-    window["seen_nonces"] = sorted(set([*window.get("seen_nonces", []), record["nonce"]]))
+    seen_digests.add(record["event_digest"])
+    replay_cache.record(node_id, record["event_sequence"], record["nonce"], observed_at=observed_at)
     window["last_sequence_by_node"][node_id] = record["event_sequence"]
     window["last_event_digest_by_node"][node_id] = record["event_digest"]
     window["last_seen_event_by_node"][node_id] = {
@@ -4,6 +4,7 @@ import json
 from datetime import UTC, datetime
 from typing import Any, Iterable
 
+from core_engine.federation.replay_protection import ReplayProtectionCache
 from core_engine.federation.signing import (
     SIGNING_RECORD_VERSION,
     SIGNING_SAFETY_FLAGS,
@@ -302,7 +303,9 @@ def _validate_replay_hook(
     replay = envelope.get("replay_window") if isinstance(envelope.get("replay_window"), dict) else {}
     if not nonce:
         errors.append("nonce is required")
-    if nonce and nonce in set(str(item) for item in seen_nonces or []):
+    if not isinstance(seen_nonces, (set, frozenset, ReplayProtectionCache)):
+        seen_nonces = set(str(item) for item in seen_nonces or [])
+    if nonce and nonce in seen_nonces:
         errors.append("nonce has already been seen in replay window")
     if not isinstance(sequence, int) or sequence < 0:
         errors.append("sequence must be a non-negative integer")
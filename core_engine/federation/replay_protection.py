@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from collections import deque
+from datetime import UTC, datetime
+from typing import Any
+
+from core_engine.federation.signing import SIGNING_SAFETY_FLAGS
+
+
+REPLAY_PROTECTION_RECORD_VERSION = 1
+DEFAULT_REPLAY_BUCKET_COUNT = 10
+
+
+class ReplayProtectionError(ValueError):
+    """Raised when replay-protection state is malformed."""
+
+
+class ReplayProtectionCache:
+    """Time-bucketed nonce set plus per-node sequence high-water marks.
+
+    Nonces are filed into buckets of ``replay_window_seconds / bucket_count``
+    seconds and dropped once their whole bucket is older than the replay
+    window, so membership stays O(1) and the set stays bounded by the traffic
+    of one window. A nonce is therefore remembered for at least
+    ``replay_window_seconds`` and at most one bucket longer. Envelopes older
+    than the window are already rejected by their replay-window timestamps.
+    """
+
+    def __init__(
+        self,
+        *,
+        replay_window_seconds: int = 300,
+        bucket_count: int = DEFAULT_REPLAY_BUCKET_COUNT,
+        last_sequence_by_node: dict[str, int] | None = None,
+    ) -> None:
+        if int(replay_window_seconds) <= 0:
+            raise ReplayProtectionError("replay_window_seconds must be greater than zero")
+        if int(bucket_count) <= 0:
+            raise ReplayProtectionError("bucket_count must be greater than zero")
+        self.replay_window_seconds = int(replay_window_seconds)
+        self.bucket_seconds = max(1, self.replay_window_seconds // int(bucket_count))
+        self._buckets: deque[tuple[int, set[str]]] = deque()
+        self._nonce_bucket: dict[str, int] = {}
+        self.last_sequence_by_node: dict[str, int] = {str(key): int(value) for key, value in dict(last_sequence_by_node or {}).items()}
+
+    def __contains__(self, nonce: object) -> bool:
+        return str(nonce) in self._nonce_bucket
+
+    def __iter__(self):
+        return iter(self._nonce_bucket)
+
+    def __len__(self) -> int:
+        return len(self._nonce_bucket)
+
+    def add_nonce(self, nonce: str, *, observed_at: str | None = None) -> bool:
+        """Remember ``nonce``; returns ``False`` when it is already live."""
+        nonce = str(nonce or "")
+        if not nonce.strip():
+            return False
+        if nonce in self._nonce_bucket:
+            return False
+        index = _epoch_seconds(observed_at) // self.bucket_seconds
+        bucket = self._bucket(index)
+        bucket.add(nonce)
+        self._nonce_bucket[nonce] = index
+        return True
+
+    def sequence_is_fresh(self, node_id: str, sequence: int) -> bool:
+        last = self.last_sequence_by_node.get(str(node_id))
+        return last is None or int(sequence) > last
+
+    def record(self, node_id: str, sequence: int, nonce: str, *, observed_at: str | None = None) -> None:
+        node = str(node_id)
+        self.last_sequence_by_node[node] = max(int(sequence), self.last_sequence_by_node.get(node, int(sequence)))
+        self.add_nonce(nonce, observed_at=observed_at)
+
+    def expire(self, now: str | None = None) -> int:
+        """Drop buckets that ended more than ``replay_window_seconds`` before ``now``."""
+        cutoff = _epoch_seconds(now) - self.replay_window_seconds
+        dropped = 0
+        while self._buckets and (self._buckets[0][0] + 1) * self.bucket_seconds <= cutoff:
+            _index, nonces = self._buckets.popleft()
+            for nonce in nonces:
+                self._nonce_bucket.pop(nonce, None)
+            dropped += len(nonces)
+        return dropped
+
+    def sorted_nonces(self) -> list[str]:
+        return sorted(self._nonce_bucket)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Compact persisted form: one row per live bucket."""
+        return {
+            "record_type": "federation_replay_protection",
+            "record_version": REPLAY_PROTECTION_RECORD_VERSION,
+            "replay_window_seconds": self.replay_window_seconds,
+            "bucket_seconds": self.bucket_seconds,
+            "buckets": [[index, sorted(nonces)] for index, nonces in self._buckets if nonces],
+            "last_sequence_by_node": dict(sorted(self.last_sequence_by_node.items())),
+            **SIGNING_SAFETY_FLAGS,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "ReplayProtectionCache":
+        if not isinstance(payload, dict):
+            raise ReplayProtectionError("replay protection state must be an object")
+        window = int(payload.get("replay_window_seconds") or 0)
+        bucket_seconds = int(payload.get("bucket_seconds") or 0)
+        if window <= 0 or bucket_seconds <= 0:
+            raise ReplayProtectionError("replay protection state requires positive window and bucket sizes")
+        cache = cls(replay_window_seconds=window, last_sequence_by_node=payload.get("last_sequence_by_node"))
+        cache.bucket_seconds = bucket_seconds
+        for row in payload.get("buckets") or []:
+            if not isinstance(row, (list, tuple)) or len(row) != 2:
+                raise ReplayProtectionError("replay protection buckets must be [index, nonces] pairs")
+            index = int(row[0])
+            bucket = cache._bucket(index)
+            for nonce in row[1] or []:
+                nonce = str(nonce)
+                if nonce.strip() and nonce not in cache._nonce_bucket:
+                    bucket.add(nonce)
+                    cache._nonce_bucket[nonce] = index
+        return cache
+
+    @classmethod
+    def from_window(cls, window: dict[str, Any], *, observed_at: str | None = None) -> "ReplayProtectionCache":
+        """Load a sync or event window, seeding legacy ``seen_nonces`` at ``observed_at``."""
+        state = window.get("replay_protection")
+        if isinstance(state, dict) and state.get("buckets") is not None:
+            cache = cls.from_dict(state)
+        else:
+            cache = cls(replay_window_seconds=int(window.get("replay_window_seconds") or 300))
+        for node, sequence in dict(window.get("last_sequence_by_node") or {}).items():
+            cache.last_sequence_by_node[str(node)] = max(int(sequence), cache.last_sequence_by_node.get(str(node), int(sequence)))
+        for nonce in window.get("seen_nonces") or []:
+            cache.add_nonce(str(nonce), observed_at=observed_at)
+        return cache
+
+    def _bucket(self, index: int) -> set[str]:
+        if self._buckets and self._buckets[-1][0] == index:
+            return self._buckets[-1][1]
+        if not self._buckets or self._buckets[-1][0] < index:
+            bucket: set[str] = set()
+            self._buckets.append((index, bucket))
+            return bucket
+        for existing, nonces in self._buckets:
+            if existing == index:
+                return nonces
+        bucket = set()
+        self._buckets = deque(sorted([*self._buckets, (index, bucket)], key=lambda item: item[0]))
+        return bucket
+
+
+def store_replay_protection(window: dict[str, Any], cache: ReplayProtectionCache, *, now: str | None = None) -> None:
+    """Expire ``cache`` and write it back to ``window`` in persisted form."""
+    cache.expire(now)
+    window["seen_nonces"] = cache.sorted_nonces()
+    window["replay_protection"] = cache.to_dict()
+
+
+def _epoch_seconds(value: str | None) -> int:
+    if not value:
+        return int(datetime.now(UTC).timestamp())
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise ReplayProtectionError(f"invalid timestamp: {value}") from exc
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return int(parsed.timestamp())
+
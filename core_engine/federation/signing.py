@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime
+from hashlib import sha256
 from typing import Any
 
-from core_engine.export.node_manifest import digest_payload
+from core_engine.federation.canonical_digest import canonical_bytes, canonical_digest
 from core_engine.federation.trust import TRUST_SAFETY_FLAGS, normalize_node_identity_reference
 
 
@@ -29,19 +30,20 @@ def canonical_json(payload: Any) -> str:
 
 
 def deterministic_digest(payload: Any) -> str:
-    return digest_payload(json.loads(canonical_json(payload)))
+    return canonical_digest(payload)
 
 
 def build_payload_digest_record(payload: Any, *, generated_at: str | None = None) -> dict[str, Any]:
     timestamp = generated_at or _now()
     canonical = canonical_json(payload)
+    material = canonical_bytes(payload)
     return {
         "record_type": "federation_payload_digest",
         "record_version": SIGNING_RECORD_VERSION,
         "digest_algorithm": "sha256",
         "canonicalization": "json-sort-keys-compact",
         "canonical_size_bytes": len(canonical.encode("utf-8")),
-        "payload_digest": digest_payload(json.loads(canonical)),
+        "payload_digest": "sha256:" + sha256(material).hexdigest(),
         "generated_at": timestamp,
         **SIGNING_SAFETY_FLAGS,
     }
@@ -7,6 +7,7 @@ from typing import Any, Iterable
 
 from core_engine.federation.cluster_state import build_cluster_sync_dashboard_status, build_merged_cluster_state
 from core_engine.federation.exchange import verify_signed_runtime_summary_envelope
+from core_engine.federation.replay_protection import ReplayProtectionCache, store_replay_protection
 from core_engine.federation.signing import SIGNING_RECORD_VERSION, SIGNING_SAFETY_FLAGS, build_verification_status_record
 
 
@@ -72,6 +73,8 @@ def apply_signed_summary_updates(
     timestamp = generated_at or _now()
     window = _copy_window(sync_window)
     transports = _transport_map(transport_sessions)
+    replay_cache = ReplayProtectionCache.from_window(window, observed_at=timestamp)
+    replay_cache.expire(timestamp)
     accepted: list[dict[str, Any]] = []
     rejected: list[dict[str, Any]] = []
     conflicts: list[dict[str, Any]] = []
@@ -96,15 +99,15 @@ def apply_signed_summary_updates(
                 envelope,
                 trust_profile=trust_profile,
                 transport_session=transport,
-                seen_nonces=window.get("seen_nonces") or [],
-                last_sequence_by_node=dict(window.get("last_sequence_by_node") or {}),
+                seen_nonces=replay_cache,
+                last_sequence_by_node=replay_cache.last_sequence_by_node,
                 generated_at=timestamp,
             )
         update = build_cluster_state_update_envelope(verified, generated_at=timestamp)
         if update["update_status"] == "accepted":
             previous_digest = _last_digest_for_scope(window, update["source_node_id"], update["trust_scope_label"])
             accepted.append(update)
-            _record_accepted_update(window, update)
+            _record_accepted_update(window, update, replay_cache=replay_cache, observed_at=timestamp)
             if previous_digest and previous_digest != update["payload_digest"]:
                 drift.append(
                     build_sync_conflict_record(
@@ -125,6 +128,7 @@ def apply_signed_summary_updates(
                     generated_at=timestamp,
                 )
             )
+    store_replay_protection(window, replay_cache, now=timestamp)
 
     merged_state = build_merged_cluster_state(accepted, expected_nodes=expected_nodes, generated_at=timestamp)
     summary = summarize_live_cluster_sync(
@@ -290,11 +294,11 @@ def deterministic_sync_json(record: dict[str, Any]) -> str:
     return json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
 
 
-def _record_accepted_update(window: dict[str, Any], update: dict[str, Any]) -> None:
+def _record_accepted_update(window: dict[str, Any], update: dict[str, Any], *, replay_cache: ReplayProtectionCache, observed_at: str) -> None:
     node_id = update["source_node_id"]
     scope = update["trust_scope_label"]
     window["accepted_update_ids"].append(update["update_id"])
-    window["seen_nonces"] = sorted(set([*window.get("seen_nonces", []), update["nonce"]]))
+    replay_cache.record(node_id, update["sequence"], update["nonce"], observed_at=observed_at)
     window["last_sequence_by_node"][node_id] = update["sequence"]
     window["last_digest_by_node"][f"{node_id}:{scope}"] = update["payload_digest"]
     window["last_seen_update_by_node"][node_id] = {
@@ -18,6 +18,7 @@ from core_engine.history.aging_policies import (
 from core_engine.history.baseline_decay import (
     BASELINE_DECAY_SAFETY_FLAGS,
     apply_confidence_decay,
+    apply_confidence_decay_array,
     build_baseline_aging_decay_report,
     build_baseline_decay_records,
     build_decay_api_response,
@@ -139,6 +140,7 @@ __all__ = [
     "AgingPolicyError",
     "HistoricalSnapshotError",
     "apply_confidence_decay",
+    "apply_confidence_decay_array",
     "build_aging_policy_record",
     "build_anomaly_replay_summary",
     "build_baseline_aging_decay_report",
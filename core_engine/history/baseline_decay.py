@@ -5,12 +5,15 @@ from datetime import UTC, datetime
 from hashlib import sha256
 from typing import Any, Iterable
 
+import numpy as np
+
 from core_engine.export.node_manifest import digest_payload
 from core_engine.history.aging_policies import (
     AGING_POLICY_SAFETY_FLAGS,
     build_aging_policy_record,
 )
 from core_engine.history.snapshots import HISTORICAL_SNAPSHOT_SAFETY_FLAGS
+from core_engine.telemetry.temporal_series import timestamps_to_micros
 
 
 BASELINE_DECAY_RECORD_VERSION = 1
@@ -79,7 +82,7 @@ def build_baseline_decay_records(
     policy: dict[str, Any],
     generated_at: str,
 ) -> list[dict[str, Any]]:
-    return [_build_decay_record(row, policy=policy, generated_at=generated_at, record_kind="baseline_entry") for row in _rows_or_malformed(baseline_entries)]
+    return _build_decay_records(_rows_or_malformed(baseline_entries), policy=policy, generated_at=generated_at, record_kind="baseline_entry")
 
 
 def build_stale_fingerprint_records(
@@ -88,7 +91,7 @@ def build_stale_fingerprint_records(
     policy: dict[str, Any],
     generated_at: str,
 ) -> list[dict[str, Any]]:
-    return [_build_decay_record(row, policy=policy, generated_at=generated_at, record_kind="service_fingerprint") for row in _rows_or_malformed(service_fingerprint_profiles)]
+    return _build_decay_records(_rows_or_malformed(service_fingerprint_profiles), policy=policy, generated_at=generated_at, record_kind="service_fingerprint")
 
 
 def build_dormant_destination_records(
@@ -97,7 +100,7 @@ def build_dormant_destination_records(
     policy: dict[str, Any],
     generated_at: str,
 ) -> list[dict[str, Any]]:
-    return [_build_decay_record(row, policy=policy, generated_at=generated_at, record_kind="destination_behavior") for row in _rows_or_malformed(destination_profiles)]
+    return _build_decay_records(_rows_or_malformed(destination_profiles), policy=policy, generated_at=generated_at, record_kind="destination_behavior")
 
 
 def score_baseline_maturity(record: dict[str, Any], *, policy: dict[str, Any], generated_at: str) -> float:
@@ -105,7 +108,7 @@ def score_baseline_maturity(record: dict[str, Any], *, policy: dict[str, Any], g
     age_days = _days_between(str(record.get("first_seen") or record.get("generated_at") or generated_at), generated_at)
     observation_score = min(0.55, observations / max(1, int(policy.get("mature_after_observations") or 1)) * 0.55)
     age_score = min(0.35, age_days / max(1, int(policy.get("mature_after_days") or 1)) * 0.35)
-    stability_bonus = 0.1 if record.get("stable_behavior") or record.get("stable_service_profile") or str(record.get("behavior_state")) in {"stable", "stable_destination_behavior"} else 0.0
+    stability_bonus = 0.1 if _stable_behavior(record) else 0.0
     return round(min(1.0, observation_score + age_score + stability_bonus), 3)
 
 
@@ -128,6 +131,28 @@ def apply_confidence_decay(
     return round(max(float(policy.get("minimum_confidence") or 0.0), value * multiplier), 3)
 
 
+def apply_confidence_decay_array(
+    confidences: Iterable[float] | np.ndarray,
+    *,
+    age_days: Iterable[int] | np.ndarray,
+    policy: dict[str, Any],
+    dormant: Iterable[bool] | np.ndarray | None = None,
+) -> np.ndarray:
+    """``apply_confidence_decay`` over whole arrays; every value matches the scalar result."""
+    values = np.clip(np.asarray(confidences, dtype=np.float64), 0.0, 1.0)
+    ages = np.asarray(age_days, dtype=np.int64)
+    decay_rate = float(policy.get("decay_rate") or 0.5)
+    dormant_mask = ages >= int(policy.get("dormant_after_days") or 0)
+    if dormant is not None:
+        dormant_mask = dormant_mask | np.asarray(dormant, dtype=bool)
+    multiplier = np.select(
+        [dormant_mask, ages >= int(policy.get("stale_after_days") or 0), ages >= int(policy.get("inactive_after_days") or 0)],
+        [decay_rate * 0.5, decay_rate, 1.0 - ((1.0 - decay_rate) * 0.5)],
+        default=1.0,
+    )
+    return _round3(np.maximum(float(policy.get("minimum_confidence") or 0.0), values * multiplier))
+
+
 def summarize_baseline_decay_records(
     records: Iterable[dict[str, Any]],
     *,
@@ -275,7 +300,47 @@ def deterministic_baseline_decay_json(record: dict[str, Any]) -> str:
     return json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
 
 
-def _build_decay_record(row: dict[str, Any], *, policy: dict[str, Any], generated_at: str, record_kind: str) -> dict[str, Any]:
+def _build_decay_records(rows: list[dict[str, Any]], *, policy: dict[str, Any], generated_at: str, record_kind: str) -> list[dict[str, Any]]:
+    """Build decay records for a batch, computing ages, decay and maturity as arrays."""
+    valid = [row for row in rows if isinstance(row, dict) and row.get("record_type")]
+    last_seen_days = _days_since([row.get("last_seen") or row.get("generated_at") or generated_at for row in valid], generated_at)
+    first_seen_days = _days_since([row.get("first_seen") or row.get("generated_at") or generated_at for row in valid], generated_at)
+    dormant = np.fromiter((_marked_dormant(row) for row in valid), dtype=bool, count=len(valid))
+    dormant |= last_seen_days >= int(policy.get("dormant_after_days") or 0)
+    original = np.fromiter((_confidence(row) for row in valid), dtype=np.float64, count=len(valid))
+    observations = np.fromiter((_observation_count(row) for row in valid), dtype=np.float64, count=len(valid))
+    stable = np.fromiter((_stable_behavior(row) for row in valid), dtype=bool, count=len(valid))
+    decayed = apply_confidence_decay_array(original, age_days=last_seen_days, policy=policy, dormant=dormant)
+    observation_score = np.minimum(0.55, observations / max(1, int(policy.get("mature_after_observations") or 1)) * 0.55)
+    age_score = np.minimum(0.35, first_seen_days / max(1, int(policy.get("mature_after_days") or 1)) * 0.35)
+    maturity = _round3(np.minimum(1.0, observation_score + age_score + np.where(stable, 0.1, 0.0)))
+    computed = iter(zip(last_seen_days.tolist(), dormant.tolist(), decayed.tolist(), maturity.tolist()))
+    records = []
+    for row in rows:
+        if isinstance(row, dict) and row.get("record_type"):
+            age_days, is_dormant, decayed_confidence, maturity_score = next(computed)
+            records.append(
+                _build_decay_record(
+                    row,
+                    policy=policy,
+                    generated_at=generated_at,
+                    record_kind=record_kind,
+                    computed=(age_days, is_dormant, decayed_confidence, maturity_score),
+                )
+            )
+        else:
+            records.append(_build_decay_record(row, policy=policy, generated_at=generated_at, record_kind=record_kind))
+    return records
+
+
+def _build_decay_record(
+    row: dict[str, Any],
+    *,
+    policy: dict[str, Any],
+    generated_at: str,
+    record_kind: str,
+    computed: tuple[int, bool, float, float] | None = None,
+) -> dict[str, Any]:
     if not isinstance(row, dict) or not row.get("record_type"):
         malformed = {
             "record_type": "baseline_decay_record",
@@ -294,13 +359,16 @@ def _build_decay_record(row: dict[str, Any], *, policy: dict[str, Any], generate
         return malformed
     domain_summary = row.get("domain_summary") if isinstance(row.get("domain_summary"), dict) else {}
     source_id = _source_id(row, record_kind=record_kind)
-    age_days = _days_between(str(row.get("last_seen") or row.get("generated_at") or generated_at), generated_at)
     original_confidence = _confidence(row)
-    dormant = _is_dormant(row, age_days=age_days, policy=policy)
+    if computed is None:
+        age_days = _days_between(str(row.get("last_seen") or row.get("generated_at") or generated_at), generated_at)
+        dormant = _is_dormant(row, age_days=age_days, policy=policy)
+        decayed = apply_confidence_decay(original_confidence, age_days=age_days, policy=policy, dormant=dormant)
+        maturity = score_baseline_maturity(row, policy=policy, generated_at=generated_at)
+    else:
+        age_days, dormant, decayed, maturity = computed
     inactive = age_days >= int(policy.get("inactive_after_days") or 0) or bool(row.get("decaying_inactive"))
     stale = age_days >= int(policy.get("stale_after_days") or 0) or bool(row.get("low_confidence_warning"))
-    decayed = apply_confidence_decay(original_confidence, age_days=age_days, policy=policy, dormant=dormant)
-    maturity = score_baseline_maturity(row, policy=policy, generated_at=generated_at)
     decay_state = _decay_state(inactive=inactive, stale=stale, dormant=dormant, malformed=False)
     record = {
         "record_type": "baseline_decay_record",
@@ -359,15 +427,22 @@ def _observation_count(row: dict[str, Any]) -> int:
 
 
 def _is_dormant(row: dict[str, Any], *, age_days: int, policy: dict[str, Any]) -> bool:
+    return _marked_dormant(row) or age_days >= int(policy.get("dormant_after_days") or 0)
+
+
+def _marked_dormant(row: dict[str, Any]) -> bool:
     return bool(
         row.get("dormant")
         or row.get("dormant_behavior")
         or row.get("dormant_reappeared")
         or str(row.get("behavior_state") or "") in {"dormant", "dormant_destination_returned"}
-        or age_days >= int(policy.get("dormant_after_days") or 0)
     )
 
 
+def _stable_behavior(row: dict[str, Any]) -> bool:
+    return bool(row.get("stable_behavior") or row.get("stable_service_profile") or str(row.get("behavior_state")) in {"stable", "stable_destination_behavior"})
+
+
 def _decay_state(*, inactive: bool, stale: bool, dormant: bool, malformed: bool) -> str:
     if malformed:
         return "malformed"
@@ -418,6 +493,31 @@ def _days_between(start: str, end: str) -> int:
     return max(0, int((end_dt - start_dt).total_seconds() // 86400))
 
 
+def _days_since(starts: list[Any], end: str) -> np.ndarray:
+    """Vectorized ``_days_between`` for many start times against one end time."""
+    end_micros, end_valid = timestamps_to_micros([end])
+    start_micros, start_valid = timestamps_to_micros(starts)
+    if not end_valid[0]:
+        return np.zeros(len(starts), dtype=np.int64)
+    days = np.maximum(0, (end_micros[0] - start_micros) // 86_400_000_000)
+    return np.where(start_valid, days, 0)
+
+
+def _round3(values: np.ndarray) -> np.ndarray:
+    """Round to three decimals exactly like ``round(value, 3)``.
+
+    ``np.round`` scales by 1000 first, which can tip values sitting just
+    beside a half-way point the other way, so those few go through
+    Python's correctly rounded ``round``.
+    """
+    scaled = values * 1000.0
+    rounded = np.rint(scaled) / 1000.0
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(value, 3) for value in values[near_half].tolist()]
+    return rounded
+
+
 def _parse_time(value: str) -> datetime | None:
     text = str(value or "")
     if not text:
@@ -0,0 +1,464 @@
+from __future__ import annotations
+
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+from core_engine.integrations.common import delivery_result, utc_timestamp
+from core_engine.integrations.elastic import format_elastic_bulk
+from core_engine.integrations.sentinel import format_sentinel_batch
+from core_engine.integrations.splunk import format_splunk_hec_event
+from core_engine.integrations.webhook import format_webhook_alert
+
+
+INTEGRATION_TYPES = frozenset({"webhook", "elastic", "splunk", "sentinel"})
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_MAX_SPOOL_REPLAYS = 3
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class DispatchError(ValueError):
+    """Raised when a dispatcher destination or submission is invalid."""
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryDestination:
+    """One SIEM or webhook endpoint with its batching limits.
+
+    ``integration`` selects the batch body: Elastic bulk NDJSON, a Sentinel
+    JSON array, concatenated Splunk HEC events, or one JSON request per
+    alert for webhooks (``webhook_style`` as in ``format_webhook_alert``).
+    """
+
+    name: str
+    url: str
+    integration: str = "webhook"
+    headers: dict[str, str] = field(default_factory=dict)
+    batch_size: int = 100
+    max_batch_age: float = 5.0
+    timeout: float = 5.0
+    index: str | None = None
+    webhook_style: str = "generic"
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.name, str) or not self.name.strip():
+            raise DispatchError("destination name must be a non-empty string")
+        if self.integration not in INTEGRATION_TYPES:
+            raise DispatchError(f"unsupported integration: {self.integration}")
+        parts = urlsplit(self.url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise DispatchError("destination url must be an http or https URL")
+        if self.batch_size < 1:
+            raise DispatchError("batch_size must be at least 1")
+        if self.max_batch_age < 0 or self.timeout <= 0:
+            raise DispatchError("max_batch_age must be non-negative and timeout positive")
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections reused per scheme, host and port."""
+
+    def __init__(self, *, max_idle_per_host: int = DEFAULT_MAX_IN_FLIGHT) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+
+    def acquire(self, scheme: str, host: str, port: int, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        key = (scheme, host, port)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                connection = idle.pop()
+                connection.timeout = timeout
+                self.reused += 1
+                return connection, True
+            self.opened += 1
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(host, port, timeout=timeout), False
+
+    def release(self, scheme: str, host: str, port: int, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, host, port), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+
+class IntegrationDispatcher:
+    """Batch, pool and retry alert delivery to SIEM and webhook destinations.
+
+    ``submit`` buffers alert events per destination. A batch is handed off
+    once it reaches ``batch_size`` events, or from ``submit``/``flush_due``
+    once its oldest event is ``max_batch_age`` seconds old; there is no timer
+    thread. Deliveries run on a pool of ``max_in_flight`` workers, so
+    ``submit`` and ``flush_due`` never wait on the network and only return
+    results of deliveries that already finished; ``flush`` and ``collect``
+    wait for the rest. Requests reuse keep-alive connections and retry
+    timeouts, connection errors, 408, 429 and 5xx responses with exponential
+    backoff. Events that still fail are appended to
+    ``<spool_dir>/<destination>.spool.jsonl`` for ``replay_spool``; rejected
+    events (other 4xx) and events that fail ``max_spool_replays`` replays go
+    to ``<destination>.dead.jsonl``. Only events that were not delivered are
+    spooled. Without ``spool_dir`` failed events are reported as
+    ``dropped``. ``close`` spools any unsent events. Like the single-shot
+    send helpers, the dispatcher defaults to ``dry_run=True`` and makes no
+    network calls until it is disabled.
+    """
+
+    def __init__(
+        self,
+        destinations: list[DeliveryDestination],
+        *,
+        spool_dir: str | Path | None = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_spool_replays: int = DEFAULT_MAX_SPOOL_REPLAYS,
+        dry_run: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if max_in_flight < 1 or max_attempts < 1:
+            raise DispatchError("max_in_flight and max_attempts must be at least 1")
+        self.destinations = {destination.name: destination for destination in destinations}
+        if len(self.destinations) != len(destinations):
+            raise DispatchError("destination names must be unique")
+        self.spool_dir = Path(spool_dir) if spool_dir is not None else None
+        self.max_in_flight = max_in_flight
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_spool_replays = max_spool_replays
+        self.dry_run = dry_run
+        self.clock = clock
+        self.sleep = sleep
+        self.pool = ConnectionPool(max_idle_per_host=max_in_flight)
+        self._buffers: dict[str, list[dict[str, Any]]] = {name: [] for name in self.destinations}
+        self._oldest: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._spool_lock = threading.Lock()
+        self._replay_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight: list[Future] = []
+        self._started = clock()
+        self._counters = {
+            "submitted_events": 0,
+            "delivered_events": 0,
+            "delivered_batches": 0,
+            "requests": 0,
+            "failed_requests": 0,
+            "retries": 0,
+            "spooled_events": 0,
+            "dead_lettered_events": 0,
+            "dropped_events": 0,
+            "bytes_sent": 0,
+        }
+        self._latencies = {"count": 0, "total": 0.0, "max": 0.0}
+
+    def submit(self, destination: str, event: dict[str, Any]) -> list[dict[str, Any]]:
+        """Buffer one alert event; returns results of deliveries that have finished."""
+        if destination not in self.destinations:
+            raise DispatchError(f"unknown destination: {destination}")
+        if not isinstance(event, dict):
+            raise DispatchError("alert event must be an object")
+        now = self.clock()
+        with self._lock:
+            self._buffers[destination].append(event)
+            self._oldest.setdefault(destination, now)
+            self._counters["submitted_events"] += 1
+        return self.flush_due()
+
+    def flush_due(self) -> list[dict[str, Any]]:
+        """Hand off batches that are full or whose oldest event reached ``max_batch_age``."""
+        return self._send(self._take_batches(force=False))
+
+    def flush(self) -> list[dict[str, Any]]:
+        """Send every buffered event and wait for all outstanding deliveries."""
+        return self._send(self._take_batches(force=True), wait=True)
+
+    def collect(self) -> list[dict[str, Any]]:
+        """Wait for outstanding deliveries and return results not yet returned."""
+        return self._send([], wait=True)
+
+    def pending_count(self, destination: str | None = None) -> int:
+        with self._lock:
+            if destination is not None:
+                return len(self._buffers.get(destination, []))
+            return sum(len(rows) for rows in self._buffers.values())
+
+    def replay_spool(self, destination: str | None = None) -> list[dict[str, Any]]:
+        """Re-send spooled batches and wait for them; failures return to the spool until ``max_spool_replays``.
+
+        Each spool is first renamed to ``<destination>.claim.jsonl``, which is
+        deleted only once every claimed batch was delivered or parked again.
+        A claim left by a crash is re-sent by the next replay, so replayed
+        events are delivered at least once.
+        """
+        names = [destination] if destination is not None else sorted(self.destinations)
+        with self._replay_lock:
+            batches = []
+            claims = []
+            for name in names:
+                claim, records = self._claim_spool(name)
+                if claim is None:
+                    continue
+                claims.append(claim)
+                for record in records:
+                    batches.append((name, list(record.get("events") or []), int(record.get("replays") or 0) + 1))
+            results = self._send(batches, wait=True)
+            for claim in claims:
+                claim.unlink(missing_ok=True)
+        return results
+
+    def spooled(self, destination: str) -> list[dict[str, Any]]:
+        if self.spool_dir is None:
+            return []
+        return _read_jsonl(self._spool_path(destination, "spool"))
+
+    def dead_letters(self, destination: str) -> list[dict[str, Any]]:
+        if self.spool_dir is None:
+            return []
+        return _read_jsonl(self._spool_path(destination, "dead"))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            latencies = dict(self._latencies)
+        elapsed = max(self.clock() - self._started, 1e-9)
+        return {
+            **counters,
+            "pending_events": self.pending_count(),
+            "connections_opened": self.pool.opened,
+            "connections_reused": self.pool.reused,
+            "events_per_second": round(counters["delivered_events"] / elapsed, 3),
+            "average_latency_ms": round(1000 * latencies["total"] / latencies["count"], 3) if latencies["count"] else 0.0,
+            "max_latency_ms": round(1000 * latencies["max"], 3),
+            "dry_run": self.dry_run,
+            "automatic_changes": False,
+            "raw_payload_stored": False,
+        }
+
+    def close(self) -> None:
+        """Spool unsent events, stop workers and close pooled connections."""
+        for name, events, replays in self._take_batches(force=True):
+            self._spool(name, events, replays=replays, error="dispatcher closed before delivery")
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.pool.close()
+
+    def __enter__(self) -> "IntegrationDispatcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _take_batches(self, *, force: bool) -> list[tuple[str, list[dict[str, Any]], int]]:
+        now = self.clock()
+        batches = []
+        with self._lock:
+            for name, destination in self.destinations.items():
+                buffer = self._buffers[name]
+                while len(buffer) >= destination.batch_size:
+                    batches.append((name, buffer[: destination.batch_size], 0))
+                    del buffer[: destination.batch_size]
+                if not buffer:
+                    self._oldest.pop(name, None)
+                elif force or now - self._oldest[name] >= destination.max_batch_age:
+                    batches.append((name, list(buffer), 0))
+                    buffer.clear()
+                    self._oldest.pop(name, None)
+        return batches
+
+    def _send(self, batches: list[tuple[str, list[dict[str, Any]], int]], *, wait: bool = False) -> list[dict[str, Any]]:
+        if self.dry_run:
+            return [self._deliver(*batch) for batch in batches]
+        with self._lock:
+            if batches and self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="integration-dispatch")
+            for batch in batches:
+                self._in_flight.append(self._executor.submit(self._deliver, *batch))
+            futures = list(self._in_flight)
+        finished = futures if wait else [future for future in futures if future.done()]
+        results = [future.result() for future in finished]
+        with self._lock:
+            finished_ids = {id(future) for future in finished}
+            self._in_flight = [future for future in self._in_flight if id(future) not in finished_ids]
+        return results
+
+    def _deliver(self, name: str, events: list[dict[str, Any]], replays: int) -> dict[str, Any]:
+        destination = self.destinations[name]
+        if self.dry_run:
+            result = delivery_result(ok=True, destination=destination.url, integration=destination.integration, status="dry_run", dry_run=True)
+            return {**result, "event_count": len(events), "attempts": 0}
+        attempts = 0
+        delivered = 0
+        status = "failed"
+        detail = ""
+        for body, content_type, count in _request_bodies(destination, events):
+            ok, retryable, status, detail, used = self._post_with_retry(destination, body, content_type)
+            attempts += used
+            if not ok:
+                undelivered = events[delivered:]
+                if retryable and replays < self.max_spool_replays:
+                    outcome = self._spool(name, undelivered, replays=replays, error=detail or status)
+                else:
+                    outcome = self._dead_letter(name, undelivered, replays=replays, error=detail or status)
+                with self._lock:
+                    self._counters["delivered_events"] += delivered
+                result = delivery_result(ok=False, destination=destination.url, integration=destination.integration, status=outcome, detail=detail or status)
+                return {**result, "event_count": len(events), "delivered_count": delivered, "undelivered_count": len(undelivered), "attempts": attempts}
+            delivered += count
+        with self._lock:
+            self._counters["delivered_events"] += len(events)
+            self._counters["delivered_batches"] += 1
+        result = delivery_result(ok=True, destination=destination.url, integration=destination.integration, status=status)
+        return {**result, "event_count": len(events), "attempts": attempts}
+
+    def _post_with_retry(self, destination: DeliveryDestination, body: bytes, content_type: str) -> tuple[bool, bool, str, str, int]:
+        status = "failed"
+        detail = ""
+        retryable = True
+        for attempt in range(1, self.max_attempts + 1):
+            if attempt > 1:
+                with self._lock:
+                    self._counters["retries"] += 1
+                self.sleep(min(self.backoff_max, self.backoff_base * 2 ** (attempt - 2)))
+            started = self.clock()
+            try:
+                code = self._post(destination, body, content_type)
+                status, detail = str(code), ""
+                ok = 200 <= code < 300
+                retryable = code in RETRYABLE_STATUS_CODES
+            except (OSError, http.client.HTTPException) as exc:
+                ok, retryable, status, detail = False, True, "failed", str(exc) or type(exc).__name__
+            self._record_request(self.clock() - started, len(body), ok)
+            if ok or not retryable:
+                return ok, retryable, status, detail, attempt
+        return False, retryable, status, detail, self.max_attempts
+
+    def _post(self, destination: DeliveryDestination, body: bytes, content_type: str) -> int:
+        parts = urlsplit(destination.url)
+        scheme = parts.scheme
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        headers = {"Content-Type": content_type, "Connection": "keep-alive", **destination.headers}
+        while True:
+            connection, reused = self.pool.acquire(scheme, host, port, destination.timeout)
+            try:
+                connection.request("POST", path, body=body, headers=headers)
+                response = connection.getresponse()
+                response.read()
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self.pool.release(scheme, host, port, connection)
+            return int(response.status)
+
+    def _record_request(self, latency: float, size: int, ok: bool) -> None:
+        with self._lock:
+            self._counters["requests"] += 1
+            self._counters["bytes_sent"] += size
+            if not ok:
+                self._counters["failed_requests"] += 1
+            self._latencies["count"] += 1
+            self._latencies["total"] += latency
+            self._latencies["max"] = max(self._latencies["max"], latency)
+
+    def _spool(self, name: str, events: list[dict[str, Any]], *, replays: int, error: str) -> str:
+        return self._park(name, "spool", events, replays=replays, error=error)
+
+    def _dead_letter(self, name: str, events: list[dict[str, Any]], *, replays: int, error: str) -> str:
+        return self._park(name, "dead", events, replays=replays, error=error)
+
+    def _park(self, name: str, kind: str, events: list[dict[str, Any]], *, replays: int, error: str) -> str:
+        if self.spool_dir is None:
+            with self._lock:
+                self._counters["dropped_events"] += len(events)
+            return "dropped"
+        self._append_spool_record(name, kind, events, replays=replays, error=error)
+        with self._lock:
+            self._counters["spooled_events" if kind == "spool" else "dead_lettered_events"] += len(events)
+        return "spooled" if kind == "spool" else "dead_lettered"
+
+    def _append_spool_record(self, name: str, kind: str, events: list[dict[str, Any]], *, replays: int, error: str) -> None:
+        record = {"destination": name, "events": events, "replays": replays, "error": error, "spooled_at": utc_timestamp()}
+        path = self._spool_path(name, kind)
+        with self._spool_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(record, sort_keys=True, default=str) + "\n")
+
+    def _claim_spool(self, name: str) -> tuple[Path | None, list[dict[str, Any]]]:
+        if self.spool_dir is None:
+            return None, []
+        path = self._spool_path(name, "spool")
+        claim = self._spool_path(name, "claim")
+        with self._spool_lock:
+            if path.exists():
+                if claim.exists():
+                    with claim.open("a", encoding="utf-8") as handle:
+                        handle.write(path.read_text(encoding="utf-8"))
+                    path.unlink()
+                else:
+                    path.replace(claim)
+            if not claim.exists():
+                return None, []
+            return claim, _read_jsonl(claim)
+
+    def _spool_path(self, name: str, kind: str) -> Path:
+        assert self.spool_dir is not None
+        safe_name = "".join(character if character.isalnum() or character in "-_" else "_" for character in name)
+        return self.spool_dir / f"{safe_name}.{kind}.jsonl"
+
+
+def _request_bodies(destination: DeliveryDestination, events: list[dict[str, Any]]) -> list[tuple[bytes, str, int]]:
+    """Return ``(body, content_type, event_count)`` for each request of a batch."""
+    if destination.integration == "elastic":
+        return [(format_elastic_bulk(events, index=destination.index or "portmap-alerts").encode("utf-8"), "application/x-ndjson", len(events))]
+    if destination.integration == "sentinel":
+        return [(json.dumps(format_sentinel_batch(events), sort_keys=True).encode("utf-8"), "application/json", len(events))]
+    if destination.integration == "splunk":
+        lines = [json.dumps(format_splunk_hec_event(event, index=destination.index), sort_keys=True) for event in events]
+        return [("\n".join(lines).encode("utf-8"), "application/json", len(events))]
+    return [
+        (json.dumps(format_webhook_alert(event, style=destination.webhook_style), sort_keys=True).encode("utf-8"), "application/json", 1)
+        for event in events
+    ]
+
+
+def _read_jsonl(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    rows = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            rows.append(json.loads(line))
+    return rows
@@ -0,0 +1,218 @@
+"""Reverse-seeking tail readers for append-only JSONL and text logs."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+ANCHOR_BYTES = 64
+
+
+def parse_jsonl_record(line: bytes) -> dict[str, Any] | None:
+    """Decode one JSONL row, returning ``None`` for blank, malformed, or non-object rows."""
+    try:
+        item = json.loads(line)
+    except Exception:
+        return None
+    return item if isinstance(item, dict) else None
+
+
+def decode_log_line(line: bytes) -> str:
+    return line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def _iter_lines_reversed(handle: Any, end: int, block_size: int) -> Iterator[tuple[bytes, int]]:
+    """Yield ``(line, start_offset)`` pairs from ``end`` back to the start of the file.
+
+    The first pair is the fragment after the last newline (empty when the region
+    ends with a newline), so callers can tell complete lines from a partial write.
+    """
+    position = end
+    buffer = b""
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        handle.seek(position)
+        buffer = handle.read(read_size) + buffer
+        parts = buffer.split(b"\n")
+        buffer = parts[0]
+        offset = position + len(buffer) + 1
+        starts = []
+        for part in parts[1:]:
+            starts.append(offset)
+            offset += len(part) + 1
+        for part, start in zip(reversed(parts[1:]), reversed(starts)):
+            yield part, start
+    yield buffer, 0
+
+
+def tail_records(
+    path: Path,
+    *,
+    limit: int,
+    parse: Callable[[bytes], Any] = parse_jsonl_record,
+    predicate: Callable[[Any], bool] | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> list[Any]:
+    """Return the last ``limit`` parsed records of ``path`` in file order.
+
+    Reads backwards from EOF in ``block_size`` chunks, so the cost depends on
+    the size of the tail rather than the size of the file. Rows that ``parse``
+    maps to ``None`` or that fail ``predicate`` do not count towards ``limit``.
+    """
+    if limit <= 0:
+        return []
+    records: list[Any] = []
+    try:
+        with open(path, "rb") as handle:
+            end = os.fstat(handle.fileno()).st_size
+            for line, _start in _iter_lines_reversed(handle, end, block_size):
+                if not line:
+                    continue
+                item = parse(line)
+                if item is None or (predicate is not None and not predicate(item)):
+                    continue
+                records.append(item)
+                if len(records) >= limit:
+                    break
+    except OSError:
+        return []
+    records.reverse()
+    return records
+
+
+def tail_jsonl(
+    path: Path,
+    *,
+    limit: int,
+    predicate: Callable[[dict[str, Any]], bool] | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> list[dict[str, Any]]:
+    return tail_records(path, limit=limit, predicate=predicate, block_size=block_size)
+
+
+def tail_lines(path: Path, *, limit: int, block_size: int = DEFAULT_BLOCK_SIZE) -> list[str]:
+    return tail_records(path, limit=limit, parse=decode_log_line, block_size=block_size)
+
+
+class LogTailReader:
+    """Keep the last ``limit`` records of a growing log, reading only appended bytes.
+
+    The first ``read()`` seeks backwards from EOF; later calls resume from the
+    remembered byte offset. Rotation (a new inode), truncation (size below the
+    offset), or a rewritten prefix (anchor bytes no longer match) trigger a
+    fresh reverse scan. A trailing line without a newline is returned but not
+    consumed, so a half-written row is re-read once the writer finishes it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        limit: int,
+        parse: Callable[[bytes], Any] = parse_jsonl_record,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        self.path = Path(path)
+        self.limit = max(int(limit), 0)
+        self.parse = parse
+        self.block_size = block_size
+        self._records: deque[Any] = deque(maxlen=self.limit)
+        self._inode: int | None = None
+        self._offset: int | None = None
+        self._anchor = b""
+
+    @property
+    def offset(self) -> int:
+        return self._offset or 0
+
+    def reset(self) -> None:
+        self._records.clear()
+        self._inode = None
+        self._offset = None
+        self._anchor = b""
+
+    def read(self) -> list[Any]:
+        if self.limit <= 0:
+            return []
+        try:
+            with open(self.path, "rb") as handle:
+                stat = os.fstat(handle.fileno())
+                if self._offset is not None and not self._same_file(handle, stat):
+                    self.reset()
+                if self._offset is None:
+                    fragment = self._scan_backwards(handle, stat.st_size)
+                else:
+                    fragment = self._read_appended(handle, stat.st_size)
+                self._inode = stat.st_ino
+                self._anchor = self._read_anchor(handle)
+        except OSError:
+            self.reset()
+            return []
+        records = list(self._records)
+        if fragment:
+            item = self.parse(fragment)
+            if item is not None:
+                records.append(item)
+        return records[-self.limit :]
+
+    def _same_file(self, handle: Any, stat: os.stat_result) -> bool:
+        if stat.st_ino != self._inode or stat.st_size < self.offset:
+            return False
+        return self._read_anchor(handle) == self._anchor
+
+    def _read_anchor(self, handle: Any) -> bytes:
+        start = max(self.offset - ANCHOR_BYTES, 0)
+        handle.seek(start)
+        return handle.read(self.offset - start)
+
+    def _scan_backwards(self, handle: Any, size: int) -> bytes:
+        fragment = b""
+        complete_end: int | None = None
+        collected: list[Any] = []
+        for line, start in _iter_lines_reversed(handle, size, self.block_size):
+            if complete_end is None:
+                complete_end = start
+                fragment = line
+                continue
+            if not line:
+                continue
+            item = self.parse(line)
+            if item is None:
+                continue
+            collected.append(item)
+            if len(collected) >= self.limit:
+                break
+        collected.reverse()
+        self._records.extend(collected)
+        self._offset = complete_end or 0
+        return fragment
+
+    def _read_appended(self, handle: Any, size: int) -> bytes:
+        handle.seek(self.offset)
+        data = handle.read(size - self.offset)
+        lines = data.split(b"\n")
+        fragment = lines.pop()
+        for line in lines:
+            if not line:
+                continue
+            item = self.parse(line)
+            if item is not None:
+                self._records.append(item)
+        self._offset = self.offset + len(data) - len(fragment)
+        return fragment
+
+
+__all__ = [
+    "DEFAULT_BLOCK_SIZE",
+    "LogTailReader",
+    "decode_log_line",
+    "parse_jsonl_record",
+    "tail_jsonl",
+    "tail_lines",
+    "tail_records",
+]
@@ -148,7 +148,7 @@ def start_master_server(
                                 command,
                                 logger,
                             )
-                        ack_message = {"status": "ok"}
+                        ack_message = {"status": "ok", "frame_encodings": list(SUPPORTED_FRAME_ENCODINGS)}
                         if decision:
                             ack_message["remediation"] = decision.to_dict()
                         try:
@@ -1,6 +1,7 @@
 """Advisory policy review primitives."""
 
 from core_engine.policy.evaluator import (
+    PolicyIndex,
     build_review_record,
     evaluate_delta_against_policies,
     evaluate_event_against_policies,
@@ -19,7 +20,9 @@ from core_engine.policy.runtime_engine import (
     SAFE_ENFORCEMENT_MODES,
     PolicyEvaluation,
     RuntimePolicy,
+    RuntimePolicyIndex,
     build_policy_runtime_summary,
+    compile_runtime_policies,
     create_runtime_policy,
     deterministic_policy_runtime_json,
     evaluate_policies,
@@ -60,9 +63,11 @@ __all__ = [
     "PolicyBundle",
     "PolicyError",
     "PolicyEvaluation",
+    "PolicyIndex",
     "PolicyValidationRecord",
     "REVIEW_STATES",
     "RuntimePolicy",
+    "RuntimePolicyIndex",
     "EVALUATION_STATES",
     "POLICY_TYPES",
     "DistributedReviewError",
@@ -76,6 +81,7 @@ __all__ = [
     "build_export_ready_review_aggregation",
     "build_recommended_operator_review_records",
     "build_review_record",
+    "compile_runtime_policies",
     "create_policy",
     "create_runtime_policy",
     "deterministic_policy_bundle_json",
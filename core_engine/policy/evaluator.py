@@ -2,12 +2,55 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from hashlib import sha256
+from heapq import merge
 from typing import Any, Iterable
 
 from core_engine.policy.models import Policy, PolicyError, ReviewRecord, SEVERITY_ORDER
 
 
-def evaluate_event_against_policies(event: dict[str, Any], policies: Iterable[Policy]) -> list[ReviewRecord]:
+MAX_CACHED_POLICY_MATCHES = 4096
+
+
+class PolicyIndex:
+    """Enabled policies bucketed by category and severity threshold.
+
+    ``matching`` returns the policies ``Policy.matches`` would accept, in
+    the original policy order, and memoizes the answer per category and
+    severity so repeated events skip the per-policy scan. Policies are read
+    once at construction; build a new index after changing them.
+    """
+
+    def __init__(self, policies: Iterable[Policy]) -> None:
+        self.policies = list(policies)
+        self._by_category: dict[str, list[tuple[int, int, Policy]]] = {}
+        self._any_category: list[tuple[int, int, Policy]] = []
+        for position, policy in enumerate(self.policies):
+            if not policy.enabled:
+                continue
+            entry = (position, SEVERITY_ORDER[policy.severity_threshold], policy)
+            if not policy.categories:
+                self._any_category.append(entry)
+            for category in dict.fromkeys(policy.categories):
+                self._by_category.setdefault(category, []).append(entry)
+        self._matches: dict[tuple[str, str], tuple[Policy, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.policies)
+
+    def matching(self, *, category: str, severity: str) -> tuple[Policy, ...]:
+        key = (category, severity)
+        matches = self._matches.get(key)
+        if matches is None:
+            rank = SEVERITY_ORDER.get(severity, -1)
+            entries = merge(self._by_category.get(category, ()), self._any_category)
+            matches = tuple(policy for _position, threshold, policy in entries if rank >= threshold)
+            if len(self._matches) >= MAX_CACHED_POLICY_MATCHES:
+                self._matches.clear()
+            self._matches[key] = matches
+        return matches
+
+
+def evaluate_event_against_policies(event: dict[str, Any], policies: Iterable[Policy] | PolicyIndex) -> list[ReviewRecord]:
     category = str(event.get("event_type") or "system_notice")
     severity = _severity(event.get("severity"))
     title = category.replace("_", " ").title()
@@ -25,12 +68,11 @@ def evaluate_event_against_policies(event: dict[str, Any], policies: Iterable[Po
             evidence_refs=evidence_refs,
             recommended_action=_recommended_action(event),
         )
-        for policy in policies
-        if policy.matches(category=category, severity=severity)
+        for policy in _matching(policies, category=category, severity=severity)
     ]
 
 
-def evaluate_finding_against_policies(finding: dict[str, Any], policies: Iterable[Policy]) -> list[ReviewRecord]:
+def evaluate_finding_against_policies(finding: dict[str, Any], policies: Iterable[Policy] | PolicyIndex) -> list[ReviewRecord]:
     category = str(finding.get("category") or finding.get("type") or finding.get("finding_type") or "finding")
     severity = _severity(finding.get("severity"))
     title = str(finding.get("title") or category.replace("_", " ").title())
@@ -48,12 +90,11 @@ def evaluate_finding_against_policies(finding: dict[str, Any], policies: Iterabl
             evidence_refs=evidence_refs,
             recommended_action=_recommended_action(finding),
         )
-        for policy in policies
-        if policy.matches(category=category, severity=severity)
+        for policy in _matching(policies, category=category, severity=severity)
     ]
 
 
-def evaluate_delta_against_policies(delta: dict[str, Any], policies: Iterable[Policy]) -> list[ReviewRecord]:
+def evaluate_delta_against_policies(delta: dict[str, Any], policies: Iterable[Policy] | PolicyIndex) -> list[ReviewRecord]:
     category = str(delta.get("type") or delta.get("delta_type") or "baseline_delta")
     severity = _severity(delta.get("severity"))
     target = str(delta.get("target") or "sample target")
@@ -75,8 +116,7 @@ def evaluate_delta_against_policies(delta: dict[str, Any], policies: Iterable[Po
             evidence_refs=sorted(set(evidence_refs)),
             recommended_action=_recommended_action(delta),
         )
-        for policy in policies
-        if policy.matches(category=category, severity=severity)
+        for policy in _matching(policies, category=category, severity=severity)
     ]
 
 
@@ -116,6 +156,12 @@ def build_review_record(
     )
 
 
+def _matching(policies: Iterable[Policy] | PolicyIndex, *, category: str, severity: str) -> Iterable[Policy]:
+    if isinstance(policies, PolicyIndex):
+        return policies.matching(category=category, severity=severity)
+    return [policy for policy in policies if policy.matches(category=category, severity=severity)]
+
+
 def _severity(value: Any) -> str:
     severity = str(value or "info").lower()
     return severity if severity in SEVERITY_ORDER else "info"
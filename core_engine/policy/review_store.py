@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+import sqlite3
+from datetime import UTC, datetime
 from typing import Any, Iterable
 
 from core_engine.policy.history import (
@@ -20,19 +23,34 @@ from core_engine.storage.repositories import LocalStorageRepository
 
 
 class PersistentReviewStore:
-    """Persist advisory review records through the existing local repository."""
+    """Persist advisory review records in the local repository's review tables.
 
-    def __init__(self, repository: LocalStorageRepository) -> None:
+    Each review row holds the record as added and its current state; status
+    updates write the transition and the new current state in one
+    transaction, so list, get and summary are indexed queries that never
+    replay history. The current row is read inside that same write-locked
+    transaction, so concurrent updates cannot overwrite each other's
+    transitions. Review records written to the ``findings`` table by earlier
+    versions are copied into the review tables on first use unless
+    ``migrate`` is false, which read-only callers such as exports use.
+    """
+
+    def __init__(self, repository: LocalStorageRepository, *, migrate: bool = True) -> None:
         if not isinstance(repository, LocalStorageRepository):
             raise PolicyError("PersistentReviewStore requires a LocalStorageRepository")
         self.repository = repository
+        self.store = repository.store
+        if migrate:
+            self._migrate_legacy_records()
 
     @property
     def local_only(self) -> bool:
         return True
 
     def add_review(self, review: ReviewRecord) -> int:
-        return self.repository.insert_finding(review_to_storage_record(review))
+        current = review_from_storage_record(review_to_storage_record(review))
+        with self.store.transaction() as connection:
+            return _insert_review(connection, current, current)
 
     def add_reviews(self, reviews: Iterable[ReviewRecord]) -> list[int]:
         return [self.add_review(review) for review in reviews]
@@ -44,24 +62,35 @@ class PersistentReviewStore:
         severity: str | None = None,
         category: str | None = None,
         source_ref: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[ReviewRecord]:
-        reviews = [apply_review_history(review, self._transitions_for(review.review_id)) for review in self._base_reviews()]
         if status is not None:
             _validate_status(status)
-            reviews = [review for review in reviews if review.status == status]
-        if severity is not None:
-            reviews = [review for review in reviews if review.severity == severity]
-        if category is not None:
-            reviews = [review for review in reviews if review.category == category]
-        if source_ref is not None:
-            reviews = [review for review in reviews if review.source_ref == source_ref]
-        return sorted(reviews, key=lambda item: (item.created_at, item.review_id))
+        where, parameters = _where(status=status, severity=severity, category=category, source_ref=source_ref)
+        page, page_parameters = _page(limit, offset)
+        rows = self.store.query(
+            f"SELECT payload_json FROM review_records{where} ORDER BY created_at, review_id{page}",
+            (*parameters, *page_parameters),
+        )
+        return [review_from_storage_record(json.loads(row["payload_json"])) for row in rows]
+
+    def count_reviews(
+        self,
+        *,
+        status: str | None = None,
+        severity: str | None = None,
+        category: str | None = None,
+        source_ref: str | None = None,
+    ) -> int:
+        if status is not None:
+            _validate_status(status)
+        where, parameters = _where(status=status, severity=severity, category=category, source_ref=source_ref)
+        return int(self.store.query(f"SELECT COUNT(*) AS count FROM review_records{where}", parameters)[0]["count"])
 
     def get_review(self, review_id: str) -> ReviewRecord | None:
-        for review in self.list_reviews():
-            if review.review_id == review_id:
-                return review
-        return None
+        rows = self.store.query("SELECT payload_json FROM review_records WHERE review_id = ?", (review_id,))
+        return review_from_storage_record(json.loads(rows[0]["payload_json"])) if rows else None
 
     def update_status(
         self,
@@ -73,34 +102,57 @@ class PersistentReviewStore:
         now: str | None = None,
     ) -> ReviewRecord:
         _validate_status(status)
-        current = self.get_review(review_id)
-        if current is None:
-            raise PolicyError(f"review not found: {review_id}")
-        previous_status = current.status
-        queue = ReviewQueue([current])
-        updated = queue.update_status(
-            review_id,
-            status,
-            reviewed_by=reviewed_by,
-            review_note=review_note,
-            now=now,
-        )
-        transition = build_review_transition_record(
-            current,
-            previous_status=previous_status,
-            new_status=updated.status,
-            reviewed_by=reviewed_by,
-            review_note=review_note,
-            transitioned_at=updated.updated_at,
-        )
-        self.repository.insert_finding(transition)
+        with self.store.transaction(immediate=True) as connection:
+            row = connection.execute("SELECT payload_json FROM review_records WHERE review_id = ?", (review_id,)).fetchone()
+            if row is None:
+                raise PolicyError(f"review not found: {review_id}")
+            current = review_from_storage_record(json.loads(row["payload_json"]))
+            previous_status = current.status
+            queue = ReviewQueue([current])
+            updated = queue.update_status(
+                review_id,
+                status,
+                reviewed_by=reviewed_by,
+                review_note=review_note,
+                now=now,
+            )
+            transition = build_review_transition_record(
+                current,
+                previous_status=previous_status,
+                new_status=updated.status,
+                reviewed_by=reviewed_by,
+                review_note=review_note,
+                transitioned_at=updated.updated_at,
+            )
+            latest = connection.execute(
+                """
+                SELECT transitioned_at, transition_id FROM review_transitions
+                WHERE review_id = ? ORDER BY transitioned_at DESC, transition_id DESC LIMIT 1
+                """,
+                (review_id,),
+            ).fetchone()
+            _insert_transition(connection, transition)
+            materialized = updated
+            if latest is not None and (latest["transitioned_at"], latest["transition_id"]) > (transition["transitioned_at"], transition["transition_id"]):
+                # A back-dated transition lands mid-history; replay so current state matches history order.
+                materialized = _replay_review(connection, review_id)
+            _update_current(connection, materialized)
         return updated
 
-    def list_review_history(self, review_id: str | None = None) -> list[dict[str, Any]]:
-        rows = [row for row in self.repository.list_findings() if row.get("record_type") == REVIEW_TRANSITION_RECORD_TYPE]
-        if review_id is not None:
-            rows = [row for row in rows if row.get("review_id") == review_id]
-        return sorted(rows, key=lambda item: (str(item.get("transitioned_at") or ""), str(item.get("transition_id") or "")))
+    def list_review_history(
+        self,
+        review_id: str | None = None,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        where, parameters = _where(review_id=review_id)
+        page, page_parameters = _page(limit, offset)
+        rows = self.store.query(
+            f"SELECT payload_json FROM review_transitions{where} ORDER BY transitioned_at, transition_id{page}",
+            (*parameters, *page_parameters),
+        )
+        return [json.loads(row["payload_json"]) for row in rows]
 
     def set_finding_status(
         self,
@@ -120,21 +172,62 @@ class PersistentReviewStore:
             review_note=review_note,
             updated_at=now,
         )
-        self.repository.insert_finding(record)
+        with self.store.transaction() as connection:
+            _insert_finding_status(connection, record)
         return record
 
-    def list_finding_statuses(self, *, finding_ref: str | None = None) -> list[dict[str, Any]]:
-        rows = [row for row in self.repository.list_findings() if row.get("record_type") == FINDING_STATUS_RECORD_TYPE]
-        if finding_ref is not None:
-            rows = [row for row in rows if row.get("finding_ref") == finding_ref]
-        return sorted(rows, key=lambda item: (str(item.get("updated_at") or ""), str(item.get("status_record_id") or "")))
+    def list_finding_statuses(
+        self,
+        *,
+        finding_ref: str | None = None,
+        status: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        if status is not None:
+            _validate_status(status)
+        where, parameters = _where(finding_ref=finding_ref, status=status)
+        page, page_parameters = _page(limit, offset)
+        rows = self.store.query(
+            f"SELECT payload_json FROM finding_statuses{where} ORDER BY updated_at, status_record_id{page}",
+            (*parameters, *page_parameters),
+        )
+        return [json.loads(row["payload_json"]) for row in rows]
 
     def summarize_reviews(self) -> dict[str, Any]:
-        queue = ReviewQueue(self.list_reviews())
-        summary = queue.summarize_reviews()
-        summary["history_count"] = len(self.list_review_history())
-        summary["finding_status_count"] = len(self.list_finding_statuses())
-        return summary
+        by_status: dict[str, int] = {state: 0 for state in sorted(REVIEW_STATES)}
+        by_severity: dict[str, int] = {}
+        by_category: dict[str, int] = {}
+        review_count = 0
+        approval_required_count = 0
+        rows = self.store.query(
+            """
+            SELECT status, severity, category, approval_required, COUNT(*) AS count
+            FROM review_records GROUP BY status, severity, category, approval_required
+            """
+        )
+        for row in rows:
+            count = int(row["count"])
+            review_count += count
+            by_status[row["status"]] = by_status.get(row["status"], 0) + count
+            by_severity[row["severity"]] = by_severity.get(row["severity"], 0) + count
+            by_category[row["category"]] = by_category.get(row["category"], 0) + count
+            if row["approval_required"]:
+                approval_required_count += count
+        return {
+            "status": "ok",
+            "review_count": review_count,
+            "by_status": by_status,
+            "by_severity": dict(sorted(by_severity.items())),
+            "by_category": dict(sorted(by_category.items())),
+            "approval_required_count": approval_required_count,
+            "automatic_changes": False,
+            "administrator_controlled": True,
+            "raw_payload_stored": False,
+            "local_only": True,
+            "history_count": self._count("review_transitions"),
+            "finding_status_count": self._count("finding_statuses"),
+        }
 
     def export_reviews(self, *, generated_at: str | None = None) -> dict[str, Any]:
         return export_review_records(self.list_reviews(), generated_at=generated_at)
@@ -142,14 +235,140 @@ class PersistentReviewStore:
     def import_reviews(self, payload: dict[str, Any] | list[dict[str, Any]]) -> list[int]:
         return self.add_reviews(import_review_records(payload))
 
-    def _base_reviews(self) -> list[ReviewRecord]:
-        rows = [row for row in self.repository.list_findings() if row.get("record_type") == REVIEW_RECORD_TYPE]
-        return [review_from_storage_record(row) for row in rows]
+    def _count(self, table: str) -> int:
+        return int(self.store.query(f"SELECT COUNT(*) AS count FROM {table}")[0]["count"])
+
+    def _migrate_legacy_records(self) -> None:
+        if any(self._count(table) for table in ("review_records", "review_transitions", "finding_statuses")):
+            return
+        rows = self.store.query(
+            "SELECT payload_json FROM findings WHERE finding_type IN (?, ?, ?) ORDER BY id",
+            (REVIEW_RECORD_TYPE, REVIEW_TRANSITION_RECORD_TYPE, FINDING_STATUS_RECORD_TYPE),
+        )
+        if not rows:
+            return
+        records = [json.loads(row["payload_json"]) for row in rows]
+        transitions: dict[str, list[dict[str, Any]]] = {}
+        for record in records:
+            if record.get("record_type") == REVIEW_TRANSITION_RECORD_TYPE:
+                transitions.setdefault(str(record.get("review_id") or ""), []).append(record)
+        with self.store.transaction() as connection:
+            for record in records:
+                record_type = record.get("record_type")
+                if record_type == REVIEW_RECORD_TYPE:
+                    base = review_from_storage_record(record)
+                    _insert_review(connection, base, apply_review_history(base, transitions.get(base.review_id, [])))
+                elif record_type == REVIEW_TRANSITION_RECORD_TYPE:
+                    _insert_transition(connection, record)
+                elif record_type == FINDING_STATUS_RECORD_TYPE:
+                    _insert_finding_status(connection, record)
+
+
+def _insert_review(connection: sqlite3.Connection, base: ReviewRecord, current: ReviewRecord) -> int:
+    cursor = connection.execute(
+        """
+        INSERT INTO review_records (
+            review_id, status, severity, category, source_ref, approval_required,
+            created_at, updated_at, base_json, payload_json, stored_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            current.review_id,
+            current.status,
+            current.severity,
+            current.category,
+            current.source_ref,
+            int(current.approval_required),
+            current.created_at,
+            current.updated_at,
+            _to_json(base),
+            _to_json(current),
+            _now(),
+        ),
+    )
+    return int(cursor.lastrowid)
+
+
+def _update_current(connection: sqlite3.Connection, review: ReviewRecord) -> None:
+    connection.execute(
+        "UPDATE review_records SET status = ?, updated_at = ?, payload_json = ? WHERE review_id = ?",
+        (review.status, review.updated_at, _to_json(review), review.review_id),
+    )
+
+
+def _replay_review(connection: sqlite3.Connection, review_id: str) -> ReviewRecord:
+    base = connection.execute("SELECT base_json FROM review_records WHERE review_id = ?", (review_id,)).fetchone()
+    transitions = connection.execute("SELECT payload_json FROM review_transitions WHERE review_id = ?", (review_id,)).fetchall()
+    return apply_review_history(
+        review_from_storage_record(json.loads(base["base_json"])),
+        [json.loads(row["payload_json"]) for row in transitions],
+    )
 
-    def _transitions_for(self, review_id: str) -> list[dict[str, Any]]:
-        return self.list_review_history(review_id)
+
+def _insert_transition(connection: sqlite3.Connection, transition: dict[str, Any]) -> None:
+    connection.execute(
+        """
+        INSERT INTO review_transitions (
+            transition_id, review_id, previous_status, new_status, transitioned_at, payload_json, created_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            transition["transition_id"],
+            transition["review_id"],
+            transition["previous_status"],
+            transition["new_status"],
+            str(transition.get("transitioned_at") or ""),
+            json.dumps(transition, sort_keys=True, separators=(",", ":")),
+            _now(),
+        ),
+    )
+
+
+def _insert_finding_status(connection: sqlite3.Connection, record: dict[str, Any]) -> None:
+    connection.execute(
+        """
+        INSERT INTO finding_statuses (status_record_id, finding_ref, status, source_ref, updated_at, payload_json, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            record["status_record_id"],
+            record["finding_ref"],
+            record["status"],
+            record.get("source_ref"),
+            str(record.get("updated_at") or ""),
+            json.dumps(record, sort_keys=True, separators=(",", ":")),
+            _now(),
+        ),
+    )
+
+
+def _where(**filters: str | None) -> tuple[str, tuple[str, ...]]:
+    active = {column: value for column, value in filters.items() if value is not None}
+    if not active:
+        return "", ()
+    return " WHERE " + " AND ".join(f"{column} = ?" for column in active), tuple(active.values())
+
+
+def _page(limit: int | None, offset: int) -> tuple[str, tuple[int, ...]]:
+    if limit is not None and (not isinstance(limit, int) or limit < 0):
+        raise PolicyError("limit must be a non-negative integer")
+    if not isinstance(offset, int) or offset < 0:
+        raise PolicyError("offset must be a non-negative integer")
+    if limit is None and not offset:
+        return "", ()
+    return " LIMIT ? OFFSET ?", (-1 if limit is None else limit, offset)
+
+
+def _to_json(review: ReviewRecord) -> str:
+    return json.dumps(review_to_storage_record(review)["review"], sort_keys=True, separators=(",", ":"))
 
 
 def _validate_status(status: str) -> None:
     if status not in REVIEW_STATES:
         raise PolicyError(f"unsupported review status: {status}")
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
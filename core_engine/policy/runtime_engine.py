@@ -3,8 +3,9 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from hashlib import sha256
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from core_engine.policy.models import PolicyError, SEVERITY_ORDER
 
@@ -210,14 +211,140 @@ def evaluate_policy(policy: RuntimePolicy, context: dict[str, Any] | None, *, no
 
 
 def evaluate_policies(
-    policies: Iterable[RuntimePolicy],
+    policies: Iterable[RuntimePolicy] | RuntimePolicyIndex,
     context: dict[str, Any] | None,
     *,
     now: str | None = None,
 ) -> list[PolicyEvaluation]:
+    if isinstance(policies, RuntimePolicyIndex):
+        return policies.evaluate(context, now=now)
     return [evaluate_policy(policy, context, now=now) for policy in policies]
 
 
+class RuntimePolicyIndex:
+    """Runtime policies compiled once for evaluation against many contexts.
+
+    Match conditions become predicates with pre-split lookup paths and
+    pre-parsed numeric and severity operands. Identical predicates are
+    shared across policies, and within one context each path is looked up
+    and each predicate evaluated once. Policy types are checked against the
+    context type once per type, not once per policy. ``evaluate`` returns the
+    same ``PolicyEvaluation`` records as ``evaluate_policies`` for the same
+    ``now``. Policies are read once at construction; build a new index after
+    changing them.
+    """
+
+    def __init__(self, policies: Iterable[RuntimePolicy]) -> None:
+        self.policies = list(policies)
+        self._predicates: list[_Predicate] = []
+        interned: dict[tuple[Any, ...], int] = {}
+        self._conditions: list[tuple[int, ...]] = []
+        for policy in self.policies:
+            predicate_ids = []
+            for key, predicate in _compile_conditions(policy.match_conditions):
+                if key not in interned:
+                    interned[key] = len(self._predicates)
+                    self._predicates.append(predicate)
+                predicate_ids.append(interned[key])
+            self._conditions.append(tuple(predicate_ids))
+        self._policy_types = frozenset(policy.policy_type for policy in self.policies)
+
+    def __len__(self) -> int:
+        return len(self.policies)
+
+    @property
+    def predicate_count(self) -> int:
+        return len(self._predicates)
+
+    def evaluate(
+        self,
+        context: dict[str, Any] | None,
+        *,
+        now: str | None = None,
+        matched_only: bool = False,
+    ) -> list[PolicyEvaluation]:
+        return self._evaluate(context, now or _now(), matched_only)
+
+    def evaluate_many(
+        self,
+        contexts: Iterable[dict[str, Any] | None],
+        *,
+        now: str | None = None,
+        matched_only: bool = False,
+    ) -> list[list[PolicyEvaluation]]:
+        """Evaluate every policy against each context; one list per context, in policy order.
+
+        ``matched_only=True`` keeps only matched evaluations and skips building
+        records for the rest.
+        """
+        return [self._evaluate(context, now or _now(), matched_only) for context in contexts]
+
+    def _evaluate(self, context: dict[str, Any] | None, timestamp: str, matched_only: bool) -> list[PolicyEvaluation]:
+        if not isinstance(context, dict):
+            if matched_only:
+                return []
+            return [
+                _evaluation(policy, False, "context_unavailable", 0.0, "degraded", timestamp)
+                if policy.enabled
+                else _evaluation(policy, False, "policy_disabled", 0.0, "not_matched", timestamp)
+                for policy in self.policies
+            ]
+        context_type = str(context.get("policy_type") or context.get("context_type") or context.get("record_type") or "")
+        applicable = {policy_type: not context_type or _type_matches(policy_type, context_type) for policy_type in self._policy_types}
+        lookup = _memoized_lookup(context)
+        results: dict[int, bool | PolicyError] = {}
+        context_confidence: float | None = None
+        confidence_loaded = False
+        evaluations = []
+        for policy, predicate_ids in zip(self.policies, self._conditions):
+            if not policy.enabled:
+                if not matched_only:
+                    evaluations.append(_evaluation(policy, False, "policy_disabled", 0.0, "not_matched", timestamp))
+                continue
+            if not applicable[policy.policy_type]:
+                if not matched_only:
+                    evaluations.append(_evaluation(policy, False, "context_type_not_applicable", 0.0, "not_matched", timestamp))
+                continue
+            total = len(predicate_ids)
+            if total == 0:
+                if not matched_only:
+                    evaluations.append(_evaluation(policy, False, "no_match_conditions", 0.0, "unknown", timestamp))
+                continue
+            matched = 0
+            error: PolicyError | None = None
+            for predicate_id in predicate_ids:
+                result = results.get(predicate_id)
+                if result is None:
+                    try:
+                        result = self._predicates[predicate_id](lookup, context)
+                    except PolicyError as exc:
+                        result = exc
+                    results[predicate_id] = result
+                if isinstance(result, PolicyError):
+                    error = result
+                    break
+                matched += result
+            if error is not None:
+                if not matched_only:
+                    evaluations.append(_evaluation(policy, False, str(error), 0.0, "invalid", timestamp))
+                continue
+            if matched_only and matched != total:
+                continue
+            if not confidence_loaded:
+                context_confidence = _first_number(context, ("confidence_score", "metadata_confidence", "reconstruction_confidence"))
+                confidence_loaded = True
+            confidence = _clamp(matched / total)
+            if context_confidence is not None:
+                confidence = _clamp((confidence + _clamp(context_confidence)) / 2)
+            state = "matched" if matched == total else "not_matched"
+            evaluations.append(_evaluation(policy, matched == total, f"matched {matched}/{total} conditions", confidence, state, timestamp))
+        return evaluations
+
+
+def compile_runtime_policies(policies: Iterable[RuntimePolicy]) -> RuntimePolicyIndex:
+    return RuntimePolicyIndex(policies)
+
+
 def build_policy_runtime_summary(evaluations: Iterable[PolicyEvaluation]) -> dict[str, Any]:
     rows = list(evaluations or [])
     by_state: dict[str, int] = {}
@@ -251,9 +378,8 @@ def _evaluation(
     state: str,
     timestamp: str,
 ) -> PolicyEvaluation:
-    material = "|".join([policy.policy_id, reason, state, timestamp])
     return PolicyEvaluation(
-        evaluation_id="policy-eval-" + sha256(material.encode("utf-8")).hexdigest()[:16],
+        evaluation_id=_evaluation_id(policy.policy_id, reason, state, timestamp),
         policy_id=policy.policy_id,
         matched=matched,
         match_reason=reason,
@@ -268,6 +394,12 @@ def _evaluation(
     )
 
 
+@lru_cache(maxsize=8192)
+def _evaluation_id(policy_id: str, reason: str, state: str, timestamp: str) -> str:
+    material = "|".join([policy_id, reason, state, timestamp])
+    return "policy-eval-" + sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
 def _match_conditions(conditions: dict[str, Any], context: dict[str, Any]) -> tuple[int, int, float]:
     if not conditions:
         return 0, 0, 0.0
@@ -308,6 +440,65 @@ def _match_conditions(conditions: dict[str, Any], context: dict[str, Any]) -> tu
     return matched, total, confidence
 
 
+_Predicate = Callable[[Callable[[Any], Any], dict[str, Any]], bool]
+
+
+def _compile_conditions(conditions: dict[str, Any]) -> list[tuple[tuple[Any, ...], _Predicate]]:
+    """Compile conditions in ``_match_conditions`` order into (intern key, predicate) pairs."""
+    compiled: list[tuple[tuple[Any, ...], _Predicate]] = []
+    for key, expected in sorted(conditions.items()):
+        if key in {"equals", "contains", "minimums", "maximums"} and isinstance(expected, dict):
+            for path, value in sorted(expected.items()):
+                compiled.append(_compile_predicate(key, str(path), value))
+        elif key == "severity_at_least":
+            compiled.append(_compile_predicate(key, "severity", expected))
+        else:
+            compiled.append(_compile_predicate("equals", key, expected))
+    return compiled
+
+
+def _compile_predicate(kind: str, path: Any, value: Any) -> tuple[tuple[Any, ...], _Predicate]:
+    intern_key = (kind, path, type(value).__name__, repr(value))
+    if kind == "equals":
+        return intern_key, lambda lookup, _context: lookup(path) == value
+    if kind == "contains":
+        return intern_key, lambda lookup, _context: _contains(lookup(path), value)
+    if kind in {"minimums", "maximums"}:
+        try:
+            bound = _number(value)
+        except PolicyError as exc:
+            error = exc
+
+            def invalid(lookup: Callable[[Any], Any], _context: dict[str, Any]) -> bool:
+                raise PolicyError(str(error))
+
+            return intern_key, invalid
+        if kind == "minimums":
+            return intern_key, lambda lookup, _context: _number(lookup(path)) >= bound
+        return intern_key, lambda lookup, _context: _number(lookup(path)) <= bound
+    expected_rank = SEVERITY_ORDER.get(str(value or "info").lower())
+
+    def severity_at_least(lookup: Callable[[Any], Any], context: dict[str, Any]) -> bool:
+        observed = str(lookup("severity") or context.get("drift_severity") or "info").lower()
+        if observed not in SEVERITY_ORDER or expected_rank is None:
+            raise PolicyError("invalid severity condition")
+        return SEVERITY_ORDER[observed] >= expected_rank
+
+    return intern_key, severity_at_least
+
+
+def _memoized_lookup(context: dict[str, Any]) -> Callable[[Any], Any]:
+    values: dict[Any, Any] = {}
+
+    def lookup(path: Any) -> Any:
+        if path in values:
+            return values[path]
+        value = values[path] = _lookup(context, path)
+        return value
+
+    return lookup
+
+
 def _type_matches(policy_type: str, context_type: str) -> bool:
     normalized = context_type.lower()
     if policy_type == "port_exposure":
@@ -366,6 +557,14 @@ def _first_number(row: dict[str, Any], keys: Iterable[str]) -> float | None:
 
 
 def _validate_safe_action(action: str) -> None:
+    if isinstance(action, str):
+        _validate_safe_action_text(action)
+    else:
+        _required_str(action, "recommended_action")
+
+
+@lru_cache(maxsize=1024)
+def _validate_safe_action_text(action: str) -> None:
     _required_str(action, "recommended_action")
     lowered = action.lower()
     if any(token in lowered for token in UNSAFE_ACTION_TOKENS):
@@ -1,7 +1,7 @@
 """Lightweight local runtime scheduler primitives."""
 
 from core_engine.runtime.jobs import BUILT_IN_JOB_TYPES, RuntimeJob, RuntimeJobError, create_runtime_job
-from core_engine.runtime.pipeline import run_runtime_pipeline, summarize_runtime_pipeline
+from core_engine.runtime.pipeline import PipelineMemo, PipelineStep, run_runtime_pipeline, summarize_runtime_pipeline
 from core_engine.runtime.profile_loader import (
     export_runtime_profile,
     get_builtin_runtime_profile,
@@ -117,6 +117,8 @@ __all__ = [
     "BUILT_IN_JOB_TYPES",
     "DistributedNodeStateError",
     "LocalRuntimeScheduler",
+    "PipelineMemo",
+    "PipelineStep",
     "RuntimeJob",
     "RuntimeJobError",
     "RuntimeCheckpointError",
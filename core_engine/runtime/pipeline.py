@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from hashlib import sha256
 from typing import Any, Callable, Iterable
 
 from core_engine.events import create_event, event_to_dict
-from core_engine.policy.evaluator import evaluate_delta_against_policies, evaluate_finding_against_policies
+from core_engine.policy.evaluator import PolicyIndex, evaluate_delta_against_policies, evaluate_finding_against_policies
 from core_engine.policy.models import Policy, ReviewRecord
 from core_engine.storage.repositories import LocalStorageRepository
 from core_engine.topology.diff import compare_topology_snapshots
@@ -21,6 +27,55 @@ from core_engine.visibility import build_visibility_report
 
 StepCallable = Callable[[dict[str, Any]], Any]
 
+DEFAULT_PIPELINE_WORKERS = 4
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineStep:
+    """One pipeline step and the context keys it reads and writes.
+
+    Ordering comes from the declared keys: a step waits for every earlier
+    step that writes a key it reads or writes, or that reads a key it writes.
+    Steps with side effects set ``memoize=False``; steps that touch
+    thread-bound resources such as SQLite connections set ``inline=True`` to
+    run on the calling thread.
+    """
+
+    name: str
+    run: StepCallable
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    memoize: bool = True
+    inline: bool = False
+
+
+class PipelineMemo:
+    """Last result of each memoizable step, keyed by a digest of its inputs.
+
+    Pass the same instance to successive ``run_runtime_pipeline`` calls; a
+    step whose inputs hash the same as last time restores its cached outputs
+    instead of running again.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[str, Any, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, name: str, digest: str) -> tuple[Any, dict[str, Any]] | None:
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None or entry[0] != digest:
+            return None
+        return entry[1], {key: _copy_output(value) for key, value in entry[2].items()}
+
+    def store(self, name: str, digest: str, result: Any, outputs: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[name] = (digest, result, {key: _copy_output(value) for key, value in outputs.items()})
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 def run_runtime_pipeline(
     *,
@@ -37,11 +92,15 @@ def run_runtime_pipeline(
     write_local: bool = False,
     generated_at: str | None = None,
     label: str = "runtime-pipeline",
+    memo: PipelineMemo | None = None,
+    max_workers: int = DEFAULT_PIPELINE_WORKERS,
 ) -> dict[str, Any]:
     """Run the explicit local runtime workflow over operator-provided records.
 
     The pipeline never collects data, contacts nodes, executes remediation, or
     writes storage unless ``write_local`` is true and ``dry_run`` is false.
+    Independent steps (policy review, correlation, and events after drift
+    detection) run concurrently on up to ``max_workers`` threads.
     """
     context: dict[str, Any] = {
         "assets": _rows(assets),
@@ -66,16 +125,7 @@ def run_runtime_pipeline(
         "storage_records": [],
         "storage_writes": [],
     }
-    steps = [
-        ("visibility", _step_visibility),
-        ("topology_snapshot", _step_topology_snapshot),
-        ("drift_detection", _step_drift_detection),
-        ("events", _step_events),
-        ("policy_review", _step_policy_review),
-        ("correlation", _step_correlation),
-        ("storage", _step_storage),
-    ]
-    step_results = [_run_step(name, step, context) for name, step in steps]
+    step_results = run_pipeline_steps(RUNTIME_PIPELINE_STEPS, context, memo=memo, max_workers=max_workers)
     return {
         "status": "ok" if all(step["ok"] for step in step_results) else "partial",
         "ok": all(step["ok"] for step in step_results),
@@ -111,6 +161,9 @@ def summarize_runtime_pipeline(context: dict[str, Any], step_results: Iterable[d
         "correlation_record_count": len(context.get("correlation_records") or []),
         "storage_record_count": len(context.get("storage_records") or []),
         "storage_write_count": len(context.get("storage_writes") or []),
+        "memoized_step_count": sum(1 for step in steps if step.get("memoized")),
+        "step_timings_ms": {str(step["step"]): step["duration_ms"] for step in steps if "duration_ms" in step},
+        "total_step_time_ms": round(sum(float(step.get("duration_ms") or 0.0) for step in steps), 3),
         "dry_run": bool(context.get("dry_run", True)),
         "write_local": bool(context.get("write_local", False)),
         **SAFETY_FLAGS,
@@ -208,11 +261,12 @@ def _step_policy_review(context: dict[str, Any]) -> dict[str, Any]:
     policies = context["policies"]
     if not policies:
         return {"review_draft_count": 0, "policy_count": 0}
+    index = PolicyIndex(policies)
     reviews: list[ReviewRecord] = []
     for finding in context["findings"]:
-        reviews.extend(evaluate_finding_against_policies(finding, policies))
+        reviews.extend(evaluate_finding_against_policies(finding, index))
     for drift in _rows((context.get("drift_report") or {}).get("drifts")):
-        reviews.extend(evaluate_delta_against_policies(drift, policies))
+        reviews.extend(evaluate_delta_against_policies(drift, index))
     draft_rows = [review.to_dict() for review in _dedupe_reviews(reviews)]
     context["review_drafts"].extend(draft_rows)
     return {"review_draft_count": len(draft_rows), "policy_count": len(policies)}
@@ -253,30 +307,167 @@ def _step_storage(context: dict[str, Any]) -> dict[str, Any]:
     return {"storage_write_count": len(writes)}
 
 
-def _run_step(name: str, step: StepCallable, context: dict[str, Any]) -> dict[str, Any]:
+RUNTIME_PIPELINE_STEPS: tuple[PipelineStep, ...] = (
+    PipelineStep(
+        "visibility",
+        _step_visibility,
+        inputs=("assets", "services", "flows", "input_findings", "visibility_report", "findings"),
+        outputs=("visibility_report", "findings"),
+    ),
+    PipelineStep(
+        "topology_snapshot",
+        _step_topology_snapshot,
+        inputs=("current_snapshot", "assets", "services", "findings", "label", "generated_at", "snapshots"),
+        outputs=("topology_snapshot", "current_snapshot", "snapshots"),
+    ),
+    PipelineStep(
+        "drift_detection",
+        _step_drift_detection,
+        inputs=("baseline_snapshot", "current_snapshot", "generated_at", "findings", "storage_records", "timeline_entries", "correlation_records"),
+        outputs=("drift_report", "findings", "storage_records", "timeline_entries", "correlation_records"),
+    ),
+    PipelineStep(
+        "events",
+        _step_events,
+        inputs=("visibility_report", "topology_snapshot", "drift_report", "generated_at", "events"),
+        outputs=("events",),
+        memoize=False,
+    ),
+    PipelineStep(
+        "policy_review",
+        _step_policy_review,
+        inputs=("policies", "findings", "drift_report", "review_drafts"),
+        outputs=("review_drafts",),
+        memoize=False,
+    ),
+    PipelineStep(
+        "correlation",
+        _step_correlation,
+        inputs=("correlation_records", "findings"),
+        outputs=("correlation_records",),
+    ),
+    PipelineStep(
+        "storage",
+        _step_storage,
+        inputs=("dry_run", "write_local", "repository", "events", "snapshots", "findings", "storage_writes"),
+        outputs=("storage_writes",),
+        memoize=False,
+        inline=True,
+    ),
+)
+
+
+def pipeline_step_dependencies(steps: Iterable[PipelineStep]) -> dict[str, set[str]]:
+    """Map each step name to the earlier steps it must wait for."""
+    ordered = list(steps)
+    dependencies: dict[str, set[str]] = {}
+    for index, step in enumerate(ordered):
+        reads, writes = set(step.inputs), set(step.outputs)
+        dependencies[step.name] = {
+            earlier.name
+            for earlier in ordered[:index]
+            if set(earlier.outputs) & (reads | writes) or set(earlier.inputs) & writes
+        }
+    return dependencies
+
+
+def run_pipeline_steps(
+    steps: Iterable[PipelineStep],
+    context: dict[str, Any],
+    *,
+    memo: PipelineMemo | None = None,
+    max_workers: int = DEFAULT_PIPELINE_WORKERS,
+) -> list[dict[str, Any]]:
+    """Run ``steps`` as a dependency graph, returning results in declared order.
+
+    A failed step is reported without stopping the steps that depend on it,
+    matching the original sequential behavior.
+    """
+    ordered = list(steps)
+    dependencies = pipeline_step_dependencies(ordered)
+    results: dict[str, dict[str, Any]] = {}
+    if max_workers <= 1:
+        for step in ordered:
+            results[step.name] = _run_step(step, context, memo)
+        return [results[step.name] for step in ordered]
+    pending = {step.name: step for step in ordered}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="portmap-runtime-pipeline") as executor:
+        running: dict[Any, str] = {}
+        while pending or running:
+            for name, step in list(pending.items()):
+                if dependencies[name] <= results.keys():
+                    del pending[name]
+                    if step.inline:
+                        results[name] = _run_step(step, context, memo)
+                    else:
+                        running[executor.submit(_run_step, step, context, memo)] = name
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+    return [results[step.name] for step in ordered]
+
+
+def _run_step(step: PipelineStep, context: dict[str, Any], memo: PipelineMemo | None = None) -> dict[str, Any]:
+    started = time.perf_counter()
+    digest = _inputs_digest(step, context) if memo is not None and step.memoize else None
+    cached = memo.lookup(step.name, digest) if digest is not None else None
+    if cached is not None:
+        result, outputs = cached
+        context.update(outputs)
+        return _step_record(step.name, result=result, started=started, memoized=True)
     try:
-        result = step(context)
+        result = step.run(context)
     except Exception as exc:  # Pipeline steps report failures without aborting later steps.
-        return {
-            "step": name,
-            "ok": False,
-            "status": "failed",
-            "error": str(exc),
+        return _step_record(step.name, error=str(exc), started=started)
+    if digest is not None:
+        memo.store(step.name, digest, result, {key: context[key] for key in step.outputs if key in context})
+    return _step_record(step.name, result=result, started=started)
+
+
+def _step_record(name: str, *, started: float, result: Any = None, error: str | None = None, memoized: bool = False) -> dict[str, Any]:
+    record: dict[str, Any] = {"step": name, "ok": error is None, "status": "ok" if error is None else "failed"}
+    if error is None:
+        record["result"] = result
+    else:
+        record["error"] = error
+    record.update(
+        {
+            "memoized": memoized,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
             "automatic_changes": False,
             "administrator_controlled": True,
             "raw_payload_stored": False,
             "local_only": True,
         }
-    return {
-        "step": name,
-        "ok": True,
-        "status": "ok",
-        "result": result,
-        "automatic_changes": False,
-        "administrator_controlled": True,
-        "raw_payload_stored": False,
-        "local_only": True,
-    }
+    )
+    return record
+
+
+def _inputs_digest(step: PipelineStep, context: dict[str, Any]) -> str:
+    material = json.dumps(
+        {"step": step.name, "inputs": {key: context.get(key) for key in step.inputs}},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=_digest_default,
+    )
+    return sha256(material.encode("utf-8")).hexdigest()
+
+
+def _digest_default(value: Any) -> Any:
+    to_dict = getattr(value, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    return repr(value)
+
+
+def _copy_output(value: Any) -> Any:
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
 
 
 def _event_severity_from_findings(findings: Iterable[dict[str, Any]]) -> str:
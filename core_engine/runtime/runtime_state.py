@@ -1,6 +1,42 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
+
+
+JOB_TIMING_BUCKETS_SECONDS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0)
+
+
+@dataclass(slots=True)
+class JobTimingHistogram:
+    """Per-job start latency and run duration counts over fixed buckets."""
+
+    latency_counts: list[int] = field(default_factory=lambda: [0] * (len(JOB_TIMING_BUCKETS_SECONDS) + 1))
+    duration_counts: list[int] = field(default_factory=lambda: [0] * (len(JOB_TIMING_BUCKETS_SECONDS) + 1))
+    max_latency_seconds: float = 0.0
+    max_duration_seconds: float = 0.0
+    overrun_count: int = 0
+    missed_run_count: int = 0
+
+    def record(self, *, latency: float, duration: float, overrun: bool) -> None:
+        latency = max(0.0, latency)
+        duration = max(0.0, duration)
+        self.latency_counts[_bucket_index(latency)] += 1
+        self.duration_counts[_bucket_index(duration)] += 1
+        self.max_latency_seconds = max(self.max_latency_seconds, latency)
+        self.max_duration_seconds = max(self.max_duration_seconds, duration)
+        if overrun:
+            self.overrun_count += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "latency_histogram": _histogram_dict(self.latency_counts),
+            "duration_histogram": _histogram_dict(self.duration_counts),
+            "max_latency_seconds": self.max_latency_seconds,
+            "max_duration_seconds": self.max_duration_seconds,
+            "overrun_count": self.overrun_count,
+            "missed_run_count": self.missed_run_count,
+        }
 
 
 @dataclass(slots=True)
@@ -10,6 +46,7 @@ class RuntimeState:
     stop_time: float | None = None
     executed_job_count: int = 0
     failed_job_count: int = 0
+    job_timings: dict[str, JobTimingHistogram] = field(default_factory=dict)
 
     def mark_started(self, now: float) -> None:
         self.scheduler_status = "running"
@@ -27,13 +64,20 @@ class RuntimeState:
         self.executed_job_count += 1
         self.failed_job_count += 1
 
+    def record_job_timing(self, job_id: str, *, latency: float, duration: float, overrun: bool = False) -> None:
+        self._timing(job_id).record(latency=latency, duration=duration, overrun=overrun)
+
+    def record_missed_runs(self, job_id: str, count: int) -> None:
+        if count > 0:
+            self._timing(job_id).missed_run_count += count
+
     def uptime_seconds(self, now: float) -> float:
         if self.start_time is None:
             return 0.0
         end = self.stop_time if self.stop_time is not None else now
         return max(0.0, end - self.start_time)
 
-    def to_dict(self, *, now: float) -> dict[str, float | int | str | None]:
+    def to_dict(self, *, now: float) -> dict[str, Any]:
         return {
             "scheduler_status": self.scheduler_status,
             "start_time": self.start_time,
@@ -41,6 +85,26 @@ class RuntimeState:
             "uptime_seconds": self.uptime_seconds(now),
             "executed_job_count": self.executed_job_count,
             "failed_job_count": self.failed_job_count,
+            "job_timings": {job_id: timing.to_dict() for job_id, timing in sorted(self.job_timings.items())},
             "local_only": True,
             "automatic_changes": False,
         }
+
+    def _timing(self, job_id: str) -> JobTimingHistogram:
+        timing = self.job_timings.get(job_id)
+        if timing is None:
+            timing = JobTimingHistogram()
+            self.job_timings[job_id] = timing
+        return timing
+
+
+def _bucket_index(value: float) -> int:
+    for index, bound in enumerate(JOB_TIMING_BUCKETS_SECONDS):
+        if value <= bound:
+            return index
+    return len(JOB_TIMING_BUCKETS_SECONDS)
+
+
+def _histogram_dict(counts: list[int]) -> dict[str, int]:
+    labels = [f"le_{bound:g}s" for bound in JOB_TIMING_BUCKETS_SECONDS] + ["gt_" + f"{JOB_TIMING_BUCKETS_SECONDS[-1]:g}s"]
+    return dict(zip(labels, counts))
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import heapq
+import itertools
+import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
 from core_engine.runtime.jobs import RuntimeJob, RuntimeJobError
@@ -10,9 +14,25 @@ from core_engine.runtime.runtime_state import RuntimeState
 
 JobHandler = Callable[[RuntimeJob], Any]
 
+MISSED_RUN_POLICIES = frozenset({"coalesce", "catch_up", "skip"})
+DEFAULT_MAX_WORKERS = 4
+
 
 class LocalRuntimeScheduler:
-    """Local-only lightweight scheduler for operator-controlled runtime jobs."""
+    """Local-only lightweight scheduler for operator-controlled runtime jobs.
+
+    Enabled jobs sit on a min-heap of next-run times. The background loop
+    sleeps until the earliest one is due (never longer than ``poll_interval``)
+    and hands due handlers to a bounded thread pool, so a slow job no longer
+    delays the others; a job never overlaps with its own previous run.
+
+    ``missed_run_policy`` decides what happens when a job is due more than one
+    interval late: ``coalesce`` runs once and reschedules from completion,
+    ``catch_up`` keeps the fixed-rate grid so missed runs fire back to back,
+    and ``skip`` drops the late run and waits for the next interval.
+    ``jitter_seconds`` adds a random delay of up to that many seconds to each
+    reschedule. Both can be overridden per job through ``job.metadata``.
+    """
 
     def __init__(
         self,
@@ -20,18 +40,37 @@ class LocalRuntimeScheduler:
         poll_interval: float = 1.0,
         time_fn: Callable[[], float] | None = None,
         sleep_fn: Callable[[float], None] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        jitter_seconds: float = 0.0,
+        missed_run_policy: str = "coalesce",
+        random_fn: Callable[[], float] | None = None,
     ) -> None:
         if poll_interval <= 0:
             raise ValueError("poll_interval must be greater than zero")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than zero")
+        if jitter_seconds < 0:
+            raise ValueError("jitter_seconds must not be negative")
+        if missed_run_policy not in MISSED_RUN_POLICIES:
+            raise ValueError(f"unsupported missed_run_policy: {missed_run_policy}")
         self.poll_interval = poll_interval
+        self.max_workers = int(max_workers)
+        self.jitter_seconds = float(jitter_seconds)
+        self.missed_run_policy = missed_run_policy
         self._time = time_fn or time.time
-        self._sleep = sleep_fn or time.sleep
+        self._sleep = sleep_fn
+        self._random = random_fn or random.random
         self._jobs: dict[str, RuntimeJob] = {}
         self._handlers: dict[str, JobHandler] = {}
         self._state = RuntimeState()
         self._lock = threading.RLock()
         self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
         self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._heap: list[tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._running: set[str] = set()
 
     @property
     def local_only(self) -> bool:
@@ -46,11 +85,15 @@ class LocalRuntimeScheduler:
             raise RuntimeJobError("add_job requires a RuntimeJob")
         if handler is not None and not callable(handler):
             raise RuntimeJobError("handler must be callable")
+        policy = job.metadata.get("missed_run_policy")
+        if policy is not None and policy not in MISSED_RUN_POLICIES:
+            raise RuntimeJobError(f"unsupported missed_run_policy: {policy}")
         with self._lock:
             if job.job_id in self._jobs:
                 raise RuntimeJobError(f"job already exists: {job.job_id}")
             self._jobs[job.job_id] = job
             self._handlers[job.job_id] = handler or _default_handler
+            self._push(job)
         return job
 
     def remove_job(self, job_id: str) -> bool:
@@ -65,6 +108,7 @@ class LocalRuntimeScheduler:
             if job is None:
                 return False
             job.mark_enabled(self._time())
+            self._push(job)
             return True
 
     def disable_job(self, job_id: str) -> bool:
@@ -80,13 +124,9 @@ class LocalRuntimeScheduler:
             return sorted(self._jobs.values(), key=lambda item: item.job_id)
 
     def run_due_jobs_once(self) -> list[dict[str, Any]]:
-        now = self._time()
-        with self._lock:
-            due = [(job, self._handlers[job.job_id]) for job in self._jobs.values() if job.is_due(now)]
-        results: list[dict[str, Any]] = []
-        for job, handler in sorted(due, key=lambda item: item[0].job_id):
-            results.append(self._run_job(job, handler))
-        return results
+        """Run every due job inline on the calling thread, ordered by job id."""
+        due = self._take_due(self._time())
+        return [self._run_job(job, handler, scheduled_at) for job, handler, scheduled_at in due]
 
     def start(self) -> None:
         with self._lock:
@@ -94,28 +134,82 @@ class LocalRuntimeScheduler:
                 return
             self._stop_event.clear()
             self._state.mark_started(self._time())
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="portmap-runtime-job")
             self._thread = threading.Thread(target=self._run_loop, name="portmap-local-runtime-scheduler", daemon=True)
             self._thread.start()
 
     def stop(self, *, timeout: float = 2.0) -> None:
         self._stop_event.set()
+        self._wakeup.set()
         thread = self._thread
         if thread is not None:
             thread.join(timeout=timeout)
+        executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
         with self._lock:
             self._state.mark_stopped(self._time())
             self._thread = None
+            self._executor = None
 
     def status(self) -> dict[str, Any]:
-        return self._state.to_dict(now=self._time())
+        with self._lock:
+            return self._state.to_dict(now=self._time())
+
+    def next_due_in(self) -> float | None:
+        """Seconds until the earliest scheduled job, or ``None`` when nothing is scheduled."""
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - self._time())
 
     def _run_loop(self) -> None:
         while not self._stop_event.is_set():
-            self.run_due_jobs_once()
-            self._sleep(self.poll_interval)
+            for job, handler, scheduled_at in self._take_due(self._time()):
+                executor = self._executor
+                if executor is None:
+                    break
+                try:
+                    executor.submit(self._run_job, job, handler, scheduled_at)
+                except RuntimeError:
+                    with self._lock:
+                        self._running.discard(job.job_id)
+                    break
+            delay = self.next_due_in()
+            delay = self.poll_interval if delay is None else min(delay, self.poll_interval)
+            if self._sleep is not None:
+                self._sleep(delay)
+            else:
+                self._wakeup.wait(delay)
+                self._wakeup.clear()
+
+    def _push(self, job: RuntimeJob) -> None:
+        if job.enabled:
+            heapq.heappush(self._heap, (_next_run(job), next(self._sequence), job.job_id))
+            self._wakeup.set()
 
-    def _run_job(self, job: RuntimeJob, handler: JobHandler) -> dict[str, Any]:
+    def _take_due(self, now: float) -> list[tuple[RuntimeJob, JobHandler, float]]:
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                scheduled_at, _sequence, job_id = heapq.heappop(self._heap)
+                job = self._jobs.get(job_id)
+                if job is None or not job.enabled or job_id in self._running or _next_run(job) != scheduled_at:
+                    continue
+                missed = self._missed_runs(job, scheduled_at, now)
+                if missed and self._policy(job) == "skip":
+                    self._state.record_missed_runs(job_id, missed)
+                    job.next_run_at = now + job.interval_seconds + self._jitter(job)
+                    self._push(job)
+                    continue
+                self._state.record_missed_runs(job_id, missed)
+                self._running.add(job_id)
+                due.append((job, self._handlers[job_id], scheduled_at))
+        return sorted(due, key=lambda item: item[0].job_id)
+
+    def _run_job(self, job: RuntimeJob, handler: JobHandler, scheduled_at: float | None = None) -> dict[str, Any]:
         now = self._time()
+        scheduled = now if scheduled_at is None else scheduled_at
         with self._lock:
             job.status = "running"
             job.last_run_at = now
@@ -127,16 +221,50 @@ class LocalRuntimeScheduler:
                 job.status = "failed"
                 job.last_error = str(exc)
                 job.failure_count += 1
-                job.schedule_next(self._time())
+                self._finish(job, scheduled, started_at=now)
                 self._state.record_job_failure()
             return {"job_id": job.job_id, "name": job.name, "ok": False, "error": str(exc)}
         with self._lock:
             job.status = "success"
             job.last_error = None
-            job.schedule_next(self._time())
+            self._finish(job, scheduled, started_at=now)
             self._state.record_job_success()
         return {"job_id": job.job_id, "name": job.name, "ok": True, "result": output}
 
+    def _finish(self, job: RuntimeJob, scheduled_at: float, *, started_at: float) -> None:
+        finished_at = self._time()
+        duration = finished_at - started_at
+        self._state.record_job_timing(
+            job.job_id,
+            latency=started_at - scheduled_at,
+            duration=duration,
+            overrun=duration > job.interval_seconds,
+        )
+        if self._policy(job) == "catch_up" and scheduled_at > 0:
+            job.next_run_at = scheduled_at + job.interval_seconds
+        else:
+            job.schedule_next(finished_at)
+        job.next_run_at += self._jitter(job)
+        self._running.discard(job.job_id)
+        if job.job_id in self._jobs:
+            self._push(job)
+
+    def _missed_runs(self, job: RuntimeJob, scheduled_at: float, now: float) -> int:
+        if scheduled_at <= 0:
+            return 0
+        return int((now - scheduled_at) // job.interval_seconds)
+
+    def _policy(self, job: RuntimeJob) -> str:
+        return str(job.metadata.get("missed_run_policy") or self.missed_run_policy)
+
+    def _jitter(self, job: RuntimeJob) -> float:
+        spread = float(job.metadata.get("jitter_seconds", self.jitter_seconds) or 0.0)
+        return self._random() * spread if spread > 0 else 0.0
+
+
+def _next_run(job: RuntimeJob) -> float:
+    return job.next_run_at if job.next_run_at is not None else 0.0
+
 
 def _default_handler(job: RuntimeJob) -> dict[str, Any]:
     return {
@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+import json
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Any, Callable, Iterable
+
+
+DEFAULT_PARTITION_COUNT = 64
+DEFAULT_SNAPSHOT_INDEX_ENTRIES = 64
+_HASH_MASK = (1 << 64) - 1
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+KeyFunction = Callable[[dict[str, Any]], str]
+ContentFunction = Callable[[dict[str, Any]], Any]
+FlagFunction = Callable[[Any], bool]
+
+
+class SnapshotDiffError(ValueError):
+    """Raised when keyed snapshots cannot be compared."""
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotKeySpec:
+    """How one snapshot section is keyed, fingerprinted, and flagged.
+
+    ``key`` returns the record key; records whose key is empty are skipped and
+    later records replace earlier ones with the same key. ``content`` returns
+    the fields a caller compares; two records with equal content count as
+    unchanged. ``None`` compares keys only. ``flag`` receives the ``content``
+    value and marks records that must be reported even when unchanged, for
+    checks that look at a single side (such as low-confidence matches).
+    """
+
+    name: str
+    key: KeyFunction
+    content: ContentFunction | None = None
+    flag: FlagFunction | None = None
+    partition_count: int = DEFAULT_PARTITION_COUNT
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotDelta:
+    """Sorted keys that differ between two keyed snapshots."""
+
+    added: tuple[str, ...]
+    removed: tuple[str, ...]
+    changed: tuple[str, ...]
+    flagged: tuple[str, ...]
+    partition_count: int = 0
+    skipped_partition_count: int = 0
+
+    @property
+    def change_count(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def common(self) -> list[str]:
+        """Keys present on both sides that callers must inspect, in sorted order."""
+        return sorted({*self.changed, *self.flagged})
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "added": list(self.added),
+            "removed": list(self.removed),
+            "changed": list(self.changed),
+            "flagged": list(self.flagged),
+            "change_count": self.change_count,
+            "partition_count": self.partition_count,
+            "skipped_partition_count": self.skipped_partition_count,
+        }
+
+
+class KeyedSnapshot:
+    """One snapshot section stored as key-sorted record streams.
+
+    Records are spread over ``spec.partition_count`` partitions by key hash.
+    Each partition keeps its keys sorted, a content fingerprint per key, and
+    an order-independent digest (XOR of the fingerprints). Two snapshots diff by
+    skipping partitions whose digests match and merge-joining the sorted key
+    lists of the rest; keys whose fingerprints match are confirmed against the
+    stored content. ``upsert`` and ``remove`` keep all of this current in
+    O(log n) per record.
+    """
+
+    def __init__(self, rows: Iterable[dict[str, Any]] | None = None, *, spec: SnapshotKeySpec) -> None:
+        if int(spec.partition_count) <= 0:
+            raise SnapshotDiffError("partition_count must be greater than zero")
+        self.spec = spec
+        self._rows: dict[str, dict[str, Any]] = {}
+        self._hashes: dict[str, int] = {}
+        self._material: dict[str, Any] = {}
+        self._keys: list[list[str]] = [[] for _ in range(spec.partition_count)]
+        self._digests: list[int] = [0] * spec.partition_count
+        self._flagged: list[set[str]] = [set() for _ in range(spec.partition_count)]
+        latest: dict[str, dict[str, Any]] = {}
+        key_fn = spec.key
+        for row in rows or []:
+            if isinstance(row, dict):
+                key = key_fn(row)
+                if key:
+                    latest[key if type(key) is str else str(key)] = row
+        count = spec.partition_count
+        content = spec.content
+        flag = spec.flag
+        hashes = self._hashes
+        materials = self._material
+        digests = self._digests
+        partitions = self._keys
+        flagged = self._flagged
+        for key, row in latest.items():
+            partition = hash(key) % count
+            if content is None:
+                value = hash(key) & _HASH_MASK
+            else:
+                material = content(row)
+                value = _content_hash(key, material)
+                materials[key] = material
+                if flag is not None and flag(material):
+                    flagged[partition].add(key)
+            hashes[key] = value
+            digests[partition] ^= value
+            partitions[partition].append(key)
+        self._rows = latest
+        for keys in partitions:
+            keys.sort()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        return self._rows[key]
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self._rows.get(key)
+
+    def keys(self) -> list[str]:
+        return sorted(self._rows)
+
+    def rows(self) -> list[dict[str, Any]]:
+        return [self._rows[key] for key in self.keys()]
+
+    def partition_digests(self) -> list[str]:
+        return [f"{value:016x}" for value in self._digests]
+
+    def upsert(self, row: dict[str, Any]) -> str:
+        """Insert or replace ``row``; returns ``"added"``, ``"changed"``, ``"unchanged"`` or ``""`` when skipped."""
+        key = str(self.spec.key(row) or "")
+        if not key:
+            return ""
+        previous = self._hashes.get(key)
+        if previous is None:
+            self._insert(key, row)
+            return "added"
+        partition = self._partition(key)
+        previous_material = self._material.get(key)
+        value = self._fingerprint(partition, key, row)
+        self._rows[key] = row
+        if value == previous and self._material.get(key) == previous_material:
+            return "unchanged"
+        self._hashes[key] = value
+        self._digests[partition] ^= previous ^ value
+        return "changed"
+
+    def remove(self, key: str) -> dict[str, Any] | None:
+        row = self._rows.pop(key, None)
+        if row is None:
+            return None
+        partition = self._partition(key)
+        keys = self._keys[partition]
+        del keys[bisect_left(keys, key)]
+        self._digests[partition] ^= self._hashes.pop(key)
+        self._material.pop(key, None)
+        self._flagged[partition].discard(key)
+        return row
+
+    def _insert(self, key: str, row: dict[str, Any]) -> None:
+        partition = self._partition(key)
+        value = self._fingerprint(partition, key, row)
+        self._rows[key] = row
+        self._hashes[key] = value
+        self._digests[partition] ^= value
+        insort(self._keys[partition], key)
+
+    def _fingerprint(self, partition: int, key: str, row: dict[str, Any]) -> int:
+        """Hash ``row``, store its content, and refresh its flag."""
+        if self.spec.content is None:
+            return hash(key) & _HASH_MASK
+        material = self.spec.content(row)
+        self._material[key] = material
+        if self.spec.flag is not None and self.spec.flag(material):
+            self._flagged[partition].add(key)
+        else:
+            self._flagged[partition].discard(key)
+        return _content_hash(key, material)
+
+    def _partition(self, key: str) -> int:
+        return hash(key) % self.spec.partition_count
+
+
+def diff_keyed_snapshots(before: KeyedSnapshot, after: KeyedSnapshot) -> SnapshotDelta:
+    """Diff two snapshots built from the same spec, skipping identical partitions."""
+    if before.spec.partition_count != after.spec.partition_count:
+        raise SnapshotDiffError("keyed snapshots must use the same partition_count")
+    added: list[str] = []
+    removed: list[str] = []
+    changed: list[str] = []
+    flagged: list[str] = []
+    skipped = 0
+    for partition in range(before.spec.partition_count):
+        if before._digests[partition] == after._digests[partition]:
+            skipped += 1
+            flagged.extend(before._flagged[partition] | after._flagged[partition])
+            continue
+        _merge_join(before, after, partition, added, removed, changed, flagged)
+    return SnapshotDelta(
+        added=tuple(sorted(added)),
+        removed=tuple(sorted(removed)),
+        changed=tuple(sorted(changed)),
+        flagged=tuple(sorted(flagged)),
+        partition_count=before.spec.partition_count,
+        skipped_partition_count=skipped,
+    )
+
+
+class RunningSnapshot:
+    """A keyed snapshot kept current across cycles.
+
+    ``apply`` takes only the records that changed since the previous cycle
+    and returns their delta in O(changes). ``advance`` takes a full record
+    set, for producers that cannot report changes, and diffs it against the
+    running state before replacing it.
+    """
+
+    def __init__(self, rows: Iterable[dict[str, Any]] | None = None, *, spec: SnapshotKeySpec) -> None:
+        self.current = KeyedSnapshot(rows, spec=spec)
+
+    def apply(
+        self,
+        *,
+        upserts: Iterable[dict[str, Any]] | None = None,
+        removals: Iterable[str] | None = None,
+    ) -> SnapshotDelta:
+        current = self.current
+        original: dict[str, tuple[int | None, Any]] = {}
+        for key in removals or []:
+            key = str(key)
+            original.setdefault(key, (current._hashes.get(key), current._material.get(key)))
+            current.remove(key)
+        for row in upserts or []:
+            if not isinstance(row, dict):
+                continue
+            key = str(current.spec.key(row) or "")
+            if key:
+                original.setdefault(key, (current._hashes.get(key), current._material.get(key)))
+                current.upsert(row)
+        added: list[str] = []
+        removed: list[str] = []
+        changed: list[str] = []
+        for key, (before, before_material) in original.items():
+            after = current._hashes.get(key)
+            if before is None and after is not None:
+                added.append(key)
+            elif before is not None and after is None:
+                removed.append(key)
+            elif before != after or before_material != current._material.get(key):
+                changed.append(key)
+        touched = {*added, *changed}
+        flagged = [key for keys in current._flagged for key in keys if key not in touched]
+        return SnapshotDelta(
+            added=tuple(sorted(added)),
+            removed=tuple(sorted(removed)),
+            changed=tuple(sorted(changed)),
+            flagged=tuple(sorted(flagged)),
+            partition_count=current.spec.partition_count,
+        )
+
+    def advance(self, rows: Iterable[dict[str, Any]]) -> SnapshotDelta:
+        snapshot = rows if isinstance(rows, KeyedSnapshot) else KeyedSnapshot(rows, spec=self.current.spec)
+        delta = diff_keyed_snapshots(self.current, snapshot)
+        self.current = snapshot
+        return delta
+
+
+class SnapshotIndexCache:
+    """Bounded LRU of keyed snapshot sections, keyed by source object identity.
+
+    Comparison helpers index the same baseline or snapshot on every cycle;
+    passing one cache across calls indexes each source once. Entries keep a
+    reference to their source, so an ``id()`` cannot be reused while cached.
+    Only cache sources that are not mutated afterwards.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_SNAPSHOT_INDEX_ENTRIES) -> None:
+        if int(max_entries) <= 0:
+            raise SnapshotDiffError("max_entries must be greater than zero")
+        self.max_entries = int(max_entries)
+        self._entries: OrderedDict[tuple[int, str], tuple[Any, KeyedSnapshot]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def index(self, source: Any, rows: Callable[[], Iterable[dict[str, Any]]], spec: SnapshotKeySpec) -> KeyedSnapshot:
+        key = (id(source), spec.name)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is source and entry[1].spec is spec:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        snapshot = KeyedSnapshot(rows(), spec=spec)
+        self._entries[key] = (source, snapshot)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return snapshot
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def keyed_snapshot(
+    source: Iterable[dict[str, Any]] | KeyedSnapshot | None,
+    spec: SnapshotKeySpec,
+    *,
+    cache: SnapshotIndexCache | None = None,
+) -> KeyedSnapshot:
+    """Return ``source`` as a keyed snapshot for ``spec``, reusing it or a cached index when possible."""
+    if isinstance(source, KeyedSnapshot) and source.spec is spec:
+        return source
+    if isinstance(source, KeyedSnapshot):
+        return KeyedSnapshot(source.rows(), spec=spec)
+    if cache is not None and isinstance(source, (list, tuple)):
+        return cache.index(source, lambda: _materialize(source), spec)
+    return KeyedSnapshot(_materialize(source), spec=spec)
+
+
+def diff_rows(
+    before: Iterable[dict[str, Any]] | KeyedSnapshot | None,
+    after: Iterable[dict[str, Any]] | KeyedSnapshot | None,
+    spec: SnapshotKeySpec,
+    *,
+    cache: SnapshotIndexCache | None = None,
+) -> tuple[KeyedSnapshot, KeyedSnapshot, SnapshotDelta]:
+    """Index both sides with ``spec`` and diff them."""
+    baseline = keyed_snapshot(before, spec, cache=cache)
+    current = keyed_snapshot(after, spec, cache=cache)
+    return baseline, current, diff_keyed_snapshots(baseline, current)
+
+
+def _merge_join(
+    before: KeyedSnapshot,
+    after: KeyedSnapshot,
+    partition: int,
+    added: list[str],
+    removed: list[str],
+    changed: list[str],
+    flagged: list[str],
+) -> None:
+    left = before._keys[partition]
+    right = after._keys[partition]
+    left_flags = before._flagged[partition]
+    right_flags = after._flagged[partition]
+    left_material = before._material
+    right_material = after._material
+    i = j = 0
+    while i < len(left) and j < len(right):
+        lkey = left[i]
+        rkey = right[j]
+        if lkey == rkey:
+            if before._hashes[lkey] != after._hashes[rkey] or left_material.get(lkey) != right_material.get(rkey):
+                changed.append(lkey)
+            elif lkey in left_flags or lkey in right_flags:
+                flagged.append(lkey)
+            i += 1
+            j += 1
+        elif lkey < rkey:
+            removed.append(lkey)
+            i += 1
+        else:
+            added.append(rkey)
+            j += 1
+    removed.extend(left[i:])
+    added.extend(right[j:])
+
+
+def _content_hash(key: str, material: Any) -> int:
+    # Partition digests XOR these fingerprints, so they come from a real digest
+    # rather than the interpreter's hash, which collides on ordinary values
+    # (hash(-1) == hash(-2)). Scalars and flat tuples of scalars have a
+    # canonical repr; anything else goes through canonical JSON.
+    kind = type(material)
+    if kind in _SCALAR_TYPES or (kind is tuple and all(type(item) in _SCALAR_TYPES for item in material)):
+        payload = "r" + repr((key, material))
+    else:
+        payload = "j" + json.dumps([key, material], sort_keys=True, separators=(",", ":"), default=str)
+    return int.from_bytes(blake2b(payload.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _materialize(source: Any) -> list[dict[str, Any]]:
+    return [item for item in source or [] if isinstance(item, dict)]
+
+
+__all__ = [
+    "DEFAULT_PARTITION_COUNT",
+    "DEFAULT_SNAPSHOT_INDEX_ENTRIES",
+    "KeyedSnapshot",
+    "RunningSnapshot",
+    "SnapshotDelta",
+    "SnapshotDiffError",
+    "SnapshotIndexCache",
+    "SnapshotKeySpec",
+    "diff_keyed_snapshots",
+    "diff_rows",
+    "keyed_snapshot",
+]
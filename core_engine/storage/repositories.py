@@ -5,10 +5,13 @@ from datetime import UTC, datetime
 from hashlib import sha256
 from typing import Any
 
-from core_engine.events import LocalEvent, event_to_dict
+from core_engine.events import LocalEvent
 from core_engine.storage.sqlite_store import SQLiteStore, StorageError
 
 
+_EVENT_COLUMNS = ("event_id", "event_type", "severity", "source", "timestamp", "message")
+
+
 class LocalStorageRepository:
     """Repository methods for local SQLite visibility records."""
 
@@ -21,23 +24,20 @@ class LocalStorageRepository:
         return self.store.local_only
 
     def insert_event(self, event: LocalEvent | dict[str, Any]) -> int:
-        payload = event_to_dict(event) if isinstance(event, LocalEvent) else dict(event)
-        event_id = _required(payload, "event_id")
+        if isinstance(event, LocalEvent):
+            # Validated at construction; reuse the encoding the bus and event log already share.
+            columns = tuple(getattr(event, field_name) for field_name in _EVENT_COLUMNS)
+            payload_json = _event_json(event)
+        else:
+            payload = dict(event)
+            columns = tuple(_required(payload, field_name) for field_name in _EVENT_COLUMNS)
+            payload_json = _to_json(payload)
         cursor = self.store.execute(
             """
             INSERT INTO events (event_id, event_type, severity, source, timestamp, message, payload_json, created_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                event_id,
-                _required(payload, "event_type"),
-                _required(payload, "severity"),
-                _required(payload, "source"),
-                _required(payload, "timestamp"),
-                _required(payload, "message"),
-                _to_json(payload),
-                _now(),
-            ),
+            (*columns, payload_json, _now()),
         )
         return int(cursor.lastrowid)
 
@@ -179,6 +179,13 @@ def _optional_int(value: Any) -> int | None:
         raise StorageError("port must be an integer when provided") from exc
 
 
+def _event_json(event: LocalEvent) -> str:
+    try:
+        return event.to_json()
+    except TypeError as exc:
+        raise StorageError(f"payload is not JSON serializable: {exc}") from exc
+
+
 def _to_json(payload: dict[str, Any]) -> str:
     try:
         return json.dumps(payload, sort_keys=True, separators=(",", ":"))
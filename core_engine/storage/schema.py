@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 2
 
 
 SCHEMA_STATEMENTS = (
@@ -75,4 +75,54 @@ SCHEMA_STATEMENTS = (
         created_at TEXT NOT NULL
     )
     """,
+    """
+    CREATE TABLE IF NOT EXISTS review_records (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        review_id TEXT NOT NULL UNIQUE,
+        status TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        category TEXT NOT NULL,
+        source_ref TEXT NOT NULL,
+        approval_required INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        base_json TEXT NOT NULL,
+        payload_json TEXT NOT NULL,
+        stored_at TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS review_records_status ON review_records (status, created_at, review_id)",
+    "CREATE INDEX IF NOT EXISTS review_records_severity ON review_records (severity, created_at, review_id)",
+    "CREATE INDEX IF NOT EXISTS review_records_category ON review_records (category, created_at, review_id)",
+    "CREATE INDEX IF NOT EXISTS review_records_source_ref ON review_records (source_ref, created_at, review_id)",
+    "CREATE INDEX IF NOT EXISTS review_records_created ON review_records (created_at, review_id)",
+    """
+    CREATE TABLE IF NOT EXISTS review_transitions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        transition_id TEXT NOT NULL UNIQUE,
+        review_id TEXT NOT NULL,
+        previous_status TEXT NOT NULL,
+        new_status TEXT NOT NULL,
+        transitioned_at TEXT NOT NULL,
+        payload_json TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS review_transitions_review ON review_transitions (review_id, transitioned_at, transition_id)",
+    "CREATE INDEX IF NOT EXISTS review_transitions_order ON review_transitions (transitioned_at, transition_id)",
+    """
+    CREATE TABLE IF NOT EXISTS finding_statuses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        status_record_id TEXT NOT NULL UNIQUE,
+        finding_ref TEXT NOT NULL,
+        status TEXT NOT NULL,
+        source_ref TEXT,
+        updated_at TEXT NOT NULL,
+        payload_json TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS finding_statuses_ref ON finding_statuses (finding_ref, updated_at, status_record_id)",
+    "CREATE INDEX IF NOT EXISTS finding_statuses_status ON finding_statuses (status)",
+    "CREATE INDEX IF NOT EXISTS finding_statuses_order ON finding_statuses (updated_at, status_record_id)",
 )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import sqlite3
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from core_engine.storage.schema import SCHEMA_STATEMENTS, SCHEMA_VERSION
 
@@ -62,6 +63,22 @@ class SQLiteStore:
         except sqlite3.Error as exc:
             raise StorageError(str(exc)) from exc
 
+    @contextmanager
+    def transaction(self, *, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Run several statements as one transaction, rolling back on any error.
+
+        ``immediate`` takes the write lock up front (``BEGIN IMMEDIATE``), so
+        rows read inside the transaction cannot change before it commits.
+        """
+        connection = self.connect()
+        try:
+            with connection:
+                if immediate:
+                    connection.execute("BEGIN IMMEDIATE")
+                yield connection
+        except sqlite3.Error as exc:
+            raise StorageError(str(exc)) from exc
+
     def close(self) -> None:
         if self._connection is not None:
             self._connection.close()
@@ -1,6 +1,7 @@
 """Metadata-only local stream parsing helpers."""
 
 from core_engine.streams.metadata_parser import (
+    StreamFrameReader,
     build_stream_correlation_record,
     build_stream_event,
     build_stream_finding,
@@ -9,11 +10,13 @@ from core_engine.streams.metadata_parser import (
     build_stream_topology_summary,
     parse_stream_bytes,
     parse_stream_file,
+    parse_stream_source,
     summarize_stream_result,
 )
 from core_engine.streams.patterns import detect_patterns, normalize_patterns
 
 __all__ = [
+    "StreamFrameReader",
     "build_stream_correlation_record",
     "build_stream_event",
     "build_stream_finding",
@@ -24,5 +27,6 @@ __all__ = [
     "normalize_patterns",
     "parse_stream_bytes",
     "parse_stream_file",
+    "parse_stream_source",
     "summarize_stream_result",
 ]
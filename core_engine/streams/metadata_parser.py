@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import re
+import time
 from collections import Counter
 from datetime import UTC, datetime
 from hashlib import sha256
 from math import log2
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
-from core_engine.streams.patterns import SAFETY_FLAGS, detect_patterns, normalize_patterns
+from core_engine.streams.patterns import SAFETY_FLAGS, normalize_patterns
 
 
 STREAM_METADATA_RECORD_VERSION = 2
@@ -17,6 +19,10 @@ STATUS_SEVERITY = {
     "unsupported": "high",
     "input_limited": "low",
 }
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_FRAME_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_FRAME_ROWS = 128
+PRINTABLE_BYTES = frozenset({9, 10, 13, *range(32, 127)})
 
 
 def parse_stream_bytes(
@@ -46,7 +52,8 @@ def parse_stream_bytes(
         length_prefix_bytes=length_prefix_bytes,
         max_frames=max_frames,
     )
-    frame_rows = [_frame_metadata(index, offset, payload, patterns) for index, offset, payload in frames]
+    matchers = _compile_patterns(pattern_result)
+    frame_rows = [_frame_metadata(index, offset, payload, matchers) for index, offset, payload in frames]
     status = "ok" if not errors else "malformed"
     if len(frames) >= max_frames and _has_more_frames(raw, frames):
         status = "input_limited"
@@ -95,17 +102,240 @@ def parse_stream_file(
     return result
 
 
+class StreamFrameReader:
+    """Incremental frame parser over a local file, file object, socket, or byte chunks.
+
+    Input is read ``chunk_size`` bytes at a time; a frame split across chunks
+    is carried over, so memory stays bounded by the chunk size plus
+    ``max_frame_bytes``. Iterating yields frame metadata rows lazily, in the
+    shape produced by ``parse_stream_bytes``, with pattern detection run over
+    memoryview slices of each chunk. Without ``frame_size``, ``delimiter`` or
+    ``length_prefix_bytes`` the stream is cut into ``chunk_size`` frames.
+    After iteration, ``errors``, ``bytes_read``, ``frame_count`` and
+    ``elapsed`` describe the pass; ``limited`` is set when ``max_frames``
+    stopped it early.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        *,
+        patterns: Iterable[dict[str, Any]] | None = None,
+        frame_size: int | None = None,
+        delimiter: bytes | None = None,
+        length_prefix_bytes: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_frames: int | None = None,
+        max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES,
+    ) -> None:
+        self.source = source
+        self.pattern_result = normalize_patterns(patterns)
+        self.frame_size = frame_size
+        self.delimiter = delimiter
+        self.length_prefix_bytes = length_prefix_bytes
+        self.chunk_size = chunk_size
+        self.max_frames = max_frames
+        self.max_frame_bytes = max_frame_bytes
+        self.errors: list[str] = []
+        self.bytes_read = 0
+        self.frame_count = 0
+        self.elapsed = 0.0
+        self.limited = False
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        started = time.perf_counter()
+        try:
+            yield from self._frames()
+        finally:
+            self.elapsed = time.perf_counter() - started
+
+    def throughput(self) -> dict[str, Any]:
+        return {
+            "bytes_read": self.bytes_read,
+            "elapsed_seconds": round(self.elapsed, 6),
+            "mb_per_second": round(self.bytes_read / 1_000_000 / self.elapsed, 3) if self.elapsed else 0.0,
+        }
+
+    def _frames(self) -> Iterator[dict[str, Any]]:
+        if not self.pattern_result["ok"]:
+            self.errors.extend(self.pattern_result["errors"])
+            return
+        if self.chunk_size <= 0 or self.max_frame_bytes <= 0:
+            self.errors.append("chunk_size and max_frame_bytes must be positive")
+            return
+        if self.frame_size is not None and self.frame_size <= 0:
+            self.errors.append("frame_size must be positive")
+            return
+        if self.length_prefix_bytes and self.length_prefix_bytes not in {1, 2, 4}:
+            self.errors.append("length_prefix_bytes must be 1, 2, or 4")
+            return
+        matchers = _compile_patterns(self.pattern_result)
+        for offset, payload in self._split(self._chunks()):
+            if self.max_frames is not None and self.frame_count >= self.max_frames:
+                self.limited = True
+                self.errors.append(f"frame count reached max_frames {self.max_frames}")
+                return
+            yield _frame_metadata(self.frame_count, offset, payload, matchers)
+            self.frame_count += 1
+
+    def _chunks(self) -> Iterator[bytes]:
+        source = self.source
+        if isinstance(source, (str, Path)):
+            try:
+                with Path(source).open("rb") as handle:
+                    yield from self._read_chunks(handle.read)
+            except OSError as exc:
+                self.errors.append(f"local file could not be read: {type(exc).__name__}")
+            return
+        if hasattr(source, "recv"):
+            yield from self._read_chunks(source.recv)
+        elif hasattr(source, "read"):
+            yield from self._read_chunks(source.read)
+        else:
+            for chunk in source:
+                self.bytes_read += len(chunk)
+                yield bytes(chunk)
+
+    def _read_chunks(self, read: Any) -> Iterator[bytes]:
+        while True:
+            chunk = read(self.chunk_size)
+            if not chunk:
+                return
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def _split(self, chunks: Iterator[bytes]) -> Iterator[tuple[int, memoryview]]:
+        """Yield ``(stream offset, payload view)`` for each frame, carrying partial frames forward."""
+        carry = b""
+        base = 0
+        started = False
+        limit = self.max_frame_bytes + self.length_prefix_bytes + len(self.delimiter or b"")
+        for chunk in chunks:
+            started = True
+            data = carry + chunk if carry else chunk
+            frames, position, failed = self._complete_frames(data)
+            for start, frame in frames:
+                yield base + start, frame
+            if failed:
+                return
+            carry = data[position:]
+            base += position
+            if len(carry) > limit:
+                self.errors.append(f"frame exceeds max_frame_bytes {self.max_frame_bytes}")
+                return
+        if started:
+            yield from self._final_frame(carry, base)
+
+    def _complete_frames(self, data: bytes) -> tuple[list[tuple[int, memoryview]], int, bool]:
+        """Frames wholly inside ``data``, where unparsed input starts, and whether framing failed."""
+        view = memoryview(data)
+        frames: list[tuple[int, memoryview]] = []
+        position = 0
+        if self.length_prefix_bytes:
+            width = self.length_prefix_bytes
+            while position + width <= len(data):
+                length = int.from_bytes(data[position : position + width], "big")
+                if length > self.max_frame_bytes:
+                    self.errors.append(f"frame exceeds max_frame_bytes {self.max_frame_bytes}")
+                    return frames, position, True
+                end = position + width + length
+                if end > len(data):
+                    break
+                frames.append((position + width, view[position + width : end]))
+                position = end
+        elif self.delimiter:
+            while (end := data.find(self.delimiter, position)) >= 0:
+                frames.append((position, view[position:end]))
+                position = end + len(self.delimiter)
+        else:
+            size = self.frame_size or self.chunk_size
+            while len(data) - position >= size:
+                frames.append((position, view[position : position + size]))
+                position += size
+        return frames, position, False
+
+    def _final_frame(self, carry: bytes, base: int) -> Iterator[tuple[int, memoryview]]:
+        if self.length_prefix_bytes:
+            if carry:
+                if len(carry) < self.length_prefix_bytes:
+                    self.errors.append("truncated length prefix")
+                else:
+                    self.errors.append("declared frame length exceeds remaining input")
+            return
+        if self.delimiter or carry:
+            yield base, memoryview(carry)
+
+
+def parse_stream_source(
+    source: Any,
+    *,
+    patterns: Iterable[dict[str, Any]] | None = None,
+    frame_size: int | None = None,
+    delimiter: bytes | None = None,
+    length_prefix_bytes: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_frames: int | None = None,
+    max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES,
+    max_frame_rows: int = DEFAULT_MAX_FRAME_ROWS,
+) -> dict[str, Any]:
+    """Parse a stream of any size in constant memory with ``StreamFrameReader``.
+
+    Summaries cover every frame, but only the first ``max_frame_rows`` frame
+    rows are kept (``frames_truncated`` marks the rest as omitted). The
+    result adds ``throughput`` with bytes read and MB/s.
+    """
+    is_path = isinstance(source, (str, Path))
+    source_label = "local_file" if is_path else "stream"
+    if is_path and not Path(source).is_file():
+        return _result("unsupported", [], ["local file does not exist or is not a file"], source=source_label)
+    reader = StreamFrameReader(
+        source,
+        patterns=patterns,
+        frame_size=frame_size,
+        delimiter=delimiter,
+        length_prefix_bytes=length_prefix_bytes,
+        chunk_size=chunk_size,
+        max_frames=max_frames,
+        max_frame_bytes=max_frame_bytes,
+    )
+    stats = _FrameStats()
+    rows: list[dict[str, Any]] = []
+    for row in reader:
+        stats.add(row)
+        if len(rows) < max_frame_rows:
+            rows.append(row)
+    if not reader.pattern_result["ok"]:
+        status = "unsupported"
+    elif reader.limited:
+        status = "input_limited"
+    else:
+        status = "ok" if not reader.errors else "malformed"
+    result = _result(status, rows, reader.errors, source=source_label, input_length=reader.bytes_read, stats=stats)
+    result["frames_truncated"] = stats.count > len(rows)
+    result["throughput"] = reader.throughput()
+    if is_path:
+        result["file_summary"] = {"name": Path(source).name, "size": reader.bytes_read, "path_stored": False}
+    result["summary"] = summarize_stream_result(result)
+    result["result_id"] = _stable_id("stream-result", result["source"], result["classification"], result["input_length"], result["summary"])
+    return result
+
+
 def summarize_stream_result(result: dict[str, Any]) -> dict[str, Any]:
     frames = [row for row in result.get("frames") or [] if isinstance(row, dict)]
     status = str(result.get("classification") or result.get("status") or "unsupported")
     detected_markers = sorted(str(marker) for marker in result.get("detected_markers") or [])
+    frame_count = len(frames)
+    max_frame_length = max((int(frame.get("length") or 0) for frame in frames), default=0)
+    if result.get("frames_truncated"):
+        frame_count = int(result.get("frame_count") or 0)
+        max_frame_length = int((result.get("length_summary") or {}).get("max") or 0)
     return {
         "classification": status,
         "severity": STATUS_SEVERITY.get(status, "medium"),
         "source": str(result.get("source") or "unknown"),
         "input_length": int(result.get("input_length") or 0),
-        "frame_count": len(frames),
-        "max_frame_length": max((int(frame.get("length") or 0) for frame in frames), default=0),
+        "frame_count": frame_count,
+        "max_frame_length": max_frame_length,
         "average_entropy": float((result.get("entropy_summary") or {}).get("average") or 0.0),
         "average_printable_ratio": float((result.get("printable_ratio_summary") or {}).get("average") or 0.0),
         "detected_marker_count": len(detected_markers),
@@ -326,20 +556,57 @@ def _split_length_prefixed(raw: bytes, *, length_prefix_bytes: int, max_frames:
     return frames, errors
 
 
-def _frame_metadata(index: int, offset: int, payload: bytes, patterns: Iterable[dict[str, Any]] | None) -> dict[str, Any]:
-    markers = detect_patterns(payload, patterns)
+def _frame_metadata(
+    index: int,
+    offset: int,
+    payload: bytes | memoryview,
+    matchers: list[tuple[dict[str, Any], re.Pattern[bytes]]],
+) -> dict[str, Any]:
+    # Counting a transient bytes copy is faster than iterating the memoryview.
+    counts = Counter(payload.tobytes() if isinstance(payload, memoryview) else payload)
     return {
         "frame_id": f"frame-{index:04d}",
         "offset": offset,
         "length": len(payload),
-        "entropy": _entropy(payload),
-        "printable_ratio": _printable_ratio(payload),
+        "entropy": _entropy(counts, len(payload)),
+        "printable_ratio": _printable_ratio(counts, len(payload)),
         "hex_summary": payload[:16].hex(),
-        "detected_markers": markers,
+        "detected_markers": _detect_markers(payload, matchers),
         "raw_payload_stored": False,
     }
 
 
+def _compile_patterns(pattern_result: dict[str, Any]) -> list[tuple[dict[str, Any], re.Pattern[bytes]]]:
+    # Same matches as ``detect_patterns``: bytes IGNORECASE folds ASCII only, like ``bytes.lower``.
+    matchers = []
+    for pattern in pattern_result["_patterns"]:
+        flags = re.IGNORECASE if pattern["type"] == "string" and not pattern["case_sensitive"] else 0
+        matchers.append((pattern, re.compile(re.escape(bytes(pattern["_bytes"])), flags)))
+    return matchers
+
+
+def _detect_markers(payload: bytes | memoryview, matchers: list[tuple[dict[str, Any], re.Pattern[bytes]]]) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    for pattern, matcher in matchers:
+        offsets: list[int] = []
+        match_count = 0
+        for match in matcher.finditer(payload):
+            if match_count < 8:
+                offsets.append(match.start())
+            match_count += 1
+        if match_count:
+            results.append(
+                {
+                    "pattern_id": pattern["pattern_id"],
+                    "name": pattern["name"],
+                    "type": pattern["type"],
+                    "match_count": match_count,
+                    "offsets": offsets,
+                }
+            )
+    return results
+
+
 def _result(
     status: str,
     frames: list[dict[str, Any]],
@@ -347,11 +614,12 @@ def _result(
     *,
     source: str,
     input_length: int = 0,
+    stats: _FrameStats | None = None,
 ) -> dict[str, Any]:
-    lengths = [frame["length"] for frame in frames]
-    entropies = [frame["entropy"] for frame in frames]
-    printable = [frame["printable_ratio"] for frame in frames]
-    detected = sorted({marker["name"] for frame in frames for marker in frame.get("detected_markers", [])})
+    if stats is None:
+        stats = _FrameStats()
+        for frame in frames:
+            stats.add(frame)
     payload = {
         "ok": status == "ok",
         "status": status,
@@ -360,11 +628,11 @@ def _result(
         "diagnostic_type": "stream_metadata",
         "source": source,
         "input_length": input_length,
-        "frame_count": len(frames),
-        "length_summary": _numeric_summary(lengths),
-        "entropy_summary": _numeric_summary(entropies),
-        "printable_ratio_summary": _numeric_summary(printable),
-        "detected_markers": detected,
+        "frame_count": stats.count,
+        "length_summary": stats.lengths.summary(),
+        "entropy_summary": stats.entropies.summary(),
+        "printable_ratio_summary": stats.printable.summary(),
+        "detected_markers": sorted(stats.markers),
         "frames": frames,
         "errors": errors,
         **SAFETY_FLAGS,
@@ -375,30 +643,65 @@ def _result(
     return payload
 
 
-def _numeric_summary(values: list[int] | list[float]) -> dict[str, float | int]:
-    if not values:
-        return {"min": 0, "max": 0, "average": 0}
-    return {
-        "min": round(min(values), 4),
-        "max": round(max(values), 4),
-        "average": round(sum(values) / len(values), 4),
-    }
+class _RunningSummary:
+    """Min, max and average of a value series without keeping the values."""
+
+    __slots__ = ("count", "total", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total: int | float = 0
+        self.minimum: int | float = 0
+        self.maximum: int | float = 0
+
+    def add(self, value: int | float) -> None:
+        if not self.count or value < self.minimum:
+            self.minimum = value
+        if not self.count or value > self.maximum:
+            self.maximum = value
+        self.total += value
+        self.count += 1
+
+    def summary(self) -> dict[str, float | int]:
+        if not self.count:
+            return {"min": 0, "max": 0, "average": 0}
+        return {
+            "min": round(self.minimum, 4),
+            "max": round(self.maximum, 4),
+            "average": round(self.total / self.count, 4),
+        }
+
+
+class _FrameStats:
+    """Result summaries accumulated frame by frame."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.lengths = _RunningSummary()
+        self.entropies = _RunningSummary()
+        self.printable = _RunningSummary()
+        self.markers: set[str] = set()
+
+    def add(self, frame: dict[str, Any]) -> None:
+        self.count += 1
+        self.lengths.add(frame["length"])
+        self.entropies.add(frame["entropy"])
+        self.printable.add(frame["printable_ratio"])
+        self.markers.update(marker["name"] for marker in frame.get("detected_markers", []))
 
 
-def _entropy(payload: bytes) -> float:
-    if not payload:
+def _entropy(counts: Counter[int], total: int) -> float:
+    if not total:
         return 0.0
-    counts = Counter(payload)
-    total = len(payload)
     value = -sum((count / total) * log2(count / total) for count in counts.values())
     return round(value, 4)
 
 
-def _printable_ratio(payload: bytes) -> float:
-    if not payload:
+def _printable_ratio(counts: Counter[int], total: int) -> float:
+    if not total:
         return 0.0
-    printable = sum(1 for byte in payload if byte in {9, 10, 13} or 32 <= byte <= 126)
-    return round(printable / len(payload), 4)
+    printable = sum(count for byte, count in counts.items() if byte in PRINTABLE_BYTES)
+    return round(printable / total, 4)
 
 
 def _has_more_frames(raw: bytes, frames: list[tuple[int, int, bytes]]) -> bool:
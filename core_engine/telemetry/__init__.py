@@ -20,7 +20,9 @@ from core_engine.telemetry.capture_sessions import (
 from core_engine.telemetry.baseline_windows import (
     BASELINE_WINDOW_RECORD_VERSION,
     BASELINE_WINDOW_SAFETY_FLAGS,
+    DEFAULT_BASELINE_BUCKET_SECONDS,
     DEFAULT_BASELINE_WINDOWS,
+    BaselineWindowAggregator,
     BaselineWindowError,
     build_baseline_window_record,
     build_baseline_window_records,
@@ -120,9 +122,11 @@ from core_engine.telemetry.temporal_anomalies import (
     TEMPORAL_ANOMALY_RECORD_VERSION,
     TEMPORAL_ANOMALY_SAFETY_FLAGS,
     TemporalAnomalyError,
+    assemble_temporal_anomaly_report,
     build_temporal_anomaly_api_response,
     build_temporal_anomaly_dashboard_record,
     build_temporal_anomaly_export_record,
+    build_temporal_anomaly_record,
     build_temporal_anomaly_report,
     detect_burst_anomalies,
     detect_rare_service_timing,
@@ -132,6 +136,20 @@ from core_engine.telemetry.temporal_anomalies import (
     score_anomaly_confidence,
     summarize_temporal_anomalies,
 )
+from core_engine.telemetry.temporal_series import (
+    DEFAULT_EWMA_ALPHA,
+    DEFAULT_SEASON_SECONDS,
+    DEFAULT_SERIES_BUCKET_SECONDS,
+    DEFAULT_SERIES_DAYS,
+    DEFAULT_SERIES_WINDOWS,
+    DEFAULT_ZSCORE_THRESHOLD,
+    KeyCountSeries,
+    TemporalSeriesError,
+    build_series_anomaly_windows,
+    build_temporal_series_report,
+    detect_series_anomalies,
+    timestamps_to_micros,
+)
 from core_engine.telemetry.fingerprint_profiles import (
     DEFAULT_MAX_SERVICE_FINGERPRINT_PROFILES,
     DEFAULT_SERVICE_FINGERPRINT_MATURITY_THRESHOLD,
@@ -148,7 +166,12 @@ from core_engine.telemetry.fingerprint_profiles import (
     summarize_service_fingerprint_profiles,
 )
 from core_engine.telemetry.dns_correlation import (
+    DEFAULT_DNS_CACHE_MAX_ENTRIES,
+    DEFAULT_DNS_CACHE_MAX_TTL_SECONDS,
+    DEFAULT_DNS_CACHE_TTL_SECONDS,
+    StreamingDnsFlowCorrelator,
     build_dns_visibility_report,
+    build_flow_endpoint_index,
     correlate_domains_to_flows,
     deterministic_dns_correlation_json,
     pair_dns_queries_and_responses,
@@ -438,10 +461,15 @@ __all__ = [
     "DESTINATION_LEARNING_RECORD_VERSION",
     "DESTINATION_LEARNING_SAFETY_FLAGS",
     "DEFAULT_BASELINE_MATURITY_THRESHOLD",
+    "DEFAULT_BASELINE_BUCKET_SECONDS",
     "DEFAULT_BASELINE_WINDOWS",
     "DEFAULT_DESTINATION_MATURITY_THRESHOLD",
     "DEFAULT_BURST_MULTIPLIER",
     "DEFAULT_EPHEMERAL_PORT_MIN",
+    "DEFAULT_EWMA_ALPHA",
+    "DEFAULT_DNS_CACHE_MAX_ENTRIES",
+    "DEFAULT_DNS_CACHE_MAX_TTL_SECONDS",
+    "DEFAULT_DNS_CACHE_TTL_SECONDS",
     "DEFAULT_DOMAIN_LABEL_LIMIT",
     "DEFAULT_DOMAIN_TOTAL_LIMIT",
     "DEFAULT_ADAPTIVE_RISK_BASE_SCORE",
@@ -462,9 +490,14 @@ __all__ = [
     "DEFAULT_MIN_BURST_COUNT",
     "DEFAULT_PERSISTENT_BYTE_THRESHOLD",
     "DEFAULT_PERSISTENT_PACKET_THRESHOLD",
+    "DEFAULT_SEASON_SECONDS",
+    "DEFAULT_SERIES_BUCKET_SECONDS",
+    "DEFAULT_SERIES_DAYS",
+    "DEFAULT_SERIES_WINDOWS",
     "DEFAULT_STALE_AFTER_SECONDS",
     "DEFAULT_UPDATE_INTERVAL_SECONDS",
     "DEFAULT_VOLUME_DRIFT_MULTIPLIER",
+    "DEFAULT_ZSCORE_THRESHOLD",
     "DEFAULT_SERVICE_FINGERPRINT_MATURITY_THRESHOLD",
     "DNS_ERROR_CODES",
     "DNS_BEHAVIOR_RECORD_VERSION",
@@ -492,6 +525,7 @@ __all__ = [
     "PROTOCOL_FINGERPRINT_RECORD_VERSION",
     "PROTOCOL_METADATA_RECORD_VERSION",
     "PassiveCaptureSessionError",
+    "BaselineWindowAggregator",
     "BaselineWindowError",
     "BehaviorBaselineError",
     "DestinationLearningError",
@@ -519,9 +553,13 @@ __all__ = [
     "AnomalyWindowError",
     "AdaptiveRiskError",
     "TemporalAnomalyError",
+    "TemporalSeriesError",
+    "KeyCountSeries",
     "ServiceBehaviorFingerprintError",
     "ServiceFingerprintProfileError",
+    "StreamingDnsFlowCorrelator",
     "apply_adaptive_risk_weights",
+    "assemble_temporal_anomaly_report",
     "build_anomaly_window_record",
     "build_anomaly_window_records",
     "build_adaptive_risk_api_response",
@@ -578,6 +616,7 @@ __all__ = [
     "build_enriched_flow_observation",
     "build_encrypted_dns_limitation_summary",
     "build_flow_api_response",
+    "build_flow_endpoint_index",
     "build_flow_counter_summary",
     "build_flow_enrichment_api_response",
     "build_flow_enrichment_dashboard_record",
@@ -632,8 +671,11 @@ __all__ = [
     "build_temporal_anomaly_dashboard_record",
     "build_temporal_anomaly_export_record",
     "build_temporal_anomaly_operator_panel",
+    "build_temporal_anomaly_record",
     "build_temporal_anomaly_report",
     "build_temporal_anomaly_rollup",
+    "build_temporal_series_report",
+    "build_series_anomaly_windows",
     "build_resource_usage_telemetry_summary",
     "build_rolling_flow_statistics",
     "build_sanitized_attribution_display",
@@ -700,6 +742,7 @@ __all__ = [
     "deterministic_temporal_anomaly_json",
     "detect_burst_anomalies",
     "detect_rare_service_timing",
+    "detect_series_anomalies",
     "detect_volume_drift_hints",
     "detect_window_novelty",
     "enumerate_local_interfaces",
@@ -762,6 +805,7 @@ __all__ = [
     "summarize_service_fingerprints",
     "summarize_socket_inventory",
     "summarize_temporal_anomalies",
+    "timestamps_to_micros",
     "track_flow_sessions",
     "unusual_destination_adjustment",
     "unusual_service_fingerprint_adjustment",
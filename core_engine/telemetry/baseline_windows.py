@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import heapq
 import json
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from hashlib import sha256
+from itertools import islice
 from typing import Any, Iterable
 
 from core_engine.telemetry.interfaces import TELEMETRY_SAFETY_FLAGS
@@ -15,6 +18,9 @@ DEFAULT_BASELINE_WINDOWS = {
     "medium": {"duration_seconds": 3600, "max_records": 750},
     "long": {"duration_seconds": 86400, "max_records": 2000},
 }
+DEFAULT_BASELINE_BUCKET_SECONDS = 60
+# Batch builders keep every entry, so coarser buckets give identical output with fewer bucket objects.
+_BATCH_BUCKET_SECONDS = 3600
 
 BASELINE_WINDOW_SAFETY_FLAGS = {
     **TELEMETRY_SAFETY_FLAGS,
@@ -41,28 +47,11 @@ def build_baseline_window_records(
 ) -> dict[str, Any]:
     """Build bounded short, medium, and long baseline window records."""
     timestamp = generated_at or _now()
-    configs = _normalize_window_config(window_config or DEFAULT_BASELINE_WINDOWS)
-    rows = _rows(observations)
-    windows = {
-        name: build_baseline_window_record(
-            rows,
-            window_name=name,
-            duration_seconds=int(config["duration_seconds"]),
-            max_records=int(config["max_records"]),
-            generated_at=timestamp,
-        )
-        for name, config in sorted(configs.items())
-    }
-    return {
-        "record_type": "baseline_window_set",
-        "record_version": BASELINE_WINDOW_RECORD_VERSION,
-        "generated_at": timestamp,
-        "window_count": len(windows),
-        "input_observation_count": len(rows),
-        "windows": windows,
-        "summary": summarize_baseline_windows(windows, generated_at=timestamp),
-        **BASELINE_WINDOW_SAFETY_FLAGS,
-    }
+    aggregator = BaselineWindowAggregator(window_config=window_config, bucket_seconds=_BATCH_BUCKET_SECONDS, max_entries_per_bucket=None)
+    # Rows older than the longest window are rejected on ingest instead of being bucketed first.
+    aggregator.expire(timestamp)
+    aggregator.ingest_many(observations)
+    return aggregator.records(generated_at=timestamp)
 
 
 def build_baseline_window_record(
@@ -78,33 +67,227 @@ def build_baseline_window_record(
         raise BaselineWindowError("duration_seconds must be positive")
     if int(max_records) <= 0:
         raise BaselineWindowError("max_records must be positive")
-    cutoff = _parse_time(timestamp) - timedelta(seconds=int(duration_seconds))
-    candidates = [
-        row
-        for row in _rows(observations)
-        if _observation_time(row) is not None and _observation_time(row) >= cutoff
-    ]
-    candidates = sorted(candidates, key=lambda item: (_timestamp_string(item), str(item.get("category") or ""), str(item.get("key") or "")))
-    retained = candidates[-int(max_records) :]
-    dropped = max(0, len(candidates) - len(retained))
-    category_counts = _count_by(retained, "category")
-    key_counts = _key_counts(retained)
-    return {
-        "record_type": "baseline_window",
-        "record_version": BASELINE_WINDOW_RECORD_VERSION,
-        "window_name": str(window_name),
-        "generated_at": timestamp,
-        "duration_seconds": int(duration_seconds),
-        "max_records": int(max_records),
-        "retained_observation_count": len(retained),
-        "dropped_observation_count": dropped,
-        "earliest_seen": min((_timestamp_string(row) for row in retained), default=""),
-        "latest_seen": max((_timestamp_string(row) for row in retained), default=""),
-        "category_counts": category_counts,
-        "key_counts": key_counts,
-        "observation_refs": [str(row.get("observation_ref") or _digest(row)[:16]) for row in retained],
-        **BASELINE_WINDOW_SAFETY_FLAGS,
-    }
+    aggregator = BaselineWindowAggregator.single_window(
+        str(window_name),
+        duration_seconds=int(duration_seconds),
+        max_records=int(max_records),
+        bucket_seconds=_BATCH_BUCKET_SECONDS,
+        max_entries_per_bucket=None,
+    )
+    aggregator.expire(timestamp)
+    aggregator.ingest_many(observations)
+    return aggregator.window_record(str(window_name), generated_at=timestamp)
+
+
+@dataclass
+class _BaselineBucket:
+    index: int
+    entries: list[tuple] = field(default_factory=list)
+    category_counts: dict[str, int] = field(default_factory=dict)
+    key_counts: dict[str, int] = field(default_factory=dict)
+    count: int = 0
+    trimmed_count: int = 0
+    trimmed_latest: int | None = None
+
+
+class BaselineWindowAggregator:
+    """Incrementally maintained baseline windows over time-bucketed counters.
+
+    Each observation is parsed once on ingest and filed into a bucket of
+    ``bucket_seconds``. Buckets keep category and key counts plus the entries
+    needed for ``observation_refs``, ordered like the batch builder. Buckets
+    older than the longest window are expired, so ``records()`` only touches
+    live buckets instead of rescanning history.
+
+    ``max_entries_per_bucket`` (default: the largest ``max_records``) caps the
+    entries kept per bucket; the oldest are dropped but still counted. Output
+    matches ``build_baseline_window_records`` exactly unless a single bucket
+    straddling a window cutoff overflows that cap, in which case only that
+    window's ``dropped_observation_count`` is approximate. Time is expected to
+    move forward: emitting for a ``generated_at`` earlier than one already used
+    may miss expired buckets.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_config: dict[str, dict[str, int]] | None = None,
+        bucket_seconds: int = DEFAULT_BASELINE_BUCKET_SECONDS,
+        max_entries_per_bucket: int | None = -1,
+    ) -> None:
+        if int(bucket_seconds) <= 0:
+            raise BaselineWindowError("bucket_seconds must be positive")
+        self.bucket_micros = int(bucket_seconds) * 1_000_000
+        self._set_windows(_normalize_window_config(window_config or DEFAULT_BASELINE_WINDOWS), max_entries_per_bucket=max_entries_per_bucket)
+        self._buckets: list[_BaselineBucket] = []
+        self._buckets_unordered = False
+        self._by_index: dict[int, _BaselineBucket] = {}
+        self._expired_before: int | None = None
+        self.input_observation_count = 0
+
+    @classmethod
+    def single_window(
+        cls,
+        window_name: str,
+        *,
+        duration_seconds: int,
+        max_records: int,
+        bucket_seconds: int = DEFAULT_BASELINE_BUCKET_SECONDS,
+        max_entries_per_bucket: int | None = -1,
+    ) -> "BaselineWindowAggregator":
+        """Aggregator for one named window instead of the short, medium and long set."""
+        aggregator = cls(bucket_seconds=bucket_seconds, max_entries_per_bucket=max_entries_per_bucket)
+        aggregator._set_windows(
+            {str(window_name): {"duration_seconds": duration_seconds, "max_records": max_records}},
+            max_entries_per_bucket=max_entries_per_bucket,
+        )
+        return aggregator
+
+    def _set_windows(self, windows: dict[str, dict[str, int]], *, max_entries_per_bucket: int | None) -> None:
+        self.windows = {name: _window_config(name, values) for name, values in sorted(windows.items())}
+        if max_entries_per_bucket == -1:
+            max_entries_per_bucket = max(config["max_records"] for config in self.windows.values())
+        self.max_entries_per_bucket = max_entries_per_bucket
+        self._horizon = max(config["duration_seconds"] for config in self.windows.values()) * 1_000_000
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._buckets)
+
+    def ingest(self, observation: dict[str, Any]) -> bool:
+        """Add one observation; returns ``False`` when it has no usable timestamp."""
+        if not isinstance(observation, dict):
+            return False
+        self.input_observation_count += 1
+        row = observation
+        stamp = _timestamp_string(row)
+        micros = _observation_micros(stamp)
+        if micros is None or (self._expired_before is not None and micros < self._expired_before):
+            return False
+        category = str(row.get("category") or "unknown")
+        count_key = f"{row.get('category') or 'unknown'}:{row.get('key') or 'unknown'}"
+        # Rows without an observation_ref are digested only if a window retains them.
+        ref = str(row["observation_ref"]) if row.get("observation_ref") else dict(row)
+        sort_key = (stamp, str(row.get("category") or ""), str(row.get("key") or ""))
+        bucket = self._bucket(micros // self.bucket_micros)
+        entry = (sort_key, micros, ref, category, count_key)
+        entries = bucket.entries
+        if not entries or entries[-1][0] <= sort_key:
+            entries.append(entry)
+        else:
+            position = _bisect_right(entries, sort_key)
+            entries.insert(position, entry)
+        bucket.count += 1
+        bucket.category_counts[category] = bucket.category_counts.get(category, 0) + 1
+        bucket.key_counts[count_key] = bucket.key_counts.get(count_key, 0) + 1
+        if self.max_entries_per_bucket is not None and len(entries) > self.max_entries_per_bucket:
+            overflow = len(entries) - self.max_entries_per_bucket
+            latest = max(item[1] for item in entries[:overflow])
+            del entries[:overflow]
+            bucket.trimmed_count += overflow
+            bucket.trimmed_latest = latest if bucket.trimmed_latest is None else max(bucket.trimmed_latest, latest)
+        return True
+
+    def ingest_many(self, observations: Iterable[dict[str, Any]] | None) -> int:
+        return sum(1 for item in observations or [] if self.ingest(item))
+
+    def expire(self, generated_at: str) -> int:
+        """Drop buckets that can no longer fall inside the longest window."""
+        threshold = _time_micros(_parse_time(generated_at)) - self._horizon
+        if self._expired_before is None or threshold > self._expired_before:
+            self._expired_before = threshold
+        buckets = self._ordered_buckets()
+        expired = 0
+        while expired < len(buckets) and (buckets[expired].index + 1) * self.bucket_micros <= threshold:
+            del self._by_index[buckets[expired].index]
+            expired += 1
+        del buckets[:expired]
+        return expired
+
+    def window_record(self, window_name: str, *, generated_at: str | None = None) -> dict[str, Any]:
+        timestamp = generated_at or _now()
+        config = self.windows.get(window_name)
+        if config is None:
+            raise BaselineWindowError(f"unknown baseline window: {window_name}")
+        duration = config["duration_seconds"]
+        max_records = config["max_records"]
+        cutoff = _time_micros(_parse_time(timestamp)) - duration * 1_000_000
+        sources: list[Iterable[tuple]] = []
+        full: list[_BaselineBucket] = []
+        partial: list[tuple] = []
+        candidate_count = 0
+        for bucket in self._ordered_buckets():
+            if (bucket.index + 1) * self.bucket_micros <= cutoff:
+                continue
+            if bucket.index * self.bucket_micros >= cutoff:
+                full.append(bucket)
+                candidate_count += bucket.count
+                sources.append(reversed(bucket.entries))
+                continue
+            inside = [entry for entry in bucket.entries if entry[1] >= cutoff]
+            partial.extend(inside)
+            candidate_count += len(inside)
+            if bucket.trimmed_latest is not None and bucket.trimmed_latest >= cutoff:
+                candidate_count += bucket.trimmed_count
+            sources.append(reversed(inside))
+        retained = list(islice(heapq.merge(*sources, key=_entry_sort_key, reverse=True), max_records))
+        retained.reverse()
+        if candidate_count <= max_records and len(retained) == candidate_count:
+            category_counts = _merge_counts([bucket.category_counts for bucket in full], (entry[3] for entry in partial))
+            key_counts = _merge_counts([bucket.key_counts for bucket in full], (entry[4] for entry in partial))
+        else:
+            category_counts = _merge_counts([], (entry[3] for entry in retained))
+            key_counts = _merge_counts([], (entry[4] for entry in retained))
+        return {
+            "record_type": "baseline_window",
+            "record_version": BASELINE_WINDOW_RECORD_VERSION,
+            "window_name": str(window_name),
+            "generated_at": timestamp,
+            "duration_seconds": duration,
+            "max_records": max_records,
+            "retained_observation_count": len(retained),
+            "dropped_observation_count": max(0, candidate_count - len(retained)),
+            "earliest_seen": retained[0][0][0] if retained else "",
+            "latest_seen": retained[-1][0][0] if retained else "",
+            "category_counts": category_counts,
+            "key_counts": key_counts,
+            "observation_refs": [_entry_ref(entry) for entry in retained],
+            **BASELINE_WINDOW_SAFETY_FLAGS,
+        }
+
+    def records(self, *, generated_at: str | None = None) -> dict[str, Any]:
+        """Emit the same ``baseline_window_set`` as ``build_baseline_window_records``."""
+        timestamp = generated_at or _now()
+        self.expire(timestamp)
+        windows = {name: self.window_record(name, generated_at=timestamp) for name in sorted(self.windows)}
+        return {
+            "record_type": "baseline_window_set",
+            "record_version": BASELINE_WINDOW_RECORD_VERSION,
+            "generated_at": timestamp,
+            "window_count": len(windows),
+            "input_observation_count": self.input_observation_count,
+            "windows": windows,
+            "summary": summarize_baseline_windows(windows, generated_at=timestamp),
+            **BASELINE_WINDOW_SAFETY_FLAGS,
+        }
+
+    def _bucket(self, index: int) -> _BaselineBucket:
+        bucket = self._by_index.get(index)
+        if bucket is not None:
+            return bucket
+        bucket = _BaselineBucket(index=index)
+        self._by_index[index] = bucket
+        if self._buckets and self._buckets[-1].index > index:
+            self._buckets_unordered = True
+        self._buckets.append(bucket)
+        return bucket
+
+    def _ordered_buckets(self) -> list[_BaselineBucket]:
+        # Out-of-order buckets are appended and sorted once on the next read.
+        if self._buckets_unordered:
+            self._buckets.sort(key=lambda item: item.index)
+            self._buckets_unordered = False
+        return self._buckets
 
 
 def summarize_baseline_windows(windows: dict[str, dict[str, Any]], *, generated_at: str | None = None) -> dict[str, Any]:
@@ -136,51 +319,68 @@ def deterministic_baseline_window_json(record: dict[str, Any]) -> str:
 
 
 def _normalize_window_config(config: dict[str, dict[str, int]]) -> dict[str, dict[str, int]]:
-    normalized: dict[str, dict[str, int]] = {}
-    for name in ("short", "medium", "long"):
-        values = dict((config or {}).get(name) or DEFAULT_BASELINE_WINDOWS[name])
-        duration = int(values.get("duration_seconds") or 0)
-        max_records = int(values.get("max_records") or 0)
-        if duration <= 0 or max_records <= 0:
-            raise BaselineWindowError(f"{name} window requires positive duration_seconds and max_records")
-        normalized[name] = {"duration_seconds": duration, "max_records": max_records}
-    return normalized
+    return {
+        name: _window_config(name, (config or {}).get(name) or DEFAULT_BASELINE_WINDOWS[name])
+        for name in ("short", "medium", "long")
+    }
 
 
-def _rows(value: Iterable[dict[str, Any]] | None) -> list[dict[str, Any]]:
-    return [dict(item) for item in value or [] if isinstance(item, dict)]
+def _window_config(name: str, values: dict[str, int]) -> dict[str, int]:
+    values = dict(values or {})
+    duration = int(values.get("duration_seconds") or 0)
+    max_records = int(values.get("max_records") or 0)
+    if duration <= 0 or max_records <= 0:
+        raise BaselineWindowError(f"{name} window requires positive duration_seconds and max_records")
+    return {"duration_seconds": duration, "max_records": max_records}
 
 
-def _count_by(rows: Iterable[dict[str, Any]], field_name: str) -> dict[str, int]:
+def _merge_counts(tables: Iterable[dict[str, int]], values: Iterable[str]) -> dict[str, int]:
     counts: dict[str, int] = {}
-    for row in rows:
-        value = str(row.get(field_name) or "unknown")
+    for table in tables:
+        for value, count in table.items():
+            counts[value] = counts.get(value, 0) + count
+    for value in values:
         counts[value] = counts.get(value, 0) + 1
     return dict(sorted(counts.items()))
 
 
-def _key_counts(rows: Iterable[dict[str, Any]]) -> dict[str, int]:
-    counts: dict[str, int] = {}
-    for row in rows:
-        key = f"{row.get('category') or 'unknown'}:{row.get('key') or 'unknown'}"
-        counts[key] = counts.get(key, 0) + 1
-    return dict(sorted(counts.items()))
+def _entry_sort_key(entry: tuple) -> tuple[str, str, str]:
+    return entry[0]
+
+
+def _entry_ref(entry: tuple) -> str:
+    ref = entry[2]
+    return ref if isinstance(ref, str) else _digest(ref)[:16]
+
+
+def _bisect_right(entries: list[tuple], sort_key: tuple[str, str, str]) -> int:
+    low, high = 0, len(entries)
+    while low < high:
+        middle = (low + high) // 2
+        if sort_key < entries[middle][0]:
+            high = middle
+        else:
+            low = middle + 1
+    return low
 
 
 def _timestamp_string(row: dict[str, Any]) -> str:
     return str(row.get("observed_at") or row.get("last_seen") or row.get("first_seen") or row.get("timestamp") or row.get("generated_at") or "")
 
 
-def _observation_time(row: dict[str, Any]) -> datetime | None:
-    value = _timestamp_string(row)
+def _observation_micros(value: str) -> int | None:
     if not value:
         return None
     try:
-        return _parse_time(value)
+        return _time_micros(_parse_time(value))
     except ValueError:
         return None
 
 
+def _time_micros(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
 def _parse_time(value: str) -> datetime:
     parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
     if parsed.tzinfo is None:
@@ -193,5 +393,8 @@ def _digest(payload: Any) -> str:
     return sha256(material.encode("utf-8")).hexdigest()
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
 def _now() -> str:
     return datetime.now(UTC).isoformat()
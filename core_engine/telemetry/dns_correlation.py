@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import heapq
 import json
-from datetime import UTC, datetime
+from collections import deque
+from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 from typing import Any, Iterable
 
@@ -108,21 +110,27 @@ def build_dns_visibility_report(
     }
 
 
+DEFAULT_DNS_CACHE_TTL_SECONDS = 300
+DEFAULT_DNS_CACHE_MAX_TTL_SECONDS = 3600
+DEFAULT_DNS_CACHE_MAX_ENTRIES = 50_000
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
 def pair_dns_queries_and_responses(
     queries: Iterable[dict[str, Any]],
     responses: Iterable[dict[str, Any]],
 ) -> list[dict[str, Any]]:
-    response_index = {}
-    for response in responses or []:
-        if isinstance(response, dict):
-            response_index.setdefault(_pair_key(response), []).append(dict(response))
+    response_rows = [dict(response) for response in responses or [] if isinstance(response, dict)]
+    response_index: dict[tuple[str, str, str], deque[dict[str, Any]]] = {}
+    for response in response_rows:
+        response_index.setdefault(_pair_key(response), deque()).append(response)
     pairs = []
     seen_responses = set()
     for query in queries or []:
         if not isinstance(query, dict):
             continue
-        matches = response_index.get(_pair_key(query), [])
-        response = matches.pop(0) if matches else None
+        matches = response_index.get(_pair_key(query))
+        response = dict(matches.popleft()) if matches else None
         if response:
             seen_responses.add(str(response.get("response_record_id") or ""))
         pairs.append(
@@ -134,8 +142,8 @@ def pair_dns_queries_and_responses(
                 **DNS_VISIBILITY_SAFETY_FLAGS,
             }
         )
-    for response in responses or []:
-        if isinstance(response, dict) and str(response.get("response_record_id") or "") not in seen_responses:
+    for response in response_rows:
+        if str(response.get("response_record_id") or "") not in seen_responses:
             pairs.append(
                 {
                     "record_type": "dns_query_response_pairing",
@@ -155,36 +163,171 @@ def correlate_domains_to_flows(
     generated_at: str | None = None,
 ) -> list[dict[str, Any]]:
     timestamp = generated_at or _now()
-    flow_rows = [dict(row) for row in enriched_flows or [] if isinstance(row, dict)]
+    flow_refs = build_flow_endpoint_index(enriched_flows)
     records = []
     for response in responses or []:
         if not isinstance(response, dict):
             continue
-        answer_value_set = {str(answer.get("value") or "") for answer in response.get("answers") or [] if isinstance(answer, dict)}
-        answer_values = sorted(answer_value_set)
-        matches = []
-        for flow in flow_rows:
-            endpoints = _flow_endpoint_values(flow)
-            if answer_value_set and answer_value_set.intersection(endpoints):
-                matches.append(flow)
-        record = {
-            "record_type": "domain_flow_correlation",
-            "record_version": DNS_VISIBILITY_RECORD_VERSION,
-            "generated_at": timestamp,
-            "query_name": str(response.get("query_name") or ""),
-            "query_ref": str(response.get("query_id") or ""),
-            "response_ref": str(response.get("response_record_id") or ""),
-            "answer_values": sorted(answer_values),
-            "matched_flow_refs": sorted(str(row.get("flow_ref") or "") for row in matches),
-            "status": "matched" if matches else "unmatched",
-            "confidence": 0.85 if matches else 0.2,
-            **DNS_VISIBILITY_SAFETY_FLAGS,
-        }
-        record["correlation_id"] = "dns-flow-correlation-" + _digest(record)[:16]
-        records.append(record)
+        matches: dict[int, str] = {}
+        for value in _answer_values(response):
+            for position, flow_ref in flow_refs.get(value, ()):
+                matches[position] = flow_ref
+        records.append(_correlation_record(response, matches.values(), generated_at=timestamp))
     return sorted(records, key=lambda item: (str(item.get("query_name") or ""), str(item.get("response_ref") or "")))
 
 
+def build_flow_endpoint_index(enriched_flows: Iterable[dict[str, Any]] | None) -> dict[str, list[tuple[int, str]]]:
+    """Map each flow endpoint IP to ``(flow position, flow_ref)`` pairs, built once per batch."""
+    index: dict[str, list[tuple[int, str]]] = {}
+    position = 0
+    for flow in enriched_flows or []:
+        if not isinstance(flow, dict):
+            continue
+        flow_ref = str(flow.get("flow_ref") or "")
+        for value in _flow_endpoint_values(flow):
+            index.setdefault(value, []).append((position, flow_ref))
+        position += 1
+    return index
+
+
+class StreamingDnsFlowCorrelator:
+    """Tag flows with domains from recently seen DNS answers.
+
+    Responses are observed as they arrive and their answer values are cached
+    for the answer TTL (``default_ttl_seconds`` when absent, capped at
+    ``max_ttl_seconds``). Each flow is looked up by endpoint IP against the live
+    cache only. Once every answer of a response has expired its
+    ``domain_flow_correlation`` record is finalized and handed out by
+    ``expire()``; ``correlations()`` reports the responses still live. The cache
+    holds at most ``max_entries`` answers, evicting the soonest to expire.
+    Malformed TTLs fall back to ``default_ttl_seconds``, and records without a
+    parseable timestamp reuse the last one observed (the Unix epoch before
+    any), so replaying the same input always gives the same result.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_ttl_seconds: int = DEFAULT_DNS_CACHE_TTL_SECONDS,
+        max_ttl_seconds: int = DEFAULT_DNS_CACHE_MAX_TTL_SECONDS,
+        max_entries: int = DEFAULT_DNS_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.default_ttl_seconds = max(int(default_ttl_seconds), 0)
+        self.max_ttl_seconds = max(int(max_ttl_seconds), 0)
+        self.max_entries = max(int(max_entries), 1)
+        self._answers: dict[str, dict[str, datetime]] = {}
+        self._expiry_heap: list[tuple[datetime, str, str]] = []
+        self._responses: dict[str, dict[str, Any]] = {}
+        self._finished: list[dict[str, Any]] = []
+        self._entry_count = 0
+        self._last_observed = _EPOCH
+
+    @property
+    def cached_answer_count(self) -> int:
+        return self._entry_count
+
+    def observe_response(self, response: dict[str, Any], *, observed_at: str | None = None) -> int:
+        """Cache the answers of one DNS response; returns how many answers were cached."""
+        if not isinstance(response, dict):
+            return 0
+        now = self._observed_time(observed_at or response.get("timestamp"))
+        self._purge(now)
+        response_ref = str(response.get("response_record_id") or "")
+        state = self._responses.get(response_ref)
+        if state is None:
+            state = {"response": dict(response), "matches": set(), "live": 0}
+            self._responses[response_ref] = state
+        cached = 0
+        for answer in response.get("answers") or []:
+            if not isinstance(answer, dict) or not str(answer.get("value") or ""):
+                continue
+            value = str(answer.get("value") or "")
+            seconds = self._ttl_seconds(answer.get("ttl"))
+            expires = now + timedelta(seconds=min(max(seconds, 0), self.max_ttl_seconds))
+            refs = self._answers.setdefault(value, {})
+            if response_ref not in refs:
+                state["live"] += 1
+                self._entry_count += 1
+            elif refs[response_ref] >= expires:
+                continue
+            refs[response_ref] = expires
+            heapq.heappush(self._expiry_heap, (expires, value, response_ref))
+            cached += 1
+        if not state["live"]:
+            self._finish(response_ref)
+        while self._entry_count > self.max_entries:
+            self._evict_next()
+        return cached
+
+    def observe_flow(self, flow: dict[str, Any], *, observed_at: str | None = None) -> list[str]:
+        """Return the sorted domain names whose live answers match a flow endpoint."""
+        if not isinstance(flow, dict):
+            return []
+        now = self._observed_time(observed_at or flow.get("last_seen") or flow.get("first_seen"))
+        self._purge(now)
+        flow_ref = str(flow.get("flow_ref") or "")
+        domains = set()
+        for value in _flow_endpoint_values(flow):
+            for response_ref in self._answers.get(value, ()):
+                state = self._responses[response_ref]
+                state["matches"].add(flow_ref)
+                domains.add(str(state["response"].get("query_name") or ""))
+        return sorted(domains)
+
+    def expire(self, now: str | None = None) -> list[dict[str, Any]]:
+        """Drop expired answers and return the correlation records finalized so far."""
+        timestamp = now or _now()
+        self._purge(self._observed_time(timestamp))
+        finished, self._finished = self._finished, []
+        return [_correlation_record(state["response"], state["matches"], generated_at=timestamp) for state in finished]
+
+    def correlations(self, *, generated_at: str | None = None) -> list[dict[str, Any]]:
+        timestamp = generated_at or _now()
+        records = [
+            _correlation_record(state["response"], state["matches"], generated_at=timestamp)
+            for state in self._responses.values()
+        ]
+        return sorted(records, key=lambda item: (str(item.get("query_name") or ""), str(item.get("response_ref") or "")))
+
+    def _ttl_seconds(self, ttl: Any) -> int:
+        if ttl is None:
+            return self.default_ttl_seconds
+        try:
+            return int(ttl)
+        except (TypeError, ValueError):
+            return self.default_ttl_seconds
+
+    def _observed_time(self, value: Any) -> datetime:
+        parsed = _parse_time(value)
+        if parsed is not None:
+            self._last_observed = parsed
+        return self._last_observed
+
+    def _purge(self, now: datetime) -> None:
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            self._evict_next()
+
+    def _evict_next(self) -> None:
+        expires, value, response_ref = heapq.heappop(self._expiry_heap)
+        refs = self._answers.get(value)
+        if not refs or refs.get(response_ref) != expires:
+            return
+        del refs[response_ref]
+        if not refs:
+            del self._answers[value]
+        self._entry_count -= 1
+        state = self._responses.get(response_ref)
+        if state is not None:
+            state["live"] -= 1
+            if state["live"] <= 0:
+                self._finish(response_ref)
+
+    def _finish(self, response_ref: str) -> None:
+        state = self._responses.pop(response_ref, None)
+        if state is not None:
+            self._finished.append(state)
+
+
 def deterministic_dns_correlation_json(record: dict[str, Any]) -> str:
     return deterministic_dns_visibility_json(record)
 
@@ -204,6 +347,29 @@ def _encrypted_dns_flow_count(flows: list[dict[str, Any]], protocol_records: lis
     return count
 
 
+def _answer_values(response: dict[str, Any]) -> set[str]:
+    return {str(answer.get("value") or "") for answer in response.get("answers") or [] if isinstance(answer, dict)}
+
+
+def _correlation_record(response: dict[str, Any], matched_flow_refs: Iterable[str], *, generated_at: str) -> dict[str, Any]:
+    matched = sorted(matched_flow_refs)
+    record = {
+        "record_type": "domain_flow_correlation",
+        "record_version": DNS_VISIBILITY_RECORD_VERSION,
+        "generated_at": generated_at,
+        "query_name": str(response.get("query_name") or ""),
+        "query_ref": str(response.get("query_id") or ""),
+        "response_ref": str(response.get("response_record_id") or ""),
+        "answer_values": sorted(_answer_values(response)),
+        "matched_flow_refs": matched,
+        "status": "matched" if matched else "unmatched",
+        "confidence": 0.85 if matched else 0.2,
+        **DNS_VISIBILITY_SAFETY_FLAGS,
+    }
+    record["correlation_id"] = "dns-flow-correlation-" + _digest(record)[:16]
+    return record
+
+
 def _flow_endpoint_values(flow: dict[str, Any]) -> set[str]:
     values = set()
     for field_name in ("initiator", "responder"):
@@ -226,6 +392,16 @@ def _pair_key(record: dict[str, Any]) -> tuple[str, str, str]:
     )
 
 
+def _parse_time(value: Any) -> datetime | None:
+    try:
+        parsed = datetime.fromisoformat(str(value or "").replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
 def _digest(payload: Any) -> str:
     material = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
     return sha256(material.encode("utf-8")).hexdigest()
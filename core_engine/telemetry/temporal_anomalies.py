@@ -52,7 +52,7 @@ def build_temporal_anomaly_report(
     )
     if not isinstance(baseline_report, dict):
         anomalies = [
-            _anomaly(
+            build_temporal_anomaly_record(
                 label="malformed_baseline_input",
                 window_name="none",
                 category="input",
@@ -71,24 +71,35 @@ def build_temporal_anomaly_report(
         anomalies.extend(detect_rare_service_timing(windows, entries=entries, generated_at=timestamp))
         anomalies.extend(detect_volume_drift_hints(windows, generated_at=timestamp, volume_drift_multiplier=volume_drift_multiplier))
         anomalies.extend(detect_window_novelty(windows, entries=entries, generated_at=timestamp))
+    return assemble_temporal_anomaly_report(windows, anomalies, generated_at=timestamp, max_anomalies=max_anomalies)
+
+
+def assemble_temporal_anomaly_report(
+    anomaly_windows: dict[str, Any],
+    anomalies: list[dict[str, Any]],
+    *,
+    generated_at: str,
+    max_anomalies: int = DEFAULT_MAX_TEMPORAL_ANOMALIES,
+) -> dict[str, Any]:
+    """Dedupe, bound, and summarize detected anomalies into a ``temporal_anomaly_report``."""
     anomalies = _dedupe_anomalies(anomalies)
     dropped = max(0, len(anomalies) - int(max_anomalies))
     selected = sorted(anomalies, key=lambda item: (-float(item.get("confidence") or 0.0), str(item.get("label") or ""), str(item.get("baseline_key") or "")))[: int(max_anomalies)]
     for row in selected:
         row["bounded_retention_applied"] = dropped > 0
         row["dropped_anomaly_count"] = dropped
-    summary = summarize_temporal_anomalies(selected, anomaly_windows=windows, dropped_anomaly_count=dropped, generated_at=timestamp)
-    dashboard = build_temporal_anomaly_dashboard_record(summary=summary, anomalies=selected, generated_at=timestamp)
-    api = build_temporal_anomaly_api_response(summary=summary, anomaly_windows=windows, anomalies=selected, dashboard=dashboard, generated_at=timestamp)
-    export = build_temporal_anomaly_export_record(summary=summary, anomalies=selected, generated_at=timestamp)
+    summary = summarize_temporal_anomalies(selected, anomaly_windows=anomaly_windows, dropped_anomaly_count=dropped, generated_at=generated_at)
+    dashboard = build_temporal_anomaly_dashboard_record(summary=summary, anomalies=selected, generated_at=generated_at)
+    api = build_temporal_anomaly_api_response(summary=summary, anomaly_windows=anomaly_windows, anomalies=selected, dashboard=dashboard, generated_at=generated_at)
+    export = build_temporal_anomaly_export_record(summary=summary, anomalies=selected, generated_at=generated_at)
     return {
         "record_type": "temporal_anomaly_report",
         "record_version": TEMPORAL_ANOMALY_RECORD_VERSION,
-        "report_id": "temporal-anomaly-report-" + _digest({"generated_at": timestamp, "anomalies": [row.get("anomaly_id") for row in selected]})[:16],
-        "generated_at": timestamp,
+        "report_id": "temporal-anomaly-report-" + _digest({"generated_at": generated_at, "anomalies": [row.get("anomaly_id") for row in selected]})[:16],
+        "generated_at": generated_at,
         "max_anomalies": int(max_anomalies),
         "dropped_anomaly_count": dropped,
-        "anomaly_windows": windows,
+        "anomaly_windows": anomaly_windows,
         "anomalies": selected,
         "summary": summary,
         "dashboard_status": dashboard,
@@ -120,7 +131,7 @@ def detect_burst_anomalies(
         if int(short_count) >= int(min_burst_count) and float(short_count) >= expected_short * float(burst_multiplier):
             entry = entry_index.get(str(key))
             rows.append(
-                _anomaly(
+                build_temporal_anomaly_record(
                     label="burst_detected",
                     window_name="short",
                     category=_category_from_key(str(key)),
@@ -145,7 +156,7 @@ def detect_rare_service_timing(anomaly_windows: dict[str, Any], *, entries: list
             continue
         if str(entry.get("category")) == "service" and int(entry.get("observation_count") or 0) <= 2:
             rows.append(
-                _anomaly(
+                build_temporal_anomaly_record(
                     label="rare_service_timing",
                     window_name="short",
                     category="service",
@@ -177,7 +188,7 @@ def detect_volume_drift_hints(
     if short_count <= 0 or short_count < expected * float(volume_drift_multiplier):
         return []
     return [
-        _anomaly(
+        build_temporal_anomaly_record(
             label="volume_drift_hint",
             window_name="short",
             category="window",
@@ -199,7 +210,7 @@ def detect_window_novelty(anomaly_windows: dict[str, Any], *, entries: list[dict
         key = f"{entry.get('category')}:{entry.get('baseline_key')}"
         if key in short_keys and bool(entry.get("novelty")):
             rows.append(
-                _anomaly(
+                build_temporal_anomaly_record(
                     label="new_behavior_in_window",
                     window_name="short",
                     category=str(entry.get("category") or "unknown"),
@@ -218,6 +229,8 @@ def detect_window_novelty(anomaly_windows: dict[str, Any], *, entries: list[dict
 def score_anomaly_confidence(*, label: str, baseline_entry: dict[str, Any] | None, ratio: float = 1.0) -> float:
     base = {
         "burst_detected": 0.45,
+        "rate_spike": 0.4,
+        "seasonal_deviation": 0.35,
         "rare_service_timing": 0.35,
         "volume_drift_hint": 0.4,
         "new_behavior_in_window": 0.3,
@@ -341,7 +354,7 @@ def deterministic_temporal_anomaly_json(record: dict[str, Any]) -> str:
     return json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
 
 
-def _anomaly(
+def build_temporal_anomaly_record(
     *,
     label: str,
     window_name: str,
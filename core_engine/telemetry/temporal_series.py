@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import re
+from datetime import UTC, datetime, timedelta
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from core_engine.telemetry.anomaly_windows import (
+    ANOMALY_WINDOW_RECORD_VERSION,
+    ANOMALY_WINDOW_SAFETY_FLAGS,
+    DEFAULT_MAX_ANOMALY_WINDOW_KEYS,
+    build_anomaly_window_record,
+    summarize_anomaly_windows,
+)
+from core_engine.telemetry.temporal_anomalies import (
+    DEFAULT_BURST_MULTIPLIER,
+    DEFAULT_MAX_TEMPORAL_ANOMALIES,
+    DEFAULT_MIN_BURST_COUNT,
+    DEFAULT_VOLUME_DRIFT_MULTIPLIER,
+    assemble_temporal_anomaly_report,
+    build_temporal_anomaly_record,
+    detect_burst_anomalies,
+    detect_rare_service_timing,
+    detect_volume_drift_hints,
+    detect_window_novelty,
+    score_anomaly_confidence,
+)
+
+
+DEFAULT_SERIES_BUCKET_SECONDS = 3600
+DEFAULT_SERIES_DAYS = 30
+DEFAULT_SERIES_WINDOWS = {"short": 3600, "medium": 86400, "long": 7 * 86400}
+DEFAULT_EWMA_ALPHA = 0.3
+DEFAULT_ZSCORE_THRESHOLD = 3.0
+DEFAULT_SEASON_SECONDS = 86400
+
+_FAST_TIMESTAMP = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{3}|\.\d{6})?)(?:Z|[+-]00:00)?")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class TemporalSeriesError(ValueError):
+    """Raised when temporal series configuration or input is malformed."""
+
+
+def timestamps_to_micros(values: Iterable[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """Parse ISO timestamps to UTC epoch microseconds in bulk.
+
+    Returns ``(micros, valid)``. Naive and UTC ``YYYY-MM-DDTHH:MM:SS[.fff]``
+    strings are converted by NumPy in one pass; other offsets and forms go
+    through ``datetime.fromisoformat`` like the row-by-row parsers, and
+    values that do not parse are marked invalid.
+    """
+    texts = ["" if value is None else str(value) for value in values]
+    micros = np.zeros(len(texts), dtype=np.int64)
+    valid = np.zeros(len(texts), dtype=bool)
+    fast_positions: list[int] = []
+    fast_texts: list[str] = []
+    slow_positions: list[int] = []
+    for position, text in enumerate(texts):
+        match = _FAST_TIMESTAMP.fullmatch(text)
+        if match:
+            fast_positions.append(position)
+            fast_texts.append(match.group(1))
+        elif text:
+            slow_positions.append(position)
+    if fast_texts:
+        try:
+            parsed = np.array(fast_texts, dtype="datetime64[us]").astype(np.int64)
+        except ValueError:
+            slow_positions = sorted(slow_positions + fast_positions)
+        else:
+            micros[fast_positions] = parsed
+            valid[fast_positions] = True
+    for position in slow_positions:
+        value = _python_micros(texts[position])
+        if value is not None:
+            micros[position] = value
+            valid[position] = True
+    return micros, valid
+
+
+class KeyCountSeries:
+    """Per-key observation counts over fixed time buckets.
+
+    ``counts[k, b]`` holds the observations for ``keys[k]`` in bucket ``b``.
+    The last bucket ends at ``generated_at`` and the matrix spans ``days``.
+    Keys use the ``category:key`` form of the baseline windows, so rows line
+    up with behavior baseline entries. Observations without a usable
+    timestamp or outside the span are counted in
+    ``skipped_observation_count``. Baselines and windows are computed over
+    all keys at once with array operations.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        counts: np.ndarray,
+        *,
+        generated_at: str,
+        bucket_seconds: int = DEFAULT_SERIES_BUCKET_SECONDS,
+        input_observation_count: int | None = None,
+        skipped_observation_count: int = 0,
+    ) -> None:
+        counts = np.asarray(counts, dtype=np.int64)
+        if counts.ndim != 2 or counts.shape[0] != len(keys):
+            raise TemporalSeriesError("counts must be a keys x buckets matrix")
+        if int(bucket_seconds) <= 0:
+            raise TemporalSeriesError("bucket_seconds must be positive")
+        self.keys = [str(key) for key in keys]
+        self.counts = counts
+        self.generated_at = str(generated_at)
+        self.bucket_seconds = int(bucket_seconds)
+        self.input_observation_count = int(counts.sum()) if input_observation_count is None else int(input_observation_count)
+        self.skipped_observation_count = int(skipped_observation_count)
+
+    @classmethod
+    def from_observations(
+        cls,
+        observations: Iterable[dict[str, Any]] | None,
+        *,
+        generated_at: str | None = None,
+        bucket_seconds: int = DEFAULT_SERIES_BUCKET_SECONDS,
+        days: int = DEFAULT_SERIES_DAYS,
+    ) -> KeyCountSeries:
+        rows = [row for row in observations or [] if isinstance(row, dict)]
+        codes: dict[str, int] = {}
+        key_index = np.fromiter(
+            (codes.setdefault(f"{row.get('category') or 'unknown'}:{row.get('key') or 'unknown'}", len(codes)) for row in rows),
+            dtype=np.int64,
+            count=len(rows),
+        )
+        micros, valid = timestamps_to_micros(_timestamp_string(row) for row in rows)
+        return cls.from_arrays(list(codes), key_index, micros, valid=valid, generated_at=generated_at, bucket_seconds=bucket_seconds, days=days)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        keys: Sequence[str],
+        key_index: np.ndarray,
+        micros: np.ndarray,
+        *,
+        valid: np.ndarray | None = None,
+        generated_at: str | None = None,
+        bucket_seconds: int = DEFAULT_SERIES_BUCKET_SECONDS,
+        days: int = DEFAULT_SERIES_DAYS,
+    ) -> KeyCountSeries:
+        """Bucket columnar observations: ``keys[key_index[i]]`` seen at ``micros[i]``."""
+        if int(bucket_seconds) <= 0 or int(days) <= 0:
+            raise TemporalSeriesError("bucket_seconds and days must be positive")
+        timestamp = generated_at or _now()
+        key_index = np.asarray(key_index, dtype=np.int64)
+        micros = np.asarray(micros, dtype=np.int64)
+        if key_index.shape != micros.shape:
+            raise TemporalSeriesError("key_index and micros must have the same length")
+        if key_index.size and (key_index.min() < 0 or key_index.max() >= len(keys)):
+            raise TemporalSeriesError("key_index refers to unknown keys")
+        bucket_micros = int(bucket_seconds) * 1_000_000
+        bucket_count = -(-int(days) * 86400 // int(bucket_seconds))
+        end = _python_micros(timestamp)
+        if end is None:
+            raise TemporalSeriesError(f"invalid generated_at: {timestamp}")
+        start = end - bucket_count * bucket_micros
+        keep = (micros >= start) & (micros <= end)
+        if valid is not None:
+            keep &= np.asarray(valid, dtype=bool)
+        buckets = np.minimum((micros[keep] - start) // bucket_micros, bucket_count - 1)
+        flat = key_index[keep] * bucket_count + buckets
+        counts = np.bincount(flat, minlength=len(keys) * bucket_count).reshape(len(keys), bucket_count)
+        order = sorted(range(len(keys)), key=lambda position: str(keys[position]))
+        return cls(
+            [keys[position] for position in order],
+            counts[order],
+            generated_at=timestamp,
+            bucket_seconds=bucket_seconds,
+            input_observation_count=int(micros.size),
+            skipped_observation_count=int(micros.size - np.count_nonzero(keep)),
+        )
+
+    @property
+    def bucket_count(self) -> int:
+        return int(self.counts.shape[1])
+
+    def window_buckets(self, duration_seconds: int) -> int:
+        return max(1, min(self.bucket_count, -(-int(duration_seconds) // self.bucket_seconds)))
+
+    def window_counts(self, duration_seconds: int) -> np.ndarray:
+        """Per-key totals over the trailing buckets covering ``duration_seconds``."""
+        return self.counts[:, -self.window_buckets(duration_seconds) :].sum(axis=1)
+
+    def ewma_baseline(self, alpha: float = DEFAULT_EWMA_ALPHA) -> tuple[np.ndarray, np.ndarray]:
+        """Exponentially weighted mean and variance of every bucket before the latest."""
+        if not 0 < float(alpha) <= 1:
+            raise TemporalSeriesError("alpha must be in (0, 1]")
+        history = self.counts[:, :-1].astype(np.float64)
+        mean = history[:, 0].copy() if history.shape[1] else np.zeros(len(self.keys))
+        variance = np.zeros(len(self.keys))
+        for column in range(1, history.shape[1]):
+            delta = history[:, column] - mean
+            mean += alpha * delta
+            variance = (1.0 - alpha) * (variance + alpha * delta * delta)
+        return mean, variance
+
+    def seasonal_baseline(self, period_seconds: int = DEFAULT_SEASON_SECONDS) -> tuple[np.ndarray, np.ndarray, int]:
+        """Mean, standard deviation and sample count of past buckets in the latest bucket's phase."""
+        period = int(period_seconds) // self.bucket_seconds
+        if period <= 0 or self.bucket_count <= period:
+            zeros = np.zeros(len(self.keys))
+            return zeros, zeros, 0
+        same_phase = self.counts[:, self.bucket_count - 1 - period :: -period].astype(np.float64)
+        return same_phase.mean(axis=1), same_phase.std(axis=1), int(same_phase.shape[1])
+
+
+def build_series_anomaly_windows(
+    series: KeyCountSeries,
+    *,
+    entries: list[dict[str, Any]] | None = None,
+    window_seconds: dict[str, int] | None = None,
+    max_keys_per_window: int = DEFAULT_MAX_ANOMALY_WINDOW_KEYS,
+) -> dict[str, Any]:
+    """Build a ``temporal_anomaly_window_set`` from trailing bucket sums.
+
+    Windows are measured in whole buckets, so ``duration_seconds`` reports
+    the span actually covered.
+    """
+    if int(max_keys_per_window) <= 0:
+        raise TemporalSeriesError("max_keys_per_window must be positive")
+    categories = [_category_from_key(key) for key in series.keys]
+    category_names = sorted(set(categories))
+    codes = {name: code for code, name in enumerate(category_names)}
+    category_codes = np.fromiter((codes[name] for name in categories), dtype=np.int64, count=len(categories))
+    records = {}
+    for name, duration in sorted((window_seconds or DEFAULT_SERIES_WINDOWS).items()):
+        counts = series.window_counts(duration)
+        present = np.flatnonzero(counts)
+        candidates = present
+        if present.size > int(max_keys_per_window):
+            floor = np.partition(counts[present], present.size - int(max_keys_per_window))[present.size - int(max_keys_per_window)]
+            candidates = present[counts[present] >= floor]
+        per_category = np.bincount(category_codes, weights=counts, minlength=len(category_names))
+        window = {
+            "duration_seconds": series.window_buckets(duration) * series.bucket_seconds,
+            "retained_observation_count": int(counts.sum()),
+            "category_counts": {category: int(total) for category, total in zip(category_names, per_category) if total},
+            "key_counts": {series.keys[position]: int(counts[position]) for position in candidates},
+        }
+        record = build_anomaly_window_record(
+            window,
+            baseline_entries=entries or [],
+            window_name=name,
+            generated_at=series.generated_at,
+            max_keys=int(max_keys_per_window),
+        )
+        record["dropped_key_count"] = int(present.size) - len(record["key_counts"])
+        records[name] = record
+    return {
+        "record_type": "temporal_anomaly_window_set",
+        "record_version": ANOMALY_WINDOW_RECORD_VERSION,
+        "generated_at": series.generated_at,
+        "window_count": len(records),
+        "windows": records,
+        "summary": summarize_anomaly_windows(records, generated_at=series.generated_at),
+        **ANOMALY_WINDOW_SAFETY_FLAGS,
+    }
+
+
+def detect_series_anomalies(
+    series: KeyCountSeries,
+    *,
+    entries: list[dict[str, Any]] | None = None,
+    alpha: float = DEFAULT_EWMA_ALPHA,
+    z_threshold: float = DEFAULT_ZSCORE_THRESHOLD,
+    min_count: int = DEFAULT_MIN_BURST_COUNT,
+    season_seconds: int = DEFAULT_SEASON_SECONDS,
+) -> list[dict[str, Any]]:
+    """Flag keys whose latest bucket stands out from their EWMA or seasonal baseline.
+
+    Z-scores divide by at least one observation so a single event on a key
+    with a flat history is not reported.
+    """
+    if float(z_threshold) <= 0:
+        raise TemporalSeriesError("z_threshold must be positive")
+    recent = series.counts[:, -1].astype(np.float64)
+    mean, variance = series.ewma_baseline(alpha)
+    ewma_std = np.sqrt(np.maximum(variance, 1.0))
+    ewma_z = (recent - mean) / ewma_std
+    spikes = np.flatnonzero((recent >= int(min_count)) & (ewma_z >= float(z_threshold)))
+    season_mean, season_std, samples = series.seasonal_baseline(season_seconds)
+    season_z = (recent - season_mean) / np.maximum(season_std, 1.0)
+    seasonal = np.flatnonzero((recent >= int(min_count)) & (season_z >= float(z_threshold))) if samples >= 2 else np.zeros(0, dtype=np.int64)
+    entry_index = _entry_index(entries or [])
+    rows = []
+    for position in spikes.tolist():
+        key = series.keys[position]
+        entry = entry_index.get(key)
+        label = _display_label(entry, key)
+        rows.append(
+            build_temporal_anomaly_record(
+                label="rate_spike",
+                window_name="short",
+                category=_category_from_key(key),
+                baseline_key=_baseline_from_key(key),
+                display_label=label,
+                confidence=score_anomaly_confidence(label="rate_spike", baseline_entry=entry, ratio=float(recent[position]) / max(1.0, float(mean[position]))),
+                severity="medium",
+                explanation=f"Latest-bucket observations for {label} were {float(ewma_z[position]):.1f} standard deviations above the EWMA baseline.",
+                generated_at=series.generated_at,
+                evidence={
+                    "recent_count": int(recent[position]),
+                    "ewma_mean": round(float(mean[position]), 3),
+                    "ewma_std": round(float(ewma_std[position]), 3),
+                    "z_score": round(float(ewma_z[position]), 3),
+                    "bucket_seconds": series.bucket_seconds,
+                },
+            )
+        )
+    for position in seasonal.tolist():
+        key = series.keys[position]
+        entry = entry_index.get(key)
+        label = _display_label(entry, key)
+        rows.append(
+            build_temporal_anomaly_record(
+                label="seasonal_deviation",
+                window_name="short",
+                category=_category_from_key(key),
+                baseline_key=_baseline_from_key(key),
+                display_label=label,
+                confidence=score_anomaly_confidence(label="seasonal_deviation", baseline_entry=entry, ratio=float(recent[position]) / max(1.0, float(season_mean[position]))),
+                severity="low",
+                explanation=f"Observations for {label} were above what the same time of day usually shows.",
+                generated_at=series.generated_at,
+                evidence={
+                    "recent_count": int(recent[position]),
+                    "seasonal_mean": round(float(season_mean[position]), 3),
+                    "seasonal_std": round(float(season_std[position]), 3),
+                    "z_score": round(float(season_z[position]), 3),
+                    "seasonal_samples": samples,
+                    "season_seconds": int(season_seconds),
+                },
+            )
+        )
+    return rows
+
+
+def build_temporal_series_report(
+    series: KeyCountSeries,
+    *,
+    entries: list[dict[str, Any]] | None = None,
+    max_anomalies: int = DEFAULT_MAX_TEMPORAL_ANOMALIES,
+    max_keys_per_window: int = DEFAULT_MAX_ANOMALY_WINDOW_KEYS,
+    window_seconds: dict[str, int] | None = None,
+    burst_multiplier: float = DEFAULT_BURST_MULTIPLIER,
+    min_burst_count: int = DEFAULT_MIN_BURST_COUNT,
+    volume_drift_multiplier: float = DEFAULT_VOLUME_DRIFT_MULTIPLIER,
+    alpha: float = DEFAULT_EWMA_ALPHA,
+    z_threshold: float = DEFAULT_ZSCORE_THRESHOLD,
+    season_seconds: int = DEFAULT_SEASON_SECONDS,
+) -> dict[str, Any]:
+    """Build a ``temporal_anomaly_report`` from a bucketed series.
+
+    The window detectors of ``build_temporal_anomaly_report`` run on the
+    bucketed windows, and the EWMA and seasonal detectors add ``rate_spike``
+    and ``seasonal_deviation`` records.
+    """
+    if int(max_anomalies) <= 0:
+        raise TemporalSeriesError("max_anomalies must be positive")
+    if float(burst_multiplier) <= 1:
+        raise TemporalSeriesError("burst_multiplier must be greater than 1")
+    rows = [dict(row) for row in entries or [] if isinstance(row, dict)]
+    windows = build_series_anomaly_windows(series, entries=rows, window_seconds=window_seconds, max_keys_per_window=max_keys_per_window)
+    anomalies = []
+    anomalies.extend(detect_burst_anomalies(windows, entries=rows, generated_at=series.generated_at, burst_multiplier=burst_multiplier, min_burst_count=min_burst_count))
+    anomalies.extend(detect_rare_service_timing(windows, entries=rows, generated_at=series.generated_at))
+    anomalies.extend(detect_volume_drift_hints(windows, generated_at=series.generated_at, volume_drift_multiplier=volume_drift_multiplier))
+    anomalies.extend(detect_window_novelty(windows, entries=rows, generated_at=series.generated_at))
+    anomalies.extend(detect_series_anomalies(series, entries=rows, alpha=alpha, z_threshold=z_threshold, min_count=min_burst_count, season_seconds=season_seconds))
+    report = assemble_temporal_anomaly_report(windows, anomalies, generated_at=series.generated_at, max_anomalies=max_anomalies)
+    report["series_summary"] = {
+        "key_count": len(series.keys),
+        "bucket_count": series.bucket_count,
+        "bucket_seconds": series.bucket_seconds,
+        "input_observation_count": series.input_observation_count,
+        "skipped_observation_count": series.skipped_observation_count,
+    }
+    return report
+
+
+def _entry_index(entries: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    index: dict[str, dict[str, Any]] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        category = str(entry.get("category") or "")
+        key = str(entry.get("baseline_key") or "")
+        if category and key:
+            index[f"{category}:{key}"] = entry
+    return index
+
+
+def _category_from_key(key: str) -> str:
+    return key.split(":", 1)[0] if ":" in key else "unknown"
+
+
+def _baseline_from_key(key: str) -> str:
+    return key.split(":", 1)[1] if ":" in key else key
+
+
+def _display_label(entry: dict[str, Any] | None, fallback: str) -> str:
+    return str((entry or {}).get("display_label") or fallback)
+
+
+def _timestamp_string(row: dict[str, Any]) -> str:
+    return str(row.get("observed_at") or row.get("last_seen") or row.get("first_seen") or row.get("timestamp") or row.get("generated_at") or "")
+
+
+def _python_micros(value: str) -> int | None:
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return (parsed.astimezone(UTC) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
@@ -2,13 +2,37 @@ from __future__ import annotations
 
 import json
 import socket
+import struct
+import zlib
 from typing import Any
 
+try:  # optional: only used when both ends have zstandard installed
+    import zstandard
+except ImportError:  # pragma: no cover - exercised when zstandard is absent
+    zstandard = None
+
 FRAME_DELIMITER = b"\n"
 DEFAULT_MAX_FRAME_BYTES = 2 * 1024 * 1024
 DEFAULT_RECV_CHUNK_BYTES = 65536
 DEFAULT_FRAME_READ_TIMEOUT_SECONDS = 5.0
 
+# Compact frames: 4-byte magic, version, codec, big-endian body length, body.
+# JSON frames always start with "{", so the magic can never be mistaken for one.
+COMPACT_FRAME_MAGIC = b"PMTC"
+COMPACT_FRAME_VERSION = 1
+COMPACT_FRAME_HEADER = struct.Struct(">4sBBI")
+FRAME_CODEC_NONE = 0
+FRAME_CODEC_ZLIB = 1
+FRAME_CODEC_ZSTD = 2
+FRAME_CODECS = {"none": FRAME_CODEC_NONE, "zlib": FRAME_CODEC_ZLIB, "zstd": FRAME_CODEC_ZSTD}
+FRAME_ENCODING_JSON = "json"
+FRAME_ENCODING_COMPACT = "compact-v1"
+SUPPORTED_FRAME_ENCODINGS = (FRAME_ENCODING_JSON, FRAME_ENCODING_COMPACT)
+# A list of same-shaped dicts is sent as [TABLE_MARKER, columns, row, ...] so
+# repeated connection keys appear once per list instead of once per row.
+_TABLE_MARKER = "\u0000t"
+_LITERAL_MARKER = "\u0000l"
+
 
 class TelemetryFrameError(ValueError):
     """Base class for worker telemetry frame failures."""
@@ -49,6 +73,83 @@ def decode_json_frame(frame: bytes) -> dict[str, Any]:
     return decoded
 
 
+def available_frame_codecs() -> tuple[str, ...]:
+    codecs = ["none", "zlib"]
+    if zstandard is not None:
+        codecs.append("zstd")
+    return tuple(codecs)
+
+
+def negotiate_frame_encoding(mode: str | None, advertised: Any = None) -> str:
+    """Pick the frame encoding a worker should send.
+
+    ``json`` always sends JSON, ``compact`` always sends compact frames, and
+    ``auto`` upgrades only after the master has advertised compact support.
+    """
+    mode = str(mode or "json").lower()
+    if mode == "compact":
+        return FRAME_ENCODING_COMPACT
+    if mode == "auto" and isinstance(advertised, (list, tuple)) and FRAME_ENCODING_COMPACT in advertised:
+        return FRAME_ENCODING_COMPACT
+    return FRAME_ENCODING_JSON
+
+
+def encode_telemetry_frame(
+    payload: dict[str, Any],
+    *,
+    encoding: str = FRAME_ENCODING_JSON,
+    compression: str = "zlib",
+    max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES,
+) -> bytes:
+    if encoding == FRAME_ENCODING_COMPACT:
+        return encode_compact_frame(payload, compression=compression, max_frame_bytes=max_frame_bytes)
+    if encoding != FRAME_ENCODING_JSON:
+        raise TelemetryFrameMalformed("unsupported_frame_encoding")
+    return encode_json_frame(payload, max_frame_bytes=max_frame_bytes)
+
+
+def encode_compact_frame(
+    payload: dict[str, Any],
+    *,
+    compression: str = "zlib",
+    max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES,
+) -> bytes:
+    """Encode a payload as a length-prefixed compact frame with interned row keys."""
+    if not isinstance(payload, dict):
+        raise TelemetryFrameMalformed("payload_must_be_object")
+    codec = FRAME_CODECS.get(compression)
+    if codec is None or compression not in available_frame_codecs():
+        raise TelemetryFrameMalformed("unsupported_frame_codec")
+    body = json.dumps(_pack_value(payload), separators=(",", ":"), default=str).encode("utf-8")
+    if len(body) > max_frame_bytes:
+        raise TelemetryFrameTooLarge("frame_exceeds_maximum")
+    if codec == FRAME_CODEC_ZLIB:
+        body = zlib.compress(body, 6)
+    elif codec == FRAME_CODEC_ZSTD:
+        body = zstandard.ZstdCompressor(level=3).compress(body)
+    if len(body) > max_frame_bytes:
+        raise TelemetryFrameTooLarge("frame_exceeds_maximum")
+    return COMPACT_FRAME_HEADER.pack(COMPACT_FRAME_MAGIC, COMPACT_FRAME_VERSION, codec, len(body)) + body
+
+
+def decode_compact_frame(frame: bytes, *, max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES) -> dict[str, Any]:
+    """Decode one complete compact frame, header included."""
+    body_length, codec = _compact_frame_header(frame, max_frame_bytes=max_frame_bytes)
+    body = frame[COMPACT_FRAME_HEADER.size :]
+    if len(body) != body_length:
+        raise TelemetryFrameMalformed("incomplete_frame")
+    body = _decompress_compact_body(body, codec, max_frame_bytes=max_frame_bytes)
+    try:
+        decoded = _unpack_value(json.loads(body.decode("utf-8")))
+    except UnicodeDecodeError as exc:
+        raise TelemetryFrameMalformed("invalid_utf8") from exc
+    except (json.JSONDecodeError, ValueError, TypeError) as exc:
+        raise TelemetryFrameMalformed("invalid_compact_body") from exc
+    if not isinstance(decoded, dict):
+        raise TelemetryFrameMalformed("payload_must_be_object")
+    return decoded
+
+
 def read_json_frames(
     conn,
     *,
@@ -58,8 +159,10 @@ def read_json_frames(
 ) -> list[dict[str, Any]]:
     """Read one or more complete worker telemetry JSON frames.
 
-    New workers send newline-delimited JSON. For compatibility with older
-    workers, a complete raw JSON object without a trailing newline is accepted.
+    New workers send newline-delimited JSON or length-prefixed compact frames
+    (see ``encode_compact_frame``); both may be mixed on one connection. For
+    compatibility with older workers, a complete raw JSON object without a
+    trailing newline is accepted.
     """
     frames: list[dict[str, Any]] = []
     buffer = bytearray()
@@ -78,25 +181,23 @@ def read_json_frames(
             if not chunk:
                 if not buffer:
                     return frames
+                if _is_compact_prefix(buffer):
+                    raise TelemetryFrameMalformed("incomplete_frame")
                 frames.append(_decode_legacy_buffer(bytes(buffer), max_frame_bytes=max_frame_bytes))
                 return frames
 
             buffer.extend(chunk)
-            if len(buffer) > max_frame_bytes and FRAME_DELIMITER not in buffer:
-                raise TelemetryFrameTooLarge("frame_exceeds_maximum")
-
-            while FRAME_DELIMITER in buffer:
-                raw_frame, _, remainder = bytes(buffer).partition(FRAME_DELIMITER)
-                buffer = bytearray(remainder)
-                if not raw_frame:
-                    continue
-                if len(raw_frame) > max_frame_bytes:
-                    raise TelemetryFrameTooLarge("frame_exceeds_maximum")
-                frames.append(decode_json_frame(raw_frame))
+            _drain_frames(buffer, frames, max_frame_bytes=max_frame_bytes)
 
             if frames and not buffer:
                 return frames
 
+            if _is_compact_prefix(buffer):
+                continue
+
+            if len(buffer) > max_frame_bytes and FRAME_DELIMITER not in buffer:
+                raise TelemetryFrameTooLarge("frame_exceeds_maximum")
+
             if not frames and FRAME_DELIMITER not in buffer:
                 legacy_payload = _try_decode_legacy_buffer(bytes(buffer), max_frame_bytes=max_frame_bytes)
                 if legacy_payload is not None:
@@ -155,6 +256,145 @@ def summarize_worker_payload(payload: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _drain_frames(buffer: bytearray, frames: list[dict[str, Any]], *, max_frame_bytes: int) -> None:
+    """Move every complete JSON or compact frame from ``buffer`` into ``frames``."""
+    while buffer:
+        if _is_compact_prefix(buffer):
+            if len(buffer) < COMPACT_FRAME_HEADER.size:
+                return
+            body_length, _codec = _compact_frame_header(bytes(buffer[: COMPACT_FRAME_HEADER.size]), max_frame_bytes=max_frame_bytes)
+            frame_length = COMPACT_FRAME_HEADER.size + body_length
+            if len(buffer) < frame_length:
+                return
+            frames.append(decode_compact_frame(bytes(buffer[:frame_length]), max_frame_bytes=max_frame_bytes))
+            del buffer[:frame_length]
+            continue
+        index = buffer.find(FRAME_DELIMITER)
+        if index < 0:
+            return
+        raw_frame = bytes(buffer[:index])
+        del buffer[: index + 1]
+        if not raw_frame:
+            continue
+        if len(raw_frame) > max_frame_bytes:
+            raise TelemetryFrameTooLarge("frame_exceeds_maximum")
+        frames.append(decode_json_frame(raw_frame))
+
+
+def _is_compact_prefix(buffer: bytes | bytearray) -> bool:
+    if not buffer:
+        return False
+    if len(buffer) >= len(COMPACT_FRAME_MAGIC):
+        return buffer.startswith(COMPACT_FRAME_MAGIC)
+    return COMPACT_FRAME_MAGIC.startswith(bytes(buffer))
+
+
+def _compact_frame_header(frame: bytes, *, max_frame_bytes: int) -> tuple[int, int]:
+    if len(frame) < COMPACT_FRAME_HEADER.size:
+        raise TelemetryFrameMalformed("incomplete_frame")
+    magic, version, codec, body_length = COMPACT_FRAME_HEADER.unpack_from(frame)
+    if magic != COMPACT_FRAME_MAGIC:
+        raise TelemetryFrameMalformed("invalid_frame_magic")
+    if version != COMPACT_FRAME_VERSION:
+        raise TelemetryFrameMalformed("unsupported_frame_version")
+    if codec not in FRAME_CODECS.values():
+        raise TelemetryFrameMalformed("unsupported_frame_codec")
+    if body_length > max_frame_bytes:
+        raise TelemetryFrameTooLarge("frame_exceeds_maximum")
+    return body_length, codec
+
+
+def _decompress_compact_body(body: bytes, codec: int, *, max_frame_bytes: int) -> bytes:
+    if codec == FRAME_CODEC_NONE:
+        return body
+    try:
+        if codec == FRAME_CODEC_ZLIB:
+            decompressor = zlib.decompressobj()
+            # Bound the inflated size as well so a small frame cannot expand past the limit.
+            inflated = decompressor.decompress(body, max_frame_bytes + 1)
+            if len(inflated) > max_frame_bytes or decompressor.unconsumed_tail:
+                raise TelemetryFrameTooLarge("frame_exceeds_maximum")
+            return inflated
+        if zstandard is None:
+            raise TelemetryFrameMalformed("unsupported_frame_codec")
+        inflated = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    except zlib.error as exc:
+        raise TelemetryFrameMalformed("invalid_compressed_body") from exc
+    except TelemetryFrameError:
+        raise
+    except Exception as exc:
+        raise TelemetryFrameMalformed("invalid_compressed_body") from exc
+    if len(inflated) > max_frame_bytes:
+        raise TelemetryFrameTooLarge("frame_exceeds_maximum")
+    return inflated
+
+
+def _pack_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _pack_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if len(value) > 1 and all(isinstance(item, dict) for item in value):
+            return _pack_table(value)
+        packed = [_pack_value(item) for item in value]
+        if packed and packed[0] in (_TABLE_MARKER, _LITERAL_MARKER):
+            return [_LITERAL_MARKER, *packed]
+        return packed
+    return value
+
+
+def _pack_table(items: list[dict[str, Any]] | tuple[dict[str, Any], ...]) -> list[Any]:
+    """Pack dicts as ``[marker, columns, nested_columns, row, ...]``.
+
+    ``nested_columns`` lists the column indexes holding containers, so the
+    decoder can rebuild flat rows with a single ``dict(zip(...))``.
+    """
+    columns = list(items[0])
+    shape = tuple(columns)
+    nested: set[int] = set()
+    rows: list[Any] = []
+    for item in items:
+        if tuple(item) != shape:
+            rows.append(_pack_value(item))
+            continue
+        row = []
+        for index, key in enumerate(columns):
+            cell = item[key]
+            if isinstance(cell, (dict, list, tuple)):
+                nested.add(index)
+                cell = _pack_value(cell)
+            row.append(cell)
+        rows.append(row)
+    return [_TABLE_MARKER, columns, sorted(nested), *rows]
+
+
+def _unpack_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _unpack_value(item) if isinstance(item, (dict, list)) else item for key, item in value.items()}
+    if isinstance(value, list):
+        if not value:
+            return value
+        head = value[0]
+        if head == _TABLE_MARKER:
+            return _unpack_table(value)
+        if head == _LITERAL_MARKER:
+            value = value[1:]
+        return [_unpack_value(item) if isinstance(item, (dict, list)) else item for item in value]
+    return value
+
+
+def _unpack_table(value: list[Any]) -> list[Any]:
+    columns, nested = value[1], value[2]
+    rows = []
+    for row in value[3:]:
+        if not isinstance(row, list):
+            rows.append(_unpack_value(row))
+            continue
+        for index in nested:
+            row[index] = _unpack_value(row[index])
+        rows.append(dict(zip(columns, row)))
+    return rows
+
+
 def _decode_legacy_buffer(buffer: bytes, *, max_frame_bytes: int) -> dict[str, Any]:
     if len(buffer) > max_frame_bytes:
         raise TelemetryFrameTooLarge("frame_exceeds_maximum")
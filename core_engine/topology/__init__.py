@@ -40,6 +40,17 @@ from core_engine.topology.federated import (
     summarize_federated_topology,
 )
 from core_engine.topology.graph import build_topology_graph, summarize_topology
+from core_engine.topology.graph_analytics import (
+    DEFAULT_BETWEENNESS_EXACT_LIMIT,
+    DEFAULT_BETWEENNESS_SAMPLE_SIZE,
+    DEFAULT_BLAST_RADIUS_HOPS,
+    GRAPH_ANALYTICS_RECORD_VERSION,
+    GraphAnalyticsError,
+    TopologyGraphIndex,
+    build_graph_analytics_report,
+    build_topology_graph_index,
+    deterministic_graph_analytics_json,
+)
 from core_engine.topology.import_export import (
     build_topology_export_bundle,
     export_topology_bundle,
@@ -114,11 +125,15 @@ from core_engine.topology.trust_zones import (
     infer_trust_zones,
     normalize_trust_zone_class,
     score_trust_zone_confidence,
+    score_trust_zone_reach,
 )
 
 __all__ = [
     "DEPENDENCY_RECORD_VERSION",
     "DEPENDENCY_TYPES",
+    "DEFAULT_BETWEENNESS_EXACT_LIMIT",
+    "DEFAULT_BETWEENNESS_SAMPLE_SIZE",
+    "DEFAULT_BLAST_RADIUS_HOPS",
     "DependencyMappingError",
     "build_drift_correlation_records",
     "build_drift_event",
@@ -135,6 +150,7 @@ __all__ = [
     "build_federated_dashboard_summary",
     "build_federated_timeline_entries",
     "build_federated_topology",
+    "build_graph_analytics_report",
     "build_lateral_analysis_api",
     "build_lateral_analysis_dashboard",
     "build_lateral_analysis_report",
@@ -146,6 +162,7 @@ __all__ = [
     "build_timeline_entries",
     "build_topology_export_bundle",
     "build_topology_graph",
+    "build_topology_graph_index",
     "build_topology_snapshot",
     "build_topology_state",
     "build_trust_zone_api",
@@ -164,12 +181,15 @@ __all__ = [
     "dedupe_relationship_records",
     "detect_unusual_peer",
     "deterministic_dependency_json",
+    "deterministic_graph_analytics_json",
     "deterministic_lateral_analysis_json",
     "deterministic_relationship_graph_json",
     "deterministic_trust_zone_json",
     "drift_to_finding",
     "export_topology_bundle",
     "export_topology_snapshot",
+    "GRAPH_ANALYTICS_RECORD_VERSION",
+    "GraphAnalyticsError",
     "import_topology_snapshot",
     "list_persisted_topology_snapshots",
     "load_topology_snapshot",
@@ -201,6 +221,7 @@ __all__ = [
     "score_spread_potential",
     "score_topology_risk",
     "score_trust_zone_confidence",
+    "score_trust_zone_reach",
     "summarize_federated_topology",
     "summarize_dependencies",
     "summarize_lateral_analysis",
@@ -213,6 +234,7 @@ __all__ = [
     "TRUST_ZONE_CLASSES",
     "TRUST_ZONE_RECORD_VERSION",
     "TrustZoneError",
+    "TopologyGraphIndex",
     "topology_snapshot_to_storage_record",
     "validate_topology_snapshot",
     "write_topology_snapshot",
@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 from hashlib import sha256
 from typing import Any, Iterable
 
+from core_engine.snapshot_diff import KeyedSnapshot, SnapshotIndexCache, SnapshotKeySpec, diff_rows
 from core_engine.topology.drift import build_drift_report
 from core_engine.topology.snapshots import SAFETY_FLAGS, validate_topology_snapshot
 
@@ -14,7 +15,13 @@ def compare_topology_snapshots(
     current: dict[str, Any],
     *,
     generated_at: str | None = None,
+    index_cache: SnapshotIndexCache | None = None,
 ) -> dict[str, Any]:
+    """Diff two topology snapshots into a drift report.
+
+    Pass the same ``index_cache`` on every cycle so each snapshot's sections
+    are indexed once, however many times it is compared.
+    """
     baseline_validation = validate_topology_snapshot(baseline)
     current_validation = validate_topology_snapshot(current)
     errors = [f"baseline: {error}" for error in baseline_validation["errors"]]
@@ -29,29 +36,30 @@ def compare_topology_snapshots(
             status="invalid",
         )
 
+    refs = {"baseline_ref": _snapshot_ref(baseline), "current_ref": _snapshot_ref(current)}
+    sections = {name: (_section(baseline, name, index_cache), _section(current, name, index_cache)) for name in _SECTION_SPECS}
     drifts: list[dict[str, Any]] = []
-    drifts.extend(compare_asset_drift(_assets(baseline), _assets(current), baseline_ref=_snapshot_ref(baseline), current_ref=_snapshot_ref(current)))
-    drifts.extend(compare_service_drift(_services(baseline), _services(current), baseline_ref=_snapshot_ref(baseline), current_ref=_snapshot_ref(current)))
-    drifts.extend(compare_topology_edge_drift(_edges(baseline), _edges(current), baseline_ref=_snapshot_ref(baseline), current_ref=_snapshot_ref(current)))
-    drifts.extend(compare_finding_drift(_findings(baseline), _findings(current), baseline_ref=_snapshot_ref(baseline), current_ref=_snapshot_ref(current)))
+    drifts.extend(compare_asset_drift(*sections["assets"], **refs))
+    drifts.extend(compare_service_drift(*sections["services"], **refs))
+    drifts.extend(compare_topology_edge_drift(*sections["edges"], **refs))
+    drifts.extend(compare_finding_drift(*sections["findings"], **refs))
     return build_drift_report(baseline, current, drifts, generated_at=generated_at)
 
 
 def compare_asset_drift(
-    baseline_assets: Iterable[dict[str, Any]],
-    current_assets: Iterable[dict[str, Any]],
+    baseline_assets: Iterable[dict[str, Any]] | KeyedSnapshot,
+    current_assets: Iterable[dict[str, Any]] | KeyedSnapshot,
     *,
     baseline_ref: str = "baseline",
     current_ref: str = "current",
 ) -> list[dict[str, Any]]:
-    baseline = _index(_rows(baseline_assets), _asset_key)
-    current = _index(_rows(current_assets), _asset_key)
+    baseline, current, delta = diff_rows(baseline_assets, current_assets, _ASSET_SPEC)
     drifts: list[dict[str, Any]] = []
-    for key in sorted(set(current) - set(baseline)):
+    for key in delta.added:
         drifts.append(_drift("asset_added", "asset", "medium", key, "Asset added", f"Asset {key} appears in the current topology snapshot.", current[key], baseline_ref, current_ref))
-    for key in sorted(set(baseline) - set(current)):
+    for key in delta.removed:
         drifts.append(_drift("asset_removed", "asset", "low", key, "Asset removed", f"Asset {key} was present in the baseline topology snapshot.", baseline[key], baseline_ref, current_ref))
-    for key in sorted(set(baseline) & set(current)):
+    for key in delta.common():
         before = baseline[key]
         after = current[key]
         if _first(before, "label") != _first(after, "label"):
@@ -65,20 +73,19 @@ def compare_asset_drift(
 
 
 def compare_service_drift(
-    baseline_services: Iterable[dict[str, Any]],
-    current_services: Iterable[dict[str, Any]],
+    baseline_services: Iterable[dict[str, Any]] | KeyedSnapshot,
+    current_services: Iterable[dict[str, Any]] | KeyedSnapshot,
     *,
     baseline_ref: str = "baseline",
     current_ref: str = "current",
 ) -> list[dict[str, Any]]:
-    baseline = _index(_rows(baseline_services), _service_key)
-    current = _index(_rows(current_services), _service_key)
+    baseline, current, delta = diff_rows(baseline_services, current_services, _SERVICE_SPEC)
     drifts: list[dict[str, Any]] = []
-    for key in sorted(set(current) - set(baseline)):
+    for key in delta.added:
         drifts.append(_drift("service_added", "service", "medium", key, "Service added", f"Service {key} appears in the current topology snapshot.", current[key], baseline_ref, current_ref))
-    for key in sorted(set(baseline) - set(current)):
+    for key in delta.removed:
         drifts.append(_drift("service_removed", "service", "low", key, "Service removed", f"Service {key} was present in the baseline topology snapshot.", baseline[key], baseline_ref, current_ref))
-    for key in sorted(set(baseline) & set(current)):
+    for key in delta.common():
         before = _service_label(baseline[key])
         after = _service_label(current[key])
         if before != after:
@@ -87,20 +94,19 @@ def compare_service_drift(
 
 
 def compare_topology_edge_drift(
-    baseline_edges: Iterable[dict[str, Any]],
-    current_edges: Iterable[dict[str, Any]],
+    baseline_edges: Iterable[dict[str, Any]] | KeyedSnapshot,
+    current_edges: Iterable[dict[str, Any]] | KeyedSnapshot,
     *,
     baseline_ref: str = "baseline",
     current_ref: str = "current",
 ) -> list[dict[str, Any]]:
-    baseline = _index(_rows(baseline_edges), _edge_key)
-    current = _index(_rows(current_edges), _edge_key)
+    baseline, current, delta = diff_rows(baseline_edges, current_edges, _EDGE_SPEC)
     drifts: list[dict[str, Any]] = []
-    for key in sorted(set(current) - set(baseline)):
+    for key in delta.added:
         drifts.append(_drift("topology_edge_added", "topology", "medium", key, "Topology edge added", f"Topology edge {key} appears in the current topology snapshot.", current[key], baseline_ref, current_ref))
-    for key in sorted(set(baseline) - set(current)):
+    for key in delta.removed:
         drifts.append(_drift("topology_edge_removed", "topology", "low", key, "Topology edge removed", f"Topology edge {key} was present in the baseline topology snapshot.", baseline[key], baseline_ref, current_ref))
-    for key in sorted(set(baseline) & set(current)):
+    for key in delta.common():
         before_count = int(baseline[key].get("observation_count") or 0)
         after_count = int(current[key].get("observation_count") or 0)
         if before_count != after_count:
@@ -109,21 +115,20 @@ def compare_topology_edge_drift(
 
 
 def compare_finding_drift(
-    baseline_findings: Iterable[dict[str, Any]],
-    current_findings: Iterable[dict[str, Any]],
+    baseline_findings: Iterable[dict[str, Any]] | KeyedSnapshot,
+    current_findings: Iterable[dict[str, Any]] | KeyedSnapshot,
     *,
     baseline_ref: str = "baseline",
     current_ref: str = "current",
 ) -> list[dict[str, Any]]:
-    baseline = _index(_rows(baseline_findings), _finding_key)
-    current = _index(_rows(current_findings), _finding_key)
+    baseline, current, delta = diff_rows(baseline_findings, current_findings, _FINDING_SPEC)
     drifts: list[dict[str, Any]] = []
-    for key in sorted(set(current) - set(baseline)):
+    for key in delta.added:
         drifts.append(_drift("finding_added", "finding", _severity(current[key]), key, "Finding added", f"Finding {key} appears in the current topology snapshot.", current[key], baseline_ref, current_ref))
-    for key in sorted(set(baseline) - set(current)):
+    for key in delta.removed:
         drifts.append(_drift("finding_removed", "finding", "low", key, "Finding removed", f"Finding {key} was present in the baseline topology snapshot.", baseline[key], baseline_ref, current_ref))
-    baseline_categories = _categories(baseline.values())
-    current_categories = _categories(current.values())
+    baseline_categories = _categories(baseline.rows())
+    current_categories = _categories(current.rows())
     for category, rows in sorted(current_categories.items()):
         if len(rows) > 1:
             drifts.append(_drift("finding_category_repeated", "finding", _highest_severity(rows), category, "Finding category repeated", f"Finding category {category} appears {len(rows)} times in the current topology snapshot.", {"count": len(rows), "category": category}, baseline_ref, current_ref))
@@ -218,8 +223,11 @@ def _rows(value: Any) -> list[dict[str, Any]]:
     return [item for item in value or [] if isinstance(item, dict)]
 
 
-def _index(rows: list[dict[str, Any]], key_fn) -> dict[str, dict[str, Any]]:
-    return {key_fn(row): row for row in rows}
+def _section(snapshot: dict[str, Any], name: str, cache: SnapshotIndexCache | None) -> KeyedSnapshot:
+    reader, spec = _SECTION_SPECS[name]
+    if cache is None:
+        return KeyedSnapshot(reader(snapshot), spec=spec)
+    return cache.index(snapshot, lambda: reader(snapshot), spec)
 
 
 def _asset_key(row: dict[str, Any]) -> str:
@@ -305,3 +313,19 @@ def _now() -> str:
 
 
 _SEVERITY_ORDER = {"info": 0, "low": 1, "medium": 2, "high": 3, "critical": 4}
+
+_ASSET_SPEC = SnapshotKeySpec(
+    "topology.assets",
+    _asset_key,
+    content=lambda row: (_first(row, "label"), _first(row, "category"), _confidence(row)),
+    flag=lambda content: 0 < content[2] < 0.5,
+)
+_SERVICE_SPEC = SnapshotKeySpec("topology.services", _service_key, content=_service_label)
+_EDGE_SPEC = SnapshotKeySpec("topology.edges", _edge_key, content=lambda row: int(row.get("observation_count") or 0))
+_FINDING_SPEC = SnapshotKeySpec("topology.findings", _finding_key)
+_SECTION_SPECS = {
+    "assets": (_assets, _ASSET_SPEC),
+    "services": (_services, _SERVICE_SPEC),
+    "edges": (_edges, _EDGE_SPEC),
+    "findings": (_findings, _FINDING_SPEC),
+}
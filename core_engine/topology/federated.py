@@ -5,13 +5,11 @@ from datetime import UTC, datetime
 from hashlib import sha256
 from typing import Any, Iterable
 
+from core_engine.aggregation.streaming import merge_grouped_rows
 from core_engine.topology.graph import build_topology_graph, summarize_topology
 from core_engine.topology.node_merge import (
+    FEDERATED_MERGE_SECTIONS,
     SAFETY_FLAGS,
-    merge_federated_assets,
-    merge_federated_findings,
-    merge_federated_services,
-    merge_federated_topology_edges,
 )
 from core_engine.topology.timeline import build_timeline_entries, summarize_timeline
 
@@ -27,10 +25,10 @@ def build_federated_topology(
 ) -> dict[str, Any]:
     timestamp = generated_at or _now()
     reports = normalize_node_topology_snapshots(node_snapshots, observed_at=timestamp)
-    assets, asset_conflicts = merge_federated_assets(_chain(reports, "assets"))
-    services, service_conflicts = merge_federated_services(_chain(reports, "services"))
-    edges, edge_conflicts = merge_federated_topology_edges(_chain(reports, "topology_edges"))
-    findings, finding_conflicts = merge_federated_findings(_chain(reports, "findings"))
+    assets, asset_conflicts = _merge_section(reports, "assets")
+    services, service_conflicts = _merge_section(reports, "services")
+    edges, edge_conflicts = _merge_section(reports, "topology_edges")
+    findings, finding_conflicts = _merge_section(reports, "findings")
     conflicts = sorted(
         [*asset_conflicts, *service_conflicts, *edge_conflicts, *finding_conflicts],
         key=lambda item: item["conflict_id"],
@@ -328,11 +326,8 @@ def _services_from_topology_nodes(topology: dict[str, Any]) -> list[dict[str, An
     return rows
 
 
-def _chain(reports: list[dict[str, Any]], field: str) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for report in reports:
-        rows.extend(_rows(report.get(field)))
-    return rows
+def _merge_section(reports: list[dict[str, Any]], field: str) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    return merge_grouped_rows((_rows(report.get(field)) for report in reports), *FEDERATED_MERGE_SECTIONS[field])
 
 
 def _rows(value: Any) -> list[dict[str, Any]]:
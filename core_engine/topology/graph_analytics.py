@@ -0,0 +1,616 @@
+from __future__ import annotations
+
+import json
+import random
+from array import array
+from collections import OrderedDict, deque
+from datetime import UTC, datetime
+from hashlib import sha256
+from typing import Any, Hashable, Iterable
+
+from core_engine.topology.relationship_graphs import RELATIONSHIP_SAFETY_FLAGS
+
+
+GRAPH_ANALYTICS_RECORD_VERSION = 1
+DEFAULT_BETWEENNESS_EXACT_LIMIT = 512
+DEFAULT_BETWEENNESS_SAMPLE_SIZE = 128
+DEFAULT_BLAST_RADIUS_HOPS = 3
+DEFAULT_ANALYTICS_CACHE_ENTRIES = 1024
+
+_SOURCE_KEYS = ("source_asset", "src_asset", "src", "source", "from", "src_ip", "source_node_reference")
+_TARGET_KEYS = ("target_asset", "dst_asset", "dst", "target", "to", "dst_ip", "target_node_reference")
+
+
+class GraphAnalyticsError(ValueError):
+    """Raised when topology graph analytics inputs are malformed."""
+
+
+class TopologyGraphIndex:
+    """Integer-indexed directed adjacency over topology nodes and edges.
+
+    Edges are stored in compressed sparse row form: ``_out_offsets[i]`` to
+    ``_out_offsets[i + 1]`` slices ``_out_targets`` for node ``i``, with a
+    mirrored reverse index for predecessor walks. Parallel topology edges
+    (same endpoints, different relationship types or labels) collapse into
+    one adjacency with a multiplicity count.
+
+    ``add_edge`` and ``remove_edge`` write to a small overlay instead of
+    rebuilding the arrays; the overlay is folded back into the compact form
+    once it grows past an eighth of the edge count. The graph digest is the
+    XOR of per-node and per-edge hashes, so it is updated in O(1) per change
+    and equal graphs share a digest regardless of insertion order. Query
+    results are cached against that digest.
+    """
+
+    def __init__(
+        self,
+        node_ids: Iterable[str] | None = None,
+        edges: Iterable[tuple[str, str]] | None = None,
+        *,
+        max_cached_results: int = DEFAULT_ANALYTICS_CACHE_ENTRIES,
+    ) -> None:
+        if int(max_cached_results) <= 0:
+            raise GraphAnalyticsError("max_cached_results must be greater than zero")
+        self.max_cached_results = int(max_cached_results)
+        self._node_ids: list[str] = []
+        self._node_index: dict[str, int] = {}
+        self._multiplicity: dict[tuple[int, int], int] = {}
+        self._digest_value = 0
+        self._results: OrderedDict[tuple[int, str, Hashable], Any] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        for node_id in node_ids or []:
+            self._intern(str(node_id))
+        for src, dst in edges or []:
+            pair = (self._intern(str(src)), self._intern(str(dst)))
+            count = self._multiplicity.get(pair, 0)
+            self._multiplicity[pair] = count + 1
+            if not count:
+                self._digest_value ^= _edge_hash(self._node_ids[pair[0]], self._node_ids[pair[1]])
+        self._compact()
+
+    @classmethod
+    def from_topology(cls, graph: dict[str, Any], **kwargs: Any) -> "TopologyGraphIndex":
+        """Index a ``build_topology_graph`` result or a topology snapshot."""
+        if not isinstance(graph, dict):
+            raise GraphAnalyticsError("topology graph must be an object")
+        topology = graph.get("topology") if isinstance(graph.get("topology"), dict) else graph
+        node_ids = [_first_str(node, "asset_id", "node_id", "host") for node in _rows(topology.get("nodes"))]
+        edges = []
+        for edge in _rows(topology.get("edges")):
+            src = _first_str(edge, *_SOURCE_KEYS)
+            dst = _first_str(edge, *_TARGET_KEYS)
+            if src and dst:
+                edges.append((src, dst))
+        return cls([node for node in node_ids if node], edges, **kwargs)
+
+    @classmethod
+    def from_relationships(cls, relationships: Iterable[dict[str, Any]], **kwargs: Any) -> "TopologyGraphIndex":
+        """Index relationship records by their source and target node references."""
+        edges = []
+        for row in _rows(relationships):
+            src = _first_str(row, *_SOURCE_KEYS)
+            dst = _first_str(row, *_TARGET_KEYS)
+            if src and dst:
+                edges.append((src, dst))
+        return cls(None, edges, **kwargs)
+
+    @property
+    def digest(self) -> str:
+        return f"topology-graph-{self._digest_value:032x}"
+
+    @property
+    def node_count(self) -> int:
+        return len(self._node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._multiplicity)
+
+    @property
+    def overlay_size(self) -> int:
+        return sum(len(items) for items in self._added_out.values()) + len(self._removed)
+
+    def __contains__(self, node_id: object) -> bool:
+        return str(node_id) in self._node_index
+
+    def node_ids(self) -> list[str]:
+        return list(self._node_ids)
+
+    def has_edge(self, src: str, dst: str) -> bool:
+        pair = (self._node_index.get(str(src), -1), self._node_index.get(str(dst), -1))
+        return pair in self._multiplicity
+
+    def successors(self, node_id: str) -> list[str]:
+        return [self._node_ids[index] for index in self._out(self._require(node_id))]
+
+    def predecessors(self, node_id: str) -> list[str]:
+        return [self._node_ids[index] for index in self._in(self._require(node_id))]
+
+    def add_node(self, node_id: str) -> bool:
+        if str(node_id) in self._node_index:
+            return False
+        self._intern(str(node_id))
+        return True
+
+    def add_edge(self, src: str, dst: str) -> bool:
+        """Add one ``src -> dst`` observation; returns ``True`` when the adjacency is new."""
+        previous = self._digest_value
+        pair = (self._intern(str(src)), self._intern(str(dst)))
+        count = self._multiplicity.get(pair, 0)
+        self._multiplicity[pair] = count + 1
+        if count:
+            return False
+        self._digest_value ^= _edge_hash(str(src), str(dst))
+        if pair in self._removed:
+            self._removed.discard(pair)
+        else:
+            self._added_out.setdefault(pair[0], set()).add(pair[1])
+            self._added_in.setdefault(pair[1], set()).add(pair[0])
+        self._carry_components_after_add(previous, pair)
+        self._maybe_compact()
+        return True
+
+    def remove_edge(self, src: str, dst: str) -> bool:
+        """Remove one ``src -> dst`` observation; returns ``True`` when the adjacency is gone."""
+        pair = (self._node_index.get(str(src), -1), self._node_index.get(str(dst), -1))
+        count = self._multiplicity.get(pair, 0)
+        if not count:
+            return False
+        if count > 1:
+            self._multiplicity[pair] = count - 1
+            return False
+        del self._multiplicity[pair]
+        self._digest_value ^= _edge_hash(str(src), str(dst))
+        added = self._added_out.get(pair[0])
+        if added is not None and pair[1] in added:
+            added.discard(pair[1])
+            self._added_in[pair[1]].discard(pair[0])
+        else:
+            self._removed.add(pair)
+        self._maybe_compact()
+        return True
+
+    def reachable(self, node_id: str, *, max_hops: int | None = None) -> dict[str, int]:
+        """Breadth-first hop distances from ``node_id`` along edge direction, excluding itself."""
+        start = self._require(node_id)
+        hops = None if max_hops is None else int(max_hops)
+        if hops is not None and hops < 0:
+            raise GraphAnalyticsError("max_hops must not be negative")
+
+        def compute() -> dict[str, int]:
+            distances = _bfs(self._adjacency(), start, hops)
+            return {self._node_ids[index]: distance for index, distance in distances.items() if index != start}
+
+        return dict(self._cached("reachable", (start, hops), compute))
+
+    def can_reach(self, src: str, dst: str) -> bool:
+        return bool(self.shortest_path(src, dst))
+
+    def shortest_path(self, src: str, dst: str) -> list[str]:
+        """Bidirectional BFS over successors and predecessors; empty when unreachable."""
+        start = self._require(src)
+        goal = self._require(dst)
+
+        def compute() -> tuple[int, ...]:
+            return tuple(_bidirectional_path(self._adjacency(), self._reverse_adjacency(), start, goal))
+
+        return [self._node_ids[index] for index in self._cached("shortest_path", (start, goal), compute)]
+
+    def blast_radius(self, node_id: str, *, hops: int = DEFAULT_BLAST_RADIUS_HOPS) -> dict[str, Any]:
+        """Nodes reachable within ``hops`` steps, bucketed by hop count."""
+        reached = self.reachable(node_id, max_hops=hops)
+        by_hop: dict[int, list[str]] = {}
+        for target, distance in reached.items():
+            by_hop.setdefault(distance, []).append(target)
+        return {
+            "node_id": str(node_id),
+            "hops": int(hops),
+            "reachable_count": len(reached),
+            "reachable_fraction": self._fraction(len(reached)),
+            "by_hop": {str(distance): sorted(nodes) for distance, nodes in sorted(by_hop.items())},
+        }
+
+    def degree_centrality(self) -> dict[str, float]:
+        """In plus out degree, normalized by ``2 * (n - 1)``."""
+
+        def compute() -> dict[str, float]:
+            adjacency = self._adjacency()
+            reverse = self._reverse_adjacency()
+            scale = 2 * (self.node_count - 1)
+            return {
+                self._node_ids[index]: round((len(adjacency[index]) + len(reverse[index])) / scale, 6) if scale > 0 else 0.0
+                for index in range(self.node_count)
+            }
+
+        return dict(self._cached("degree_centrality", None, compute))
+
+    def betweenness_centrality(
+        self,
+        *,
+        sample_size: int | None = None,
+        exact_limit: int = DEFAULT_BETWEENNESS_EXACT_LIMIT,
+        seed: int = 0,
+    ) -> dict[str, float]:
+        """Brandes betweenness, normalized to ``[0, 1]``.
+
+        Graphs larger than ``exact_limit`` nodes use ``sample_size`` pivot
+        sources (``DEFAULT_BETWEENNESS_SAMPLE_SIZE`` by default) drawn with
+        ``seed`` and scale the dependencies by ``n / sample_size``, which keeps
+        the estimate unbiased at O(sample_size * edges) cost.
+        """
+        count = self.node_count
+        if sample_size is None:
+            pivots = count if count <= int(exact_limit) else DEFAULT_BETWEENNESS_SAMPLE_SIZE
+        else:
+            pivots = int(sample_size)
+        if sample_size is not None and pivots <= 0:
+            raise GraphAnalyticsError("sample_size must be greater than zero")
+        if count == 0:
+            return {}
+        pivots = min(pivots, count)
+
+        def compute() -> dict[str, float]:
+            if pivots == count:
+                sources: list[int] = list(range(count))
+            else:
+                sources = sorted(random.Random(seed).sample(range(count), pivots))
+            scores = _brandes(self._adjacency(), sources)
+            scale = (count / pivots if pivots else 0.0) / ((count - 1) * (count - 2)) if count > 2 else 0.0
+            return {self._node_ids[index]: round(value * scale, 6) for index, value in enumerate(scores)}
+
+        return dict(self._cached("betweenness_centrality", (pivots, int(seed)), compute))
+
+    def connected_components(self) -> list[list[str]]:
+        """Weakly connected components of sorted node ids, largest first."""
+        components = [sorted(self._node_ids[index] for index in component) for component in self._components()]
+        return sorted(components, key=lambda item: (-len(item), item[0]))
+
+    def component_of(self, node_id: str) -> list[str]:
+        index = self._require(node_id)
+        for component in self._components():
+            if index in component:
+                return sorted(self._node_ids[item] for item in component)
+        return [str(node_id)]
+
+    def spread_metrics(self, node_id: str, *, hops: int = DEFAULT_BLAST_RADIUS_HOPS) -> dict[str, Any]:
+        """Path-based spread figures for one node, for lateral and trust-zone scoring."""
+        reach = self.reachable(node_id)
+        blast = self.blast_radius(node_id, hops=hops)
+        return {
+            "node_id": str(node_id),
+            "graph_digest": self.digest,
+            "reachable_count": len(reach),
+            "reachable_fraction": self._fraction(len(reach)),
+            "max_path_length": max(reach.values(), default=0),
+            "blast_radius_hops": int(hops),
+            "blast_radius_count": blast["reachable_count"],
+            "blast_radius_fraction": blast["reachable_fraction"],
+            "degree_centrality": self.degree_centrality().get(str(node_id), 0.0),
+            "betweenness_centrality": self.betweenness_centrality().get(str(node_id), 0.0),
+            "component_size": len(self.component_of(node_id)),
+        }
+
+    def clear_cache(self) -> None:
+        self._results.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _intern(self, node_id: str) -> int:
+        index = self._node_index.get(node_id)
+        if index is not None:
+            return index
+        index = len(self._node_ids)
+        self._node_ids.append(node_id)
+        self._node_index[node_id] = index
+        self._digest_value ^= _node_hash(node_id)
+        if hasattr(self, "_out_offsets"):
+            self._out_offsets.append(self._out_offsets[-1])
+            self._in_offsets.append(self._in_offsets[-1])
+        return index
+
+    def _require(self, node_id: str) -> int:
+        index = self._node_index.get(str(node_id))
+        if index is None:
+            raise GraphAnalyticsError(f"unknown topology node: {node_id}")
+        return index
+
+    def _compact(self) -> None:
+        count = len(self._node_ids)
+        out_lists: list[list[int]] = [[] for _ in range(count)]
+        in_lists: list[list[int]] = [[] for _ in range(count)]
+        for src, dst in sorted(self._multiplicity):
+            out_lists[src].append(dst)
+            in_lists[dst].append(src)
+        self._out_offsets, self._out_targets = _csr(out_lists)
+        self._in_offsets, self._in_targets = _csr(in_lists)
+        self._added_out: dict[int, set[int]] = {}
+        self._added_in: dict[int, set[int]] = {}
+        self._removed: set[tuple[int, int]] = set()
+
+    def _maybe_compact(self) -> None:
+        if self.overlay_size > max(64, len(self._multiplicity) // 8):
+            self._compact()
+
+    def _out(self, index: int) -> list[int]:
+        return _merged(self._out_targets[self._out_offsets[index] : self._out_offsets[index + 1]], self._added_out.get(index), self._removed, index, True)
+
+    def _in(self, index: int) -> list[int]:
+        return _merged(self._in_targets[self._in_offsets[index] : self._in_offsets[index + 1]], self._added_in.get(index), self._removed, index, False)
+
+    def _adjacency(self) -> tuple[tuple[int, ...], ...]:
+        return self._cached("adjacency", None, lambda: tuple(tuple(self._out(index)) for index in range(self.node_count)))
+
+    def _reverse_adjacency(self) -> tuple[tuple[int, ...], ...]:
+        return self._cached("reverse_adjacency", None, lambda: tuple(tuple(self._in(index)) for index in range(self.node_count)))
+
+    def _components(self) -> tuple[tuple[int, ...], ...]:
+        return self._cached("components", None, lambda: _weak_components(self._adjacency(), self._reverse_adjacency()))
+
+    def _carry_components_after_add(self, previous_digest: int, pair: tuple[int, int]) -> None:
+        # An added edge can only merge components, so reuse the previous
+        # partition instead of walking the graph again.
+        components = self._results.get((previous_digest, "components", None))
+        if components is None:
+            return
+        known = {index for component in components for index in component}
+        merged: list[int] = [index for index in pair if index not in known]
+        rest = []
+        for component in components:
+            if pair[0] in component or pair[1] in component:
+                merged.extend(component)
+            else:
+                rest.append(component)
+        others = [(index,) for index in range(self.node_count) if index not in known and index not in pair]
+        self._store("components", None, _sorted_components([tuple(sorted(set(merged))), *rest, *others]))
+
+    def _cached(self, name: str, params: Hashable, compute) -> Any:
+        key = (self._digest_value, name, params)
+        if key in self._results:
+            self._results.move_to_end(key)
+            self.cache_hits += 1
+            return self._results[key]
+        self.cache_misses += 1
+        return self._store(name, params, compute())
+
+    def _store(self, name: str, params: Hashable, value: Any) -> Any:
+        key = (self._digest_value, name, params)
+        self._results[key] = value
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_cached_results:
+            self._results.popitem(last=False)
+        return value
+
+    def _fraction(self, count: int) -> float:
+        return round(count / (self.node_count - 1), 6) if self.node_count > 1 else 0.0
+
+
+def build_topology_graph_index(
+    source: dict[str, Any] | Iterable[dict[str, Any]],
+    **kwargs: Any,
+) -> TopologyGraphIndex:
+    """Index a topology graph, a topology snapshot, or a list of relationship records."""
+    if isinstance(source, dict):
+        return TopologyGraphIndex.from_topology(source, **kwargs)
+    try:
+        return TopologyGraphIndex.from_relationships(source, **kwargs)
+    except TypeError as exc:
+        raise GraphAnalyticsError("topology source must be a graph, snapshot, or relationship list") from exc
+
+
+def build_graph_analytics_report(
+    index: TopologyGraphIndex,
+    *,
+    hops: int = DEFAULT_BLAST_RADIUS_HOPS,
+    top_n: int = 10,
+    generated_at: str | None = None,
+) -> dict[str, Any]:
+    if not isinstance(index, TopologyGraphIndex):
+        raise GraphAnalyticsError("index must be a TopologyGraphIndex")
+    timestamp = generated_at or _now()
+    betweenness = index.betweenness_centrality()
+    degree = index.degree_centrality()
+    components = index.connected_components()
+    blast = sorted(
+        ((node, index.blast_radius(node, hops=hops)["reachable_count"]) for node in index.node_ids()),
+        key=lambda item: (-item[1], item[0]),
+    )
+    return {
+        "record_type": "topology_graph_analytics",
+        "record_version": GRAPH_ANALYTICS_RECORD_VERSION,
+        "report_id": "topology-graph-analytics-" + _digest({"graph_digest": index.digest, "hops": int(hops), "generated_at": timestamp})[:16],
+        "generated_at": timestamp,
+        "graph_digest": index.digest,
+        "node_count": index.node_count,
+        "edge_count": index.edge_count,
+        "component_count": len(components),
+        "largest_component_size": len(components[0]) if components else 0,
+        "betweenness_approximate": index.node_count > DEFAULT_BETWEENNESS_EXACT_LIMIT,
+        "blast_radius_hops": int(hops),
+        "top_blast_radius": [{"node_id": node, "reachable_count": count} for node, count in blast[:top_n]],
+        "top_betweenness": _top(betweenness, top_n),
+        "top_degree": _top(degree, top_n),
+        **RELATIONSHIP_SAFETY_FLAGS,
+    }
+
+
+def deterministic_graph_analytics_json(record: dict[str, Any]) -> str:
+    return json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _csr(lists: list[list[int]]) -> tuple[array, array]:
+    offsets = array("l", [0])
+    targets = array("l")
+    for items in lists:
+        targets.extend(items)
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def _merged(base: array, added: set[int] | None, removed: set[tuple[int, int]], index: int, outgoing: bool) -> list[int]:
+    if removed:
+        items = [item for item in base if ((index, item) if outgoing else (item, index)) not in removed]
+    else:
+        items = list(base)
+    if added:
+        items.extend(sorted(added))
+    return items
+
+
+def _bfs(adjacency: tuple[tuple[int, ...], ...], start: int, max_hops: int | None) -> dict[int, int]:
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        distance = distances[node]
+        if max_hops is not None and distance >= max_hops:
+            continue
+        for neighbor in adjacency[node]:
+            if neighbor not in distances:
+                distances[neighbor] = distance + 1
+                queue.append(neighbor)
+    return distances
+
+
+def _bidirectional_path(
+    adjacency: tuple[tuple[int, ...], ...],
+    reverse: tuple[tuple[int, ...], ...],
+    start: int,
+    goal: int,
+) -> list[int]:
+    if start == goal:
+        return [start]
+    forward = {start: -1}
+    backward = {goal: -1}
+    forward_frontier = [start]
+    backward_frontier = [goal]
+    while forward_frontier and backward_frontier:
+        # Expand the smaller frontier; the first meeting node gives a shortest path.
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meet = _expand(forward_frontier, adjacency, forward, backward)
+        else:
+            backward_frontier, meet = _expand(backward_frontier, reverse, backward, forward)
+        if meet is not None:
+            path = []
+            node = meet
+            while node != -1:
+                path.append(node)
+                node = forward[node]
+            path.reverse()
+            node = backward[meet]
+            while node != -1:
+                path.append(node)
+                node = backward[node]
+            return path
+    return []
+
+
+def _expand(
+    frontier: list[int],
+    adjacency: tuple[tuple[int, ...], ...],
+    parents: dict[int, int],
+    other: dict[int, int],
+) -> tuple[list[int], int | None]:
+    next_frontier = []
+    for node in frontier:
+        for neighbor in adjacency[node]:
+            if neighbor in parents:
+                continue
+            parents[neighbor] = node
+            if neighbor in other:
+                return next_frontier, neighbor
+            next_frontier.append(neighbor)
+    return next_frontier, None
+
+
+def _brandes(adjacency: tuple[tuple[int, ...], ...], sources: list[int]) -> list[float]:
+    count = len(adjacency)
+    scores = [0.0] * count
+    for source in sources:
+        stack = []
+        predecessors: list[list[int]] = [[] for _ in range(count)]
+        sigma = [0] * count
+        sigma[source] = 1
+        distance = [-1] * count
+        distance[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            stack.append(node)
+            next_distance = distance[node] + 1
+            for neighbor in adjacency[node]:
+                if distance[neighbor] < 0:
+                    distance[neighbor] = next_distance
+                    queue.append(neighbor)
+                if distance[neighbor] == next_distance:
+                    sigma[neighbor] += sigma[node]
+                    predecessors[neighbor].append(node)
+        delta = [0.0] * count
+        while stack:
+            node = stack.pop()
+            for parent in predecessors[node]:
+                delta[parent] += sigma[parent] / sigma[node] * (1.0 + delta[node])
+            if node != source:
+                scores[node] += delta[node]
+    return scores
+
+
+def _weak_components(
+    adjacency: tuple[tuple[int, ...], ...],
+    reverse: tuple[tuple[int, ...], ...],
+) -> tuple[tuple[int, ...], ...]:
+    seen = [False] * len(adjacency)
+    components = []
+    for start in range(len(adjacency)):
+        if seen[start]:
+            continue
+        seen[start] = True
+        component = [start]
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbor in (*adjacency[node], *reverse[node]):
+                if not seen[neighbor]:
+                    seen[neighbor] = True
+                    component.append(neighbor)
+                    stack.append(neighbor)
+        components.append(tuple(sorted(component)))
+    return _sorted_components(components)
+
+
+def _sorted_components(components: list[tuple[int, ...]]) -> tuple[tuple[int, ...], ...]:
+    return tuple(sorted(components, key=lambda item: (-len(item), item[0] if item else 0)))
+
+
+def _top(scores: dict[str, float], top_n: int) -> list[dict[str, Any]]:
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return [{"node_id": node, "score": score} for node, score in ranked[:top_n]]
+
+
+def _node_hash(node_id: str) -> int:
+    return int.from_bytes(sha256(b"node\0" + node_id.encode("utf-8")).digest()[:16], "big")
+
+
+def _edge_hash(src: str, dst: str) -> int:
+    return int.from_bytes(sha256(b"edge\0" + src.encode("utf-8") + b"\0" + dst.encode("utf-8")).digest()[:16], "big")
+
+
+def _rows(value: Any) -> list[dict[str, Any]]:
+    return [item for item in value or [] if isinstance(item, dict)]
+
+
+def _first_str(row: dict[str, Any], *keys: str) -> str:
+    for key in keys:
+        value = row.get(key)
+        if value is not None and str(value).strip():
+            return str(value)
+    return ""
+
+
+def _digest(payload: Any) -> str:
+    material = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return sha256(material.encode("utf-8")).hexdigest()
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 from hashlib import sha256
 from typing import Any, Iterable
 
+from core_engine.topology.graph_analytics import TopologyGraphIndex
 from core_engine.topology.relationship_graphs import (
     RELATIONSHIP_SAFETY_FLAGS,
     build_node_relationship_record,
@@ -22,6 +23,7 @@ class LateralAnalysisError(ValueError):
 def build_lateral_relationship_analysis(
     relationship: dict[str, Any],
     *,
+    graph_index: TopologyGraphIndex | None = None,
     generated_at: str | None = None,
 ) -> dict[str, Any]:
     if not isinstance(relationship, dict):
@@ -30,7 +32,13 @@ def build_lateral_relationship_analysis(
     row = relationship if relationship.get("record_type") == "cross_node_relationship" else build_node_relationship_record(relationship, generated_at=timestamp)
     recurrence = _clamp(row.get("recurring_interaction_score"))
     topology_risk = score_topology_risk(row)
-    spread_potential = score_spread_potential(row, topology_risk=topology_risk, recurrence_score=recurrence)
+    path_metrics = _path_metrics(row, graph_index)
+    spread_potential = score_spread_potential(
+        row,
+        topology_risk=topology_risk,
+        recurrence_score=recurrence,
+        path_metrics=path_metrics,
+    )
     unusual_peer = detect_unusual_peer(row)
     state = classify_lateral_relationship(
         row,
@@ -44,7 +52,7 @@ def build_lateral_relationship_analysis(
         topology_risk=topology_risk,
         spread_potential=spread_potential,
     )
-    return {
+    record = {
         "record_type": "lateral_relationship_analysis",
         "record_version": LATERAL_ANALYSIS_RECORD_VERSION,
         "analysis_id": "lateral-analysis-"
@@ -75,17 +83,21 @@ def build_lateral_relationship_analysis(
         "enforcement_action": "none",
         **RELATIONSHIP_SAFETY_FLAGS,
     }
+    if graph_index is not None:
+        record["path_metrics"] = path_metrics
+    return record
 
 
 def build_lateral_analysis_report(
     relationships: Iterable[dict[str, Any]],
     *,
+    graph_index: TopologyGraphIndex | None = None,
     generated_at: str | None = None,
 ) -> dict[str, Any]:
     timestamp = generated_at or _now()
     try:
         analyses = [
-            build_lateral_relationship_analysis(row, generated_at=timestamp)
+            build_lateral_relationship_analysis(row, graph_index=graph_index, generated_at=timestamp)
             for row in relationships or []
             if isinstance(row, dict)
         ]
@@ -240,8 +252,20 @@ def score_spread_potential(
     *,
     topology_risk: float,
     recurrence_score: float,
+    path_metrics: dict[str, Any] | None = None,
 ) -> float:
-    score = topology_risk * 0.45 + recurrence_score * 0.35
+    """Blend per-edge heuristics with path reach when graph metrics are available.
+
+    ``path_metrics`` is a ``TopologyGraphIndex.spread_metrics`` record for the
+    relationship target: how much of the graph is reachable from there and
+    how often it sits on shortest paths.
+    """
+    if path_metrics:
+        score = topology_risk * 0.3 + recurrence_score * 0.25
+        score += _clamp(path_metrics.get("reachable_fraction")) * 0.2
+        score += _clamp(path_metrics.get("betweenness_centrality")) * 0.1
+    else:
+        score = topology_risk * 0.45 + recurrence_score * 0.35
     if relationship.get("shared_service_state") == "shared":
         score += 0.15
     if relationship.get("relationship_state") == "recurring":
@@ -286,6 +310,15 @@ def _operator_summary(
     return f"Relationship state is unknown with topology risk {topology_risk} and spread potential {spread_potential}."
 
 
+def _path_metrics(relationship: dict[str, Any], graph_index: TopologyGraphIndex | None) -> dict[str, Any] | None:
+    if graph_index is None:
+        return None
+    target = str(relationship.get("target_node_reference") or "")
+    if not target or target not in graph_index:
+        return None
+    return graph_index.spread_metrics(target)
+
+
 def _count_state(rows: list[dict[str, Any]], state: str) -> int:
     return sum(1 for row in rows if row.get("lateral_relationship_state") == state)
 
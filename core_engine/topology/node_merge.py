@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime
+from functools import partial
 from hashlib import sha256
 from typing import Any, Iterable
 
 from core_engine.aggregation.conflict_resolution import build_conflict_record
+from core_engine.aggregation.streaming import merge_grouped_rows
 
 
 SAFETY_FLAGS = {
@@ -18,55 +20,19 @@ SAFETY_FLAGS = {
 
 
 def merge_federated_assets(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    return _merge_rows(
-        rows,
-        key_fn=lambda row: _first(row, "asset_id", "host", "target", "label") or "asset-unknown",
-        record_type="asset",
-        duplicate_conflict_type="duplicate_asset",
-        conflict_fields={"label": "asset_label_drift"},
-        prefer_fields=("asset_id", "label", "category", "role"),
-    )
+    return merge_grouped_rows([rows], *FEDERATED_MERGE_SECTIONS["assets"])
 
 
 def merge_federated_services(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    return _merge_rows(
-        rows,
-        key_fn=lambda row: "|".join([_first(row, "asset_id", "target", "host") or "asset-unknown", str(row.get("port") or "0")]),
-        record_type="service",
-        duplicate_conflict_type="duplicate_service",
-        conflict_fields={"service": "service_name_drift", "service_name": "service_name_drift"},
-        prefer_fields=("service_id", "asset_id", "target", "port", "service", "service_name"),
-        sum_fields=("observation_count",),
-    )
+    return merge_grouped_rows([rows], *FEDERATED_MERGE_SECTIONS["services"])
 
 
 def merge_federated_topology_edges(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    return _merge_rows(
-        rows,
-        key_fn=lambda row: "|".join(
-            [
-                _first(row, "source_asset", "src", "source", "from") or "source-unknown",
-                _first(row, "target_asset", "dst", "target", "to") or "target-unknown",
-                _first(row, "relationship_type", "type") or "relationship",
-            ]
-        ),
-        record_type="topology_edge",
-        duplicate_conflict_type="duplicate_topology_edge",
-        conflict_fields={"protocol_service_label": "edge_disagreement", "service_label": "edge_disagreement", "protocol": "edge_disagreement"},
-        prefer_fields=("edge_id", "source_asset", "target_asset", "relationship_type", "protocol_service_label", "service_label", "protocol"),
-        sum_fields=("observation_count", "flow_count"),
-    )
+    return merge_grouped_rows([rows], *FEDERATED_MERGE_SECTIONS["topology_edges"])
 
 
 def merge_federated_findings(rows: Iterable[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    return _merge_rows(
-        rows,
-        key_fn=lambda row: _first(row, "finding_id", "source_ref", "title", "summary") or "finding-unknown",
-        record_type="finding",
-        duplicate_conflict_type="duplicate_finding",
-        conflict_fields={"severity": "finding_severity_drift"},
-        prefer_fields=("finding_id", "finding_type", "severity", "title", "summary"),
-    )
+    return merge_grouped_rows([rows], *FEDERATED_MERGE_SECTIONS["findings"])
 
 
 def build_federated_conflict(
@@ -93,54 +59,45 @@ def build_federated_conflict(
     return record
 
 
-def _merge_rows(
-    rows: Iterable[dict[str, Any]],
+def _merge_group(
+    key: str,
+    group: list[dict[str, Any]],
     *,
-    key_fn,
     record_type: str,
     duplicate_conflict_type: str,
     conflict_fields: dict[str, str],
     prefer_fields: tuple[str, ...],
     sum_fields: tuple[str, ...] = (),
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    grouped: dict[str, list[dict[str, Any]]] = {}
-    for row in rows:
-        key = key_fn(row)
-        grouped.setdefault(key, []).append(dict(row))
-
-    merged: list[dict[str, Any]] = []
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    item = _base_record(record_type, key, group, prefer_fields=prefer_fields, sum_fields=sum_fields)
     conflicts: list[dict[str, Any]] = []
-    for key in sorted(grouped):
-        group = grouped[key]
-        item = _base_record(record_type, key, group, prefer_fields=prefer_fields, sum_fields=sum_fields)
-        if len(group) > 1:
+    if len(group) > 1:
+        conflicts.append(
+            build_federated_conflict(
+                conflict_type=duplicate_conflict_type,
+                affected_ref=f"{record_type}:{key}",
+                source_node_ids=item["source_node_ids"],
+                source_refs=item["source_refs"],
+                summary=f"{record_type} {key} was reported by multiple trusted node snapshots.",
+                severity="low",
+                recommended_review=True,
+            )
+        )
+    for field, conflict_type in conflict_fields.items():
+        values = sorted({str(row.get(field)) for row in group if row.get(field) not in (None, "")})
+        if len(values) > 1:
             conflicts.append(
                 build_federated_conflict(
-                    conflict_type=duplicate_conflict_type,
+                    conflict_type=conflict_type,
                     affected_ref=f"{record_type}:{key}",
                     source_node_ids=item["source_node_ids"],
                     source_refs=item["source_refs"],
-                    summary=f"{record_type} {key} was reported by multiple trusted node snapshots.",
-                    severity="low",
+                    summary=f"{record_type} {key} has conflicting {field} values: {', '.join(values)}.",
+                    severity="medium",
                     recommended_review=True,
                 )
             )
-        for field, conflict_type in conflict_fields.items():
-            values = sorted({str(row.get(field)) for row in group if row.get(field) not in (None, "")})
-            if len(values) > 1:
-                conflicts.append(
-                    build_federated_conflict(
-                        conflict_type=conflict_type,
-                        affected_ref=f"{record_type}:{key}",
-                        source_node_ids=item["source_node_ids"],
-                        source_refs=item["source_refs"],
-                        summary=f"{record_type} {key} has conflicting {field} values: {', '.join(values)}.",
-                        severity="medium",
-                        recommended_review=True,
-                    )
-                )
-        merged.append(item)
-    return merged, _dedupe_conflicts(conflicts)
+    return item, conflicts
 
 
 def _base_record(
@@ -259,10 +216,6 @@ def _combined_confidence(values: list[float]) -> float:
     return round(min(1.0, average + source_bonus), 3)
 
 
-def _dedupe_conflicts(conflicts: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    return sorted({conflict["conflict_id"]: conflict for conflict in conflicts}.values(), key=lambda item: item["conflict_id"])
-
-
 def _stable_id(prefix: str, *parts: Any) -> str:
     material = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
     return f"{prefix}-" + sha256(material.encode("utf-8")).hexdigest()[:16]
@@ -270,3 +223,55 @@ def _stable_id(prefix: str, *parts: Any) -> str:
 
 def _now() -> str:
     return datetime.now(UTC).isoformat()
+
+
+FEDERATED_MERGE_SECTIONS = {
+    "assets": (
+        lambda row: _first(row, "asset_id", "host", "target", "label") or "asset-unknown",
+        partial(
+            _merge_group,
+            record_type="asset",
+            duplicate_conflict_type="duplicate_asset",
+            conflict_fields={"label": "asset_label_drift"},
+            prefer_fields=("asset_id", "label", "category", "role"),
+        ),
+    ),
+    "services": (
+        lambda row: "|".join([_first(row, "asset_id", "target", "host") or "asset-unknown", str(row.get("port") or "0")]),
+        partial(
+            _merge_group,
+            record_type="service",
+            duplicate_conflict_type="duplicate_service",
+            conflict_fields={"service": "service_name_drift", "service_name": "service_name_drift"},
+            prefer_fields=("service_id", "asset_id", "target", "port", "service", "service_name"),
+            sum_fields=("observation_count",),
+        ),
+    ),
+    "topology_edges": (
+        lambda row: "|".join(
+            [
+                _first(row, "source_asset", "src", "source", "from") or "source-unknown",
+                _first(row, "target_asset", "dst", "target", "to") or "target-unknown",
+                _first(row, "relationship_type", "type") or "relationship",
+            ]
+        ),
+        partial(
+            _merge_group,
+            record_type="topology_edge",
+            duplicate_conflict_type="duplicate_topology_edge",
+            conflict_fields={"protocol_service_label": "edge_disagreement", "service_label": "edge_disagreement", "protocol": "edge_disagreement"},
+            prefer_fields=("edge_id", "source_asset", "target_asset", "relationship_type", "protocol_service_label", "service_label", "protocol"),
+            sum_fields=("observation_count", "flow_count"),
+        ),
+    ),
+    "findings": (
+        lambda row: _first(row, "finding_id", "source_ref", "title", "summary") or "finding-unknown",
+        partial(
+            _merge_group,
+            record_type="finding",
+            duplicate_conflict_type="duplicate_finding",
+            conflict_fields={"severity": "finding_severity_drift"},
+            prefer_fields=("finding_id", "finding_type", "severity", "title", "summary"),
+        ),
+    ),
+}
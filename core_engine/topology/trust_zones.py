@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 from hashlib import sha256
 from typing import Any, Iterable
 
+from core_engine.topology.graph_analytics import TopologyGraphIndex
 from core_engine.topology.relationship_graphs import (
     RELATIONSHIP_SAFETY_FLAGS,
     build_node_relationship_record,
@@ -24,6 +25,7 @@ def build_trust_zone_record(
     relationships: Iterable[dict[str, Any]] | None = None,
     *,
     zone_class: str | None = None,
+    graph_index: TopologyGraphIndex | None = None,
     generated_at: str | None = None,
 ) -> dict[str, Any]:
     timestamp = generated_at or _now()
@@ -51,12 +53,15 @@ def build_trust_zone_record(
         "advisory_notes": _zone_advisory_notes(normalized_zone, relationship_count=len(rows)),
         **RELATIONSHIP_SAFETY_FLAGS,
     }
+    if graph_index is not None:
+        record["path_metrics"] = score_trust_zone_reach(rows, graph_index)
     return record
 
 
 def infer_trust_zones(
     relationships: Iterable[dict[str, Any]],
     *,
+    graph_index: TopologyGraphIndex | None = None,
     generated_at: str | None = None,
 ) -> list[dict[str, Any]]:
     timestamp = generated_at or _now()
@@ -69,7 +74,7 @@ def infer_trust_zones(
         grouped["unknown"] = []
     return sorted(
         [
-            build_trust_zone_record(zone_rows, zone_class=zone, generated_at=timestamp)
+            build_trust_zone_record(zone_rows, zone_class=zone, graph_index=graph_index, generated_at=timestamp)
             for zone, zone_rows in grouped.items()
         ],
         key=lambda item: (str(item.get("zone_class") or ""), str(item.get("trust_zone_id") or "")),
@@ -103,10 +108,11 @@ def build_trust_zone_summary(
 def build_trust_zone_report(
     relationships: Iterable[dict[str, Any]],
     *,
+    graph_index: TopologyGraphIndex | None = None,
     generated_at: str | None = None,
 ) -> dict[str, Any]:
     timestamp = generated_at or _now()
-    zones = infer_trust_zones(relationships, generated_at=timestamp)
+    zones = infer_trust_zones(relationships, graph_index=graph_index, generated_at=timestamp)
     summary = build_trust_zone_summary(zones, generated_at=timestamp)
     return {
         "record_type": "trust_zone_report",
@@ -208,6 +214,33 @@ def score_trust_zone_confidence(
     return round(min(1.0, average_relationship_confidence * 0.45 + average_relationship_strength * 0.25 + coverage + known_zone_bonus), 3)
 
 
+def score_trust_zone_reach(
+    relationships: Iterable[dict[str, Any]],
+    graph_index: TopologyGraphIndex,
+) -> dict[str, Any]:
+    """Measure how far paths from a zone's member nodes reach outside the zone."""
+    members = set()
+    for row in relationships or []:
+        if not isinstance(row, dict):
+            continue
+        for key in ("source_node_reference", "target_node_reference"):
+            reference = str(row.get(key) or "")
+            if reference and reference in graph_index:
+                members.add(reference)
+    reached: set[str] = set()
+    for member in sorted(members):
+        reached.update(graph_index.reachable(member))
+    outside = reached - members
+    candidates = graph_index.node_count - len(members)
+    return {
+        "graph_digest": graph_index.digest,
+        "member_node_count": len(members),
+        "reachable_node_count": len(reached | members),
+        "outside_reach_count": len(outside),
+        "outside_reach_fraction": round(len(outside) / candidates, 3) if candidates > 0 else 0.0,
+    }
+
+
 def normalize_trust_zone_class(value: Any) -> str:
     text = str(value or "unknown").strip().lower().replace("-", "_")
     return text if text in TRUST_ZONE_CLASSES else "unknown"
@@ -4,6 +4,8 @@ import json
 from hashlib import sha256
 from typing import Any, Iterable
 
+from core_engine.snapshot_diff import KeyedSnapshot, SnapshotIndexCache, SnapshotKeySpec, diff_keyed_snapshots
+
 
 SNAPSHOT_SCHEMA_VERSION = 1
 
@@ -69,21 +71,22 @@ def compare_visibility_snapshots(
     current: dict[str, Any],
     *,
     require_approval: bool = True,
+    index_cache: SnapshotIndexCache | None = None,
 ) -> dict[str, Any]:
-    """Compare two snapshots and return safe operator-review deltas."""
-    baseline_assets = {str(item.get("asset_id")): item for item in _rows(baseline.get("assets")) if item.get("asset_id")}
-    current_assets = {str(item.get("asset_id")): item for item in _rows(current.get("assets")) if item.get("asset_id")}
-    baseline_services = {_service_key(item): item for item in _rows(baseline.get("services"))}
-    current_services = {_service_key(item): item for item in _rows(current.get("services"))}
-    baseline_edges = {_edge_key(item): item for item in _rows((baseline.get("topology") or {}).get("edges"))}
-    current_edges = {_edge_key(item): item for item in _rows((current.get("topology") or {}).get("edges"))}
+    """Compare two snapshots and return safe operator-review deltas.
+
+    Pass the same ``index_cache`` across calls to index each snapshot once.
+    """
+    baseline_assets, current_assets, asset_delta = _section_delta(baseline, current, _ASSET_SPEC, _snapshot_assets, index_cache)
+    baseline_services, current_services, service_delta = _section_delta(baseline, current, _SERVICE_SPEC, _snapshot_services, index_cache)
+    baseline_edges, current_edges, edge_delta = _section_delta(baseline, current, _EDGE_SPEC, _snapshot_edges, index_cache)
 
     deltas: list[dict[str, Any]] = []
-    for asset_id in sorted(set(current_assets) - set(baseline_assets)):
+    for asset_id in asset_delta.added:
         deltas.append(_delta("asset_added", "medium", current_assets[asset_id].get("host", "unknown"), {"asset_id": asset_id}))
-    for asset_id in sorted(set(baseline_assets) - set(current_assets)):
+    for asset_id in asset_delta.removed:
         deltas.append(_delta("asset_missing", "medium", baseline_assets[asset_id].get("host", "unknown"), {"asset_id": asset_id}))
-    for asset_id in sorted(set(baseline_assets) & set(current_assets)):
+    for asset_id in asset_delta.common():
         before = baseline_assets[asset_id]
         after = current_assets[asset_id]
         if before.get("status") != after.get("status"):
@@ -94,13 +97,13 @@ def compare_visibility_snapshots(
                 {"asset_id": asset_id, "before": before.get("status"), "after": after.get("status")},
             ))
 
-    for key in sorted(set(current_services) - set(baseline_services)):
+    for key in service_delta.added:
         service = current_services[key]
         deltas.append(_delta("service_added", _service_delta_severity(service), service.get("target", "unknown"), _service_evidence(service)))
-    for key in sorted(set(baseline_services) - set(current_services)):
+    for key in service_delta.removed:
         service = baseline_services[key]
         deltas.append(_delta("service_removed", "low", service.get("target", "unknown"), _service_evidence(service)))
-    for key in sorted(set(baseline_services) & set(current_services)):
+    for key in service_delta.common():
         before = baseline_services[key]
         after = current_services[key]
         if _service_signature(before) != _service_signature(after):
@@ -111,10 +114,10 @@ def compare_visibility_snapshots(
                 {"before": _service_signature(before), "after": _service_signature(after), **_service_evidence(after)},
             ))
 
-    for key in sorted(set(current_edges) - set(baseline_edges)):
+    for key in edge_delta.added:
         edge = current_edges[key]
         deltas.append(_delta("topology_relationship_added", "medium", key, _edge_evidence(edge)))
-    for key in sorted(set(baseline_edges) - set(current_edges)):
+    for key in edge_delta.removed:
         edge = baseline_edges[key]
         deltas.append(_delta("topology_relationship_removed", "low", key, _edge_evidence(edge)))
 
@@ -139,6 +142,34 @@ def _rows(value: Any) -> list[dict[str, Any]]:
     return [item for item in value or [] if isinstance(item, dict)]
 
 
+def _section_delta(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    spec: SnapshotKeySpec,
+    reader,
+    cache: SnapshotIndexCache | None,
+) -> tuple[KeyedSnapshot, KeyedSnapshot, Any]:
+    if cache is None:
+        before = KeyedSnapshot(reader(baseline), spec=spec)
+        after = KeyedSnapshot(reader(current), spec=spec)
+    else:
+        before = cache.index(baseline, lambda: reader(baseline), spec)
+        after = cache.index(current, lambda: reader(current), spec)
+    return before, after, diff_keyed_snapshots(before, after)
+
+
+def _snapshot_assets(snapshot: dict[str, Any]) -> list[dict[str, Any]]:
+    return _rows(snapshot.get("assets"))
+
+
+def _snapshot_services(snapshot: dict[str, Any]) -> list[dict[str, Any]]:
+    return _rows(snapshot.get("services"))
+
+
+def _snapshot_edges(snapshot: dict[str, Any]) -> list[dict[str, Any]]:
+    return _rows((snapshot.get("topology") or {}).get("edges"))
+
+
 def _flow_rows(value: Iterable[dict[str, Any]] | dict[str, Any] | None) -> list[dict[str, Any]]:
     if isinstance(value, dict):
         return _rows(value.get("flows"))
@@ -381,4 +412,13 @@ def _delta_summary(deltas: list[dict[str, Any]], workflows: list[dict[str, Any]]
     }
 
 
+_ASSET_SPEC = SnapshotKeySpec(
+    "visibility.assets",
+    lambda row: str(row.get("asset_id")) if row.get("asset_id") else "",
+    content=lambda row: row.get("status"),
+)
+_SERVICE_SPEC = SnapshotKeySpec("visibility.services", _service_key, content=lambda row: tuple(_service_signature(row).values()))
+_EDGE_SPEC = SnapshotKeySpec("visibility.edges", _edge_key)
+
+
 __all__ = ["SNAPSHOT_SCHEMA_VERSION", "build_visibility_snapshot", "compare_visibility_snapshots"]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 import json
 import re
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Sequence
 from urllib import parse, request
 
 from core_engine.vuln.cvss import advisory_risk_score, extract_cvss, normalize_severity, severity_rank
@@ -12,6 +15,11 @@ from core_engine.vuln.cvss import advisory_risk_score, extract_cvss, normalize_s
 NVD_API_URL = "https://services.nvd.nist.gov/rest/json/cves/2.0"
 DEFAULT_FETCH_LIMIT = 50
 MAX_FETCH_LIMIT = 2000
+DEFAULT_MATCH_CHUNK_SIZE = 32
+# Confidence every CVE with an id gets before any token matches.
+BASELINE_CONFIDENCE = 0.05
+# Everything str.splitlines() breaks on, so one record is always one search line.
+_LINE_BREAKS = dict.fromkeys(map(ord, "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"), " ")
 
 UrlOpen = Callable[..., Any]
 
@@ -119,20 +127,43 @@ def normalize_cve_record(raw: dict[str, Any]) -> dict[str, Any]:
 
 def analyze_service_cves(
     services: Iterable[dict[str, Any]],
-    cves: Iterable[dict[str, Any]],
+    cves: Iterable[dict[str, Any]] | CVEIndex,
     *,
     min_confidence: float = 0.25,
+    max_workers: int | None = 0,
+    chunk_size: int = DEFAULT_MATCH_CHUNK_SIZE,
 ) -> dict[str, Any]:
+    """Match every service against the CVE set in one batch.
+
+    ``cves`` may be a prebuilt ``CVEIndex`` (see ``cve_store.load_cve_index``);
+    otherwise one is built for this call. Services sharing a name and
+    version are scored once, and only CVEs whose search text contains one
+    of their tokens are scored at all. With ``max_workers`` above 1, chunks
+    of ``chunk_size`` distinct services are scored in a process pool.
+    Results match scoring every service against every CVE.
+    """
     service_rows = [service for service in services if isinstance(service, dict)]
-    cve_rows = [normalize_cve_record(cve) for cve in cves if isinstance(cve, dict)]
+    index = cves if isinstance(cves, CVEIndex) else CVEIndex(cves)
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+    keys = list(dict.fromkeys(_service_match_key(service) for service in service_rows))
+    if not max_workers or max_workers <= 1 or len(keys) <= chunk_size:
+        scored = dict(zip(keys, (index.score(name, version, min_confidence=min_confidence) for name, version in keys)))
+    else:
+        chunks = [keys[offset : offset + chunk_size] for offset in range(0, len(keys), chunk_size)]
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_match_worker, initargs=(index,)) as executor:
+            scored = {}
+            for chunk, results in zip(chunks, executor.map(_score_match_chunk, [(chunk, min_confidence) for chunk in chunks])):
+                scored.update(zip(chunk, results))
     matches: list[dict[str, Any]] = []
     for service in service_rows:
-        matches.extend(match_service_to_cves(service, cve_rows, min_confidence=min_confidence))
+        key = _service_match_key(service)
+        matches.extend(_match_row(service, index.normalized(position), score, reasons, version_match) for position, score, reasons, version_match in scored[key])
     matches.sort(key=lambda item: (-item["risk_score"], -severity_rank(item["severity"]), item["cve_id"]))
     return {
         "ok": True,
         "service_count": len(service_rows),
-        "cve_count": len(cve_rows),
+        "cve_count": len(index),
         "match_count": len(matches),
         "matches": matches,
         "raw_payload_stored": False,
@@ -143,59 +174,177 @@ def analyze_service_cves(
 
 def match_service_to_cves(
     service: dict[str, Any],
-    cves: Iterable[dict[str, Any]],
+    cves: Iterable[dict[str, Any]] | CVEIndex,
     *,
     min_confidence: float = 0.25,
 ) -> list[dict[str, Any]]:
-    service_name = str(service.get("service") or service.get("service_name") or service.get("name") or "").strip()
-    version = str(service.get("version") or "").strip()
-    target = str(service.get("target") or service.get("host") or service.get("remote") or "-")
-    port = service.get("port")
-    exposed = str(service.get("state") or service.get("status") or "").lower() in {"open", "listening"}
+    if isinstance(cves, CVEIndex):
+        name, version = _service_match_key(service)
+        return [
+            _match_row(service, cves.normalized(position), score, reasons, version_match)
+            for position, score, reasons, version_match in cves.score(name, version, min_confidence=min_confidence)
+        ]
+    service_name, version = _service_match_key(service)
     results: list[dict[str, Any]] = []
     for raw_cve in cves:
         cve = normalize_cve_record(raw_cve)
         score, reasons, version_match = _match_confidence(service_name, version, cve)
         if score < min_confidence:
             continue
-        risk_score = advisory_risk_score(
-            cve.get("cvss_score"),
-            exposed=exposed,
-            known_exploited=bool(cve.get("known_exploited")),
-            version_match=version_match,
-        )
-        results.append({
-            "target": target,
-            "port": port,
-            "service": service_name or "unknown",
-            "version": version,
-            "cve_id": cve["id"],
-            "severity": cve["severity"],
-            "cvss_score": cve["cvss_score"],
-            "risk_score": risk_score,
-            "confidence": round(score, 2),
-            "match_reasons": reasons,
-            "known_exploited": bool(cve.get("known_exploited")),
-            "ransomware_association": bool(cve.get("ransomware_association")),
-            "ransomware_families": list(cve.get("ransomware_families") or []),
-            "tags": list(cve.get("tags") or []),
-            "summary": cve.get("summary") or "",
-            "references": cve.get("references") or [],
-            "advisory": _advisory_text(cve, service_name, version),
-        })
+        results.append(_match_row(service, cve, score, reasons, version_match))
     return results
 
 
+class CVEIndex:
+    """Search index over CVE records for batched service correlation.
+
+    Matching treats service and version tokens as substrings of each CVE's
+    summary, descriptions and CPEs, so the index keeps that lowercased
+    search text for all records in one string with record offsets. Finding
+    the CVEs that mention a token is then one scan of that string, cached
+    per token, instead of a comparison per CVE. Candidates are normalized
+    lazily, twice, exactly as the per-service path has always seen them
+    (once on load, once per match). ``search_text`` can be persisted and
+    passed back in so a saved cache does not have to be renormalized; a
+    lazy ``Sequence`` of records (such as ``CVEShardStore.records()``) is
+    then used as is, so only matched records are ever read.
+    """
+
+    def __init__(self, records: Iterable[dict[str, Any]] | Sequence[dict[str, Any]], *, search_text: str | None = None) -> None:
+        if isinstance(records, Sequence) and not isinstance(records, (list, tuple)):
+            self.records = records
+        else:
+            self.records = [record for record in records if isinstance(record, dict)]
+        self._normalized: dict[int, tuple[dict[str, Any], str]] = {}
+        self._token_cache: dict[str, frozenset[int]] = {}
+        if search_text is None:
+            search_text = "\n".join(_search_line(self._entry(position)[1]) for position in range(len(self.records)))
+        self.search_text = search_text
+        starts = array("Q", [0])
+        position = search_text.find("\n")
+        while position >= 0:
+            starts.append(position + 1)
+            position = search_text.find("\n", position + 1)
+        if self.records and len(starts) != len(self.records):
+            raise ValueError("CVE index search text does not match the record count")
+        self._starts = starts
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def record_ids(self) -> list[str]:
+        return [str(record.get("id") or record.get("cve_id") or "").upper() for record in self.records]
+
+    def normalized(self, position: int) -> dict[str, Any]:
+        return self._entry(position)[0]
+
+    def positions_containing(self, token: str) -> frozenset[int]:
+        """Positions of records whose search text contains ``token``."""
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+        positions = []
+        text = self.search_text
+        offset = text.find(token)
+        while offset >= 0:
+            position = bisect_right(self._starts, offset) - 1
+            positions.append(position)
+            following = self._starts[position + 1] if position + 1 < len(self._starts) else len(text)
+            offset = text.find(token, following)
+        result = frozenset(positions)
+        self._token_cache[token] = result
+        return result
+
+    def candidates(self, service_tokens: set[str], version_tokens: set[str], *, min_confidence: float) -> list[int]:
+        if min_confidence <= BASELINE_CONFIDENCE:
+            return list(range(len(self.records)))
+        found: set[int] = set()
+        for token in (*service_tokens, *version_tokens):
+            found.update(self.positions_containing(token))
+        return sorted(found)
+
+    def score(self, service_name: str, version: str, *, min_confidence: float) -> list[tuple[int, float, list[str], bool]]:
+        """``(position, confidence, reasons, version_match)`` for CVEs at or above ``min_confidence``."""
+        service_tokens = _service_tokens(service_name)
+        version_tokens = _version_tokens(version)
+        results = []
+        for position in self.candidates(service_tokens, version_tokens, min_confidence=min_confidence):
+            cve, haystack = self._entry(position)
+            score, reasons, version_match = _token_confidence(service_tokens, version_tokens, cve, haystack)
+            if score >= min_confidence:
+                results.append((position, score, reasons, version_match))
+        return results
+
+    def _entry(self, position: int) -> tuple[dict[str, Any], str]:
+        entry = self._normalized.get(position)
+        if entry is None:
+            cve = normalize_cve_record(normalize_cve_record(self.records[position]))
+            entry = (cve, _haystack(cve))
+            self._normalized[position] = entry
+        return entry
+
+
+_MATCH_WORKER_INDEX: CVEIndex | None = None
+
+
+def _init_match_worker(index: CVEIndex) -> None:
+    global _MATCH_WORKER_INDEX
+    _MATCH_WORKER_INDEX = index
+
+
+def _score_match_chunk(task: tuple[list[tuple[str, str]], float]) -> list[list[tuple[int, float, list[str], bool]]]:
+    keys, min_confidence = task
+    assert _MATCH_WORKER_INDEX is not None
+    return [_MATCH_WORKER_INDEX.score(name, version, min_confidence=min_confidence) for name, version in keys]
+
+
+def _service_match_key(service: dict[str, Any]) -> tuple[str, str]:
+    service_name = str(service.get("service") or service.get("service_name") or service.get("name") or "").strip()
+    return service_name, str(service.get("version") or "").strip()
+
+
+def _match_row(service: dict[str, Any], cve: dict[str, Any], score: float, reasons: list[str], version_match: bool) -> dict[str, Any]:
+    service_name, version = _service_match_key(service)
+    target = str(service.get("target") or service.get("host") or service.get("remote") or "-")
+    exposed = str(service.get("state") or service.get("status") or "").lower() in {"open", "listening"}
+    risk_score = advisory_risk_score(
+        cve.get("cvss_score"),
+        exposed=exposed,
+        known_exploited=bool(cve.get("known_exploited")),
+        version_match=version_match,
+    )
+    return {
+        "target": target,
+        "port": service.get("port"),
+        "service": service_name or "unknown",
+        "version": version,
+        "cve_id": cve["id"],
+        "severity": cve["severity"],
+        "cvss_score": cve["cvss_score"],
+        "risk_score": risk_score,
+        "confidence": round(score, 2),
+        "match_reasons": list(reasons),
+        "known_exploited": bool(cve.get("known_exploited")),
+        "ransomware_association": bool(cve.get("ransomware_association")),
+        "ransomware_families": list(cve.get("ransomware_families") or []),
+        "tags": list(cve.get("tags") or []),
+        "summary": cve.get("summary") or "",
+        "references": cve.get("references") or [],
+        "advisory": _advisory_text(cve, service_name, version),
+    }
+
+
 def _match_confidence(service_name: str, version: str, cve: dict[str, Any]) -> tuple[float, list[str], bool]:
-    service_tokens = _service_tokens(service_name)
-    version_tokens = _version_tokens(version)
-    haystack = " ".join(
-        [
-            cve.get("summary") or "",
-            " ".join(cve.get("descriptions") or []),
-            " ".join(cve.get("cpes") or []),
-        ]
-    ).lower()
+    return _token_confidence(_service_tokens(service_name), _version_tokens(version), cve, _haystack(cve))
+
+
+def _token_confidence(
+    service_tokens: set[str],
+    version_tokens: set[str],
+    cve: dict[str, Any],
+    haystack: str,
+) -> tuple[float, list[str], bool]:
     score = 0.0
     reasons: list[str] = []
     if service_tokens and any(token in haystack for token in service_tokens):
@@ -210,10 +359,29 @@ def _match_confidence(service_name: str, version: str, cve: dict[str, Any]) -> t
         score += 0.25
         reasons.append("version")
     if cve.get("id"):
-        score += 0.05
+        score += BASELINE_CONFIDENCE
     return min(score, 1.0), reasons or ["weak_keyword"], version_match
 
 
+def cve_search_line(record: dict[str, Any]) -> str:
+    """One ``CVEIndex`` search text line for a raw cache record."""
+    return _search_line(_haystack(normalize_cve_record(normalize_cve_record(record))))
+
+
+def _search_line(haystack: str) -> str:
+    return haystack.translate(_LINE_BREAKS)
+
+
+def _haystack(cve: dict[str, Any]) -> str:
+    return " ".join(
+        [
+            cve.get("summary") or "",
+            " ".join(cve.get("descriptions") or []),
+            " ".join(cve.get("cpes") or []),
+        ]
+    ).lower()
+
+
 def _service_tokens(service_name: str) -> set[str]:
     aliases = {
         "http": {"http", "apache", "nginx", "iis", "httpd"},
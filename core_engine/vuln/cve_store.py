@@ -1,22 +1,68 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Sequence
 from datetime import UTC, datetime
+import gzip
+import hashlib
 import json
+import mmap
+import os
 from pathlib import Path
 from typing import Any, Iterable
+import zlib
 
 from core_engine.config_loader import DATA_DIR, ensure_runtime_dirs
+from core_engine.vuln.cve_client import CVEIndex, cve_search_line
 
 
 DEFAULT_CVE_CACHE = DATA_DIR / "cve_cache.json"
+CVE_INDEX_FORMAT = "portmap-cve-index"
+CVE_INDEX_VERSION = 2
+CVE_STORE_FORMAT = "portmap-cve-store"
+CVE_STORE_VERSION = 2
+_READABLE_STORE_VERSIONS = frozenset({1, CVE_STORE_VERSION})
+DEFAULT_SHARD_COUNT = 64
+MAX_SHARD_COUNT = 1000
+
+
+class CVEStoreError(ValueError):
+    pass
 
 
 def default_cve_cache_path() -> Path:
     return DEFAULT_CVE_CACHE
 
 
+def cve_index_path(cache_path: str | Path | None = None) -> Path:
+    path = Path(cache_path).expanduser() if cache_path else DEFAULT_CVE_CACHE
+    return path.with_name(path.name + ".index.gz")
+
+
+def is_cve_store(path: str | Path | None) -> bool:
+    """Whether ``path`` names a sharded store rather than a JSON cache file.
+
+    Existing directories are stores; so are new paths without a suffix.
+    """
+    if not path:
+        return False
+    store_path = Path(path).expanduser()
+    return store_path.is_dir() or (not store_path.exists() and not store_path.suffix)
+
+
 def load_cve_cache(path: str | Path | None = None) -> dict[str, Any]:
     cache_path = Path(path).expanduser() if path else DEFAULT_CVE_CACHE
+    if cache_path.is_dir():
+        with CVEShardStore(cache_path) as store:
+            records = list(store.records())
+            return {
+                "ok": True,
+                "cache_path": str(cache_path),
+                "updated_at": store.updated_at,
+                "metadata": store.metadata,
+                "records": records,
+                "record_count": len(records),
+            }
     if not cache_path.exists():
         return {
             "ok": True,
@@ -58,14 +104,310 @@ def save_cve_cache(
     with open(cache_path, "w", encoding="utf-8") as handle:
         json.dump(payload, handle, indent=2, sort_keys=True)
         handle.write("\n")
+    index_path = _save_cve_index(CVEIndex(merged), cache_path=cache_path, updated_at=payload["updated_at"])
     return {
         "ok": True,
         "cache_path": str(cache_path),
+        "index_path": str(index_path),
         "record_count": len(merged),
         "updated_at": payload["updated_at"],
     }
 
 
+def load_cve_index(path: str | Path | None = None) -> dict[str, Any]:
+    """Load the CVE cache together with the search index saved beside it.
+
+    The saved index is used only when it was written for this exact cache
+    (same ``updated_at`` and record ids); otherwise it is rebuilt in memory,
+    which gives the same matches, just without the head start.
+
+    For a sharded store the index is assembled from the per-shard search
+    text and ``records`` is a lazy view, so only matched CVEs are parsed.
+    The store stays mapped for as long as the index is in use.
+    """
+    cache_path = Path(path).expanduser() if path else DEFAULT_CVE_CACHE
+    if cache_path.is_dir():
+        store = CVEShardStore(cache_path)
+        records = store.records()
+        return {
+            "ok": True,
+            "cache_path": str(cache_path),
+            "updated_at": store.updated_at,
+            "metadata": store.metadata,
+            "records": records,
+            "record_count": len(records),
+            "index_path": str(cache_path),
+            "index_loaded": True,
+            "index": CVEIndex(records, search_text=store.search_text()),
+        }
+    cache = load_cve_cache(path)
+    records = cache["records"]
+    index_path = cve_index_path(cache["cache_path"])
+    search_text = _read_cve_index(index_path, updated_at=cache.get("updated_at"), records=records)
+    index = CVEIndex(records, search_text=search_text) if search_text is not None else CVEIndex(records)
+    return {
+        **cache,
+        "index_path": str(index_path),
+        "index_loaded": search_text is not None,
+        "index": index,
+    }
+
+
+class CVEShardStore:
+    """CVE cache split into hash-addressed shards that are read lazily.
+
+    Every shard ``NNN`` has three files per generation ``G``:
+    ``NNN.G.jsonl`` with one compact record per line sorted by id,
+    ``NNN.G.idx`` with an ``id offset length`` row per record, and
+    ``NNN.G.search`` with each record's ``CVEIndex`` search line in the same
+    order. ``manifest.json`` records each shard's current generation, counts
+    and the cache metadata. Opening a store reads only the manifest; records
+    are decoded from an mmap of their shard when asked for. ``merge``
+    follows ``merge_cve_records`` semantics but rewrites only the shards
+    whose records actually change, each into a new generation; replacing
+    the manifest switches to them at once, so a crash mid-merge leaves the
+    previous generation intact.
+    """
+
+    def __init__(self, directory: str | Path, *, shard_count: int = DEFAULT_SHARD_COUNT) -> None:
+        self.directory = Path(directory).expanduser()
+        manifest_path = self.directory / "manifest.json"
+        if manifest_path.exists():
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as exc:
+                raise CVEStoreError(f"invalid CVE store manifest: {exc.msg}") from exc
+            if not isinstance(manifest, dict) or manifest.get("format") != CVE_STORE_FORMAT:
+                raise CVEStoreError(f"{self.directory} is not a CVE store")
+            if manifest.get("version") not in _READABLE_STORE_VERSIONS:
+                raise CVEStoreError(f"unsupported CVE store version: {manifest.get('version')}")
+        else:
+            if not 1 <= int(shard_count) <= MAX_SHARD_COUNT:
+                raise CVEStoreError(f"shard_count must be between 1 and {MAX_SHARD_COUNT}")
+            manifest = {
+                "format": CVE_STORE_FORMAT,
+                "version": CVE_STORE_VERSION,
+                "shard_count": int(shard_count),
+                "updated_at": None,
+                "metadata": {},
+                "shards": {},
+            }
+        self._manifest = manifest
+        self.shard_count = int(manifest["shard_count"])
+        self._entries: dict[str, list[tuple[str, int, int]]] = {}
+        self._lookup: dict[str, dict[str, int]] = {}
+        self._maps: dict[str, tuple[Any, mmap.mmap | None]] = {}
+
+    def __enter__(self) -> CVEShardStore:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(int(shard["record_count"]) for shard in self._manifest["shards"].values())
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Open maps cannot be pickled (spawned worker processes); the copy reopens shards lazily.
+        state = dict(self.__dict__)
+        state.update(_entries={}, _lookup={}, _maps={})
+        return state
+
+    @property
+    def updated_at(self) -> str | None:
+        return self._manifest.get("updated_at")
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return dict(self._manifest.get("metadata") or {})
+
+    def shard_for(self, cve_id: str) -> str:
+        return f"{zlib.crc32(cve_id.upper().encode('utf-8')) % self.shard_count:03d}"
+
+    def shards(self) -> list[str]:
+        return sorted(self._manifest["shards"])
+
+    def ids(self) -> list[str]:
+        return [cve_id for shard in self.shards() for cve_id, _offset, _length in self._shard_entries(shard)]
+
+    def get(self, cve_id: str) -> dict[str, Any] | None:
+        cve_id = str(cve_id or "").upper()
+        shard = self.shard_for(cve_id)
+        if shard not in self._manifest["shards"]:
+            return None
+        lookup = self._lookup.get(shard)
+        if lookup is None:
+            lookup = {entry_id: position for position, (entry_id, _offset, _length) in enumerate(self._shard_entries(shard))}
+            self._lookup[shard] = lookup
+        position = lookup.get(cve_id)
+        return None if position is None else self._record(shard, position)
+
+    def records(self) -> _ShardRecords:
+        """Lazy sequence of all records, shard by shard."""
+        return _ShardRecords(self)
+
+    def search_text(self) -> str:
+        # Read as bytes: text mode would turn a stray "\r" into a line break.
+        return "\n".join(self._shard_path(shard, "search").read_bytes().decode("utf-8") for shard in self.shards())
+
+    def merge(self, incoming: Iterable[dict[str, Any]], *, metadata: dict[str, Any] | None = None) -> dict[str, Any]:
+        ensure_runtime_dirs()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for record in incoming:
+            if not isinstance(record, dict):
+                continue
+            cve_id = str(record.get("id") or record.get("cve_id") or "").upper()
+            if not cve_id:
+                continue
+            grouped.setdefault(self.shard_for(cve_id), []).append({**record, "id": cve_id})
+        added = updated = rewritten_bytes = 0
+        changed_shards: list[str] = []
+        retired: list[Path] = []
+        for shard in sorted(grouped):
+            positions = {entry[0]: position for position, entry in enumerate(self._shard_entries(shard))} if shard in self._manifest["shards"] else {}
+            changed: dict[str, dict[str, Any]] = {}
+            for normalized in grouped[shard]:
+                cve_id = normalized["id"]
+                previous = changed.get(cve_id)
+                if previous is None and cve_id in positions:
+                    previous = self._record(shard, positions[cve_id])
+                merged = {**(previous or {}), **normalized}
+                if previous is not None and merged == previous:
+                    continue
+                if cve_id in positions or cve_id in changed:
+                    updated += 1
+                else:
+                    added += 1
+                changed[cve_id] = merged
+            if not changed:
+                continue
+            if shard in self._manifest["shards"]:
+                retired.extend(self._shard_path(shard, suffix) for suffix in ("jsonl", "idx", "search"))
+            rewritten_bytes += self._write_shard(shard, positions, changed)
+            changed_shards.append(shard)
+        if changed_shards or metadata is not None:
+            self._manifest["version"] = CVE_STORE_VERSION
+            self._manifest["updated_at"] = datetime.now(UTC).isoformat()
+            if metadata is not None:
+                self._manifest["metadata"] = metadata
+            _write_atomic(self.directory / "manifest.json", json.dumps(self._manifest, indent=2, sort_keys=True).encode("utf-8") + b"\n")
+            for path in retired:
+                path.unlink(missing_ok=True)
+        return {
+            "ok": True,
+            "cache_path": str(self.directory),
+            "record_count": len(self),
+            "added": added,
+            "updated": updated,
+            "changed_shards": changed_shards,
+            "rewritten_bytes": rewritten_bytes,
+            "updated_at": self.updated_at,
+        }
+
+    def close(self) -> None:
+        for handle, mapped in self._maps.values():
+            if mapped is not None:
+                mapped.close()
+            handle.close()
+        self._maps.clear()
+
+    def _shard_entries(self, shard: str) -> list[tuple[str, int, int]]:
+        entries = self._entries.get(shard)
+        if entries is not None:
+            return entries
+        entries = []
+        with open(self._shard_path(shard, "idx"), "r", encoding="utf-8") as handle:
+            for line in handle:
+                cve_id, offset, length = line.rstrip("\n").split("\t")
+                entries.append((cve_id, int(offset), int(length)))
+        if len(entries) != int(self._manifest["shards"][shard]["record_count"]):
+            raise CVEStoreError(f"CVE store shard {shard} does not match the manifest")
+        self._entries[shard] = entries
+        return entries
+
+    def _record(self, shard: str, position: int) -> dict[str, Any]:
+        return json.loads(self._raw(shard, position))
+
+    def _raw(self, shard: str, position: int) -> bytes:
+        _cve_id, offset, length = self._shard_entries(shard)[position]
+        mapped = self._maps.get(shard)
+        if mapped is None:
+            handle = open(self._shard_path(shard, "jsonl"), "rb")
+            size = os.fstat(handle.fileno()).st_size
+            mapped = (handle, mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) if size else None)
+            self._maps[shard] = mapped
+        if mapped[1] is None or offset + length > len(mapped[1]):
+            raise CVEStoreError(f"CVE store shard {shard} is truncated")
+        return mapped[1][offset : offset + length]
+
+    def _write_shard(self, shard: str, positions: dict[str, int], changed: dict[str, dict[str, Any]]) -> int:
+        """Write the next generation of one shard, copying unchanged records and search lines as they are.
+
+        The new files only become current once the caller writes the manifest.
+        """
+        old_search = self._shard_path(shard, "search").read_bytes().decode("utf-8").split("\n") if positions else []
+        lines: list[bytes] = []
+        search_lines: list[str] = []
+        entries: list[tuple[str, int, int]] = []
+        offset = 0
+        for cve_id in sorted(positions.keys() | changed.keys()):
+            record = changed.get(cve_id)
+            if record is None:
+                line = self._raw(shard, positions[cve_id])
+                search_lines.append(old_search[positions[cve_id]])
+            else:
+                line = json.dumps(record, sort_keys=True, separators=(",", ":")).encode("utf-8")
+                search_lines.append(cve_search_line(record))
+            lines.append(line)
+            entries.append((cve_id, offset, len(line)))
+            offset += len(line) + 1
+        data = b"\n".join(lines) + b"\n"
+        index = "".join(f"{cve_id}\t{start}\t{length}\n" for cve_id, start, length in entries).encode("utf-8")
+        search = "\n".join(search_lines).encode("utf-8")
+        cached = self._maps.pop(shard, None)
+        if cached is not None:
+            if cached[1] is not None:
+                cached[1].close()
+            cached[0].close()
+        generation = int((self._manifest["shards"].get(shard) or {}).get("generation") or 0) + 1
+        for suffix, payload in (("jsonl", data), ("search", search), ("idx", index)):
+            _write_atomic(self.directory / f"{shard}.{generation}.{suffix}", payload)
+        self._manifest["shards"][shard] = {"record_count": len(entries), "bytes": len(data), "generation": generation}
+        self._entries[shard] = entries
+        self._lookup.pop(shard, None)
+        return len(data) + len(index) + len(search)
+
+
+    def _shard_path(self, shard: str, suffix: str) -> Path:
+        generation = self._manifest["shards"].get(shard, {}).get("generation")
+        # Version 1 stores wrote unversioned shard files.
+        return self.directory / (f"{shard}.{suffix}" if generation is None else f"{shard}.{generation}.{suffix}")
+
+
+class _ShardRecords(Sequence):
+    def __init__(self, store: CVEShardStore) -> None:
+        self._store = store
+        self._shards = store.shards()
+        starts = [0]
+        for shard in self._shards:
+            starts.append(starts[-1] + int(store._manifest["shards"][shard]["record_count"]))
+        self._starts = starts
+
+    def __len__(self) -> int:
+        return self._starts[-1]
+
+    def __getitem__(self, position):  # type: ignore[override]
+        if isinstance(position, slice):
+            return [self[item] for item in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("CVE store position out of range")
+        shard_position = bisect_right(self._starts, position) - 1
+        return self._store._record(self._shards[shard_position], position - self._starts[shard_position])
+
+
 def merge_cve_records(
     existing: Iterable[dict[str, Any]],
     incoming: Iterable[dict[str, Any]],
@@ -81,3 +423,55 @@ def merge_cve_records(
         previous = by_id.get(cve_id, {})
         by_id[cve_id] = {**previous, **normalized}
     return [by_id[key] for key in sorted(by_id)]
+
+
+def _save_cve_index(index: CVEIndex, *, cache_path: Path, updated_at: str) -> Path:
+    index_path = cve_index_path(cache_path)
+    header = {
+        "format": CVE_INDEX_FORMAT,
+        "version": CVE_INDEX_VERSION,
+        "updated_at": updated_at,
+        "record_count": len(index),
+        "records_sha256": _records_digest(index.record_ids),
+    }
+    temporary = index_path.with_name(index_path.name + ".tmp")
+    with gzip.open(temporary, "wt", encoding="utf-8", newline="", compresslevel=6) as handle:
+        handle.write(json.dumps(header, sort_keys=True))
+        handle.write("\n")
+        handle.write(index.search_text)
+    os.replace(temporary, index_path)
+    return index_path
+
+
+def _read_cve_index(index_path: Path, *, updated_at: Any, records: list[dict[str, Any]]) -> str | None:
+    if not index_path.exists():
+        return None
+    try:
+        with gzip.open(index_path, "rt", encoding="utf-8", newline="") as handle:
+            header = json.loads(handle.readline())
+            search_text = handle.read()
+    except (OSError, EOFError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(header, dict) or header.get("format") != CVE_INDEX_FORMAT or header.get("version") != CVE_INDEX_VERSION:
+        return None
+    if header.get("updated_at") != updated_at or header.get("record_count") != len(records):
+        return None
+    ids = [str(record.get("id") or record.get("cve_id") or "").upper() for record in records]
+    if header.get("records_sha256") != _records_digest(ids):
+        return None
+    if search_text.count("\n") != max(len(records) - 1, 0):
+        return None
+    return search_text
+
+
+def _records_digest(ids: list[str]) -> str:
+    return hashlib.sha256("\n".join(ids).encode("utf-8")).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
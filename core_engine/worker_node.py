@@ -26,12 +26,20 @@ from core_engine.logging_utils import configure_logger, update_log_level
 from core_engine.platform_utils import local_node_address
 from core_engine.modules.scanner import basic_scan_with_diagnostics, normalize_scan_snapshot, scan_snapshot_id
 from core_engine.firewall_hooks import configure_firewall
-from core_engine.telemetry_framing import encode_json_frame, summarize_worker_payload
+from core_engine.telemetry_framing import (
+    encode_telemetry_frame,
+    negotiate_frame_encoding,
+    summarize_worker_payload,
+)
 from core_engine.tls_utils import create_client_context, merge_tls_config
 
 DEFAULT_TIMEOUT = 5
 DEFAULT_MASTER_IP = "127.0.0.1"
 DEFAULT_PORT = 9000
+DEFAULT_TELEMETRY_ENCODING = "json"
+
+# Frame encodings advertised by each master in its ack, keyed by (host, port).
+_MASTER_FRAME_ENCODINGS: dict[tuple[str, int], list] = {}
 
 
 def parse_level(level_name: str) -> int:
@@ -130,10 +138,12 @@ def send_to_master(
     autolearn: bool,
     tls_context: ssl.SSLContext | None = None,
     tls_config: dict | None = None,
+    telemetry_encoding: str = DEFAULT_TELEMETRY_ENCODING,
 ):
     connections = collect_connections(logger)
     payload = build_payload(node_id, connections, logger, autolearn)
-    data = encode_json_frame(payload)
+    frame_encoding = negotiate_frame_encoding(telemetry_encoding, _MASTER_FRAME_ENCODINGS.get((master_ip, port)))
+    data = encode_telemetry_frame(payload, encoding=frame_encoding)
 
     logger.info("🔌 Connecting to master %s:%s with timeout=%ss ...", master_ip, port, timeout)
     sock = None
@@ -146,7 +156,7 @@ def send_to_master(
             sock = tls_context.wrap_socket(raw_sock, server_hostname=server_hostname)
         else:
             sock = raw_sock
-        logger.info("✅ Connected. Sending payload bytes: %s", len(data))
+        logger.info("✅ Connected. Sending %s payload bytes: %s", frame_encoding, len(data))
         sock.sendall(data)
         logger.debug("Payload summary: %s", summarize_worker_payload(payload))
 
@@ -158,6 +168,9 @@ def send_to_master(
                 logger.info("📥 Ack from master: %s", ack_text)
                 try:
                     ack_payload = json.loads(ack_text)
+                    advertised = ack_payload.get("frame_encodings")
+                    if isinstance(advertised, list):
+                        _MASTER_FRAME_ENCODINGS[(master_ip, port)] = advertised
                     remediation = ack_payload.get("remediation")
                     if remediation:
                         logger.info(
@@ -325,6 +338,7 @@ def run_worker(
         "autolearn": bool(settings.get("enable_autolearn")),
         "orchestrator_url": config.get("orchestrator_url") or settings.get("orchestrator_url"),
         "orchestrator_token": config.get("orchestrator_token") or settings.get("orchestrator_token"),
+        "telemetry_encoding": str(config.get("telemetry_encoding") or DEFAULT_TELEMETRY_ENCODING),
     }
 
     if continuous:
@@ -422,6 +436,7 @@ def run_worker(
             tls_cfg = tls_config
             orchestrator_url = runtime.get("orchestrator_url")
             orchestrator_token = runtime.get("orchestrator_token")
+            telemetry_encoding = runtime["telemetry_encoding"]
 
         extra_scan = False
         if orchestrator_url:
@@ -437,6 +452,7 @@ def run_worker(
             autolearn=autolearn,
             tls_context=context,
             tls_config=tls_cfg,
+            telemetry_encoding=telemetry_encoding,
         )
         if orchestrator_url and extra_scan:
             logger.info("Executing orchestrator-triggered scan")
@@ -449,6 +465,7 @@ def run_worker(
                 autolearn=runtime["autolearn"],
                 tls_context=context,
                 tls_config=tls_cfg,
+                telemetry_encoding=telemetry_encoding,
             )
 
     stop_event = threading.Event()
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -22,6 +24,7 @@ from core_engine.config_loader import load_settings, save_settings
 from core_engine.deployment import build_deployment_manifest_catalog
 from core_engine.time_utils import format_utc_label, parse_utc_instant, utc_now_iso
 from core_engine.log_exporter import export_logs, resolve_export_dir
+from core_engine.log_tail import LogTailReader, decode_log_line, parse_jsonl_record
 from core_engine.packaging import (
     build_auto_updater_readiness,
     build_container_deployment_readiness,
@@ -33,7 +36,6 @@ from gui.visualization import (
     build_flow_visualization,
     build_risk_timeline,
     flow_rows,
-    read_jsonl,
     render_risk_timeline,
     topology_edge_rows,
     visualization_summary,
@@ -4994,6 +4996,75 @@ class NodeTable(DataTable):
         _restore_table_selection(self, selection)
 
 
+def _path_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _export_dir_signature(export_dir: Path) -> tuple[tuple[str, int, int], ...] | None:
+    entries: List[tuple[str, int, int]] = []
+    try:
+        with os.scandir(export_dir) as iterator:
+            for entry in iterator:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.name, stat.st_size, stat.st_mtime_ns))
+    except OSError:
+        return None
+    return tuple(sorted(entries))
+
+
+@dataclass
+class RefreshSnapshot:
+    data: Dict[str, Any]
+    changed: frozenset[str]
+    timings: Dict[str, float]
+    unchanged: int = 0
+
+
+class RefreshSourceTracker:
+    """Remember per-source signatures and values between dashboard refreshes."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self._signatures: Dict[str, Any] = {}
+        self._values: Dict[str, Any] = {}
+
+    def load(
+        self,
+        name: str,
+        signature: Any,
+        loader: Any,
+        *,
+        force: bool = False,
+        timings: Dict[str, float] | None = None,
+    ) -> tuple[Any, bool]:
+        """Return ``(value, changed)``, calling ``loader`` only when the signature moved."""
+        if not force and name in self._values and self._signatures.get(name) == signature:
+            return self._values[name], False
+        started = time.perf_counter()
+        value = loader()
+        if timings is not None:
+            timings[name] = round((time.perf_counter() - started) * 1000, 2)
+        changed = name not in self._values or self._values[name] != value
+        self._signatures[name] = signature
+        self._values[name] = value
+        return value, changed
+
+
+def _format_refresh_timings(timings: Dict[str, float], *, unchanged: int = 0, limit: int = 4) -> str:
+    if not timings and not unchanged:
+        return ""
+    slowest = sorted(timings.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    loaded = ", ".join(f"{name} {value:.1f}ms" for name, value in slowest) or "none"
+    return f"Refresh loads - {loaded} ({unchanged} unchanged)"
+
+
 def _compute_metrics(nodes: List[Dict[str, Any]], events: List[Dict[str, Any]]) -> Dict[str, Any]:
     total = len(nodes)
     online = sum(1 for n in nodes if (n.get("status") or "").lower() in {"online", "ready"})
@@ -5051,6 +5122,12 @@ class MetricsPanel(Static):
                 f"{visualization.get('topology_edges', 0)} edges, "
                 f"latest max score: {_format_risk_score(visualization.get('latest_max_score'))}"
             )
+        refresh_line = _format_refresh_timings(
+            metrics.get("refresh_timings") or {},
+            unchanged=int(metrics.get("refresh_unchanged") or 0),
+        )
+        if refresh_line:
+            text += f"\n{refresh_line}"
         self.update(text)
 
 
@@ -7204,6 +7281,7 @@ class PortMapDashboard(App):
         self._allowlist_candidates: List[Dict[str, Any]] = []
         self._expected_services: List[Dict[str, Any]] = []
         self._nodes_cache: List[Dict[str, Any]] = []
+        self._refresh_sources = RefreshSourceTracker()
         self._risk_finding_keys: set[str] | None = None
         self._risk_feed_keys: set[str] | None = None
         self._risk_timeline_keys: set[str] | None = None
@@ -7222,85 +7300,224 @@ class PortMapDashboard(App):
     async def auto_refresh(self) -> None:
         while True:
             try:
-                self.refresh_state()
+                snapshot = await asyncio.to_thread(self._collect_refresh_snapshot)
+                self._apply_refresh_snapshot(snapshot)
             except Exception as exc:
                 self.log("Failed to refresh dashboard: %s", exc)
             await asyncio.sleep(self.scan_interval)
 
     def refresh_state(self) -> None:
-        nodes = self._load_nodes()
+        """Reload every source immediately; used after operator actions."""
+        self._apply_refresh_snapshot(self._collect_refresh_snapshot(force=True))
+
+    def _refresh_tracker(self) -> RefreshSourceTracker:
+        tracker = getattr(self, "_refresh_sources", None)
+        if tracker is None:
+            tracker = RefreshSourceTracker()
+            self._refresh_sources = tracker
+        return tracker
+
+    def _collect_refresh_snapshot(self, *, force: bool = False) -> RefreshSnapshot:
+        """Load dashboard sources off the UI thread, skipping files whose signature is unchanged.
+
+        Widgets are never touched here; ``_apply_refresh_snapshot`` renders the result.
+        """
+        tracker = self._refresh_tracker()
+        tail_size = self.tail_size
+        data: Dict[str, Any] = {}
+        changed: set[str] = set()
+        timings: Dict[str, float] = {}
+        loaded = 0
+
+        def load(name: str, signature: Any, loader: Any, *, dirty: bool = False) -> bool:
+            nonlocal loaded
+            value, is_changed = tracker.load(name, signature, loader, force=force or dirty, timings=timings)
+            data[name] = value
+            if name in timings:
+                loaded += 1
+            if is_changed:
+                changed.add(name)
+            return is_changed
+
+        with tracker.lock:
+            master_events_signature = _path_signature(MASTER_EVENTS_LOG)
+            command_signature = _path_signature(COMMAND_AUDIT_LOG)
+            export_dir = getattr(self, "export_dir", resolve_export_dir())
+            activity_limit = max(tail_size * 4, 20)
+
+            load("nodes", _path_signature(ORCHESTRATOR_STATE), self._load_nodes)
+            load("logs", (tail_size, _path_signature(MASTER_LOG)), self._tail_log)
+            remediation_changed = load(
+                "remediation_events",
+                (tail_size, _path_signature(REMEDIATION_LOG)),
+                lambda: self._load_remediation_events(limit=tail_size),
+            )
+            scan_changed = load(
+                "scan_results",
+                (tail_size, master_events_signature),
+                lambda: self._load_scan_results(data["remediation_events"], limit=tail_size),
+                dirty=remediation_changed,
+            )
+            load(
+                "risk_timeline",
+                tail_size,
+                lambda: build_risk_timeline([*data["remediation_events"], *data["scan_results"]], limit=tail_size),
+                dirty=remediation_changed or scan_changed,
+            )
+            load(
+                "flow_visualization",
+                (activity_limit, _path_signature(FLOW_EVENTS_LOG), master_events_signature),
+                lambda: self._load_flow_visualization(limit=activity_limit),
+            )
+            load(
+                "command_events",
+                (tail_size, command_signature),
+                lambda: self._load_command_events(limit=tail_size),
+            )
+            export_limit = max(tail_size * 4, EXPORT_ACTIVITY_LIMIT)
+            exports_changed = load(
+                "export_rows",
+                (export_limit, str(export_dir), _export_dir_signature(export_dir)),
+                lambda: _export_rows_from_dir(export_dir, limit=export_limit),
+            )
+            data["governance_rows"] = []
+            if hasattr(self, "governance_status_panel"):
+                governance_limit = max(tail_size * 4, GOVERNANCE_EVIDENCE_LIMIT)
+                load(
+                    "governance_rows",
+                    (governance_limit, _path_signature(AUDIT_EVENTS_LOG), command_signature),
+                    lambda: self._load_governance_rows(
+                        remediation_events=data["remediation_events"],
+                        export_rows=data["export_rows"],
+                        limit=governance_limit,
+                    ),
+                    dirty=remediation_changed or exports_changed,
+                )
+            data["deployment_rows"] = []
+            if hasattr(self, "deployment_status_panel"):
+                deployment_limit = max(tail_size * 4, DEPLOYMENT_READINESS_LIMIT)
+                load(
+                    "deployment_rows",
+                    deployment_limit,
+                    lambda: self._load_deployment_rows(limit=deployment_limit),
+                )
+            data["ai_events"] = []
+            if hasattr(self, "ai_status_panel"):
+                ai_limit = max(tail_size * 4, AI_ACTIVITY_LIMIT)
+                load(
+                    "ai_events",
+                    (ai_limit, master_events_signature),
+                    lambda: self._load_ai_events(
+                        remediation_events=data["remediation_events"],
+                        scan_results=data["scan_results"],
+                        limit=ai_limit,
+                    ),
+                    dirty=remediation_changed or scan_changed,
+                )
+            runtime_settings = getattr(self, "runtime_settings", {})
+            expected_changed = load(
+                "expected_services",
+                None,
+                lambda: [item for item in runtime_settings.get("expected_services", []) if isinstance(item, dict)],
+                dirty=True,
+            )
+            load(
+                "allowlist_candidates",
+                None,
+                lambda: self._build_allowlist_candidates(data["remediation_events"]),
+                dirty=remediation_changed or expected_changed,
+            )
+            if hasattr(self, "metrics_panel"):
+                load("orchestrator_health", None, self._load_orchestrator_health, dirty=True)
+            else:
+                data["orchestrator_health"] = {}
+
+        return RefreshSnapshot(
+            data=data,
+            changed=frozenset(changed),
+            timings=timings,
+            unchanged=max(len(data) - loaded, 0),
+        )
+
+    def _apply_refresh_snapshot(self, snapshot: RefreshSnapshot) -> None:
+        """Render a collected snapshot, updating only panels whose sources changed."""
+        data = snapshot.data
+        changed = snapshot.changed
+        nodes = data["nodes"]
+        remediation_events = data["remediation_events"]
+        scan_results = data["scan_results"]
+        risk_timeline = data["risk_timeline"]
+        flow_visualization = data["flow_visualization"]
+        command_events = data["command_events"]
+        export_rows = data["export_rows"]
+        governance_rows = data["governance_rows"]
+        deployment_rows = data["deployment_rows"]
+        ai_events = data["ai_events"]
         self._nodes_cache = nodes
-        self.node_table.update_nodes(nodes)
-        logs = self._tail_log()
-        self.log_panel.update_log(logs)
-        remediation_events = self._load_remediation_events(limit=self.tail_size)
-        if hasattr(self, "remediation_panel"):
+        self._allowlist_candidates = data["allowlist_candidates"]
+        self._expected_services = data["expected_services"]
+
+        if "nodes" in changed:
+            self.node_table.update_nodes(nodes)
+        if "logs" in changed:
+            self.log_panel.update_log(data["logs"])
+        if "remediation_events" in changed and hasattr(self, "remediation_panel"):
             self.remediation_panel.update_events(remediation_events)
-        scan_results = self._load_scan_results(remediation_events, limit=self.tail_size)
-        self.scan_results_panel.update_results(scan_results)
-        risk_timeline = build_risk_timeline([*remediation_events, *scan_results], limit=self.tail_size)
-        flow_visualization = self._load_flow_visualization(limit=max(self.tail_size * 4, 20))
-        if hasattr(self, "risk_timeline_panel"):
+        if "scan_results" in changed:
+            self.scan_results_panel.update_results(scan_results)
+        if "risk_timeline" in changed and hasattr(self, "risk_timeline_panel"):
             self.risk_timeline_panel.update_timeline(risk_timeline)
-        if hasattr(self, "compact_risk_panel"):
+        if changed & {"remediation_events", "scan_results"} and hasattr(self, "compact_risk_panel"):
             self.compact_risk_panel.update_risk(remediation_events, scan_results)
-        export_rows = self._load_export_rows(limit=max(self.tail_size * 4, EXPORT_ACTIVITY_LIMIT))
-        if hasattr(self, "exports_status_panel"):
+        if "export_rows" in changed:
             self._update_exports_workspace(export_rows)
-        governance_rows: List[Dict[str, str]] = []
-        if hasattr(self, "governance_status_panel"):
-            governance_rows = self._load_governance_rows(
-                remediation_events=remediation_events,
-                export_rows=export_rows,
-                limit=max(self.tail_size * 4, GOVERNANCE_EVIDENCE_LIMIT),
-            )
+        if "governance_rows" in changed:
             self._update_governance_workspace(governance_rows)
-        deployment_rows: List[Dict[str, str]] = []
-        if hasattr(self, "deployment_status_panel"):
-            deployment_rows = self._load_deployment_rows(limit=max(self.tail_size * 4, DEPLOYMENT_READINESS_LIMIT))
+        if "deployment_rows" in changed:
             self._update_deployment_workspace(deployment_rows)
-        ai_events: List[Dict[str, Any]] = []
-        if hasattr(self, "ai_status_panel"):
-            ai_events = self._load_ai_events(
+        if "ai_events" in changed:
+            self._update_ai_workspace(ai_events)
+        if "flow_visualization" in changed:
+            self._update_packet_workspace(flow_visualization)
+            if hasattr(self, "topology_panel"):
+                self.topology_panel.update_topology(
+                    topology_edge_rows(flow_visualization.get("topology"), limit=self.tail_size)
+                )
+            if hasattr(self, "traffic_flows_panel"):
+                self.traffic_flows_panel.update_flows(
+                    flow_rows(flow_visualization.get("flows") or [], limit=self.tail_size)
+                )
+        if changed & {"allowlist_candidates", "expected_services"}:
+            self.expected_services_panel.update_services(self._allowlist_candidates, self._expected_services)
+        if changed & {"remediation_events", "scan_results", "risk_timeline", "allowlist_candidates", "expected_services"}:
+            self._update_risk_workspace(
                 remediation_events=remediation_events,
                 scan_results=scan_results,
-                limit=max(self.tail_size * 4, AI_ACTIVITY_LIMIT),
+                risk_timeline=risk_timeline,
+                allowlist_candidates=self._allowlist_candidates,
+                expected_services=self._expected_services,
+                selected_index=self._selected_expected_services_row(),
             )
-            self._update_ai_workspace(ai_events)
-        packet_rows: List[Dict[str, str]] = []
-        if hasattr(self, "packet_status_panel"):
-            packet_rows = _packet_activity_rows(flow_visualization.get("flows") or [], limit=PACKET_ACTIVITY_LIMIT)
-            self._update_packet_workspace(flow_visualization)
-        if hasattr(self, "topology_panel"):
-            self.topology_panel.update_topology(topology_edge_rows(flow_visualization.get("topology"), limit=self.tail_size))
-        if hasattr(self, "traffic_flows_panel"):
-            self.traffic_flows_panel.update_flows(flow_rows(flow_visualization.get("flows") or [], limit=self.tail_size))
-        self._allowlist_candidates = self._build_allowlist_candidates(remediation_events)
-        self._expected_services = [
-            item for item in self.runtime_settings.get("expected_services", []) if isinstance(item, dict)
-        ]
-        self.expected_services_panel.update_services(self._allowlist_candidates, self._expected_services)
-        self._update_risk_workspace(
-            remediation_events=remediation_events,
-            scan_results=scan_results,
-            risk_timeline=risk_timeline,
-            allowlist_candidates=self._allowlist_candidates,
-            expected_services=self._expected_services,
-            selected_index=self._selected_expected_services_row(),
-        )
-        command_events = self._load_command_events(limit=self.tail_size)
-        self.command_panel.update_commands(command_events)
+        if "command_events" in changed:
+            self.command_panel.update_commands(command_events)
         if hasattr(self, "metrics_panel"):
             metrics = _compute_metrics(nodes, remediation_events)
             metrics["firewall_status"] = getattr(self, "firewall_status", _resolve_firewall_status({}))
-            metrics["orchestrator_health"] = self._load_orchestrator_health()
+            metrics["orchestrator_health"] = data["orchestrator_health"]
             metrics["visualization"] = visualization_summary(
                 nodes=nodes,
                 risk_timeline=risk_timeline,
                 flows=flow_visualization.get("flows") or [],
                 topology=flow_visualization.get("topology"),
             )
+            metrics["refresh_timings"] = snapshot.timings
+            metrics["refresh_unchanged"] = snapshot.unchanged
             self.metrics_panel.update_metrics(metrics)
+        if not changed:
+            return
+        packet_rows: List[Dict[str, str]] = []
+        if hasattr(self, "packet_status_panel"):
+            packet_rows = _packet_activity_rows(flow_visualization.get("flows") or [], limit=PACKET_ACTIVITY_LIMIT)
         self._update_workspace_intro_panels(
             nodes=nodes,
             remediation_events=remediation_events,
@@ -7373,7 +7590,7 @@ class PortMapDashboard(App):
         export_rows: List[Dict[str, str]] | None = None,
         limit: int = GOVERNANCE_EVIDENCE_LIMIT,
     ) -> List[Dict[str, str]]:
-        audit_events = read_jsonl(AUDIT_EVENTS_LOG, limit=limit)
+        audit_events = self._read_jsonl_tail(AUDIT_EVENTS_LOG, limit)
         command_events = self._load_command_events(limit=limit)
         return _governance_rows_from_sources(
             audit_events=audit_events,
@@ -7575,29 +7792,29 @@ class PortMapDashboard(App):
         except Exception:
             return []
 
-    def _tail_log(self) -> List[str]:
-        if not MASTER_LOG.exists():
-            return []
-        try:
-            lines = MASTER_LOG.read_text().splitlines()
-            # limit by user tail size then hard-cap by panel max
-            return lines[-min(LogPanel.MAX_LINES, self.tail_size) :]
-        except Exception:
+    def _tail_reader(self, path: Path, limit: int, *, text: bool = False) -> LogTailReader:
+        readers = getattr(self, "_tail_readers", None)
+        if readers is None:
+            readers = {}
+            self._tail_readers = readers
+        key = (str(path), limit, text)
+        reader = readers.get(key)
+        if reader is None:
+            reader = LogTailReader(path, limit=limit, parse=decode_log_line if text else parse_jsonl_record)
+            readers[key] = reader
+        return reader
+
+    def _read_jsonl_tail(self, path: Path, limit: int) -> List[Dict[str, Any]]:
+        if limit <= 0:
             return []
+        return self._tail_reader(path, limit).read()
+
+    def _tail_log(self) -> List[str]:
+        # limit by user tail size then hard-cap by panel max
+        return self._tail_reader(MASTER_LOG, min(LogPanel.MAX_LINES, self.tail_size), text=True).read()
 
     def _load_remediation_events(self, limit: int = 200) -> List[Dict[str, Any]]:
-        if not REMEDIATION_LOG.exists():
-            return []
-        events = []
-        try:
-            for line in REMEDIATION_LOG.read_text().splitlines()[-limit:]:
-                try:
-                    events.append(json.loads(line))
-                except Exception:
-                    continue
-        except Exception:
-            return []
-        return events
+        return self._read_jsonl_tail(REMEDIATION_LOG, limit)
 
     def _load_worker_telemetry_events(self, limit: int = 200) -> List[Dict[str, Any]]:
         return [
@@ -7607,12 +7824,10 @@ class PortMapDashboard(App):
         ]
 
     def _load_master_events(self, limit: int = 200) -> List[Dict[str, Any]]:
-        if not MASTER_EVENTS_LOG.exists():
-            return []
-        return read_jsonl(MASTER_EVENTS_LOG, limit=limit)
+        return self._read_jsonl_tail(MASTER_EVENTS_LOG, limit)
 
     def _load_flow_visualization(self, limit: int = 200) -> Dict[str, Any]:
-        flow_events = read_jsonl(FLOW_EVENTS_LOG, limit=limit)
+        flow_events = self._read_jsonl_tail(FLOW_EVENTS_LOG, limit)
         if not flow_events:
             flow_events = _flow_events_from_master_events(self._load_master_events(limit=limit))
         try:
@@ -7646,18 +7861,7 @@ class PortMapDashboard(App):
         return list(reversed(candidates))
 
     def _load_command_events(self, limit: int = 200) -> List[Dict[str, Any]]:
-        if not COMMAND_AUDIT_LOG.exists():
-            return []
-        events = []
-        try:
-            for line in COMMAND_AUDIT_LOG.read_text().splitlines()[-limit:]:
-                try:
-                    events.append(json.loads(line))
-                except Exception:
-                    continue
-        except Exception:
-            return []
-        return events
+        return self._read_jsonl_tail(COMMAND_AUDIT_LOG, limit)
 
     def _load_orchestrator_health(self) -> Dict[str, Any]:
         url = getattr(self, "orchestrator_url", DEFAULT_ORCHESTRATOR_URL)
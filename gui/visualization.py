@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Iterable
 
+from core_engine.log_tail import tail_jsonl
 from core_engine.modules.flow_tracker import build_flow_report
 from core_engine.time_utils import epoch_seconds
 
@@ -22,19 +22,7 @@ def read_jsonl(path: Path, *, limit: int = 200) -> list[dict[str, Any]]:
         return []
     if not path.exists():
         return []
-    rows: list[dict[str, Any]] = []
-    try:
-        lines = path.read_text().splitlines()[-limit:]
-    except Exception:
-        return []
-    for line in lines:
-        try:
-            item = json.loads(line)
-        except Exception:
-            continue
-        if isinstance(item, dict):
-            rows.append(item)
-    return rows
+    return tail_jsonl(path, limit=limit)
 
 
 def risk_bucket(value: Any) -> str:
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Compare per-observation and batch behavior-graph building against shared flows and findings."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_engine.attribution.behavior_graph import build_behavior_graph_model, build_behavior_graph_models  # noqa: E402
+
+GENERATED_AT = "2026-01-01T00:00:00+00:00"
+SERVICES = ("nginx", "postgres", "sshd", "redis-server", "node", "python3")
+
+
+def build_inputs(observation_count: int, flow_count: int, finding_count: int) -> tuple[list[dict], list[dict], list[dict]]:
+    observations = [
+        {
+            "asset": f"asset-{index % 500}",
+            "port": 1024 + index % 2000,
+            "protocol": "tcp" if index % 4 else "udp",
+            "service_name": SERVICES[index % len(SERVICES)],
+            "risk_signals": ["unexpected_exposure"] if index % 9 == 0 else [],
+        }
+        for index in range(observation_count)
+    ]
+    flows = [
+        {
+            "flow_id": f"flow-{index}",
+            "source_asset": f"asset-{index % 500}",
+            "destination_asset": f"asset-{(index * 7) % 500}",
+        }
+        for index in range(flow_count)
+    ]
+    findings = [
+        {"port": 1024 + (index * 13) % 2000, "service_name": SERVICES[index % len(SERVICES)], "finding": f"finding-{index}"}
+        for index in range(finding_count)
+    ]
+    return observations, flows, findings
+
+
+def _timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--observations", type=int, default=10000)
+    parser.add_argument("--flows", type=int, default=2000)
+    parser.add_argument("--findings", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--skip-single", action="store_true", help="skip the slow per-observation baseline")
+    args = parser.parse_args(argv)
+
+    observations, flows, findings = build_inputs(args.observations, args.flows, args.findings)
+    runs = {}
+    if not args.skip_single:
+        runs["single"] = _timed(
+            lambda: [
+                build_behavior_graph_model(row, flows=flows, findings=findings, generated_at=GENERATED_AT)
+                for row in observations
+            ]
+        )
+    runs["batch"] = _timed(lambda: build_behavior_graph_models(observations, flows=flows, findings=findings, generated_at=GENERATED_AT))
+    if args.workers > 1:
+        runs[f"batch/{args.workers}p"] = _timed(
+            lambda: build_behavior_graph_models(
+                observations,
+                flows=flows,
+                findings=findings,
+                generated_at=GENERATED_AT,
+                max_workers=args.workers,
+            )
+        )
+
+    reference = json.dumps(runs["batch"][0], sort_keys=True, default=str)
+    print(f"observations={args.observations} flows={args.flows} findings={args.findings}")
+    print(f"{'mode':<12} {'seconds':>9} {'graphs/s':>10} {'identical':>10}")
+    for name, (graphs, seconds) in runs.items():
+        identical = json.dumps(graphs, sort_keys=True, default=str) == reference
+        print(f"{name:<12} {seconds:>9.2f} {len(graphs) / seconds:>10.0f} {str(identical):>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Compare the single-pass federation digest with the old serialize/parse/serialize path."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_engine.export.node_manifest import digest_payload  # noqa: E402
+from core_engine.federation.canonical_digest import CanonicalDigestMemo, canonical_digest, canonical_digest_many  # noqa: E402
+from core_engine.federation.signing import canonical_json  # noqa: E402
+
+PROGRAMS = ("nginx", "postgres", "sshd", "python3", "chrome", "redis-server", "node", "Unknown")
+
+
+def build_runtime_summary(connection_count: int, *, node_id: str = "worker-bench") -> dict:
+    return {
+        "record_type": "runtime_summary",
+        "node_id": node_id,
+        "generated_at": "2026-01-01T00:00:00+00:00",
+        "connections": [
+            {
+                "program": PROGRAMS[index % len(PROGRAMS)],
+                "port": 1024 + index % 4000,
+                "protocol": "TCP" if index % 5 else "UDP",
+                "score": round((index % 100) / 100, 3),
+                "tags": ["observed", "runtime"],
+                "labels": {"severity": "low" if index % 7 else "medium", "source_mode": "live"},
+            }
+            for index in range(connection_count)
+        ],
+        "summary": {"connection_count": connection_count, "anomaly_count": connection_count // 50, "healthy": True},
+    }
+
+
+def legacy_digest(payload: dict) -> str:
+    return digest_payload(json.loads(canonical_json(payload)))
+
+
+def _per_second(func, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - started
+    return iterations / elapsed if elapsed else float("inf")
+
+
+def run_benchmark(connection_counts: list[int], iterations: int, batch_size: int) -> list[dict]:
+    results = []
+    for count in connection_counts:
+        payload = build_runtime_summary(count)
+        batch = [build_runtime_summary(count, node_id=f"worker-{index}") for index in range(batch_size)]
+        assert canonical_digest(payload) == legacy_digest(payload)
+        memo = CanonicalDigestMemo()
+        results.append(
+            {
+                "connections": count,
+                "bytes": len(canonical_json(payload)),
+                "legacy_per_sec": _per_second(lambda: legacy_digest(payload), iterations),
+                "single_pass_per_sec": _per_second(lambda: canonical_digest(payload), iterations),
+                "memo_per_sec": _per_second(lambda: memo.digest(payload), iterations),
+                "batch_per_sec": _per_second(lambda: canonical_digest_many(batch), max(1, iterations // batch_size)) * batch_size,
+            }
+        )
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, nargs="+", default=[10, 200, 2000])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print(f"{'conns':>6} {'bytes':>9} {'legacy/s':>10} {'single/s':>10} {'speedup':>8} {'memo/s':>11} {'batch/s':>10}")
+    for row in run_benchmark(args.connections, args.iterations, args.batch_size):
+        speedup = row["single_pass_per_sec"] / row["legacy_per_sec"]
+        print(
+            f"{row['connections']:>6} {row['bytes']:>9} {row['legacy_per_sec']:>10.0f} {row['single_pass_per_sec']:>10.0f} "
+            f"{speedup:>7.2f}x {row['memo_per_sec']:>11.0f} {row['batch_per_sec']:>10.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
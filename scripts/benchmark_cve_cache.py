@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Compare CVE cache load and merge cost: JSON cache file vs sharded store."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_engine.vuln.cve_client import analyze_service_cves  # noqa: E402
+from core_engine.vuln.cve_store import (  # noqa: E402
+    CVEShardStore,
+    load_cve_cache,
+    load_cve_index,
+    merge_cve_records,
+    save_cve_cache,
+)
+
+PRODUCTS = ("apache http_server", "openssh", "nginx", "samba", "postfix", "mysql", "redis", "tomcat")
+SERVICES = [
+    {"target": "192.0.2.10", "port": 22, "state": "open", "service": "ssh", "version": "OpenSSH_8.2p1"},
+    {"target": "192.0.2.10", "port": 80, "state": "open", "service": "http", "version": "Apache/2.4.49"},
+    {"target": "192.0.2.11", "port": 3306, "state": "open", "service": "mysql", "version": "5.7.31"},
+]
+
+
+def build_records(count: int) -> list[dict]:
+    records = []
+    for index in range(count):
+        product = PRODUCTS[index % len(PRODUCTS)] if index % 20 == 0 else f"component{index % 5000}"
+        vendor, _, name = product.partition(" ")
+        records.append(
+            {
+                "id": f"CVE-2020-{index:06d}",
+                "summary": f"Sample issue {index} in {product} before {index % 9}.{index % 7}.{index % 13} allows remote attackers to cause a denial of service.",
+                "descriptions": [f"Sample issue {index} in {product}."],
+                "cvss_score": round((index % 100) / 10, 1),
+                "cpes": [f"cpe:2.3:a:{vendor}:{name or vendor}:{index % 9}.{index % 7}:*:*:*:*:*:*:*"],
+                "references": [f"https://example.invalid/advisories/{index}"],
+            }
+        )
+    return records
+
+
+def _timed(function):
+    started = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started, result
+
+
+def _peak_mib(function) -> float:
+    tracemalloc.start()
+    function()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--updates", type=int, default=100, help="Changed records in the incremental merge")
+    args = parser.parse_args(argv)
+
+    print(f"{'records':>8}  {'path':<6} {'load s':>8} {'match s':>8} {'load MiB':>9} {'merge s':>8}")
+    for count in args.records:
+        records = build_records(count)
+        updates = [{"id": record["id"], "known_exploited": True} for record in records[:: max(count // args.updates, 1)]]
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = Path(directory) / "cve_cache.json"
+            store_path = Path(directory) / "cve_store"
+            save_cve_cache(records, path=cache_path)
+            with CVEShardStore(store_path) as store:
+                store.merge(records)
+
+            for name, path in (("json", cache_path), ("store", store_path)):
+                load_seconds, loaded = _timed(lambda: load_cve_index(path))
+                match_seconds, _report = _timed(lambda: analyze_service_cves(SERVICES, loaded["index"]))
+                peak = _peak_mib(lambda: load_cve_index(path))
+                if name == "json":
+                    merge_seconds, _saved = _timed(
+                        lambda: save_cve_cache(merge_cve_records(load_cve_cache(path)["records"], updates), path=path)
+                    )
+                else:
+                    with CVEShardStore(path) as store:
+                        merge_seconds, _saved = _timed(lambda: store.merge(updates))
+                print(f"{count:>8}  {name:<6} {load_seconds:>8.3f} {match_seconds:>8.3f} {peak:>9.1f} {merge_seconds:>8.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Measure events per second through create -> publish -> durable log -> SQLite store and transport encode."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_engine.events import (  # noqa: E402
+    LocalEventBus,
+    SegmentedEventLog,
+    create_event,
+    create_events,
+    event_to_json,
+)
+from core_engine.storage import LocalStorageRepository, SQLiteStore  # noqa: E402
+
+EVENT_TYPES = ("flow_observed", "service_observed", "asset_observed", "runtime_health")
+
+
+def build_rows(count: int) -> list[dict]:
+    return [
+        {
+            "event_type": EVENT_TYPES[index % len(EVENT_TYPES)],
+            "severity": "low" if index % 3 else "medium",
+            "source": "benchmark",
+            "message": f"Sample observation {index}",
+            "asset_ref": f"asset-sample-{index % 250:03d}",
+            "metadata": {"example_network": "TEST-NET", "sequence": index},
+        }
+        for index in range(count)
+    ]
+
+
+def _run(rows: list[dict], *, batched: bool, directory: Path) -> float:
+    transported = []
+    repository = LocalStorageRepository(SQLiteStore(directory / "events.db"))
+    bus = LocalEventBus(history_limit=1000, event_log=SegmentedEventLog(directory / "log"))
+    bus.subscribe(repository.insert_event)
+    bus.subscribe(lambda event: transported.append(event_to_json(event)))
+    started = time.perf_counter()
+    events = create_events(rows) if batched else [create_event(**row) for row in rows]
+    for event in events:
+        bus.publish(event)
+        bus.consume()
+    elapsed = time.perf_counter() - started
+    bus.event_log.close()
+    stored = repository.store.query("SELECT COUNT(*) AS count FROM events")[0]["count"]
+    repository.store.close()
+    assert len(transported) == len(rows) == stored
+    return elapsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args(argv)
+
+    print(f"{'events':>7}  {'path':<8} {'seconds':>8} {'events/s':>10}")
+    for count in args.events:
+        rows = build_rows(count)
+        for name, batched in (("single", False), ("batched", True)):
+            with tempfile.TemporaryDirectory() as directory:
+                elapsed = _run(rows, batched=batched, directory=Path(directory))
+            print(f"{count:>7}  {name:<8} {elapsed:>8.3f} {count / elapsed:>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
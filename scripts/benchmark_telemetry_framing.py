@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Compare JSON and compact worker telemetry frames by size and throughput."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_engine.modules.scanner import normalize_scan_snapshot  # noqa: E402
+from core_engine.telemetry_framing import (  # noqa: E402
+    DEFAULT_MAX_FRAME_BYTES,
+    available_frame_codecs,
+    decode_compact_frame,
+    decode_json_frame,
+    encode_compact_frame,
+    encode_json_frame,
+)
+
+PROGRAMS = ("nginx", "postgres", "sshd", "python3", "chrome", "redis-server", "node", "Unknown")
+STATUSES = ("ESTABLISHED", "LISTEN", "TIME_WAIT", "CLOSE_WAIT")
+
+
+def build_snapshot(connection_count: int, *, node_id: str = "worker-bench") -> dict:
+    raw = []
+    for index in range(connection_count):
+        raw.append(
+            {
+                "program": PROGRAMS[index % len(PROGRAMS)],
+                "pid": 1000 + index % 97,
+                "port": 1024 + index % 4000,
+                "protocol": "TCP" if index % 5 else "UDP",
+                "local": f"192.0.2.{index % 250 + 1}:{1024 + index % 4000}",
+                "remote": f"198.51.100.{(index * 7) % 250 + 1}:{443 if index % 3 else 80}",
+                "status": STATUSES[index % len(STATUSES)],
+                "source_mode": "live",
+            }
+        )
+    ports = []
+    for row in normalize_scan_snapshot(raw, node_id=node_id):
+        row = dict(row)
+        row["score"] = round((hash(row.get("program")) % 100) / 100, 3)
+        ports.append(row)
+    return {
+        "node_id": node_id,
+        "timestamp": 1_780_000_000,
+        "ports": ports,
+        "anomalies": [],
+        "score": 0.42,
+        "scan_snapshot": {
+            "record_type": "worker_scan_snapshot",
+            "snapshot_id": "bench-snapshot",
+            "source_modes": ["live"],
+            "observation_count": len(ports),
+            "bounded": True,
+        },
+    }
+
+
+def _measure(encode, decode, payload: dict, iterations: int) -> dict:
+    frame = encode(payload)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        encode(payload)
+    encode_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(iterations):
+        decode(frame)
+    decode_seconds = time.perf_counter() - started
+    return {
+        "bytes": len(frame),
+        "encode_per_sec": iterations / encode_seconds if encode_seconds else float("inf"),
+        "decode_per_sec": iterations / decode_seconds if decode_seconds else float("inf"),
+    }
+
+
+def run_benchmark(connection_counts: list[int], iterations: int) -> list[dict]:
+    results = []
+    max_bytes = DEFAULT_MAX_FRAME_BYTES * 8
+    for count in connection_counts:
+        payload = build_snapshot(count)
+        variants = {
+            "json": (
+                lambda item: encode_json_frame(item, max_frame_bytes=max_bytes),
+                lambda frame: decode_json_frame(frame[:-1]),
+            )
+        }
+        for codec in available_frame_codecs():
+            variants[f"compact/{codec}"] = (
+                lambda item, codec=codec: encode_compact_frame(item, compression=codec, max_frame_bytes=max_bytes),
+                lambda frame: decode_compact_frame(frame, max_frame_bytes=max_bytes),
+            )
+        for name, (encode, decode) in variants.items():
+            assert decode(encode(payload)) == decode_json_frame(encode_json_frame(payload, max_frame_bytes=max_bytes)[:-1])
+            results.append({"connections": count, "encoding": name, **_measure(encode, decode, payload, iterations)})
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    print(f"{'conns':>6}  {'encoding':<14} {'bytes':>10} {'ratio':>6} {'enc/s':>9} {'dec/s':>9}")
+    baseline: dict[int, int] = {}
+    for row in run_benchmark(args.connections, args.iterations):
+        if row["encoding"] == "json":
+            baseline[row["connections"]] = row["bytes"]
+        ratio = row["bytes"] / baseline[row["connections"]]
+        print(
+            f"{row['connections']:>6}  {row['encoding']:<14} {row['bytes']:>10} {ratio:>6.2f} "
+            f"{row['encode_per_sec']:>9.0f} {row['decode_per_sec']:>9.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Time the NumPy temporal series engine at keys x days scale against the per-row paths."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_engine.history import (  # noqa: E402
+    apply_confidence_decay,
+    apply_confidence_decay_array,
+    build_aging_policy_record,
+)
+from core_engine.telemetry import (  # noqa: E402
+    KeyCountSeries,
+    build_baseline_window_records,
+    build_temporal_series_report,
+)
+
+GENERATED_AT = "2026-02-01T00:00:00+00:00"
+
+
+def build_columns(keys: int, days: int, per_key_day: int, seed: int) -> tuple[list[str], np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    names = [f"destination:asset-{index:05d}" for index in range(keys)]
+    count = keys * days * per_key_day
+    end = int(datetime.fromisoformat(GENERATED_AT).timestamp() * 1_000_000)
+    key_index = rng.integers(0, keys, size=count)
+    micros = end - rng.integers(0, days * 86_400_000_000, size=count)
+    return names, key_index, micros
+
+
+def build_observations(count: int, keys: int, days: int, seed: int) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    end = datetime.fromisoformat(GENERATED_AT)
+    offsets = rng.integers(0, days * 86400, size=count).tolist()
+    key_ids = rng.integers(0, keys, size=count).tolist()
+    return [
+        {
+            "category": "destination",
+            "key": f"asset-{key_id:05d}",
+            "observed_at": (end - timedelta(seconds=offset)).isoformat(),
+        }
+        for key_id, offset in zip(key_ids, offsets)
+    ]
+
+
+def _timed(function):
+    started = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started, result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--per-key-day", type=int, default=6, help="Average observations per key per day")
+    parser.add_argument("--observations", type=int, default=20000, help="Observation dicts for the per-row comparison")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    names, key_index, micros = build_columns(args.keys, args.days, args.per_key_day, args.seed)
+    seconds, series = _timed(lambda: KeyCountSeries.from_arrays(names, key_index, micros, generated_at=GENERATED_AT, days=args.days))
+    print(f"bucket {micros.size} observations into {series.counts.shape[0]} x {series.counts.shape[1]}: {seconds:.3f}s")
+    seconds, report = _timed(lambda: build_temporal_series_report(series))
+    print(f"EWMA, seasonal and window report over {len(series.keys)} keys: {seconds:.3f}s ({report['summary']['anomaly_count']} anomalies)")
+
+    observations = build_observations(args.observations, args.keys, args.days, args.seed)
+    seconds, _series = _timed(lambda: KeyCountSeries.from_observations(observations, generated_at=GENERATED_AT, days=args.days))
+    print(f"{len(observations)} observation dicts -> series: {seconds:.3f}s")
+    seconds, _windows = _timed(lambda: build_baseline_window_records(observations, generated_at=GENERATED_AT))
+    print(f"{len(observations)} observation dicts -> baseline windows (per-row): {seconds:.3f}s")
+
+    policy = build_aging_policy_record(generated_at=GENERATED_AT)
+    rng = np.random.default_rng(args.seed)
+    confidences = rng.random(args.keys * args.days)
+    ages = rng.integers(0, 120, size=confidences.size)
+    seconds, _values = _timed(lambda: [apply_confidence_decay(value, age_days=age, policy=policy) for value, age in zip(confidences.tolist(), ages.tolist())])
+    print(f"decay {confidences.size} confidences per value: {seconds:.3f}s")
+    seconds, _values = _timed(lambda: apply_confidence_decay_array(confidences, age_days=ages, policy=policy))
+    print(f"decay {confidences.size} confidences as arrays: {seconds:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,6 +5,7 @@ import pytest
 from core_engine.history import (
     AgingPolicyError,
     apply_confidence_decay,
+    apply_confidence_decay_array,
     build_aging_policy_record,
     build_baseline_aging_decay_report,
     deterministic_baseline_decay_json,
@@ -198,3 +199,17 @@ def test_apply_confidence_decay_clamps_to_policy_minimum():
     policy = build_aging_policy_record(minimum_confidence=0.2, generated_at=NOW)
 
     assert apply_confidence_decay(0.1, age_days=999, policy=policy, dormant=True) == 0.2
+
+
+def test_array_confidence_decay_matches_scalar_decay():
+    policy = build_aging_policy_record(generated_at=NOW)
+    confidences = [0.0, 0.1234, 0.5, 0.8765, 1.0, 0.3335]
+    ages = [0, 7, 30, 45, 120, 400]
+    dormant = [False, True, False, True, False, True]
+
+    decayed = apply_confidence_decay_array(confidences, age_days=ages, policy=policy, dormant=dormant)
+
+    assert decayed.tolist() == [
+        apply_confidence_decay(value, age_days=age, policy=policy, dormant=flag)
+        for value, age, flag in zip(confidences, ages, dormant)
+    ]
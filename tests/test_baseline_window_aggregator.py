@@ -0,0 +1,124 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from core_engine.telemetry import (
+    DEFAULT_BASELINE_WINDOWS,
+    BaselineWindowAggregator,
+    BaselineWindowError,
+    build_baseline_window_record,
+    build_baseline_window_records,
+    deterministic_baseline_window_json,
+)
+
+
+GENERATED_AT = "2026-01-01T01:00:00+00:00"
+WINDOW_CONFIG = {
+    "short": {"duration_seconds": 120, "max_records": 15},
+    "medium": {"duration_seconds": 600, "max_records": 40},
+    "long": {"duration_seconds": 3600, "max_records": 500},
+}
+
+
+def _observations(count: int, *, start: datetime | None = None, step_seconds: int = 9):
+    start = start or datetime(2026, 1, 1, tzinfo=UTC)
+    rows = []
+    for index in range(count):
+        moment = start + timedelta(seconds=index * step_seconds, microseconds=(index % 3) * 250000)
+        stamp = moment.isoformat()
+        if index % 4 == 0:
+            stamp = stamp.replace("+00:00", "Z")
+        row = {
+            "observed_at": stamp,
+            "category": ("flow", "dns", None)[index % 3],
+            "key": ("alpha", "beta", "gamma", "delta")[index % 4],
+        }
+        if index % 2:
+            row["observation_ref"] = f"obs-{index}"
+        rows.append(row)
+    return rows
+
+
+def test_aggregator_matches_batch_window_records():
+    rows = _observations(420)
+    rows.extend([{"category": "flow"}, {"observed_at": "not-a-time"}, "ignored"])
+
+    aggregator = BaselineWindowAggregator(window_config=WINDOW_CONFIG)
+    aggregator.ingest_many(rows)
+
+    expected = build_baseline_window_records(rows, generated_at=GENERATED_AT, window_config=WINDOW_CONFIG)
+    actual = aggregator.records(generated_at=GENERATED_AT)
+    assert deterministic_baseline_window_json(actual) == deterministic_baseline_window_json(expected)
+    assert actual["windows"]["short"]["dropped_observation_count"] > 0
+    assert actual["input_observation_count"] == 422
+
+
+def test_aggregator_streams_in_order_and_expires_old_buckets():
+    rows = _observations(800, step_seconds=15)
+    aggregator = BaselineWindowAggregator(window_config=WINDOW_CONFIG, bucket_seconds=60)
+    emitted = []
+    for offset in range(0, len(rows), 200):
+        aggregator.ingest_many(rows[offset : offset + 200])
+        generated_at = rows[offset + 199]["observed_at"].replace("Z", "+00:00")
+        emitted.append((offset + 200, generated_at, aggregator.records(generated_at=generated_at)))
+
+    for seen, generated_at, record in emitted:
+        expected = build_baseline_window_records(rows[:seen], generated_at=generated_at, window_config=WINDOW_CONFIG)
+        assert record["windows"] == expected["windows"]
+    assert aggregator.bucket_count <= 3600 // 60 + 1
+
+
+def test_aggregator_bounds_entries_per_bucket():
+    start = datetime(2026, 1, 1, 0, 59, 30, tzinfo=UTC)
+    rows = _observations(300, start=start, step_seconds=0)
+    config = {**WINDOW_CONFIG, "long": {"duration_seconds": 3600, "max_records": 40}}
+    aggregator = BaselineWindowAggregator(window_config=config)
+    aggregator.ingest_many(rows)
+
+    assert [len(bucket.entries) for bucket in aggregator._buckets] == [40]
+    expected = build_baseline_window_records(rows, generated_at=GENERATED_AT, window_config=config)
+    assert aggregator.records(generated_at=GENERATED_AT)["windows"] == expected["windows"]
+
+
+def test_aggregator_rejects_invalid_configuration():
+    with pytest.raises(BaselineWindowError):
+        BaselineWindowAggregator(bucket_seconds=0)
+    with pytest.raises(BaselineWindowError):
+        BaselineWindowAggregator(window_config={"short": {"duration_seconds": 0, "max_records": 1}})
+    with pytest.raises(BaselineWindowError):
+        BaselineWindowAggregator().window_record("hourly", generated_at=GENERATED_AT)
+
+
+def test_partial_window_config_merges_into_default_windows():
+    config = {"custom": {"duration_seconds": 30, "max_records": 5}, "short": {"duration_seconds": 60, "max_records": 3}}
+
+    records = build_baseline_window_records([], generated_at=GENERATED_AT, window_config=config)
+
+    assert sorted(records["windows"]) == ["long", "medium", "short"]
+    assert sorted(BaselineWindowAggregator(window_config=config).windows) == ["long", "medium", "short"]
+    assert records["windows"]["short"]["duration_seconds"] == 60
+    assert records["windows"]["medium"]["duration_seconds"] == DEFAULT_BASELINE_WINDOWS["medium"]["duration_seconds"]
+
+
+def test_out_of_order_input_matches_in_order_input():
+    rows = _observations(600, step_seconds=7)
+    shuffled = rows[1::2] + rows[::2][::-1]
+
+    aggregator = BaselineWindowAggregator(window_config=WINDOW_CONFIG)
+    aggregator.ingest_many(shuffled)
+
+    expected = build_baseline_window_records(rows, generated_at=GENERATED_AT, window_config=WINDOW_CONFIG)
+    assert aggregator.records(generated_at=GENERATED_AT)["windows"] == expected["windows"]
+    assert build_baseline_window_records(shuffled, generated_at=GENERATED_AT, window_config=WINDOW_CONFIG)["windows"] == expected["windows"]
+    indexes = [bucket.index for bucket in aggregator._ordered_buckets()]
+    assert indexes == sorted(indexes)
+
+
+def test_single_window_aggregator_matches_window_record():
+    rows = _observations(200)
+    aggregator = BaselineWindowAggregator.single_window("hourly", duration_seconds=900, max_records=25)
+    aggregator.ingest_many(rows)
+
+    assert list(aggregator.windows) == ["hourly"]
+    expected = build_baseline_window_record(rows, window_name="hourly", duration_seconds=900, max_records=25, generated_at=GENERATED_AT)
+    assert aggregator.window_record("hourly", generated_at=GENERATED_AT) == expected
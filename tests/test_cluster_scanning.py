@@ -2,9 +2,36 @@ import json
 
 import pytest
 
-from core_engine.cluster.job_queue import JobQueue
+from core_engine.cluster.job_queue import ClusterJob, ClusterTask, JobQueue
 from core_engine.cluster.scheduler import plan_distributed_scan
-from core_engine.cluster.worker_registry import WorkerRegistry, worker_from_dict, workers_from_orchestrator_nodes
+from core_engine.cluster.worker_registry import ClusterWorker, WorkerRegistry, worker_from_dict, workers_from_orchestrator_nodes
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _job(job_id: str, task_count: int, *, created_at: float, scan_type: str = "tcp_connect", max_retries: int = 1) -> ClusterJob:
+    return ClusterJob(
+        job_id=job_id,
+        scan_type=scan_type,
+        created_at=created_at,
+        tasks=[
+            ClusterTask(
+                task_id=f"{job_id}-task-{index}",
+                job_id=job_id,
+                targets=[{"address": "127.0.0.1"}],
+                ports=[80 + index],
+                scan_type=scan_type,
+                max_retries=max_retries,
+            )
+            for index in range(task_count)
+        ],
+    )
 
 
 def test_worker_registry_filters_available_workers():
@@ -115,3 +142,128 @@ def test_cluster_payload_is_json_serializable():
     payload = plan_distributed_scan("127.0.0.1", [80], workers=[{"node_id": "worker-a", "status": "ready"}])
 
     assert json.loads(json.dumps(payload))["summary"]["total_probes"] == 1
+
+
+def test_job_queue_assigns_in_creation_order_per_scan_type():
+    queue = JobQueue([_job("job-late", 2, created_at=20.0), _job("job-udp", 1, created_at=5.0, scan_type="udp"), _job("job-early", 2, created_at=10.0)])
+
+    order = [queue.assign_next("worker-a").task_id for _ in range(4)]
+
+    assert order == ["job-early-task-0", "job-early-task-1", "job-late-task-0", "job-late-task-1"]
+    assert queue.assign_next("worker-a") is None
+    assert queue.assign_next("worker-a", scan_type="udp").task_id == "job-udp-task-0"
+    queue.record_result("job-early-task-0", success=False, error="timeout")
+    assert queue.assign_next("worker-b").task_id == "job-early-task-0"
+
+
+def test_job_queue_requeues_expired_leases_until_retries_run_out():
+    clock = FakeClock()
+    queue = JobQueue([_job("job-a", 1, created_at=1.0, max_retries=1)], lease_seconds=30, clock=clock)
+
+    task = queue.assign_next("worker-a")
+    clock.now += 20
+    queue.renew_lease(task.task_id)
+    clock.now += 20
+    assert queue.expire_leases() == []
+    clock.now += 15
+    assert [item.task_id for item in queue.expire_leases()] == [task.task_id]
+    assert task.status == "retry" and task.error == "lease expired"
+
+    assert queue.assign_next("worker-b") is task
+    clock.now += 31
+    assert queue.assign_next("worker-c") is None
+    assert task.status == "failed"
+    assert queue.get("job-a").refresh_status() == "failed"
+
+
+def test_job_queue_weights_assignment_by_capacity_and_steals_stragglers():
+    clock = FakeClock()
+    queue = JobQueue([_job("job-a", 6, created_at=1.0, max_retries=3)], steal_after_seconds=60, clock=clock)
+    workers = [ClusterWorker(node_id="big", max_concurrency=4), ClusterWorker(node_id="small", max_concurrency=2)]
+
+    assignments = queue.assign_to_workers(workers)
+
+    assert {row["worker_id"] for row in assignments} == {"big", "small"}
+    assert queue.in_flight("big") == 4
+    assert queue.in_flight("small") == 2
+    assert queue.assign_next("small", capacity=2) is None
+
+    for row in assignments:
+        if row["worker_id"] == "big":
+            queue.record_result(row["task_id"], success=True, result={"rows": []})
+    clock.now += 61
+    stolen = queue.assign_next("big")
+    assert stolen.assigned_worker == "big"
+    assert queue.in_flight("small") == 1
+    queue.record_result(stolen.task_id, success=False, error="late failure", worker_id="small")
+    assert stolen.status == "assigned"
+
+
+def test_job_queue_replays_durable_log_after_restart(tmp_path):
+    clock = FakeClock()
+    log_path = tmp_path / "cluster" / "jobs.jsonl"
+    queue = JobQueue([_job("job-a", 3, created_at=1.0)], lease_seconds=30, log_path=log_path, clock=clock)
+    first = queue.assign_next("worker-a")
+    second = queue.assign_next("worker-a")
+    queue.record_result(first.task_id, success=True, result={"rows": [{"port": 80}]})
+
+    restored = JobQueue(lease_seconds=30, log_path=log_path, clock=clock)
+
+    assert restored.get_task(first.task_id).status == "completed"
+    assert restored.get_task(second.task_id).status == "assigned"
+    assert restored.assign_next("worker-b").task_id == "job-a-task-2"
+    clock.now += 31
+    restored.expire_leases()
+    assert restored.get_task(second.task_id).status == "retry"
+
+    restored.compact_log()
+    compacted = JobQueue(log_path=log_path, clock=clock)
+    assert compacted.aggregate_results("job-a")["result_count"] == 1
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_job_queue_restart_with_initial_jobs_keeps_replayed_state(tmp_path):
+    clock = FakeClock()
+    log_path = tmp_path / "jobs.jsonl"
+    queue = JobQueue([_job("job-a", 2, created_at=1.0)], log_path=log_path, clock=clock)
+    task = queue.assign_next("worker-a")
+    queue.record_result(task.task_id, success=True, result={"rows": []})
+
+    restarted = JobQueue([_job("job-a", 2, created_at=1.0), _job("job-b", 1, created_at=2.0)], log_path=log_path, clock=clock)
+
+    assert restarted.get_task(task.task_id).status == "completed"
+    assert [job["job_id"] for job in restarted.list_jobs()] == ["job-a", "job-b"]
+    assert restarted.ready_count() == 2
+    again = JobQueue([_job("job-a", 2, created_at=1.0)], log_path=log_path, clock=clock)
+    assert again.get("job-b") is not None
+
+
+def test_job_queue_ignores_reports_for_tasks_that_are_not_in_flight():
+    clock = FakeClock()
+    queue = JobQueue([_job("job-a", 2, created_at=1.0, max_retries=3)], lease_seconds=30, clock=clock)
+    task = queue.assign_next("worker-a")
+    clock.now += 31
+    queue.expire_leases()
+    assert task.status == "retry" and queue.ready_count() == 2
+
+    queue.record_result(task.task_id, success=False, error="late failure", worker_id="worker-a")
+    queue.record_result(task.task_id, success=True, result={"rows": [{"port": 80}]})
+
+    assert task.status == "retry" and task.error == "lease expired" and task.attempts == 1
+    assert queue.ready_count() == 2
+    assert [queue.assign_next("worker-b").task_id for _ in range(2)] == ["job-a-task-0", "job-a-task-1"]
+    assert queue.assign_next("worker-b") is None
+
+
+def test_job_queue_compacts_its_log_automatically(tmp_path):
+    clock = FakeClock()
+    log_path = tmp_path / "jobs.jsonl"
+    queue = JobQueue([_job("job-a", 1, created_at=1.0, max_retries=50)], lease_seconds=30, log_path=log_path, compact_log_after=10, clock=clock)
+    task = queue.get_task("job-a-task-0")
+    for _ in range(20):
+        queue.assign_next("worker-a")
+        queue.record_result(task.task_id, success=False, error="timeout")
+        assert len(log_path.read_text(encoding="utf-8").splitlines()) <= 10
+
+    restored = JobQueue(log_path=log_path, clock=clock)
+    assert restored.get_task(task.task_id).to_dict() == task.to_dict()
@@ -1,8 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import json
+import multiprocessing
 
-from core_engine.vuln.cve_client import analyze_service_cves, fetch_nvd_cves, load_cves_from_json, normalize_cve_record
-from core_engine.vuln.cve_store import load_cve_cache, merge_cve_records, save_cve_cache
-from core_engine.vuln.cvss import advisory_risk_score, severity_from_score
+import pytest
+
+from core_engine.vuln import cve_client
+from core_engine.vuln.cve_client import CVEIndex, analyze_service_cves, fetch_nvd_cves, load_cves_from_json, match_service_to_cves, normalize_cve_record
+from core_engine.vuln import cve_store
+from core_engine.vuln.cve_store import CVEShardStore, cve_index_path, load_cve_cache, load_cve_index, merge_cve_records, save_cve_cache
+from core_engine.vuln.cvss import advisory_risk_score, severity_from_score, severity_rank
 
 
 def _timestamp(date, *parts):
@@ -98,6 +105,131 @@ def test_cve_cache_merges_and_persists_records(tmp_path):
     assert loaded["records"][0]["severity"] == "high"
 
 
+def test_cve_index_matches_per_service_scoring():
+    cves = [
+        NVD_RECORD,
+        {"id": "CVE-2020-0001", "summary": "OpenSSH 8.2 user enumeration"},
+        {"id": "CVE-2020-0002", "summary": "Remote Desktop\nGateway flaw", "cpes": ["cpe:2.3:a:microsoft:rdp:*"]},
+        {"id": "CVE-2020-0003", "summary": "Unrelated library issue in 8.2"},
+        {"id": "", "summary": "ssh without an id"},
+    ]
+    services = [
+        {"port": 22, "state": "open", "service": "ssh", "version": "OpenSSH_8.2p1"},
+        {"port": 2222, "state": "open", "service": "ssh", "version": "OpenSSH_8.2p1"},
+        {"port": 80, "state": "open", "service": "http", "version": "Apache/2.4.49"},
+        {"port": 3389, "state": "open", "service": "rdp"},
+    ]
+
+    for min_confidence in (0.0, 0.25, 0.6):
+        expected = [row for service in services for row in match_service_to_cves(service, cves, min_confidence=min_confidence)]
+        expected.sort(key=lambda item: (-item["risk_score"], -severity_rank(item["severity"]), item["cve_id"]))
+        serial = analyze_service_cves(services, cves, min_confidence=min_confidence)
+        pooled = analyze_service_cves(services, CVEIndex(cves), min_confidence=min_confidence, max_workers=2, chunk_size=1)
+
+        assert serial["matches"] == expected
+        assert pooled["matches"] == expected
+    assert {row["cve_id"] for row in match_service_to_cves(services[0], CVEIndex(cves))} == {"CVE-2020-0001", "CVE-2020-0003", ""}
+
+
+def test_cve_cache_save_writes_index_used_on_load(tmp_path):
+    cache_path = tmp_path / "cve_cache.json"
+    saved = save_cve_cache([NVD_RECORD, {"id": "CVE-2020-0001", "summary": "OpenSSH issue"}], path=cache_path)
+
+    assert saved["index_path"] == str(cve_index_path(cache_path))
+    loaded = load_cve_index(cache_path)
+    assert loaded["index_loaded"] is True
+    report = analyze_service_cves([{"service": "ssh", "state": "open"}], loaded["index"])
+    assert [row["cve_id"] for row in report["matches"]] == ["CVE-2020-0001"]
+
+    payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    payload["records"].append({"id": "CVE-2020-0002", "summary": "ssh daemon crash"})
+    cache_path.write_text(json.dumps(payload), encoding="utf-8")
+    stale = load_cve_index(cache_path)
+    assert stale["index_loaded"] is False
+    assert len(analyze_service_cves([{"service": "ssh"}], stale["index"])["matches"]) == 2
+
+
+def test_cve_shard_store_merges_incrementally_and_reads_lazily(tmp_path):
+    store_path = tmp_path / "cve_store"
+    records = [{"id": f"CVE-2020-{index:04d}", "summary": f"issue {index} in openssh"} for index in range(40)]
+
+    with CVEShardStore(store_path, shard_count=8) as store:
+        first = store.merge(records, metadata={"source": "test"})
+        unchanged = store.merge(records[:5])
+        second = store.merge([{"id": "cve-2020-0003", "severity": "high"}, {"id": "CVE-2021-0001", "summary": "nginx"}])
+
+    assert first["added"] == 40
+    assert unchanged["changed_shards"] == []
+    assert second["added"] == 1 and second["updated"] == 1
+    assert 1 <= len(second["changed_shards"]) <= 2
+
+    loaded = load_cve_cache(store_path)
+    expected = merge_cve_records(records, [{"id": "CVE-2020-0003", "severity": "high"}, {"id": "CVE-2021-0001", "summary": "nginx"}])
+    assert sorted(loaded["records"], key=lambda row: row["id"]) == expected
+    assert loaded["metadata"] == {"source": "test"}
+    with CVEShardStore(store_path) as store:
+        assert store.shard_count == 8
+        assert store.get("cve-2020-0003") == {"id": "CVE-2020-0003", "summary": "issue 3 in openssh", "severity": "high"}
+        assert store.get("CVE-1999-0001") is None
+
+    indexed = load_cve_index(store_path)
+    report = analyze_service_cves([{"service": "ssh", "state": "open"}], indexed["index"])
+    assert report["match_count"] == 40
+    assert report["matches"] == analyze_service_cves([{"service": "ssh", "state": "open"}], expected)["matches"]
+
+
+def test_store_backed_index_scores_in_spawned_workers(tmp_path, monkeypatch):
+    store_path = tmp_path / "cve_store"
+    records = [{"id": f"CVE-2020-{index:04d}", "summary": f"issue {index} in {('openssh', 'nginx', 'postgresql')[index % 3]}"} for index in range(30)]
+    with CVEShardStore(store_path, shard_count=4) as store:
+        store.merge(records)
+    services = [{"service": name, "state": "open"} for name in ("ssh", "nginx", "postgresql")]
+    index = load_cve_index(store_path)["index"]
+    serial = analyze_service_cves(services, index)
+    monkeypatch.setattr(cve_client, "ProcessPoolExecutor", functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")))
+
+    pooled = analyze_service_cves(services, index, max_workers=2, chunk_size=1)
+
+    assert serial["match_count"] == 30
+    assert pooled["matches"] == serial["matches"]
+
+
+def test_cve_caches_keep_search_lines_aligned_and_survive_interrupted_merges(tmp_path, monkeypatch):
+    records = [{"id": f"CVE-2020-{index:04d}", "summary": f"issue {index}\rin\u2028openssh"} for index in range(12)]
+    records.append({"id": "CVE-2020-0100", "summary": "nginx worker crash"})
+    services = [{"service": "nginx", "state": "open"}, {"service": "ssh", "state": "open"}]
+    expected = analyze_service_cves(services, records)["matches"]
+
+    cache_path = tmp_path / "cve_cache.json"
+    save_cve_cache(records, path=cache_path)
+    loaded = load_cve_index(cache_path)
+    assert loaded["index_loaded"] is True
+    assert analyze_service_cves(services, loaded["index"])["matches"] == expected
+
+    store_path = tmp_path / "cve_store"
+    with CVEShardStore(store_path, shard_count=2) as store:
+        store.merge(records)
+        store.merge([{"id": "CVE-2020-0003", "severity": "high"}])
+    updated = merge_cve_records(records, [{"id": "CVE-2020-0003", "severity": "high"}])
+    assert analyze_service_cves(services, load_cve_index(store_path)["index"])["matches"] == analyze_service_cves(services, updated)["matches"]
+
+    write_atomic = cve_store._write_atomic
+
+    def crash_before_manifest(path, data):
+        if path.name == "manifest.json":
+            raise OSError("disk full")
+        write_atomic(path, data)
+
+    with CVEShardStore(store_path) as store:
+        monkeypatch.setattr(cve_store, "_write_atomic", crash_before_manifest)
+        with pytest.raises(OSError):
+            store.merge([{"id": "CVE-2020-0100", "summary": "replaced"}])
+    monkeypatch.undo()
+    with CVEShardStore(store_path) as store:
+        assert store.get("CVE-2020-0100") == records[-1]
+        assert sorted(store.ids()) == sorted(record["id"] for record in records)
+
+
 def test_load_cves_from_json_accepts_nvd_payload():
     payload = json.dumps({"vulnerabilities": [NVD_RECORD]})
 
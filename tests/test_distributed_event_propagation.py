@@ -245,3 +245,30 @@ def test_event_batch_rollup_is_deterministic_and_private_safe():
     assert deterministic_event_propagation_json(batch) == deterministic_event_propagation_json(batch)
     for pattern in PRIVATE_PATTERNS:
         assert not pattern.search(payload)
+
+
+def test_replay_protection_expires_nonces_but_keeps_sequence_high_water():
+    profile, transport, first = _envelope()
+    window = apply_distributed_event_batch(
+        [first],
+        propagation_window={**_window(), "replay_window_seconds": 60},
+        trust_profile=profile,
+        transport_sessions=[transport],
+        generated_at="2026-01-01T00:01:00+00:00",
+    )["propagation_window"]
+    assert window["seen_nonces"] == ["event-nonce-001"]
+    assert window["replay_protection"]["last_sequence_by_node"] == {"node-worker-a": 1}
+
+    _, _, second = _envelope(sequence=2, nonce="event-nonce-002", event_id="evt-sanitized-002", issued_at="2026-01-01T00:03:00+00:00")
+    later = apply_distributed_event_batch(
+        [second, first],
+        propagation_window=window,
+        trust_profile=profile,
+        transport_sessions=[transport],
+        generated_at="2026-01-01T00:03:30+00:00",
+    )
+
+    assert later["summary"]["accepted_event_count"] == 1
+    assert later["propagation_window"]["seen_nonces"] == ["event-nonce-002"]
+    assert "sequence is not greater" in later["rejected_events"][0]["classification_reason"]
+    assert [row[1] for row in later["propagation_window"]["replay_protection"]["buckets"]] == [["event-nonce-002"]]
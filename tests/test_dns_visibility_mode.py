@@ -1,9 +1,12 @@
 import re
 
 from core_engine.telemetry import (
+    StreamingDnsFlowCorrelator,
     build_dns_query_record,
+    build_dns_response_record,
     build_dns_visibility_report,
     build_packet_ingestion_window,
+    correlate_domains_to_flows,
     deterministic_dns_correlation_json,
     deterministic_dns_visibility_json,
     enrich_flow_records,
@@ -207,3 +210,85 @@ def test_dns_visibility_serialization_is_deterministic_and_private_safe():
     for pattern in PRIVATE_PATTERNS:
         assert not pattern.search(visibility_json)
         assert not pattern.search(correlation_json)
+
+
+def test_domain_flow_correlation_uses_endpoint_index_for_many_responses():
+    flows = _flows()
+    responses = [build_dns_response_record(row, generated_at=GENERATED_AT) for row in _responses()]
+    responses.append(
+        build_dns_response_record(
+            {
+                "query_id": "q-3",
+                "query_name": "alias.example.test",
+                "timestamp": "2026-01-01T00:00:02+00:00",
+                "answers": [{"answer_type": "A", "value": "198.51.100.20"}, {"answer_type": "A", "value": "198.51.100.53"}],
+            },
+            generated_at=GENERATED_AT,
+        )
+    )
+
+    records = correlate_domains_to_flows(responses=responses, enriched_flows=flows, generated_at=GENERATED_AT)
+
+    by_name = {row["query_name"]: row for row in records}
+    assert by_name["missing.example.test"]["status"] == "unmatched"
+    assert len(by_name["service.example.test"]["matched_flow_refs"]) == 1
+    assert len(by_name["alias.example.test"]["matched_flow_refs"]) == 2
+    assert [row["query_name"] for row in records] == sorted(row["query_name"] for row in records)
+
+
+def test_streaming_dns_correlator_tags_flows_within_answer_ttl():
+    flows = _flows()
+    responses = [build_dns_response_record(row, generated_at=GENERATED_AT) for row in _responses()]
+    correlator = StreamingDnsFlowCorrelator(default_ttl_seconds=30)
+    for response in responses:
+        correlator.observe_response(response)
+    assert correlator.cached_answer_count == 1
+
+    tags = [correlator.observe_flow(flow, observed_at="2026-01-01T00:00:05+00:00") for flow in flows]
+    assert ["service.example.test"] in tags
+
+    live = correlator.correlations(generated_at=GENERATED_AT)
+    batch = correlate_domains_to_flows(responses=responses[:1], enriched_flows=flows, generated_at=GENERATED_AT)
+    assert live == batch
+
+    finished = correlator.expire("2026-01-01T00:05:00+00:00")
+    assert sorted(row["query_name"] for row in finished) == ["missing.example.test", "service.example.test"]
+    assert correlator.cached_answer_count == 0
+    assert all(correlator.observe_flow(flow, observed_at="2026-01-01T00:05:01+00:00") == [] for flow in flows)
+
+
+def test_streaming_dns_correlator_bounds_cached_answers():
+    correlator = StreamingDnsFlowCorrelator(max_entries=3)
+    for index in range(6):
+        correlator.observe_response(
+            build_dns_response_record(
+                {
+                    "query_id": f"q-{index}",
+                    "query_name": f"host{index}.example.test",
+                    "timestamp": "2026-01-01T00:00:00+00:00",
+                    "answers": [{"answer_type": "A", "value": f"198.51.100.{index + 1}", "ttl": 60 + index}],
+                },
+                generated_at=GENERATED_AT,
+            )
+        )
+
+    assert correlator.cached_answer_count == 3
+    evicted = correlator.expire("2026-01-01T00:00:00+00:00")
+    assert [row["query_name"] for row in evicted] == ["host0.example.test", "host1.example.test", "host2.example.test"]
+
+
+def test_streaming_dns_correlator_tolerates_malformed_ttls_and_missing_timestamps():
+    correlator = StreamingDnsFlowCorrelator(default_ttl_seconds=30)
+    response = {
+        "response_record_id": "response-1",
+        "query_name": "service.example.test",
+        "timestamp": "2026-01-01T00:00:00+00:00",
+        "answers": [{"value": "198.51.100.7", "ttl": "soon"}, {"value": "198.51.100.8", "ttl": [60]}],
+    }
+
+    assert correlator.observe_response(response) == 2
+    flow = {"flow_ref": "flow-1", "responder": {"ip": "198.51.100.7"}}
+    assert correlator.observe_flow(flow) == ["service.example.test"]
+    assert correlator.observe_flow(flow, observed_at="2026-01-01T00:00:29+00:00") == ["service.example.test"]
+    assert correlator.observe_flow({**flow, "last_seen": "not-a-time"}) == ["service.example.test"]
+    assert correlator.observe_flow(flow, observed_at="2026-01-01T00:00:31+00:00") == []
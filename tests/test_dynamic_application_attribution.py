@@ -8,6 +8,7 @@ from core_engine.attribution import (
     append_learning_profile_history,
     build_application_attribution_report,
     build_behavior_graph_model,
+    build_behavior_graph_models,
     build_behavioral_signature_record,
     build_learning_profile,
     build_learning_profile_history,
@@ -3463,3 +3464,92 @@ def test_listener_ai_context_preserves_nullable_flow_identity():
     assert context["flow_key"] == "-"
     assert context["identity_scope"] == "listener"
     assert record["behavior_graph"]["summary"]["related_flow"] == "-"
+
+
+def _batch_graph_inputs():
+    observations = [
+        {
+            "node_id": f"asset-{index % 5}",
+            "service_name": ("frontend", "backend", "cache")[index % 3],
+            "protocol": "tcp",
+            "port": 440 + index % 6,
+            "source_mode": "live",
+            **({"flow_id": f"own-flow-{index}"} if index % 4 == 0 else {}),
+        }
+        for index in range(24)
+    ]
+    flows = [
+        {"flow_id": f"flow-{index}", "source_asset": f"asset-{index % 7}", "destination_asset": f"asset-{(index * 3) % 7}"}
+        for index in range(40)
+    ] + ["not-a-flow"]
+    findings = [
+        {"port": 440 + index % 9, "service_name": ("frontend", "db")[index % 2], "finding": f"finding-{index}"}
+        for index in range(30)
+    ]
+    peers = [{"originating_node_id": "peer-a", "intelligence_category": "service_metadata", "subject": "frontend", "value": "web", "confidence": 0.6}]
+    classifiers = [{"top_classification": "nginx", "confidence": 0.7} if index % 2 else None for index in range(len(observations))]
+    return observations, flows, findings, peers, classifiers
+
+
+def test_batch_behavior_graphs_match_single_observation_path():
+    observations, flows, findings, peers, classifiers = _batch_graph_inputs()
+    expected = [
+        build_behavior_graph_model(
+            observation,
+            classification_model=classifier,
+            flows=flows,
+            findings=findings,
+            federated_intelligence=peers,
+            generated_at=FIXED_TIME,
+        )
+        for observation, classifier in zip(observations, classifiers)
+    ]
+
+    batch = build_behavior_graph_models(
+        iter(observations),
+        classification_models=classifiers,
+        flows=iter(flows),
+        findings=iter(findings),
+        federated_intelligence=iter(peers),
+        generated_at=FIXED_TIME,
+    )
+
+    assert [deterministic_behavior_graph_json(row) for row in batch] == [deterministic_behavior_graph_json(row) for row in expected]
+    assert any(edge["metadata"].get("flow_reference") == "finding-0" for edge in batch[0]["edges"])
+
+
+def test_behavior_graphs_keep_every_shared_peer_row():
+    observation = {"node_id": "asset-1", "service_name": "nginx", "protocol": "tcp", "port": 443, "source_mode": "live"}
+    peers = [
+        {"originating_node_id": "peer-a", "subject": "nginx", "value": "web", "confidence": 0.6},
+        {"originating_node_id": "peer-b", "subject": "postgres", "asset_id": "asset-9", "port": 5432, "value": "database", "confidence": 0.5},
+    ]
+
+    single = build_behavior_graph_model(observation, federated_intelligence=peers, generated_at=FIXED_TIME)
+    batch = build_behavior_graph_models([observation, observation], federated_intelligence=peers, generated_at=FIXED_TIME)
+
+    objects = single["federated_intelligence"]["objects"]
+    assert len(objects) == 3
+    assert {row["originating_node_id"] for row in objects} >= {"peer-a", "peer-b"}
+    assert [deterministic_behavior_graph_json(row) for row in batch] == [deterministic_behavior_graph_json(single)] * 2
+    batch[0]["federated_intelligence"]["objects"][1]["metadata"]["note"] = "edited"
+    assert "note" not in batch[1]["federated_intelligence"]["objects"][1]["metadata"]
+
+
+def test_batch_behavior_graphs_use_process_pool_in_chunks():
+    observations, flows, findings, peers, classifiers = _batch_graph_inputs()
+    inline = build_behavior_graph_models(observations, classification_models=classifiers, flows=flows, findings=findings, federated_intelligence=peers, generated_at=FIXED_TIME)
+    pooled = build_behavior_graph_models(
+        observations,
+        classification_models=classifiers,
+        flows=flows,
+        findings=findings,
+        federated_intelligence=peers,
+        generated_at=FIXED_TIME,
+        max_workers=2,
+        chunk_size=5,
+    )
+
+    assert [deterministic_behavior_graph_json(row) for row in pooled] == [deterministic_behavior_graph_json(row) for row in inline]
+    with pytest.raises(ValueError):
+        build_behavior_graph_models(observations, chunk_size=0)
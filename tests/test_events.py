@@ -1,10 +1,17 @@
+import json
+import threading
+import time
+
 import pytest
 
 from core_engine.events import (
     EventValidationError,
+    LocalEvent,
     LocalEventBus,
     LocalEventQueue,
+    SegmentedEventLog,
     create_event,
+    create_events,
     event_from_dict,
     event_from_json,
     event_to_dict,
@@ -128,3 +135,217 @@ def test_bus_replay_uses_history_without_external_transport():
 
     assert [event.message for event in replayed] == ["Second", "Third"]
     assert all(result.ok for result in results)
+
+
+def test_bus_async_subscriber_does_not_block_publisher_and_reports_metrics():
+    release = threading.Event()
+    received = []
+    bus = LocalEventBus(history_limit=2)
+
+    def slow_handler(event):
+        release.wait(5)
+        received.append(event)
+
+    async_id = bus.subscribe(slow_handler, mode="async", max_pending=10)
+    sync_received = []
+    bus.subscribe(sync_received.append, event_type="flow_observed")
+    events = [create_event("flow_observed", source="flows", message=f"Flow {index}") for index in range(3)]
+
+    results = [bus.publish(event) for event in events]
+
+    assert all(result[0].queued and result[0].ok for result in results)
+    assert sync_received == events
+    lagging = {item["subscription_id"]: item for item in bus.subscriber_metrics()}[async_id]
+    assert lagging["lag"] == 3
+    release.set()
+    assert bus.close(timeout=5) is True
+    assert received == events
+    metrics = {item["subscription_id"]: item for item in bus.subscriber_metrics()}[async_id]
+    assert metrics["lag"] == 0
+    assert metrics["delivered"] == 3
+    assert metrics["max_latency_ms"] > 0
+    assert [event.message for event in bus.history] == ["Flow 1", "Flow 2"]
+
+
+def test_bus_async_overflow_drop_and_spill_policies(tmp_path):
+    release = threading.Event()
+    dropped_received = []
+    spilled_received = []
+    bus = LocalEventBus(spill_dir=tmp_path)
+
+    def gated(target):
+        def handler(event):
+            release.wait(5)
+            target.append(event)
+
+        return handler
+
+    drop_id = bus.subscribe(gated(dropped_received), mode="async", max_pending=1, overflow="drop")
+    spill_id = bus.subscribe(gated(spilled_received), mode="async", max_pending=1, overflow="spill")
+    events = [create_event("system_notice", source="runtime", message=f"Notice {index}") for index in range(5)]
+    for event in events:
+        bus.publish(event)
+        time.sleep(0.01)
+
+    assert len(list(tmp_path.glob(f"*-{spill_id}.spill.jsonl"))) == 1
+    release.set()
+    assert bus.close(timeout=5) is True
+
+    metrics = {item["subscription_id"]: item for item in bus.subscriber_metrics()}
+    assert metrics[drop_id]["dropped"] == len(events) - len(dropped_received)
+    assert metrics[drop_id]["dropped"] >= 1
+    assert spilled_received == events
+    assert metrics[spill_id]["spilled"] >= 1
+    assert metrics[spill_id]["dropped"] == 0
+
+
+def test_buses_sharing_a_spill_dir_keep_their_own_backlogs(tmp_path):
+    stale = create_event("system_notice", source="runtime", message="Stale notice")
+    leftover = tmp_path / "sub-1.spill.jsonl"
+    leftover.write_text(f"0.0\t{event_to_json(stale)}\n", encoding="utf-8")
+    release = threading.Event()
+    received = {"first": [], "second": []}
+
+    def gated(target):
+        def handler(event):
+            release.wait(5)
+            target.append(event)
+
+        return handler
+
+    first = LocalEventBus(spill_dir=tmp_path)
+    first.subscribe(gated(received["first"]), mode="async", max_pending=1, overflow="spill")
+    first_events = [create_event("system_notice", source="runtime", message=f"First {index}") for index in range(4)]
+    for event in first_events:
+        first.publish(event)
+        time.sleep(0.01)
+    assert len(list(tmp_path.glob("*.spill.jsonl"))) == 2
+
+    second = LocalEventBus(spill_dir=tmp_path)
+    second.subscribe(gated(received["second"]), mode="async", max_pending=1, overflow="spill")
+    second_events = [create_event("system_notice", source="runtime", message=f"Second {index}") for index in range(4)]
+    for event in second_events:
+        second.publish(event)
+        time.sleep(0.01)
+    release.set()
+    assert first.close(timeout=5) is True
+    assert second.close(timeout=5) is True
+
+    assert received == {"first": first_events, "second": second_events}
+    assert list(tmp_path.glob("*.spill.jsonl")) == [leftover]
+
+
+def test_bus_rejects_invalid_async_options():
+    bus = LocalEventBus()
+
+    with pytest.raises(EventValidationError):
+        bus.subscribe(print, mode="threaded")
+    with pytest.raises(EventValidationError):
+        bus.subscribe(print, mode="async", overflow="spill")
+
+
+def _log_event(index):
+    return LocalEvent(
+        event_type="flow_observed",
+        severity="info",
+        source="flows",
+        message=f"Flow {index}",
+        timestamp=f"2026-05-10T12:{index // 60:02d}:{index % 60:02d}+00:00",
+    )
+
+
+def test_event_log_rolls_segments_and_seeks_by_offset_and_time(tmp_path):
+    now = [1000.0]
+    log = SegmentedEventLog(tmp_path, segment_max_bytes=2048, segment_max_age=60, index_interval_bytes=512, clock=lambda: now[0])
+    events = [_log_event(index) for index in range(40)]
+    offsets = log.append_many(events[:30])
+    now[0] += 61
+    offsets += [log.append(event) for event in events[30:]]
+
+    segments = log.segments()
+    assert offsets == list(range(40))
+    assert len(segments) > 2
+    assert all(segment["bytes"] <= 2048 for segment in segments)
+    assert any(segment["index_entries"] > 1 for segment in segments)
+    assert 30 in [segment["base_offset"] for segment in segments]
+    assert [event for _offset, event in log.read(17, limit=5)] == events[17:22]
+    assert [offset for offset, _event in log.read(since="2026-05-10T12:00:33+00:00")] == list(range(33, 40))
+    assert log.read(40) == []
+
+
+def test_event_log_consumer_groups_recover_after_restart(tmp_path):
+    log = SegmentedEventLog(tmp_path, segment_max_bytes=1024, index_interval_bytes=256)
+    events = [_log_event(index) for index in range(12)]
+    log.append_many(events)
+    batch = log.poll("storage", limit=5)
+    log.commit("storage", batch[-1][0] + 1)
+    log.close()
+    active = sorted(tmp_path.glob("*.log"))[-1]
+    with active.open("ab") as handle:
+        handle.write(b'{"event_id": "torn')
+
+    reopened = SegmentedEventLog(tmp_path, segment_max_bytes=1024, index_interval_bytes=256)
+    assert reopened.next_offset == 12
+    assert reopened.committed("storage") == 5
+    assert [event for _offset, event in reopened.poll("storage")] == events[5:]
+    assert reopened.poll("correlation", limit=1)[0][1] == events[0]
+    assert reopened.append(_log_event(12)) == 12
+    assert reopened.consumer_lag() == {"storage": 8}
+
+    retention = reopened.apply_retention(max_segments=2)
+    assert retention["deleted_events"] > 0
+    assert reopened.start_offset == retention["start_offset"] > 0
+    assert reopened.poll("correlation", limit=1)[0][0] == reopened.start_offset
+    assert len(reopened.segments()) == 2
+
+
+def test_bus_appends_to_event_log_and_replays_from_offset(tmp_path):
+    log = SegmentedEventLog(tmp_path)
+    bus = LocalEventBus(history_limit=1, event_log=log)
+    events = [_log_event(index) for index in range(3)]
+    for event in events:
+        bus.publish(event)
+    replayed = []
+
+    results = bus.replay(replayed.append, from_offset=1)
+
+    assert replayed == events[1:]
+    assert all(result.ok for result in results)
+    with pytest.raises(EventValidationError):
+        LocalEventBus().replay(since="2026-05-10T12:00:00+00:00")
+
+
+def test_create_events_validates_batch_and_shares_timestamp():
+    rows = [
+        {"event_type": "asset_observed", "source": "visibility", "message": "Asset", "asset_ref": "asset-sample-001"},
+        {"event_type": "flow_observed", "severity": "high", "source": "flows", "message": "Flow", "metadata": {"sample": True}},
+    ]
+
+    events = create_events(rows)
+
+    assert [event.event_type for event in events] == ["asset_observed", "flow_observed"]
+    assert events[0].timestamp == events[1].timestamp
+    assert events[0].event_id != events[1].event_id
+    assert events[1].metadata == {"sample": True}
+    assert event_from_json(event_to_json(events[0])) == events[0]
+    assert event_to_dict(events[1]) == event_to_dict(create_event(**rows[1])) | {"event_id": events[1].event_id, "timestamp": events[1].timestamp}
+    with pytest.raises(EventValidationError, match=r"events\[1\]: unsupported severity"):
+        create_events([rows[0], {**rows[1], "severity": "urgent"}])
+    with pytest.raises(EventValidationError, match=r"events\[0\]: message must be"):
+        create_events([{**rows[0], "message": " "}])
+    with pytest.raises(EventValidationError, match="unknown event fields"):
+        create_events([{**rows[0], "timestamp": "now"}])
+    assert create_events([{**rows[0], "metadata": []}])[0].metadata == create_event(**rows[0], metadata=[]).metadata == {}
+    with pytest.raises(EventValidationError, match=r"events\[0\]: metadata must be an object"):
+        create_events([{**rows[0], "metadata": ["sample"]}])
+
+
+def test_event_json_is_encoded_once_and_reused():
+    event = create_event("system_notice", source="runtime", message="Notice")
+
+    encoded = event_to_json(event)
+
+    assert event_to_json(event) is encoded
+    assert json.loads(encoded) == event_to_dict(event)
+    with pytest.raises(EventValidationError, match="unknown event fields"):
+        event_from_dict({**event_to_dict(event), "_json": encoded})
@@ -0,0 +1,160 @@
+import pytest
+
+from core_engine.federation import (
+    AntiEntropyError,
+    LocalAntiEntropyPeer,
+    build_approved_peer_record,
+    build_cluster_state_merkle_tree,
+    build_local_node_trust_profile,
+    cluster_state_from_merkle_tree,
+    create_trusted_transport_session,
+    run_anti_entropy_sync,
+)
+from core_engine.nodes import create_node_capabilities, create_node_identity
+
+
+GENERATED_AT = "2026-01-01T00:00:00+00:00"
+SYNC_AT = "2026-01-01T00:01:00+00:00"
+
+
+def _node(node_id, role):
+    identity = create_node_identity(role=role, node_id=node_id, now=GENERATED_AT)
+    capabilities = create_node_capabilities(
+        node_id=node_id,
+        role=role,
+        platform="linux",
+        architecture="x86_64",
+        supported_features=["runtime", "topology", "federation"],
+    )
+    return {
+        "node_id": node_id,
+        "node_label": f"{role}-node",
+        "role": role,
+        "identity": identity.to_dict(),
+        "capabilities": capabilities.to_dict(),
+        "source_refs": [f"node-summary:{node_id}"],
+    }
+
+
+def _transport(**overrides):
+    peer = build_approved_peer_record(
+        _node("node-master", "master"),
+        trust_scope_labels=["topology-summary"],
+        allowed_transport_modes=["local-file"],
+        approved_at=GENERATED_AT,
+        expires_at="2026-01-01T01:00:00+00:00",
+    )
+    profile = build_local_node_trust_profile(
+        _node("node-worker-a", "worker"),
+        approved_peers=[peer],
+        trust_scope_labels=["topology-summary"],
+        created_at=GENERATED_AT,
+        replay_window_seconds=300,
+    )
+    return create_trusted_transport_session(
+        source_node=_node("node-worker-a", "worker"),
+        destination_node=_node("node-master", "master"),
+        trust_profile=profile,
+        transport_mode="local-file",
+        trust_scope_label="topology-summary",
+        started_at=GENERATED_AT,
+        **overrides,
+    )
+
+
+def _state(count, *, updated_at="2026-01-01T00:00:10+00:00"):
+    return {
+        "assets": [{"asset_id": f"asset-{index}", "label": f"host-{index}", "updated_at": updated_at} for index in range(count)],
+        "services": [{"service_id": f"svc-{index}", "port": 1000 + index, "updated_at": updated_at} for index in range(count)],
+        "edges": [{"edge_id": f"edge-{index}", "source": f"asset-{index}", "target": f"svc-{index}", "updated_at": updated_at} for index in range(count)],
+        "findings": [{"finding_id": f"finding-{index}", "severity": "low", "updated_at": updated_at} for index in range(count // 10)],
+    }
+
+
+def test_identical_state_exchanges_only_root_hash():
+    local = build_cluster_state_merkle_tree(_state(200))
+    remote = LocalAntiEntropyPeer("node-master", build_cluster_state_merkle_tree(_state(200)))
+
+    result = run_anti_entropy_sync(local, remote, transport_session=_transport(), generated_at=SYNC_AT)
+
+    assert result["summary"]["in_sync_before"] is True
+    assert result["summary"]["round_trip_count"] == 1
+    assert result["summary"]["converged"] is True
+
+
+def test_drifted_peers_transfer_only_differing_leaves_and_converge():
+    local_state = _state(500)
+    remote_state = _state(500)
+    remote_state["assets"][7] = {**remote_state["assets"][7], "label": "renamed", "updated_at": "2026-01-01T00:00:20+00:00"}
+    remote_state["findings"].append({"finding_id": "finding-new", "severity": "high", "updated_at": "2026-01-01T00:00:30+00:00"})
+    local_state["services"][3] = {**local_state["services"][3], "port": 8443, "updated_at": "2026-01-01T00:00:40+00:00"}
+    local = build_cluster_state_merkle_tree(local_state)
+    remote = LocalAntiEntropyPeer("node-master", build_cluster_state_merkle_tree(remote_state))
+    local.delete("edges", "edge-9", deleted_at="2026-01-01T00:00:50+00:00")
+
+    result = run_anti_entropy_sync(local, remote, transport_session=_transport(), generated_at=SYNC_AT)
+
+    summary = result["summary"]
+    assert summary["converged"] is True
+    assert summary["pulled_record_count"] == 2
+    assert summary["pushed_record_count"] == 2
+    assert summary["differing_bucket_count"] == 4
+    assert summary["round_trip_count"] <= 3 + 4
+    assert summary["bytes_sent"] + summary["bytes_received"] < 20000
+    merged = cluster_state_from_merkle_tree(local)
+    assert merged == cluster_state_from_merkle_tree(remote.tree)
+    assert {"finding_id": "finding-new", "severity": "high", "updated_at": "2026-01-01T00:00:30+00:00"} in merged["findings"]
+    assert all(row["edge_id"] != "edge-9" for row in merged["edges"])
+    assert next(row for row in merged["services"] if row["service_id"] == "svc-3")["port"] == 8443
+
+    again = run_anti_entropy_sync(local, remote, transport_session=_transport(), generated_at=SYNC_AT)
+    assert again["summary"]["round_trip_count"] == 1
+
+
+class _WireOnlyPeer:
+    """Reaches the peer only through ``handle``, like a real transport."""
+
+    def __init__(self, peer):
+        self.handle = peer.handle
+
+
+def test_sync_reads_the_remote_root_only_through_the_exchange():
+    local_state = _state(50)
+    remote_state = _state(50)
+    local_state["assets"][2] = {**local_state["assets"][2], "label": "renamed", "updated_at": "2026-01-01T00:00:20+00:00"}
+    remote_state["assets"][4] = {**remote_state["assets"][4], "label": "moved", "updated_at": "2026-01-01T00:00:30+00:00"}
+    local = build_cluster_state_merkle_tree(local_state)
+    remote = LocalAntiEntropyPeer("node-master", build_cluster_state_merkle_tree(remote_state))
+
+    result = run_anti_entropy_sync(local, _WireOnlyPeer(remote), transport_session=_transport(), generated_at=SYNC_AT)
+
+    assert result["summary"]["converged"] is True
+    assert result["summary"]["pushed_record_count"] == 1
+    assert result["destination_node_id"] == "node-master"
+    assert local.root_hash() == remote.tree.root_hash()
+    shallow = LocalAntiEntropyPeer("node-master", build_cluster_state_merkle_tree(remote_state, depth=local.depth - 1))
+    with pytest.raises(AntiEntropyError, match="same Merkle depth"):
+        run_anti_entropy_sync(local, _WireOnlyPeer(shallow), transport_session=_transport(), generated_at=SYNC_AT)
+
+
+def test_last_writer_wins_is_symmetric():
+    older = {"asset_id": "asset-1", "label": "old", "updated_at": "2026-01-01T00:00:01+00:00"}
+    newer = {"asset_id": "asset-1", "label": "new", "updated_at": "2026-01-01T00:00:02+00:00"}
+    local = build_cluster_state_merkle_tree({"assets": [newer]})
+    remote = LocalAntiEntropyPeer("node-master", build_cluster_state_merkle_tree({"assets": [older]}))
+
+    result = run_anti_entropy_sync(local, remote, transport_session=_transport(), generated_at=SYNC_AT)
+
+    assert result["summary"]["pulled_record_count"] == 0
+    assert result["summary"]["pushed_record_count"] == 1
+    assert remote.tree.records("assets") == [newer]
+
+
+def test_anti_entropy_rejects_inactive_or_misaddressed_sessions():
+    local = build_cluster_state_merkle_tree(_state(5))
+    with pytest.raises(AntiEntropyError, match="not active"):
+        run_anti_entropy_sync(local, LocalAntiEntropyPeer("node-master", build_cluster_state_merkle_tree({})), transport_session=_transport(status="closed"), generated_at=SYNC_AT)
+    with pytest.raises(AntiEntropyError, match="not addressed"):
+        run_anti_entropy_sync(local, LocalAntiEntropyPeer("node-other", build_cluster_state_merkle_tree({})), transport_session=_transport(), generated_at=SYNC_AT)
+    with pytest.raises(AntiEntropyError):
+        build_cluster_state_merkle_tree({"assets": [{"label": "missing id"}]})
@@ -0,0 +1,50 @@
+import pytest
+
+from core_engine.federation import ReplayProtectionCache, ReplayProtectionError, store_replay_protection
+
+
+def test_cache_membership_expires_by_bucket():
+    cache = ReplayProtectionCache(replay_window_seconds=300, bucket_count=10)
+    assert cache.add_nonce("n-1", observed_at="2026-01-01T00:00:05Z")
+    assert not cache.add_nonce("n-1", observed_at="2026-01-01T00:00:06Z")
+    cache.add_nonce("n-2", observed_at="2026-01-01T00:00:45+00:00")
+
+    assert "n-1" in cache and len(cache) == 2
+    assert cache.expire("2026-01-01T00:05:29+00:00") == 0
+    assert cache.expire("2026-01-01T00:05:30+00:00") == 1
+    assert "n-1" not in cache and "n-2" in cache
+    assert cache.sorted_nonces() == ["n-2"]
+
+
+def test_cache_tracks_sequence_high_water_and_round_trips():
+    cache = ReplayProtectionCache(replay_window_seconds=120, last_sequence_by_node={"node-a": 4})
+    cache.record("node-a", 3, "n-3", observed_at="2026-01-01T00:00:00+00:00")
+    cache.record("node-b", 7, "n-7", observed_at="2026-01-01T00:00:40+00:00")
+
+    assert cache.last_sequence_by_node == {"node-a": 4, "node-b": 7}
+    assert not cache.sequence_is_fresh("node-a", 4)
+    assert cache.sequence_is_fresh("node-c", 0)
+
+    restored = ReplayProtectionCache.from_dict(cache.to_dict())
+    assert restored.to_dict() == cache.to_dict()
+    assert restored.to_dict()["buckets"] == [[147268800, ["n-3"]], [147268803, ["n-7"]]]
+
+
+def test_cache_loads_legacy_window_and_stores_compact_form():
+    window = {"replay_window_seconds": 60, "seen_nonces": ["legacy"], "last_sequence_by_node": {"node-a": 2}}
+    cache = ReplayProtectionCache.from_window(window, observed_at="2026-01-01T00:00:00+00:00")
+    cache.record("node-a", 3, "fresh", observed_at="2026-01-01T00:00:30+00:00")
+    store_replay_protection(window, cache, now="2026-01-01T00:01:10+00:00")
+
+    assert window["seen_nonces"] == ["fresh"]
+    assert window["replay_protection"]["last_sequence_by_node"] == {"node-a": 3}
+    assert ReplayProtectionCache.from_window(window).sorted_nonces() == ["fresh"]
+
+
+def test_cache_rejects_malformed_state():
+    with pytest.raises(ReplayProtectionError):
+        ReplayProtectionCache(replay_window_seconds=0)
+    with pytest.raises(ReplayProtectionError):
+        ReplayProtectionCache.from_dict({"replay_window_seconds": 60, "bucket_seconds": 6, "buckets": [["bad"]]})
+    with pytest.raises(ReplayProtectionError):
+        ReplayProtectionCache().add_nonce("n", observed_at="yesterday")
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import threading
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -4150,3 +4151,95 @@ def test_queue_command_posts_to_orchestrator(monkeypatch, tmp_path):
 
     assert calls["url"].endswith("/commands")
     assert calls["data"]["node_id"] == "node-1"
+
+
+def test_refresh_source_tracker_skips_unchanged_signatures():
+    tracker = gui_app.RefreshSourceTracker()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [len(calls)]
+
+    timings = {}
+    assert tracker.load("remediation", ("sig", 1), loader, timings=timings) == ([1], True)
+    assert "remediation" in timings
+    timings = {}
+    assert tracker.load("remediation", ("sig", 1), loader, timings=timings) == ([1], False)
+    assert timings == {}
+    assert tracker.load("remediation", ("sig", 2), loader) == ([2], True)
+    assert len(calls) == 2
+
+
+def test_collect_refresh_snapshot_reloads_only_changed_sources(monkeypatch, tmp_path):
+    remediation_log = tmp_path / "remediation.jsonl"
+    remediation_log.write_text(json.dumps({"program": "nginx", "port": 443, "action": "monitor"}) + "\n")
+    monkeypatch.setattr(gui_app, "ORCHESTRATOR_STATE", tmp_path / "state.json")
+    monkeypatch.setattr(gui_app, "MASTER_LOG", tmp_path / "master.log")
+    monkeypatch.setattr(gui_app, "MASTER_EVENTS_LOG", tmp_path / "master_events.log")
+    monkeypatch.setattr(gui_app, "REMEDIATION_LOG", remediation_log)
+    monkeypatch.setattr(gui_app, "COMMAND_AUDIT_LOG", tmp_path / "command_events.jsonl")
+    monkeypatch.setattr(gui_app, "FLOW_EVENTS_LOG", tmp_path / "flow_events.jsonl")
+    dashboard = gui_app.PortMapDashboard()
+    dashboard.export_dir = tmp_path / "exports"
+    dashboard.runtime_settings = {}
+
+    first = dashboard._collect_refresh_snapshot()
+    assert "remediation_events" in first.changed
+    assert first.data["remediation_events"][0]["program"] == "nginx"
+
+    second = dashboard._collect_refresh_snapshot()
+    assert second.changed == frozenset()
+    assert "remediation_events" not in second.timings
+    assert second.unchanged > 0
+
+    with remediation_log.open("a") as handle:
+        handle.write(json.dumps({"program": "sshd", "port": 22, "action": "review"}) + "\n")
+    third = dashboard._collect_refresh_snapshot()
+    assert {"remediation_events", "scan_results", "risk_timeline"} <= third.changed
+    assert "nodes" not in third.changed
+    assert [event["program"] for event in third.data["remediation_events"]] == ["nginx", "sshd"]
+
+
+def test_format_refresh_timings_lists_slowest_sources():
+    text = gui_app._format_refresh_timings(
+        {"nodes": 0.2, "remediation_events": 12.5, "orchestrator_health": 4.0},
+        unchanged=3,
+        limit=2,
+    )
+
+    assert text == "Refresh loads - remediation_events 12.5ms, orchestrator_health 4.0ms (3 unchanged)"
+    assert gui_app._format_refresh_timings({}) == ""
+
+
+def test_dashboard_refresh_runs_loaders_off_the_event_loop(monkeypatch, tmp_path):
+    monkeypatch.setattr(gui_app, "ORCHESTRATOR_STATE", tmp_path / "state.json")
+    monkeypatch.setattr(gui_app, "MASTER_LOG", tmp_path / "master.log")
+    monkeypatch.setattr(gui_app, "MASTER_EVENTS_LOG", tmp_path / "master_events.log")
+    monkeypatch.setattr(gui_app, "REMEDIATION_LOG", tmp_path / "remediation.jsonl")
+    monkeypatch.setattr(gui_app, "COMMAND_AUDIT_LOG", tmp_path / "command_events.jsonl")
+    monkeypatch.setattr(gui_app, "FLOW_EVENTS_LOG", tmp_path / "flow_events.jsonl")
+    monkeypatch.setattr(gui_app, "AUDIT_EVENTS_LOG", tmp_path / "audit_events.jsonl")
+    monkeypatch.setattr(gui_app, "load_settings", lambda defaults=None: {})
+    monkeypatch.setattr(gui_app, "resolve_export_dir", lambda: tmp_path / "exports")
+    loader_threads = []
+
+    def fake_health(self):
+        loader_threads.append(threading.current_thread())
+        return {"url": "http://orchestrator", "status": "ok", "metrics": {}}
+
+    monkeypatch.setattr(gui_app.PortMapDashboard, "_load_orchestrator_health", fake_health)
+
+    async def run_case():
+        app = gui_app.PortMapDashboard()
+        async with app.run_test() as pilot:
+            for _ in range(20):
+                if loader_threads:
+                    break
+                await pilot.pause(0.05)
+            await pilot.pause()
+            assert loader_threads
+            assert loader_threads[0] is not threading.main_thread()
+            assert "Refresh loads -" in str(app.metrics_panel.render())
+
+    asyncio.run(run_case())
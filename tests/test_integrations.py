@@ -1,5 +1,8 @@
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
+from core_engine.integrations.dispatcher import DeliveryDestination, IntegrationDispatcher
 from core_engine.integrations.elastic import format_elastic_bulk, format_elastic_document
 from core_engine.integrations.email import format_email_alert, send_email_alert
 from core_engine.integrations.sentinel import format_sentinel_event
@@ -131,3 +134,197 @@ def test_email_format_and_delivery_failure_isolation():
     assert result["ok"] is False
     assert result["status"] == "failed"
     assert "smtp unavailable" in result["detail"]
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        status = server.statuses.pop(0) if server.statuses else 200
+        server.requests.append({"path": self.path, "body": body, "port": self.client_address[1], "status": status})
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def _stand_in(statuses=()):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    server.daemon_threads = True
+    server.statuses = list(statuses)
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_dispatcher_batches_by_size_and_age_over_pooled_connections():
+    server, base = _stand_in()
+    now = [0.0]
+    destinations = [
+        DeliveryDestination(name="elastic", url=f"{base}/_bulk", integration="elastic", batch_size=3, max_batch_age=10),
+        DeliveryDestination(name="sentinel", url=f"{base}/sentinel", integration="sentinel", batch_size=100, max_batch_age=10),
+    ]
+    try:
+        with IntegrationDispatcher(destinations, dry_run=False, clock=lambda: now[0]) as dispatcher:
+            results = []
+            for index in range(7):
+                results += dispatcher.submit("elastic", {**EVENT, "title": f"alert {index}"})
+            dispatcher.submit("sentinel", EVENT)
+            results += dispatcher.collect()
+            assert [result["event_count"] for result in results] == [3, 3]
+            assert dispatcher.pending_count() == 2
+            now[0] = 11.0
+            due = dispatcher.flush_due()
+            due += dispatcher.collect()
+            stats = dispatcher.stats()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert sorted(result["event_count"] for result in due) == [1, 1]
+    assert all(result["ok"] for result in results + due)
+    bulk_bodies = [request["body"].decode() for request in server.requests if request["path"] == "/_bulk"]
+    assert format_elastic_bulk([{**EVENT, "title": f"alert {index}"} for index in range(3)]) in bulk_bodies
+    sentinel_body = [request["body"] for request in server.requests if request["path"] == "/sentinel"][0]
+    assert json.loads(sentinel_body) == [format_sentinel_event(EVENT)]
+    assert stats["delivered_events"] == 8
+    assert stats["delivered_batches"] == 4
+    assert stats["connections_reused"] >= 1
+    assert stats["connections_opened"] < stats["requests"]
+    assert stats["pending_events"] == 0
+
+
+def test_dispatcher_retries_spools_and_dead_letters(tmp_path):
+    server, base = _stand_in([503, 200, 400])
+    sleeps = []
+    destination = DeliveryDestination(name="hooks", url=f"{base}/hook", integration="webhook", batch_size=1)
+    try:
+        dispatcher = IntegrationDispatcher([destination], spool_dir=tmp_path, dry_run=False, sleep=sleeps.append, backoff_base=0.25)
+        retried = dispatcher.submit("hooks", EVENT) + dispatcher.collect()
+        rejected = dispatcher.submit("hooks", EVENT) + dispatcher.collect()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert retried[0]["ok"] and retried[0]["attempts"] == 2
+    assert sleeps == [0.25]
+    assert rejected[0]["status"] == "dead_lettered"
+    assert dispatcher.dead_letters("hooks")[0]["error"] == "400"
+
+    unreachable = IntegrationDispatcher(
+        [DeliveryDestination(name="hooks", url=base, batch_size=1, timeout=0.5)],
+        spool_dir=tmp_path,
+        dry_run=False,
+        max_attempts=2,
+        sleep=sleeps.append,
+    )
+    spooled = unreachable.submit("hooks", EVENT) + unreachable.collect()
+    assert spooled[0]["status"] == "spooled"
+    assert spooled[0]["attempts"] == 2
+    assert unreachable.spooled("hooks")[0]["events"] == [EVENT]
+
+    server, base = _stand_in()
+    try:
+        replay = IntegrationDispatcher([DeliveryDestination(name="hooks", url=base, batch_size=1)], spool_dir=tmp_path, dry_run=False)
+        replayed = replay.replay_spool()
+        replay.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert replayed[0]["ok"] and replayed[0]["event_count"] == 1
+    assert replay.spooled("hooks") == []
+    assert json.loads(server.requests[0]["body"]) == format_webhook_alert(EVENT)
+
+
+def test_dispatcher_replay_keeps_claimed_spool_until_delivered(tmp_path):
+    destination = DeliveryDestination(name="hooks", url="http://127.0.0.1:9/hook", batch_size=10)
+    parked = IntegrationDispatcher([destination], spool_dir=tmp_path)
+    parked.submit("hooks", EVENT)
+    parked.submit("hooks", {**EVENT, "title": "Second"})
+    parked.close()
+    sent = []
+
+    def crash(destination, body, content_type):
+        raise RuntimeError("orchestrator crashed mid-replay")
+
+    crashing = IntegrationDispatcher([destination], spool_dir=tmp_path, dry_run=False)
+    crashing._post = crash
+    try:
+        crashing.replay_spool()
+    except RuntimeError:
+        pass
+    crashing.close()
+    assert (tmp_path / "hooks.claim.jsonl").exists()
+    assert crashing.spooled("hooks") == []
+
+    recovered = IntegrationDispatcher([destination], spool_dir=tmp_path, dry_run=False)
+    recovered._post = lambda destination, body, content_type: sent.append(json.loads(body)) or 200
+    results = recovered.replay_spool()
+    recovered.close()
+
+    assert [result["ok"] for result in results] == [True]
+    assert sent == [format_webhook_alert(EVENT), format_webhook_alert({**EVENT, "title": "Second"})]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_dispatcher_dry_run_makes_no_requests_and_close_spools_pending(tmp_path):
+    dispatcher = IntegrationDispatcher(
+        [DeliveryDestination(name="splunk", url="https://splunk.example.test/services/collector", integration="splunk", batch_size=2)],
+        spool_dir=tmp_path,
+    )
+    results = dispatcher.submit("splunk", EVENT) + dispatcher.submit("splunk", EVENT)
+    dispatcher.submit("splunk", EVENT)
+    dispatcher.close()
+
+    assert results == [{**results[0], "status": "dry_run", "dry_run": True, "event_count": 2, "attempts": 0}]
+    assert dispatcher.stats()["requests"] == 0
+    assert dispatcher.spooled("splunk")[0]["events"] == [EVENT]
+
+
+def test_dispatcher_spools_only_undelivered_webhook_events(tmp_path):
+    server, base = _stand_in([200, 400])
+    events = [{**EVENT, "title": f"alert {index}"} for index in range(3)]
+    try:
+        dispatcher = IntegrationDispatcher([DeliveryDestination(name="hooks", url=base, batch_size=3)], spool_dir=tmp_path, dry_run=False)
+        for event in events:
+            dispatcher.submit("hooks", event)
+        results = dispatcher.flush()
+        dispatcher.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert results[0]["status"] == "dead_lettered"
+    assert results[0]["delivered_count"] == 1
+    assert dispatcher.dead_letters("hooks")[0]["events"] == events[1:]
+    assert dispatcher.stats()["delivered_events"] == 1
+    assert len(server.requests) == 2
+
+
+def test_dispatcher_reports_dropped_events_without_spool_dir_and_does_not_block_submit():
+    release = threading.Event()
+    server, base = _stand_in([503, 503])
+    try:
+        dispatcher = IntegrationDispatcher(
+            [DeliveryDestination(name="hooks", url=base, batch_size=1)],
+            dry_run=False,
+            max_attempts=2,
+            max_spool_replays=0,
+            sleep=lambda seconds: release.wait(5),
+        )
+        assert dispatcher.submit("hooks", EVENT) == []
+        release.set()
+        results = dispatcher.collect()
+        dispatcher.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert results[0]["status"] == "dropped"
+    assert results[0]["undelivered_count"] == 1
+    assert dispatcher.stats()["dropped_events"] == 1
+    assert dispatcher.spooled("hooks") == [] and dispatcher.dead_letters("hooks") == []
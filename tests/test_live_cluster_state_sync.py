@@ -144,6 +144,8 @@ def test_apply_signed_summary_update_accepts_and_merges_runtime_state():
     assert result["summary"]["accepted_update_count"] == 1
     assert result["summary"]["rejected_update_count"] == 0
     assert result["sync_window"]["last_sequence_by_node"] == {"node-worker-a": 1}
+    assert result["sync_window"]["seen_nonces"] == [envelope["nonce"]]
+    assert result["sync_window"]["replay_protection"]["last_sequence_by_node"] == {"node-worker-a": 1}
     assert result["merged_cluster_state"]["summary"]["runtime_node_count"] == 1
     assert result["merged_cluster_state"]["distributed_runtime_state"]["summary"]["missing_node_count"] == 1
     assert result["dashboard_status"]["panel"] == "live_cluster_synchronization"
@@ -0,0 +1,109 @@
+import json
+
+from core_engine import audit_events
+from core_engine.log_tail import LogTailReader, tail_jsonl, tail_lines
+
+
+def _write_rows(path, rows, *, mode="w"):
+    with path.open(mode) as handle:
+        for row in rows:
+            handle.write(json.dumps(row) + "\n")
+
+
+def test_tail_jsonl_reads_last_records_across_block_boundaries(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _write_rows(path, [{"index": index, "padding": "x" * index} for index in range(50)])
+    with path.open("a") as handle:
+        handle.write("not json\n")
+
+    rows = tail_jsonl(path, limit=5, block_size=16)
+
+    assert [row["index"] for row in rows] == [45, 46, 47, 48, 49]
+    assert tail_jsonl(path, limit=0) == []
+    assert tail_jsonl(tmp_path / "missing.jsonl", limit=5) == []
+
+
+def test_tail_jsonl_applies_predicate_before_counting(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _write_rows(path, [{"index": index, "node_id": "w1" if index % 2 else "w2"} for index in range(20)])
+
+    rows = tail_jsonl(path, limit=3, predicate=lambda row: row["node_id"] == "w2", block_size=32)
+
+    assert [row["index"] for row in rows] == [14, 16, 18]
+
+
+def test_tail_lines_includes_unterminated_last_line(tmp_path):
+    path = tmp_path / "master.log"
+    path.write_text("one\r\ntwo\nthree")
+
+    assert tail_lines(path, limit=2, block_size=4) == ["two", "three"]
+
+
+def test_log_tail_reader_reads_only_appended_rows(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _write_rows(path, [{"index": index} for index in range(10)])
+    reader = LogTailReader(path, limit=3, block_size=16)
+
+    assert [row["index"] for row in reader.read()] == [7, 8, 9]
+    offset = reader.offset
+    assert offset == path.stat().st_size
+
+    _write_rows(path, [{"index": 10}], mode="a")
+    assert [row["index"] for row in reader.read()] == [8, 9, 10]
+    assert reader.offset > offset
+
+
+def test_log_tail_reader_holds_partial_line_until_complete(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _write_rows(path, [{"index": 1}])
+    reader = LogTailReader(path, limit=5)
+    reader.read()
+
+    with path.open("a") as handle:
+        handle.write('{"index": ')
+    assert [row["index"] for row in reader.read()] == [1]
+
+    with path.open("a") as handle:
+        handle.write("2}\n")
+    assert [row["index"] for row in reader.read()] == [1, 2]
+
+
+def test_log_tail_reader_recovers_from_rotation_and_truncation(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _write_rows(path, [{"index": index} for index in range(5)])
+    reader = LogTailReader(path, limit=10)
+    assert len(reader.read()) == 5
+
+    path.rename(tmp_path / "events.jsonl.1")
+    _write_rows(path, [{"index": 100}])
+    assert [row["index"] for row in reader.read()] == [100]
+
+    _write_rows(path, [{"index": 200}, {"index": 201}])
+    assert [row["index"] for row in reader.read()] == [200, 201]
+
+    path.write_text("")
+    assert reader.read() == []
+
+    path.unlink()
+    assert reader.read() == []
+
+
+def test_filter_audit_events_tail_reads_newest_matches(tmp_path):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    _write_rows(
+        log_dir / audit_events.AUDIT_EVENTS_FILENAME,
+        [
+            {"timestamp": f"2026-01-01T00:00:{index:02d}Z", "event_type": "command_event", "node_id": f"w{index % 2}"}
+            for index in range(30)
+        ],
+    )
+
+    events = audit_events.filter_audit_events(
+        log_dir=log_dir,
+        filenames=[audit_events.AUDIT_EVENTS_FILENAME],
+        node_id="w1",
+        limit=2,
+    )
+
+    assert [event["timestamp"] for event in events] == ["2026-01-01T00:00:27Z", "2026-01-01T00:00:29Z"]
@@ -1,7 +1,9 @@
+import io
 import json
 import re
 
 from core_engine.streams import (
+    StreamFrameReader,
     build_stream_correlation_record,
     build_stream_event,
     build_stream_finding,
@@ -12,6 +14,7 @@ from core_engine.streams import (
     normalize_patterns,
     parse_stream_bytes,
     parse_stream_file,
+    parse_stream_source,
     summarize_stream_result,
 )
 
@@ -127,6 +130,46 @@ def test_parse_local_file_uses_summary_without_path(tmp_path):
     assert str(tmp_path) not in repr(result)
 
 
+def test_streaming_parse_carries_frames_across_chunks_and_matches_in_memory_parse(tmp_path):
+    data = b"HELLO|ABC|hello world|" * 50 + b"tail"
+    sample = tmp_path / "sample_stream.bin"
+    sample.write_bytes(data)
+    expected = parse_stream_bytes(data, delimiter=b"|", patterns=_patterns(), max_input_bytes=len(data), max_frames=1000)
+
+    streamed = parse_stream_source(sample, delimiter=b"|", patterns=_patterns(), chunk_size=7, max_frame_rows=10)
+    chunked = parse_stream_source([data[:5], data[5:6], data[6:]], delimiter=b"|", patterns=_patterns(), max_frame_rows=1000)
+
+    assert streamed["frame_count"] == expected["frame_count"] == 151
+    assert streamed["frames"] == expected["frames"][:10]
+    assert streamed["frames_truncated"] is True
+    assert streamed["summary"]["frame_count"] == 151
+    assert streamed["summary"]["max_frame_length"] == 11
+    for key in ("length_summary", "entropy_summary", "printable_ratio_summary", "detected_markers"):
+        assert streamed[key] == expected[key]
+    assert chunked["frames"] == expected["frames"]
+    assert streamed["throughput"]["bytes_read"] == len(data)
+    assert streamed["file_summary"] == {"name": "sample_stream.bin", "size": len(data), "path_stored": False}
+    assert str(tmp_path) not in repr(streamed)
+
+
+def test_stream_frame_reader_is_lazy_and_reports_framing_errors():
+    reader = StreamFrameReader(io.BytesIO(b"\x03ABC\x02DE\x09XY"), length_prefix_bytes=1, chunk_size=2)
+    frames = iter(reader)
+
+    assert next(frames)["hex_summary"] == b"ABC".hex()
+    assert reader.frame_count == 0
+    assert [frame["offset"] for frame in frames] == [5]
+    assert reader.errors == ["declared frame length exceeds remaining input"]
+
+    limited = parse_stream_source(io.BytesIO(b"a|b|c"), delimiter=b"|", max_frames=2)
+    oversized = parse_stream_source(io.BytesIO(b"x" * 64), delimiter=b"|", chunk_size=8, max_frame_bytes=16)
+
+    assert limited["status"] == "input_limited"
+    assert limited["frame_count"] == 2
+    assert oversized["status"] == "malformed"
+    assert oversized["errors"] == ["frame exceeds max_frame_bytes 16"]
+
+
 def test_stream_operational_integration_records():
     result = parse_stream_bytes(b"HELLO ABC sample", patterns=_patterns())
     summary = summarize_stream_result(result)
@@ -4,6 +4,7 @@ import pytest
 
 from core_engine.policy import (
     PolicyError,
+    PolicyIndex,
     ReviewQueue,
     build_review_record,
     create_policy,
@@ -202,3 +203,20 @@ def test_no_private_identifiers_in_examples_or_output():
 
     for pattern in PRIVATE_PATTERNS:
         assert not pattern.search(output)
+
+
+def test_policy_index_matches_policy_order_and_filters():
+    wildcard = create_policy(policy_id="policy-any", name="Any", description="Any category.", severity_threshold="high", now="sample-created-at")
+    disabled = create_policy(policy_id="policy-off", name="Off", description="Disabled.", enabled=False, now="sample-created-at")
+    policies = [_policy(), disabled, wildcard]
+    index = PolicyIndex(policies)
+
+    assert [policy.policy_id for policy in index.matching(category="finding", severity="high")] == ["policy-sample", "policy-any"]
+    assert [policy.policy_id for policy in index.matching(category="finding", severity="medium")] == ["policy-sample"]
+    assert [policy.policy_id for policy in index.matching(category="other", severity="critical")] == ["policy-any"]
+    assert index.matching(category="other", severity="unknown") == ()
+
+    finding = {"finding_id": "finding-sample", "category": "finding", "severity": "critical", "title": "Sample Finding"}
+    assert [review.review_id for review in evaluate_finding_against_policies(finding, index)] == [
+        review.review_id for review in evaluate_finding_against_policies(finding, policies)
+    ]
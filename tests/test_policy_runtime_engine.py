@@ -5,6 +5,7 @@ import pytest
 from core_engine.policy import (
     PolicyError,
     build_policy_runtime_summary,
+    compile_runtime_policies,
     create_runtime_policy,
     deterministic_policy_bundle_json,
     deterministic_policy_runtime_json,
@@ -208,3 +209,30 @@ def test_cross_platform_policy_contexts_do_not_change_host_state():
     assert exported["preview_only"] is True
     assert exported["automatic_changes"] is False
     assert exported["credentials_stored"] is False
+
+
+def test_compiled_policy_index_matches_per_policy_evaluation():
+    policies = [
+        create_runtime_policy(**_policy()),
+        create_runtime_policy(**_policy(policy_id="policy-disabled", enabled=False)),
+        create_runtime_policy(**_policy(policy_id="policy-flow", policy_type="flow_behavior")),
+        create_runtime_policy(**_policy(policy_id="policy-invalid", match_conditions={"minimums": {"port": "many"}})),
+        create_runtime_policy(**_policy(policy_id="policy-severity", match_conditions={"severity_at_least": "medium", "contains": {"tags": "ssh"}})),
+    ]
+    contexts = [
+        {"policy_type": "port_exposure", "port": 22, "source_mode": "live", "confidence_score": 0.9, "severity": "high", "tags": ["ssh"]},
+        {"context_type": "service_scan", "port": 443, "source_mode": "live", "confidence_score": 0.4},
+        {"port": 22, "source_mode": "live", "confidence_score": 0.8, "severity": "low"},
+        None,
+    ]
+    index = compile_runtime_policies(policies)
+
+    batches = index.evaluate_many(contexts, now=NOW)
+
+    assert index.predicate_count == 6
+    for context, evaluations in zip(contexts, batches):
+        expected = evaluate_policies(policies, context, now=NOW)
+        assert deterministic_policy_runtime_json(evaluations) == deterministic_policy_runtime_json(expected)
+        assert [item.policy_id for item in index.evaluate(context, now=NOW, matched_only=True)] == [item.policy_id for item in expected if item.matched]
+    assert [item.evaluation_state for item in batches[0]] == ["matched", "not_matched", "not_matched", "invalid", "matched"]
+    assert evaluate_policies(index, contexts[0], now=NOW)[0].evaluation_id == batches[0][0].evaluation_id
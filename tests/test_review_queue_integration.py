@@ -1,9 +1,12 @@
 import json
 import re
+import threading
+import time
 
 import pytest
 
 from core_engine.policy import PersistentReviewStore, PolicyError, build_review_record, create_policy
+from core_engine.policy import review_store as review_store_module
 from core_engine.policy.history import (
     build_finding_status_record,
     build_review_transition_record,
@@ -212,3 +215,83 @@ def test_review_integration_output_has_no_private_identifiers(tmp_path):
 
     for pattern in PRIVATE_PATTERNS:
         assert not pattern.search(payload)
+
+
+def test_review_tables_paginate_and_replay_back_dated_transitions(tmp_path):
+    store = PersistentReviewStore(_repository(tmp_path))
+    reviews = [_review(index, severity="high" if index in "ac" else "medium") for index in "abcd"]
+    store.add_reviews(reviews)
+
+    ordered = [review.review_id for review in store.list_reviews()]
+    assert [review.review_id for review in store.list_reviews(limit=2, offset=1)] == ordered[1:3]
+    assert store.count_reviews(severity="high") == 2
+    with pytest.raises(PolicyError):
+        store.list_reviews(limit=-1)
+
+    target = reviews[0].review_id
+    store.update_status(target, "deferred", reviewed_by="operator-late", now="2026-01-05T00:00:00+00:00")
+    store.update_status(target, "approved", reviewed_by="operator-early", now="2026-01-03T00:00:00+00:00")
+    current = store.get_review(target)
+    assert current.status == "deferred"
+    assert current.reviewed_by == "operator-late"
+    assert [row["new_status"] for row in store.list_review_history(target)] == ["approved", "deferred"]
+    assert store.summarize_reviews()["by_status"]["deferred"] == 1
+
+
+def test_legacy_review_rows_in_findings_are_migrated(tmp_path):
+    repository = _repository(tmp_path)
+    review = _review()
+    repository.insert_finding(review_to_storage_record(review))
+    repository.insert_finding(
+        build_review_transition_record(review, previous_status="open", new_status="approved", transitioned_at="2026-01-02T00:00:00+00:00")
+    )
+    repository.insert_finding(build_finding_status_record("finding:finding-sample", status="resolved", updated_at="2026-01-02T00:00:00+00:00"))
+
+    store = PersistentReviewStore(repository)
+
+    assert store.get_review(review.review_id).status == "approved"
+    assert store.list_reviews(status="approved")[0].review_id == review.review_id
+    assert len(store.list_review_history(review.review_id)) == 1
+    assert store.list_finding_statuses(finding_ref="finding:finding-sample")[0]["status"] == "resolved"
+    assert PersistentReviewStore(repository).summarize_reviews()["review_count"] == 1
+
+
+def test_legacy_review_rows_are_left_alone_when_migration_is_disabled(tmp_path):
+    repository = _repository(tmp_path)
+    review = _review()
+    repository.insert_finding(review_to_storage_record(review))
+
+    store = PersistentReviewStore(repository, migrate=False)
+
+    assert store.get_review(review.review_id) is None
+    assert store.count_reviews() == 0
+    assert PersistentReviewStore(repository).get_review(review.review_id).status == "open"
+
+
+def test_concurrent_status_updates_read_the_current_row_under_the_write_lock(tmp_path, monkeypatch):
+    review = _review()
+    PersistentReviewStore(_repository(tmp_path)).add_review(review)
+    first_read = threading.Event()
+    build_transition = review_store_module.build_review_transition_record
+
+    def slow_first_transition(*args, **kwargs):
+        if kwargs.get("reviewed_by") == "operator-first":
+            first_read.set()
+            time.sleep(0.3)
+        return build_transition(*args, **kwargs)
+
+    monkeypatch.setattr(review_store_module, "build_review_transition_record", slow_first_transition)
+
+    def update(status, reviewed_by, now):
+        PersistentReviewStore(_repository(tmp_path)).update_status(review.review_id, status, reviewed_by=reviewed_by, now=now)
+
+    first = threading.Thread(target=update, args=("approved", "operator-first", "2026-01-02T00:00:00+00:00"))
+    first.start()
+    assert first_read.wait(5)
+    second = threading.Thread(target=update, args=("deferred", "operator-second", "2026-01-03T00:00:00+00:00"))
+    second.start()
+    first.join()
+    second.join()
+
+    history = PersistentReviewStore(_repository(tmp_path)).list_review_history(review.review_id)
+    assert [(row["previous_status"], row["new_status"]) for row in history] == [("open", "approved"), ("approved", "deferred")]
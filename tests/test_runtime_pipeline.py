@@ -184,3 +184,86 @@ def test_runtime_pipeline_output_does_not_contain_private_identifiers():
 
     for pattern in PRIVATE_IDENTIFIER_PATTERNS:
         assert not pattern.search(payload)
+
+
+def test_runtime_pipeline_step_graph_runs_review_and_correlation_after_drift():
+    from core_engine.runtime.pipeline import RUNTIME_PIPELINE_STEPS, pipeline_step_dependencies
+
+    dependencies = pipeline_step_dependencies(RUNTIME_PIPELINE_STEPS)
+
+    assert dependencies["visibility"] == set()
+    assert dependencies["drift_detection"] == {"visibility", "topology_snapshot"}
+    assert "correlation" not in dependencies["policy_review"]
+    assert "policy_review" not in dependencies["correlation"]
+    assert dependencies["storage"] == {"visibility", "topology_snapshot", "drift_detection", "events"}
+
+
+def test_runtime_pipeline_parallel_run_matches_sequential_run():
+    kwargs = {
+        "assets": _assets(),
+        "services": _services(),
+        "baseline_snapshot": _baseline_snapshot(),
+        "generated_at": "2026-01-03T00:00:00+00:00",
+    }
+
+    sequential = run_runtime_pipeline(max_workers=1, **kwargs)
+    parallel = run_runtime_pipeline(max_workers=4, **kwargs)
+
+    for key in ("event_count", "finding_count", "review_draft_count", "timeline_entry_count", "correlation_record_count"):
+        assert parallel["summary"][key] == sequential["summary"][key]
+    assert [row["finding_id"] for row in parallel["correlation_records"]] == [row["finding_id"] for row in sequential["correlation_records"]]
+    assert sorted(event["event_type"] for event in parallel["events"]) == sorted(event["event_type"] for event in sequential["events"])
+    assert [step["step"] for step in parallel["step_results"]] == [step["step"] for step in sequential["step_results"]]
+    assert set(parallel["summary"]["step_timings_ms"]) == {step["step"] for step in parallel["step_results"]}
+
+
+def test_runtime_pipeline_memoizes_steps_with_unchanged_inputs():
+    from core_engine.runtime import PipelineMemo
+
+    memo = PipelineMemo()
+    kwargs = {
+        "baseline_snapshot": _baseline_snapshot(),
+        "current_snapshot": _current_snapshot(),
+        "generated_at": "2026-01-03T00:00:00+00:00",
+        "memo": memo,
+    }
+
+    first = run_runtime_pipeline(**kwargs)
+    second = run_runtime_pipeline(**kwargs)
+    changed = run_runtime_pipeline(**{**kwargs, "baseline_snapshot": _current_snapshot()})
+
+    assert first["summary"]["memoized_step_count"] == 0
+    assert second["summary"]["memoized_step_count"] == 4
+    assert {step["step"] for step in second["step_results"] if not step["memoized"]} == {"events", "policy_review", "storage"}
+    assert second["drift_report"] == first["drift_report"]
+    assert second["correlation_records"] == first["correlation_records"]
+    memoized = {step["step"] for step in changed["step_results"] if step["memoized"]}
+    assert "drift_detection" not in memoized
+    assert changed["drift_report"]["drift_count"] == 0
+
+
+def test_runtime_pipeline_memo_does_not_replay_events(tmp_path):
+    from core_engine.runtime import PipelineMemo
+
+    memo = PipelineMemo()
+    kwargs = {
+        "assets": _assets(),
+        "services": _services(),
+        "dry_run": False,
+        "write_local": True,
+        "generated_at": "2026-01-03T00:00:00+00:00",
+        "memo": memo,
+    }
+    first_repository = LocalStorageRepository(SQLiteStore(tmp_path / "first.db"))
+    second_repository = LocalStorageRepository(SQLiteStore(tmp_path / "second.db"))
+
+    first = run_runtime_pipeline(repository=first_repository, **kwargs)
+    second = run_runtime_pipeline(repository=second_repository, **kwargs)
+
+    assert first["status"] == "ok"
+    assert second["status"] == "ok"
+    assert second["summary"]["memoized_step_count"] == 4
+    first_ids = {event["event_id"] for event in first_repository.list_events()}
+    second_ids = {event["event_id"] for event in second_repository.list_events()}
+    assert len(second_ids) == second["summary"]["event_count"]
+    assert first_ids.isdisjoint(second_ids)
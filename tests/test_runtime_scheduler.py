@@ -148,3 +148,81 @@ def test_disabled_job_is_not_run():
 
     assert scheduler.run_due_jobs_once() == []
     assert job.run_count == 0
+
+
+def test_background_loop_runs_slow_job_without_blocking_others():
+    release = threading.Event()
+    fast_runs = threading.Event()
+    slow_calls = []
+
+    def slow(job):
+        slow_calls.append(job.job_id)
+        release.wait(timeout=2.0)
+
+    scheduler = LocalRuntimeScheduler(poll_interval=0.01, max_workers=2)
+    scheduler.add_job(create_runtime_job("snapshot_refresh", interval_seconds=0.01, job_id="job-slow"), handler=slow)
+    scheduler.add_job(
+        create_runtime_job("health_check", interval_seconds=0.01, job_id="job-fast"),
+        handler=lambda job: fast_runs.set() if job.run_count >= 3 else None,
+    )
+    scheduler.start()
+    try:
+        assert fast_runs.wait(timeout=2.0)
+        assert slow_calls == ["job-slow"]
+    finally:
+        release.set()
+        scheduler.stop()
+
+
+def test_heap_skips_jobs_that_are_still_running():
+    clock = Clock()
+    scheduler = LocalRuntimeScheduler(time_fn=clock.now)
+    job = create_runtime_job("event_flush", interval_seconds=10, job_id="job-flush", start_at=clock.now())
+    scheduler.add_job(job)
+
+    scheduler._running.add("job-flush")
+    assert scheduler.run_due_jobs_once() == []
+    scheduler._running.discard("job-flush")
+    scheduler.enable_job("job-flush")
+    assert [row["job_id"] for row in scheduler.run_due_jobs_once()] == ["job-flush"]
+    assert scheduler.next_due_in() == 10.0
+
+
+def test_missed_run_policies_and_jitter():
+    clock = Clock()
+    scheduler = LocalRuntimeScheduler(time_fn=clock.now, jitter_seconds=4, random_fn=lambda: 0.5)
+    skip = create_runtime_job("health_check", interval_seconds=10, job_id="job-skip", start_at=clock.now(), metadata={"missed_run_policy": "skip"})
+    catch_up = create_runtime_job("event_flush", interval_seconds=10, job_id="job-catch-up", start_at=clock.now(), metadata={"missed_run_policy": "catch_up", "jitter_seconds": 0})
+    coalesce = create_runtime_job("snapshot_refresh", interval_seconds=10, job_id="job-coalesce", start_at=clock.now())
+    for job in (skip, catch_up, coalesce):
+        scheduler.add_job(job)
+
+    clock.advance(35)
+    results = scheduler.run_due_jobs_once()
+
+    assert [row["job_id"] for row in results] == ["job-catch-up", "job-coalesce"]
+    assert skip.run_count == 0
+    assert skip.next_run_at == 1047.0
+    assert catch_up.next_run_at == 1010.0
+    assert coalesce.next_run_at == 1047.0
+    assert [row["job_id"] for row in scheduler.run_due_jobs_once()] == ["job-catch-up"]
+    with pytest.raises(RuntimeJobError):
+        scheduler.add_job(create_runtime_job("health_check", interval_seconds=5, metadata={"missed_run_policy": "never"}))
+
+
+def test_runtime_state_records_latency_and_overrun_histograms():
+    clock = Clock()
+    scheduler = LocalRuntimeScheduler(time_fn=clock.now)
+
+    def slow(_job):
+        clock.advance(12)
+
+    scheduler.add_job(create_runtime_job("policy_review_refresh", interval_seconds=10, job_id="job-policy", start_at=clock.now()), handler=slow)
+    clock.advance(0.2)
+    scheduler.run_due_jobs_once()
+
+    timing = scheduler.status()["job_timings"]["job-policy"]
+    assert timing["latency_histogram"]["le_0.5s"] == 1
+    assert timing["duration_histogram"]["le_30s"] == 1
+    assert timing["overrun_count"] == 1
+    assert timing["max_duration_seconds"] == 12
@@ -1,11 +1,16 @@
 import json
 import re
+from datetime import UTC, datetime
 
+from core_engine.export.node_manifest import digest_payload
 from core_engine.federation import (
+    CanonicalDigestMemo,
     build_approved_peer_record,
+    build_payload_digest_record,
     build_exchange_summary,
     build_local_node_trust_profile,
     build_signed_runtime_summary_envelope,
+    canonical_digest_many,
     canonical_json,
     create_trusted_transport_session,
     deterministic_digest,
@@ -118,6 +123,36 @@ def test_canonical_json_and_digest_are_deterministic():
     assert deterministic_digest(left).startswith("sha256:")
 
 
+def test_single_pass_digest_matches_round_trip_digest():
+    payloads = [
+        {"b": [1, 2.5, None, True], "a": ("x", {"z": "\u00e9", "y": float("inf")})},
+        {10: "ten", 2: "two"},
+        {"nested": {3: [1, {4: "four", 12: "twelve"}]}},
+        {"when": datetime(2026, 1, 1, tzinfo=UTC), "items": [{"k": 1}] * 3},
+        [],
+        "plain",
+    ]
+
+    for payload in payloads:
+        expected = digest_payload(json.loads(canonical_json(payload)))
+        assert deterministic_digest(payload) == expected
+        assert build_payload_digest_record(payload, generated_at="2026-01-01T00:00:00+00:00")["payload_digest"] == expected
+    assert canonical_digest_many(payloads) == [deterministic_digest(payload) for payload in payloads]
+
+
+def test_digest_memo_reuses_identity_and_version():
+    payload = {"a": 1}
+    memo = CanonicalDigestMemo(max_entries=2)
+
+    assert memo.digest(payload) == memo.digest(payload) == deterministic_digest(payload)
+    assert (memo.hits, memo.misses) == (1, 1)
+    payload["a"] = 2
+    assert memo.digest(payload, version=2) == deterministic_digest({"a": 2})
+    memo.digest({"b": 1})
+    assert len(memo) == 2
+    assert canonical_digest_many([payload, payload], memo=memo) == [deterministic_digest(payload)] * 2
+
+
 def test_build_signed_runtime_summary_envelope_has_digest_signature_and_attribution():
     profile, transport, envelope = _envelope()
 
@@ -150,6 +185,27 @@ def test_verification_accepts_trusted_peer_and_replay_window():
     assert verified["verification_status"]["cryptographic_signature_verified"] is False
 
 
+def test_verification_recomputes_digest_after_in_place_mutation():
+    profile, transport, envelope = _envelope()
+    verified = verify_signed_runtime_summary_envelope(
+        envelope,
+        trust_profile=profile,
+        transport_session=transport,
+        generated_at="2026-01-01T00:01:00+00:00",
+    )
+    envelope["summary_payload"]["sync_status"] = "stale"
+    tampered = verify_signed_runtime_summary_envelope(
+        envelope,
+        trust_profile=profile,
+        transport_session=transport,
+        generated_at="2026-01-01T00:01:00+00:00",
+    )
+
+    assert verified["exchange_status"] == "accepted"
+    assert tampered["exchange_status"] != "accepted"
+    assert "summary payload digest does not match payload_digest" in tampered["verification_status"]["errors"]
+
+
 def test_verification_rejects_digest_tampering():
     profile, transport, envelope = _envelope()
     tampered = {**envelope, "summary_payload": {**envelope["summary_payload"], "sync_status": "stale"}}
@@ -0,0 +1,119 @@
+import pytest
+
+from core_engine.correlation import compare_baselines
+from core_engine.snapshot_diff import (
+    KeyedSnapshot,
+    RunningSnapshot,
+    SnapshotDiffError,
+    SnapshotIndexCache,
+    SnapshotKeySpec,
+    diff_keyed_snapshots,
+)
+from core_engine.topology.diff import compare_topology_snapshots
+from core_engine.topology.snapshots import build_topology_snapshot
+from core_engine.visibility_history import compare_visibility_snapshots
+
+
+ASSET_SPEC = SnapshotKeySpec(
+    "test.assets",
+    lambda row: str(row.get("asset_id") or ""),
+    content=lambda row: (row.get("label"), float(row.get("confidence") or 0.0)),
+    flag=lambda content: content[1] < 0.5,
+    partition_count=8,
+)
+
+
+def _assets(count, **overrides):
+    rows = [{"asset_id": f"asset-{index:03d}", "label": f"label-{index}", "confidence": 0.9} for index in range(count)]
+    for index, values in overrides.items():
+        rows[int(index)] = {**rows[int(index)], **values}
+    return rows
+
+
+def test_diff_merge_joins_changed_partitions_and_skips_the_rest():
+    before = KeyedSnapshot(_assets(40, **{"3": {"confidence": 0.2}}), spec=ASSET_SPEC)
+    after_rows = _assets(40, **{"3": {"confidence": 0.2}, "7": {"label": "renamed"}})[1:]
+    after_rows.extend([{"asset_id": "asset-900", "label": "new"}, {"label": "no key is skipped"}])
+    after_rows.append({"asset_id": "asset-010", "label": "last row wins", "confidence": 0.9})
+    after = KeyedSnapshot(after_rows, spec=ASSET_SPEC)
+
+    delta = diff_keyed_snapshots(before, after)
+
+    assert delta.added == ("asset-900",)
+    assert delta.removed == ("asset-000",)
+    assert delta.changed == ("asset-007", "asset-010")
+    assert delta.flagged == ("asset-003",)
+    assert delta.common() == ["asset-003", "asset-007", "asset-010"]
+    assert 0 < delta.skipped_partition_count < 8
+    assert after["asset-010"]["label"] == "last row wins"
+    assert diff_keyed_snapshots(after, after).change_count == 0
+
+    with pytest.raises(SnapshotDiffError):
+        diff_keyed_snapshots(before, KeyedSnapshot([], spec=SnapshotKeySpec("other", ASSET_SPEC.key, partition_count=4)))
+
+
+def test_running_snapshot_apply_matches_full_diff():
+    running = RunningSnapshot(_assets(30), spec=ASSET_SPEC)
+    baseline = KeyedSnapshot(running.current.rows(), spec=ASSET_SPEC)
+
+    delta = running.apply(
+        upserts=[
+            {"asset_id": "asset-004", "label": "renamed", "confidence": 0.9},
+            {"asset_id": "asset-005", "label": "label-5", "confidence": 0.9},
+            {"asset_id": "asset-050", "label": "new", "confidence": 0.3},
+            {"asset_id": "asset-006", "label": "label-6", "confidence": 0.9},
+        ],
+        removals=["asset-001", "asset-006", "asset-404"],
+    )
+
+    assert delta.added == ("asset-050",)
+    assert delta.removed == ("asset-001",)
+    assert delta.changed == ("asset-004",)
+    full = diff_keyed_snapshots(baseline, running.current)
+    assert (full.added, full.removed, full.changed) == (delta.added, delta.removed, delta.changed)
+    assert running.current.partition_digests() == KeyedSnapshot(running.current.rows(), spec=ASSET_SPEC).partition_digests()
+
+    advanced = running.advance(_assets(30))
+    assert advanced.added == ("asset-001",)
+    assert advanced.removed == ("asset-050",)
+    assert advanced.changed == ("asset-004",)
+
+
+def test_callers_reuse_cached_snapshot_indexes():
+    baseline = build_topology_snapshot(
+        assets=[{"asset_id": "asset-a", "label": "A"}, {"asset_id": "asset-b", "confidence": 0.3}],
+        topology_edges=[{"source_asset": "asset-a", "target_asset": "asset-b", "relationship_type": "tcp"}],
+        observed_at="2026-01-01T00:00:00+00:00",
+    )
+    current = build_topology_snapshot(
+        assets=[{"asset_id": "asset-a", "label": "A2"}, {"asset_id": "asset-b", "confidence": 0.3}],
+        topology_edges=[],
+        observed_at="2026-01-02T00:00:00+00:00",
+    )
+    cache = SnapshotIndexCache()
+
+    uncached = compare_topology_snapshots(baseline, current, generated_at="2026-01-02T00:00:00+00:00")
+    first = compare_topology_snapshots(baseline, current, generated_at="2026-01-02T00:00:00+00:00", index_cache=cache)
+    misses = cache.misses
+    second = compare_topology_snapshots(baseline, current, generated_at="2026-01-02T00:00:00+00:00", index_cache=cache)
+
+    assert uncached == first == second
+    assert {row["drift_type"] for row in first["drifts"]} >= {"asset_label_changed", "asset_low_confidence_match", "topology_edge_removed"}
+    assert cache.misses == misses and cache.hits >= 8
+
+    rows = {"assets": [{"asset_id": "asset-a", "confidence": 0.2}], "services": [], "topology_edges": []}
+    assert compare_baselines(rows, rows, index_cache=cache)["finding_count"] == compare_baselines(rows, rows)["finding_count"] == 1
+    snapshot = {"assets": [{"asset_id": "asset-a", "status": "up"}], "services": [], "topology": {"edges": []}}
+    assert compare_visibility_snapshots(snapshot, snapshot, index_cache=cache)["delta_count"] == 0
+
+
+def test_colliding_interpreter_hashes_still_count_as_changes():
+    spec = SnapshotKeySpec("test.counts", lambda row: row["id"], content=lambda row: row["count"], partition_count=4)
+    assert hash(-1) == hash(-2)
+
+    delta = diff_keyed_snapshots(KeyedSnapshot([{"id": "edge", "count": -1}], spec=spec), KeyedSnapshot([{"id": "edge", "count": -2}], spec=spec))
+    running = RunningSnapshot([{"id": "edge", "count": -1}], spec=spec)
+
+    assert delta.changed == ("edge",)
+    assert running.current.upsert({"id": "edge", "count": -2}) == "changed"
+    assert running.apply(upserts=[{"id": "edge", "count": -1}]).changed == ("edge",)
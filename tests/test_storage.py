@@ -39,6 +39,8 @@ def test_event_insert_and_list_round_trip(tmp_path):
 
     assert row_id == 1
     assert rows == [event.to_dict()]
+    stored = repository.store.query("SELECT payload_json FROM events")
+    assert stored[0]["payload_json"] == event.to_json()
 
 
 def test_snapshot_insert_and_list_round_trip(tmp_path):
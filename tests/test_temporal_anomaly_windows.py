@@ -3,12 +3,16 @@ import re
 import pytest
 
 from core_engine.telemetry import (
+    KeyCountSeries,
     TemporalAnomalyError,
+    TemporalSeriesError,
     build_behavior_baseline_report,
     build_enriched_flow_observation,
     build_live_telemetry_operator_summary,
     build_temporal_anomaly_report,
+    build_temporal_series_report,
     deterministic_temporal_anomaly_json,
+    timestamps_to_micros,
 )
 
 
@@ -163,3 +167,41 @@ def test_rejects_invalid_temporal_anomaly_configuration():
         build_temporal_anomaly_report(_burst_baseline(), generated_at=GENERATED_AT, max_anomalies=0)
     with pytest.raises(TemporalAnomalyError):
         build_temporal_anomaly_report(_burst_baseline(), generated_at=GENERATED_AT, burst_multiplier=1)
+
+
+def _series_observations():
+    rows = []
+    for day in range(1, 8):
+        for hour in range(24):
+            rows.append({"category": "destination", "key": "steady", "observed_at": f"2026-01-0{day}T{hour:02d}:30:00+00:00"})
+    for minute in range(12):
+        rows.append({"category": "destination", "key": "steady", "observed_at": f"2026-01-08T00:{minute:02d}:00Z"})
+    rows.append({"category": "destination", "key": "broken", "observed_at": "not-a-time"})
+    return rows
+
+
+def test_series_report_flags_rate_spikes_with_existing_record_shape():
+    series = KeyCountSeries.from_observations(_series_observations(), generated_at="2026-01-08T00:30:00+00:00", days=8)
+    report = build_temporal_series_report(series)
+    labels = {row["label"] for row in report["anomalies"]}
+
+    assert series.counts.shape == (2, 8 * 24)
+    assert series.skipped_observation_count == 1
+    assert {"rate_spike", "seasonal_deviation"} <= labels
+    assert report["record_type"] == "temporal_anomaly_report"
+    assert report["series_summary"]["key_count"] == 2
+    assert report["raw_payload_stored"] is False
+    assert report["external_reputation_calls"] is False
+    assert deterministic_temporal_anomaly_json(report) == deterministic_temporal_anomaly_json(report)
+    assert all(re.search(pattern, deterministic_temporal_anomaly_json(report)) is None for pattern in PRIVATE_PATTERNS)
+
+
+def test_timestamps_to_micros_matches_python_parsing_and_rejects_bad_input():
+    values = ["2026-01-01T00:00:00Z", "2026-01-01T02:00:00+02:00", "2026-01-01T00:00:00.250000", "", "garbage"]
+    micros, valid = timestamps_to_micros(values)
+
+    assert valid.tolist() == [True, True, True, False, False]
+    assert micros[0] == micros[1]
+    assert micros[2] - micros[0] == 250000
+    with pytest.raises(TemporalSeriesError):
+        KeyCountSeries(["destination:a"], [[1, 2]], generated_at=GENERATED_AT, bucket_seconds=0)
@@ -0,0 +1,136 @@
+import pytest
+
+from core_engine.topology import (
+    GraphAnalyticsError,
+    TopologyGraphIndex,
+    build_graph_analytics_report,
+    build_lateral_relationship_analysis,
+    build_topology_graph_index,
+    build_topology_snapshot,
+    build_trust_zone_record,
+    deterministic_graph_analytics_json,
+)
+
+
+FIXED_TIME = "2026-01-01T00:00:00+00:00"
+
+
+def _chain_snapshot():
+    return build_topology_snapshot(
+        assets=[{"asset_id": name} for name in ("edge-1", "web-1", "app-1", "db-1", "backup-1", "island-1")],
+        topology_edges=[
+            {"source_asset": "edge-1", "target_asset": "web-1", "protocol": "https"},
+            {"source_asset": "web-1", "target_asset": "app-1", "protocol": "http"},
+            {"source_asset": "web-1", "target_asset": "app-1", "protocol": "grpc"},
+            {"source_asset": "app-1", "target_asset": "db-1", "protocol": "postgres"},
+            {"source_asset": "db-1", "target_asset": "backup-1", "protocol": "rsync"},
+        ],
+        observed_at=FIXED_TIME,
+    )
+
+
+def test_index_reachability_blast_radius_and_components():
+    index = build_topology_graph_index(_chain_snapshot())
+
+    assert index.node_count == 6
+    assert index.edge_count == 4
+    assert index.reachable("web-1") == {"app-1": 1, "db-1": 2, "backup-1": 3}
+    assert index.shortest_path("edge-1", "backup-1") == ["edge-1", "web-1", "app-1", "db-1", "backup-1"]
+    assert index.shortest_path("backup-1", "edge-1") == []
+    assert index.blast_radius("edge-1", hops=2)["by_hop"] == {"1": ["web-1"], "2": ["app-1"]}
+    assert index.connected_components() == [["app-1", "backup-1", "db-1", "edge-1", "web-1"], ["island-1"]]
+
+    betweenness = index.betweenness_centrality()
+    assert betweenness["app-1"] > betweenness["web-1"] == betweenness["db-1"] > 0
+    assert betweenness["edge-1"] == betweenness["island-1"] == 0.0
+    assert index.degree_centrality()["web-1"] == 0.2
+
+    with pytest.raises(GraphAnalyticsError):
+        index.reachable("missing-1")
+
+
+def test_index_updates_incrementally_and_caches_per_digest():
+    index = build_topology_graph_index(_chain_snapshot())
+    original = index.digest
+    assert index.connected_components()[1] == ["island-1"]
+
+    assert index.add_edge("backup-1", "island-1") is True
+    assert index.overlay_size == 1
+    misses = index.cache_misses
+    assert index.connected_components() == [["app-1", "backup-1", "db-1", "edge-1", "island-1", "web-1"]]
+    assert index.cache_misses == misses
+    assert index.reachable("db-1") == {"backup-1": 1, "island-1": 2}
+
+    assert index.remove_edge("web-1", "app-1") is False
+    assert index.remove_edge("web-1", "app-1") is True
+    assert index.reachable("edge-1") == {"web-1": 1}
+    index.add_edge("web-1", "app-1")
+    index.remove_edge("backup-1", "island-1")
+    assert index.digest == original
+
+    rebuilt = TopologyGraphIndex(index.node_ids(), [("edge-1", "web-1"), ("web-1", "app-1"), ("app-1", "db-1"), ("db-1", "backup-1")])
+    assert rebuilt.digest == original
+    assert rebuilt.betweenness_centrality() == index.betweenness_centrality()
+
+
+def test_sampled_betweenness_and_report_are_deterministic():
+    nodes = [f"node-{number:03d}" for number in range(60)]
+    edges = [(nodes[number], nodes[(number + step) % 60]) for number in range(60) for step in (1, 7)]
+    index = TopologyGraphIndex(nodes, edges)
+
+    exact = index.betweenness_centrality()
+    sampled = index.betweenness_centrality(sample_size=30, seed=4)
+    assert sampled == index.betweenness_centrality(sample_size=30, seed=4)
+    assert abs(sum(sampled.values()) - sum(exact.values())) < 0.2 * sum(exact.values())
+
+    report = build_graph_analytics_report(index, top_n=3, generated_at=FIXED_TIME)
+    assert report["graph_digest"] == index.digest
+    assert report["component_count"] == 1
+    assert len(report["top_betweenness"]) == 3
+    assert report["read_only"] is True
+    assert deterministic_graph_analytics_json(report) == deterministic_graph_analytics_json(
+        build_graph_analytics_report(TopologyGraphIndex(nodes, reversed(edges)), top_n=3, generated_at=FIXED_TIME)
+    )
+
+
+def test_empty_topology_builds_an_empty_report():
+    index = build_topology_graph_index(build_topology_snapshot(assets=[], topology_edges=[], observed_at=FIXED_TIME))
+
+    assert index.node_count == 0
+    assert index.betweenness_centrality() == {}
+    report = build_graph_analytics_report(index, generated_at=FIXED_TIME)
+    assert report["component_count"] == 0
+    assert report["top_betweenness"] == []
+
+
+def test_lateral_analysis_and_trust_zones_use_path_metrics():
+    index = build_topology_graph_index(_chain_snapshot())
+    relationship = {
+        "source_node_class": "worker",
+        "target_node_class": "worker",
+        "relationship_type": "peer_sync",
+        "relationship_state": "recurring",
+        "observation_count": 6,
+        "source_node_reference": "edge-1",
+        "target_node_reference": "web-1",
+        "source_mode": "live",
+    }
+    heuristic = build_lateral_relationship_analysis(relationship, generated_at=FIXED_TIME)
+    central = build_lateral_relationship_analysis(relationship, graph_index=index, generated_at=FIXED_TIME)
+    leaf = build_lateral_relationship_analysis(
+        {**relationship, "target_node_reference": "backup-1"},
+        graph_index=index,
+        generated_at=FIXED_TIME,
+    )
+
+    assert "path_metrics" not in heuristic
+    assert central["path_metrics"]["reachable_count"] == 3
+    assert central["path_metrics"]["graph_digest"] == index.digest
+    assert leaf["path_metrics"]["reachable_count"] == 0
+    assert central["spread_potential"] > leaf["spread_potential"]
+
+    zone = build_trust_zone_record([relationship], zone_class="internal", graph_index=index, generated_at=FIXED_TIME)
+    assert zone["path_metrics"]["member_node_count"] == 2
+    assert zone["path_metrics"]["outside_reach_count"] == 3
+    assert zone["path_metrics"]["outside_reach_fraction"] == 0.75
+    assert "path_metrics" not in build_trust_zone_record([relationship], zone_class="internal", generated_at=FIXED_TIME)
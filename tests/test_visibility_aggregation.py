@@ -3,9 +3,11 @@ import re
 import pytest
 
 from core_engine.aggregation import (
+    NodeReportMerger,
     collect_node_reports,
     merge_assets,
     merge_findings,
+    merge_key_groups,
     merge_node_reports,
     merge_services,
     merge_topology_edges,
@@ -166,3 +168,46 @@ def test_no_private_identifiers_in_examples_or_output():
 
     for pattern in PRIVATE_PATTERNS:
         assert not pattern.search(output)
+
+
+def test_streaming_merge_matches_flat_merge_and_presorted_streams():
+    reports = [
+        _report(),
+        _report(node_id="node-sample-b", label="Sample Node B", service_name="HTTP", asset_label="Sample App B"),
+        {**_report(node_id="node-sample-c"), "assets": [{"asset_id": "asset-other"}, {"asset_id": "asset-sample", "confidence": 0.9}]},
+    ]
+    merged = merge_node_reports(reports)
+    assets, asset_conflicts = merge_assets([row for report in collect_node_reports(reports) for row in report["assets"]])
+    assert merged["assets"] == assets
+    assert {item["conflict_id"] for item in asset_conflicts} <= {item["conflict_id"] for item in merged["conflicts"]}
+
+    presorted = [
+        {**report, "assets": sorted(report["assets"], key=lambda row: row["asset_id"])}
+        for report in collect_node_reports(reports)
+    ]
+    assert merge_node_reports(presorted, presorted=True) == merged
+
+    groups = list(merge_key_groups([[{"k": "b"}, {"k": "a", "n": 1}], [{"k": "a", "n": 2}]], lambda row: row["k"]))
+    assert [(key, [row.get("n") for row in rows]) for key, rows in groups] == [("a", [1, 2]), ("b", [None])]
+    raw_presorted = [{**report, "assets": sorted(report["assets"], key=lambda row: row["asset_id"])} for report in reports]
+    assert merge_node_reports(raw_presorted, presorted=True) == merged
+    with pytest.raises(AggregationError, match="not ordered by key"):
+        list(merge_key_groups([[{"k": "b"}, {"k": "a"}, {"k": "b"}]], lambda row: row["k"], presorted=True))
+
+
+def test_node_report_merger_remerges_only_changed_keys():
+    merger = NodeReportMerger()
+    first = _report()
+    second = _report(node_id="node-sample-b", label="Sample Node B", service_name="HTTP")
+    merger.update(first)
+    merger.update(second)
+    assert merger.result() == merge_node_reports([first, second])
+
+    changed = {**second, "assets": [*second["assets"], {"asset_id": "asset-new", "label": "New", "category": "db"}]}
+    counts = merger.update(changed)
+    assert counts == {"assets": 1, "services": 0, "topology_edges": 0, "findings": 0}
+    assert merger.result() == merge_node_reports([first, changed])
+
+    merger.remove("node-sample-a")
+    assert len(merger) == 1 and "node-sample-a" not in merger
+    assert merger.result() == merge_node_reports([changed])
@@ -4,10 +4,20 @@ import logging
 import pytest
 
 from core_engine import worker_node
+from core_engine import config_validation
 from core_engine.telemetry_framing import (
+    COMPACT_FRAME_HEADER,
+    COMPACT_FRAME_MAGIC,
+    COMPACT_FRAME_VERSION,
+    FRAME_CODEC_ZLIB,
+    FRAME_ENCODING_COMPACT,
+    FRAME_ENCODING_JSON,
     TelemetryFrameMalformed,
     TelemetryFrameTooLarge,
+    decode_compact_frame,
+    encode_compact_frame,
     encode_json_frame,
+    negotiate_frame_encoding,
     read_json_frames,
     telemetry_frame_error_summary,
 )
@@ -173,3 +183,87 @@ def test_milestone_v_telemetry_fields_survive_transport():
     assert decoded["milestone_v_counters"]["observations_seen"] == 1
     assert decoded["flows"][0]["source_mode"] == "live"
     assert decoded["topology_edges"][0]["source_mode"] == "live"
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib"])
+def test_compact_frame_round_trips_and_shrinks_repeated_rows(compression):
+    payload = _payload()
+    payload["ports"] = payload["ports"] * 40 + [{"program": "odd", "extra": {"nested": [1, 2]}}]
+    payload["tags"] = ["\u0000t", "literal"]
+
+    frame = encode_compact_frame(payload, compression=compression)
+
+    assert frame.startswith(COMPACT_FRAME_MAGIC)
+    assert len(frame) < len(encode_json_frame(payload))
+    assert decode_compact_frame(frame) == payload
+
+
+def test_read_frames_accepts_mixed_json_and_compact_frames_across_partial_reads():
+    first = _payload(node_id="worker-json")
+    second = _payload(node_id="worker-compact")
+    stream = encode_json_frame(first) + encode_compact_frame(second) + encode_compact_frame(first)
+    json_length = len(encode_json_frame(first))
+    chunks = [stream[:5], stream[5 : json_length + 3], stream[json_length + 3 : -4], stream[-4:]]
+
+    decoded = read_json_frames(ChunkedSocket(chunks))
+
+    assert [item["node_id"] for item in decoded] == ["worker-json", "worker-compact", "worker-json"]
+
+
+def test_compact_frame_limits_are_enforced_from_header_and_inflated_size():
+    oversized_header = COMPACT_FRAME_HEADER.pack(COMPACT_FRAME_MAGIC, COMPACT_FRAME_VERSION, FRAME_CODEC_ZLIB, 1 << 30)
+    with pytest.raises(TelemetryFrameTooLarge):
+        read_json_frames(ChunkedSocket([oversized_header]), max_frame_bytes=1024)
+
+    bomb = encode_compact_frame({"padding": "x" * 100_000}, compression="zlib", max_frame_bytes=200_000)
+    assert len(bomb) < 1024
+    with pytest.raises(TelemetryFrameTooLarge):
+        decode_compact_frame(bomb, max_frame_bytes=1024)
+
+    truncated = encode_compact_frame(_payload())[:-3]
+    with pytest.raises(TelemetryFrameMalformed):
+        read_json_frames(ChunkedSocket([truncated]))
+
+
+def test_negotiate_frame_encoding_requires_master_advertisement_for_auto():
+    assert negotiate_frame_encoding("json", [FRAME_ENCODING_COMPACT]) == FRAME_ENCODING_JSON
+    assert negotiate_frame_encoding("auto", None) == FRAME_ENCODING_JSON
+    assert negotiate_frame_encoding("auto", ["json", FRAME_ENCODING_COMPACT]) == FRAME_ENCODING_COMPACT
+    assert negotiate_frame_encoding("compact", None) == FRAME_ENCODING_COMPACT
+
+
+def test_worker_auto_encoding_upgrades_after_master_ack(monkeypatch):
+    ack = json.dumps({"status": "ok", "frame_encodings": ["json", FRAME_ENCODING_COMPACT]}).encode("utf-8")
+    sockets = [ChunkedSocket([ack]), ChunkedSocket([ack])]
+    payload = _payload()
+
+    monkeypatch.setattr(worker_node, "_MASTER_FRAME_ENCODINGS", {})
+    monkeypatch.setattr(worker_node, "collect_connections", lambda logger: [])
+    monkeypatch.setattr(worker_node, "build_payload", lambda node_id, connections, logger, autolearn: payload)
+    monkeypatch.setattr(worker_node.socket, "create_connection", lambda endpoint, timeout: sockets.pop(0))
+
+    sent = []
+    for _ in range(2):
+        sock = sockets[0]
+        worker_node.send_to_master(
+            "worker-fixture",
+            "127.0.0.1",
+            9000,
+            1,
+            logging.getLogger("test.worker.framing"),
+            autolearn=False,
+            telemetry_encoding="auto",
+        )
+        sent.append(sock.sent)
+
+    assert sent[0].endswith(b"\n")
+    assert sent[1].startswith(COMPACT_FRAME_MAGIC)
+    assert read_json_frames(ChunkedSocket([sent[1]])) == [payload]
+
+
+def test_worker_config_rejects_unknown_telemetry_encoding():
+    config = {"node_role": "worker", "node_id": "worker-1", "master_ip": "127.0.0.1", "port": 9000}
+
+    assert config_validation.validate_config({**config, "telemetry_encoding": "auto"}).ok
+    result = config_validation.validate_config({**config, "telemetry_encoding": "msgpack"})
+    assert "telemetry_encoding must be one of: auto, compact, json" in result.errors